@@ -1,7 +1,24 @@
-"""Top-level package for the Lavazza AI Personas project."""
+"""Top-level package for the Lavazza AI Personas project.
+
+Only `adsp.config` (paths and `.env` loading) is imported eagerly; the
+subpackages are imported on first access (`adsp.core`, `adsp.app`, ...) so CLI
+commands that need a small part of the project do not pay for LangChain,
+sentence-transformers or torch.
+"""
+
+from importlib import import_module
+from typing import Any
 
 from adsp import config  # noqa: F401
-from adsp import app, communication, core, data_pipeline, modeling, monitoring, storage, utils
+
+_SUBPACKAGES = {"app", "communication", "core", "data_pipeline", "modeling", "monitoring", "storage", "utils"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f"{__name__}.{name}")
+
 
 __all__ = [
     "app",
@@ -1,10 +1,35 @@
 """Application-layer services exposed to user-facing clients."""
 
-from .persona_config import PersonaConfigurationService
-from .ingestion_service import IngestionService
-from .report_service import ReportService
-from .qa_service import QAService
-from .auth_service import AuthService
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .persona_config import PersonaConfigurationService
+    from .ingestion_service import IngestionService
+    from .report_service import ReportService
+    from .qa_service import QAService
+    from .auth_service import AuthService
+
+# Submodules are imported on first attribute access so importing the package stays cheap.
+_LAZY_ATTRS = {
+    "PersonaConfigurationService": ".persona_config",
+    "IngestionService": ".ingestion_service",
+    "ReportService": ".report_service",
+    "QAService": ".qa_service",
+    "AuthService": ".auth_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "PersonaConfigurationService",
@@ -5,9 +5,10 @@ core package remains usable even when FastAPI/uvicorn are not installed.
 """
 
 import base64
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import os
 from pathlib import Path
+import time
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -17,12 +18,29 @@ from adsp.app.auth_service import AuthService
 from adsp.app.ingestion_service import IngestionService
 from adsp.app.qa_service import QAService
 from adsp.app.report_service import ReportService
+from adsp.communication.admission import AdmissionRejected
+from adsp.core.hot_reload import HotReloader
 from adsp.core.prompt_builder.system_prompt import (
     persona_to_system_prompt,
     preamble_to_system_prompt,
 )
-from adsp.core.types import ChatRequest, ChatResponse
+from adsp.core.runtime import RuntimeWarmup
+from adsp.core.types import ChatRequest, ChatResponse, FocusGroupRequest
 from adsp.data_pipeline.schema import PersonaProfileModel
+from adsp.monitoring.metrics import collect_stage_timings, server_timing_header
+
+HTTP_METRIC = "adsp_http_request_seconds"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Admission tenant of callers without an `X-User` header. The body's `tenant_id` is
+# client-chosen, so honouring it would let a caller claim a fresh fair share per request.
+ANONYMOUS_TENANT = "anonymous"
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
 def _require_fastapi():
@@ -41,6 +59,8 @@ class AppServices:
     qa: QAService
     ingestion: IngestionService
     reports: ReportService
+    warmup: RuntimeWarmup
+    reloader: Optional[HotReloader] = None
 
 
 class HealthResponse(BaseModel):
@@ -48,6 +68,17 @@ class HealthResponse(BaseModel):
     version: str
 
 
+class ComponentReadiness(BaseModel):
+    state: str
+    detail: Optional[str] = None
+    seconds: Optional[float] = None
+
+
+class ReadyResponse(BaseModel):
+    ready: bool
+    components: Dict[str, ComponentReadiness] = Field(default_factory=dict)
+
+
 class AuthRegisterRequest(BaseModel):
     user: str
     token: str
@@ -104,7 +135,8 @@ def create_app() -> Any:
     """Create and configure the FastAPI application."""
 
     _require_fastapi()
-    from fastapi import Depends, FastAPI, Header, HTTPException, Request
+    from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
+    from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
     title = os.environ.get("ADSP_API_TITLE", "Lavazza AI Personas API")
     version = os.environ.get("ADSP_API_VERSION", "0.1.0")
@@ -130,17 +162,83 @@ def create_app() -> Any:
         bucket = os.environ.get("ADSP_INGESTION_BUCKET", "uploads")
         reports_dir = Path(os.environ.get("ADSP_REPORTS_DIR", "reports/api"))
         reports_dir.mkdir(parents=True, exist_ok=True)
+        # Personas and indexes are built by the warm-up; with ADSP_API_BACKGROUND_WARMUP (default)
+        # the server answers /health and /ready right away and the orchestrator fills in as it goes.
+        warmup = RuntimeWarmup()
+        if _env_flag("ADSP_API_BACKGROUND_WARMUP", True):
+            warmup.start()
+        else:
+            warmup.run()
+        # ADSP_HOT_RELOAD: watch persona/traits/fact-data files and swap updated components in.
+        reloader = HotReloader(warmup).start() if _env_flag("ADSP_HOT_RELOAD", False) else None
         app.state.services = AppServices(
             auth=AuthService(),
-            qa=QAService(),
+            qa=QAService(orchestrator=warmup.orchestrator),
             ingestion=IngestionService(bucket=bucket),
             reports=ReportService(output_dir=reports_dir),
+            warmup=warmup,
+            reloader=reloader,
         )
         logger.info("API server started")
 
+    @app.on_event("shutdown")
+    def _shutdown() -> None:
+        services = getattr(app.state, "services", None)
+        if services is not None and services.reloader is not None:
+            services.reloader.stop(timeout=5)
+
+    @app.exception_handler(AdmissionRejected)
+    def _admission_rejected(_request: Request, exc: AdmissionRejected) -> Any:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(int(round(exc.retry_after_s)))},
+        )
+
+    @app.middleware("http")
+    async def _observe_request(request: Request, call_next: Any) -> Any:
+        started = time.perf_counter()
+        response = await call_next(request)
+        services = getattr(request.app.state, "services", None)
+        route = request.scope.get("route")
+        if services is not None and route is not None:
+            # Streaming responses are measured up to their headers (time to first byte).
+            services.qa.orchestrator.metrics.observe(
+                HTTP_METRIC,
+                time.perf_counter() - started,
+                method=request.method,
+                route=getattr(route, "path", ""),
+                status=str(response.status_code),
+            )
+        return response
+
     def get_services(request: Request) -> AppServices:
         return request.app.state.services
 
+    retry_after = str(max(1, int(os.environ.get("ADSP_API_WARMUP_RETRY_AFTER_S", "5") or 5)))
+
+    def _not_ready(components: List[str]) -> HTTPException:
+        return HTTPException(
+            status_code=503,
+            detail=f"Warming up: {', '.join(components)} not ready",
+            headers={"Retry-After": retry_after},
+        )
+
+    def personas_ready(services: AppServices = Depends(get_services)) -> None:
+        if not services.warmup.is_ready("personas"):
+            raise _not_ready(["personas"])
+
+    def chat_ready(response: Response, services: AppServices = Depends(get_services)) -> None:
+        """Personas are required; missing indexes answer without their context unless degraded mode is off."""
+
+        personas_ready(services)
+        pending = services.warmup.pending()
+        if not pending:
+            return
+        if not _env_flag("ADSP_API_SERVE_DEGRADED", True):
+            raise _not_ready(pending)
+        response.headers["X-ADSP-Degraded"] = ",".join(pending)
+
     def auth_required() -> bool:
         raw = os.environ.get("ADSP_REQUIRE_AUTH", "false").strip().lower()
         return raw in {"1", "true", "yes", "on"}
@@ -157,10 +255,90 @@ def create_app() -> Any:
         if not services.auth.is_authorized(x_user, x_token):
             raise HTTPException(status_code=401, detail="Unauthorized")
 
+    def request_tenant(request: Request, x_user: Optional[str] = Header(None, alias="X-User")) -> str:
+        """Admission tenant: the authenticated user, else the client address.
+
+        Without `ADSP_REQUIRE_AUTH`, `X-User` is unchecked and as easy to forge as a body
+        field, so callers are told apart by address instead of sharing one tenant.
+        """
+
+        if auth_required() and x_user:
+            return x_user
+        if request.client is not None and request.client.host:
+            return f"client:{request.client.host}"
+        return ANONYMOUS_TENANT
+
     @app.get("/health", response_model=HealthResponse, tags=["system"])
     def health() -> HealthResponse:
         return HealthResponse(version=version)
 
+    @app.get(
+        "/ready",
+        response_model=ReadyResponse,
+        tags=["system"],
+        responses={503: {"model": ReadyResponse, "description": "Still warming up (or a component failed)"}},
+    )
+    def ready(response: Response, services: AppServices = Depends(get_services)) -> ReadyResponse:
+        """Readiness probe with per-component warm-up state (personas, persona_index, fact_index)."""
+
+        warmup = services.warmup
+        is_ready = warmup.is_ready()
+        if not is_ready:
+            response.status_code = 503
+            response.headers["Retry-After"] = retry_after
+        return ReadyResponse(
+            ready=is_ready,
+            components={name: ComponentReadiness(**state) for name, state in warmup.status().items()},
+        )
+
+    @app.get("/metrics", response_class=PlainTextResponse, tags=["system"])
+    def metrics(services: AppServices = Depends(get_services)) -> PlainTextResponse:
+        """Prometheus text exposition: stage and HTTP latency histograms, admission gauges."""
+
+        orchestrator = services.qa.orchestrator
+        collector = orchestrator.metrics
+        for key, value in orchestrator.admission.snapshot().items():
+            collector.write(f"adsp_admission_{key}", float(value))
+        return PlainTextResponse(collector.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    @app.get("/v1/system/admission", tags=["system"])
+    def admission_stats(services: AppServices = Depends(get_services)) -> Dict[str, float]:
+        """LLM admission-control gauges: in-flight calls, queue depth and queue wait times."""
+
+        return services.qa.orchestrator.admission.snapshot()
+
+    @app.get("/v1/system/llm-endpoints", tags=["system"])
+    def llm_endpoints(services: AppServices = Depends(get_services)) -> List[Dict[str, Any]]:
+        """LLM replica pool state: outstanding requests, latency EWMA and circuit state."""
+
+        pool = services.qa.orchestrator.router.inference_engine.pool
+        return pool.snapshot() if pool is not None else []
+
+    @app.get("/v1/system/reload", tags=["system"])
+    def reload_status(services: AppServices = Depends(get_services)) -> Dict[str, Any]:
+        """Hot-reload state: whether the watcher runs, the current generation and the last change set."""
+
+        reloader = services.reloader
+        if reloader is None:
+            return {"enabled": False, "generation": 0, "last": None}
+        last = reloader.last_result
+        return {"enabled": True, "generation": reloader.generation, "last": asdict(last) if last else None}
+
+    @app.post("/v1/system/reload", tags=["system"], dependencies=[Depends(authorize)])
+    def reload_now(services: AppServices = Depends(get_services)) -> Dict[str, Any]:
+        """Apply pending persona/fact-data file changes now instead of at the next poll."""
+
+        if services.reloader is None:
+            raise HTTPException(status_code=409, detail="Hot reload is disabled (set ADSP_HOT_RELOAD=true)")
+        if not services.warmup.wait(0):
+            raise HTTPException(status_code=503, detail="Warming up", headers={"Retry-After": retry_after})
+        result = services.reloader.poll_once()
+        return {
+            "changed": result is not None,
+            "generation": services.reloader.generation,
+            "last": asdict(result) if result else None,
+        }
+
     @app.post("/v1/auth/register", tags=["auth"])
     def register_auth(payload: AuthRegisterRequest, services: AppServices = Depends(get_services)) -> Dict[str, str]:
         services.auth.register(payload.user, payload.token)
@@ -172,7 +350,9 @@ def create_app() -> Any:
     ) -> AuthValidateResponse:
         return AuthValidateResponse(authorized=services.auth.is_authorized(payload.user, payload.token))
 
-    @app.get("/v1/personas", response_model=PersonasListResponse, tags=["personas"])
+    @app.get(
+        "/v1/personas", response_model=PersonasListResponse, tags=["personas"], dependencies=[Depends(personas_ready)]
+    )
     def list_personas(services: AppServices = Depends(get_services)) -> PersonasListResponse:
         registry = services.qa.orchestrator.prompt_builder.registry
         items: List[PersonaSummary] = []
@@ -192,7 +372,12 @@ def create_app() -> Any:
                 items.append(PersonaSummary(persona_id=persona_id))
         return PersonasListResponse(personas=items)
 
-    @app.get("/v1/personas/{persona_id}/profile", response_model=PersonaProfileModel, tags=["personas"])
+    @app.get(
+        "/v1/personas/{persona_id}/profile",
+        response_model=PersonaProfileModel,
+        tags=["personas"],
+        dependencies=[Depends(personas_ready)],
+    )
     def get_persona_profile(persona_id: str, services: AppServices = Depends(get_services)) -> PersonaProfileModel:
         registry = services.qa.orchestrator.prompt_builder.registry
         persona = registry.get(persona_id)
@@ -200,7 +385,12 @@ def create_app() -> Any:
             raise HTTPException(status_code=404, detail="Persona profile not available")
         return persona
 
-    @app.get("/v1/personas/{persona_id}/system-prompt", response_model=SystemPromptResponse, tags=["personas"])
+    @app.get(
+        "/v1/personas/{persona_id}/system-prompt",
+        response_model=SystemPromptResponse,
+        tags=["personas"],
+        dependencies=[Depends(personas_ready)],
+    )
     def get_system_prompt(persona_id: str, services: AppServices = Depends(get_services)) -> SystemPromptResponse:
         registry = services.qa.orchestrator.prompt_builder.registry
         persona = registry.get(persona_id)
@@ -210,11 +400,54 @@ def create_app() -> Any:
             return SystemPromptResponse(system_prompt=preamble_to_system_prompt(persona.get("preamble")))
         raise HTTPException(status_code=404, detail="Persona not found")
 
-    @app.post("/v1/chat", response_model=ChatResponseEnvelope, tags=["chat"], dependencies=[Depends(authorize)])
-    def chat(payload: ChatRequest, services: AppServices = Depends(get_services)) -> ChatResponseEnvelope:
-        response = services.qa.orchestrator.handle(payload)
+    @app.post(
+        "/v1/chat",
+        response_model=ChatResponseEnvelope,
+        tags=["chat"],
+        dependencies=[Depends(authorize), Depends(chat_ready)],
+    )
+    def chat(
+        payload: ChatRequest,
+        http_response: Response,
+        services: AppServices = Depends(get_services),
+        tenant_id: str = Depends(request_tenant),
+    ) -> ChatResponseEnvelope:
+        payload = payload.model_copy(update={"tenant_id": tenant_id})
+        with collect_stage_timings() as timings:
+            response = services.qa.orchestrator.handle(payload)
+        # ADSP_API_SERVER_TIMING: per-stage durations for browser devtools / client tracing.
+        if timings and _env_flag("ADSP_API_SERVER_TIMING", False):
+            http_response.headers["Server-Timing"] = server_timing_header(timings)
         return ChatResponseEnvelope(response=response)
 
+    @app.post(
+        "/v1/focus-group",
+        response_class=StreamingResponse,
+        tags=["chat"],
+        dependencies=[Depends(authorize), Depends(chat_ready)],
+        responses={200: {"content": {"application/x-ndjson": {}}}},
+    )
+    def focus_group(
+        payload: FocusGroupRequest,
+        services: AppServices = Depends(get_services),
+        tenant_id: str = Depends(request_tenant),
+    ) -> StreamingResponse:
+        """Ask one question to several personas; streams one `FocusGroupResult` JSON line per persona."""
+
+        payload = payload.model_copy(update={"tenant_id": tenant_id})
+
+        registry = services.qa.orchestrator.prompt_builder.registry
+        known = set(registry.list_personas())
+        missing = [persona_id for persona_id in payload.persona_ids if persona_id not in known]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Unknown persona ids: {', '.join(missing)}")
+
+        def _lines():
+            for result in services.qa.orchestrator.handle_focus_group(payload):
+                yield result.model_dump_json() + "\n"
+
+        return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
     @app.post(
         "/v1/ingestion/upload",
         response_model=UploadResponse,
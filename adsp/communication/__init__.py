@@ -3,5 +3,7 @@
 from .rpc import RPCClient
 from .cache import CacheClient
 from .event_broker import EventBroker
+from .single_flight import SingleFlight
+from .admission import AdmissionController, AdmissionRejected
 
-__all__ = ["RPCClient", "CacheClient", "EventBroker"]
+__all__ = ["RPCClient", "CacheClient", "EventBroker", "SingleFlight", "AdmissionController", "AdmissionRejected"]
@@ -0,0 +1,194 @@
+"""Admission control for calls into the LLM backend.
+
+Bounds the number of concurrent generations, queues the rest by priority
+(interactive chat ahead of batch work) with round-robin fairness between
+tenants, and rejects new work once the queue is full so callers can apply
+back-pressure (HTTP 429) instead of piling requests onto the model server.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import os
+import threading
+import time
+from typing import Deque, Dict, Iterator, Optional
+
+PRIORITIES: Dict[str, int] = {"interactive": 0, "batch": 1}
+DEFAULT_TENANT = "default"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a call cannot be admitted (queue full or queue wait timed out)."""
+
+    def __init__(self, message: str, *, retry_after_s: float = 1.0) -> None:
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+@dataclass
+class _Waiter:
+    priority: int
+    tenant: str
+    enqueued_at: float
+    granted: threading.Event = field(default_factory=threading.Event)
+
+
+@dataclass
+class AdmissionController:
+    """Bounded-concurrency gate with a priority queue and per-tenant fairness.
+
+    Configuration (environment variables):
+    - `ADSP_LLM_MAX_CONCURRENCY`: concurrent backend calls (default: `8`)
+    - `ADSP_LLM_MAX_QUEUE`: waiting calls before new ones are rejected (default: `64`)
+    - `ADSP_LLM_QUEUE_TIMEOUT`: max seconds a call may wait for a slot (default: `30`)
+    """
+
+    max_concurrency: int = field(default_factory=lambda: _env_int("ADSP_LLM_MAX_CONCURRENCY", 8))
+    max_queue_depth: int = field(default_factory=lambda: _env_int("ADSP_LLM_MAX_QUEUE", 64))
+    queue_timeout_s: float = field(default_factory=lambda: _env_float("ADSP_LLM_QUEUE_TIMEOUT", 30.0))
+
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _active: int = 0
+    # priority -> tenant -> FIFO of waiters; tenant order rotates for round-robin.
+    _queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = field(default_factory=dict)
+    _queued: int = 0
+    _admitted: int = 0
+    _rejected: int = 0
+    _timed_out: int = 0
+    _wait_total_s: float = 0.0
+    _wait_max_s: float = 0.0
+
+    def acquire(self, *, priority: str = "interactive", tenant: Optional[str] = None) -> None:
+        """Block until a slot is free; raise `AdmissionRejected` on overflow or timeout."""
+
+        level = PRIORITIES.get(priority, PRIORITIES["batch"])
+        tenant_key = tenant or DEFAULT_TENANT
+        with self._lock:
+            if self._active < self.max_concurrency and self._queued == 0:
+                self._active += 1
+                self._record_admission(0.0)
+                return
+            if self._queued >= self.max_queue_depth:
+                self._rejected += 1
+                raise AdmissionRejected(
+                    f"LLM queue is full ({self._queued} waiting)", retry_after_s=self._retry_after()
+                )
+            waiter = _Waiter(priority=level, tenant=tenant_key, enqueued_at=time.perf_counter())
+            self._queues.setdefault(level, OrderedDict()).setdefault(tenant_key, deque()).append(waiter)
+            self._queued += 1
+
+        if waiter.granted.wait(self.queue_timeout_s):
+            return
+
+        with self._lock:
+            if waiter.granted.is_set():
+                return
+            self._remove(waiter)
+            self._timed_out += 1
+        raise AdmissionRejected(
+            f"Timed out after {self.queue_timeout_s:.1f}s waiting for an LLM slot",
+            retry_after_s=self._retry_after(),
+        )
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiter, if any."""
+
+        with self._lock:
+            waiter = self._pop_next()
+            if waiter is None:
+                self._active = max(0, self._active - 1)
+                return
+            # The slot passes directly to the waiter; `_active` is unchanged.
+            self._record_admission(time.perf_counter() - waiter.enqueued_at)
+            waiter.granted.set()
+
+    @contextmanager
+    def slot(self, *, priority: str = "interactive", tenant: Optional[str] = None) -> Iterator[None]:
+        self.acquire(priority=priority, tenant=tenant)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current queue depth, in-flight count and wait-time statistics."""
+
+        with self._lock:
+            by_priority = {
+                name: sum(len(q) for q in self._queues.get(level, {}).values())
+                for name, level in PRIORITIES.items()
+            }
+            return {
+                "in_flight": self._active,
+                "max_concurrency": self.max_concurrency,
+                "queue_depth": self._queued,
+                "queue_depth_interactive": by_priority["interactive"],
+                "queue_depth_batch": by_priority["batch"],
+                "max_queue_depth": self.max_queue_depth,
+                "admitted_total": self._admitted,
+                "rejected_total": self._rejected,
+                "timed_out_total": self._timed_out,
+                "wait_ms_avg": (self._wait_total_s / self._admitted * 1000.0) if self._admitted else 0.0,
+                "wait_ms_max": self._wait_max_s * 1000.0,
+            }
+
+    def _record_admission(self, waited_s: float) -> None:
+        self._admitted += 1
+        self._wait_total_s += waited_s
+        self._wait_max_s = max(self._wait_max_s, waited_s)
+
+    def _retry_after(self) -> float:
+        return max(1.0, min(self.queue_timeout_s, self._wait_max_s))
+
+    def _pop_next(self) -> Optional[_Waiter]:
+        for level in sorted(self._queues):
+            tenants = self._queues[level]
+            if not tenants:
+                continue
+            tenant, waiters = next(iter(tenants.items()))
+            waiter = waiters.popleft()
+            if waiters:
+                tenants.move_to_end(tenant)
+            else:
+                del tenants[tenant]
+            self._queued -= 1
+            return waiter
+        return None
+
+    def _remove(self, waiter: _Waiter) -> None:
+        tenants = self._queues.get(waiter.priority, {})
+        waiters = tenants.get(waiter.tenant)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        self._queued -= 1
+        if not waiters:
+            del tenants[waiter.tenant]
@@ -0,0 +1,62 @@
+"""Request coalescing for identical in-flight work."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class SingleFlight:
+    """Runs a callable once per key while concurrent callers wait for its result.
+
+    The first caller for a key executes the work; callers arriving while it is
+    still running block until it finishes and receive the same result (or
+    exception). Nothing is cached once the call completes.
+    """
+
+    _calls: Dict[Hashable, _Call] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Execute `fn` (or join an in-flight execution) for `key`.
+
+        Returns `(result, shared)` where `shared` is true when the result came
+        from another caller's execution.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
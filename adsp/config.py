@@ -1,3 +1,4 @@
+from importlib.util import find_spec
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -23,10 +24,13 @@ FIGURES_DIR = REPORTS_DIR / "figures"
 
 # If tqdm is installed, configure loguru with tqdm.write
 # https://github.com/Delgan/loguru/issues/135
-try:
+# tqdm itself is imported on the first log message, not at import time.
+def _tqdm_sink(msg: str) -> None:
     from tqdm import tqdm
 
+    tqdm.write(msg, end="")
+
+
+if find_spec("tqdm") is not None:
     logger.remove(0)
-    logger.add(lambda msg: tqdm.write(msg, end=""), colorize=True)
-except ModuleNotFoundError:
-    pass
+    logger.add(_tqdm_sink, colorize=True)
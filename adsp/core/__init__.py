@@ -1,13 +1,41 @@
 """Core intelligence components (orchestrator, RAG, personas)."""
 
-from .orchestrator import Orchestrator
-from .input_handler import InputHandler
-from .prompt_builder import PromptBuilder
-from .persona_registry import PersonaRegistry
-from .ai_persona_router import PersonaRouter
-from .rag import RAGPipeline
-from .memory import ConversationMemory
-from .mcp_server import MCPServer
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .orchestrator import Orchestrator
+    from .input_handler import InputHandler
+    from .prompt_builder import PromptBuilder
+    from .persona_registry import PersonaRegistry
+    from .ai_persona_router import PersonaRouter
+    from .rag import RAGPipeline
+    from .memory import ConversationMemory
+    from .mcp_server import MCPServer
+
+# Submodules are imported on first attribute access so importing the package stays cheap.
+_LAZY_ATTRS = {
+    "Orchestrator": ".orchestrator",
+    "InputHandler": ".input_handler",
+    "PromptBuilder": ".prompt_builder",
+    "PersonaRegistry": ".persona_registry",
+    "PersonaRouter": ".ai_persona_router",
+    "RAGPipeline": ".rag",
+    "ConversationMemory": ".memory",
+    "MCPServer": ".mcp_server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Orchestrator",
@@ -3,16 +3,83 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
 
+from loguru import logger
+
+from adsp.data_pipeline.schema import PersonaProfileModel
 from adsp.modeling.inference import PersonaInferenceEngine
 
 
+def _parse_mapping(raw: str) -> Dict[str, str]:
+    mapping: Dict[str, str] = {}
+    for item in (raw or "").split(","):
+        key, sep, value = item.partition("=")
+        if sep and key.strip() and value.strip():
+            mapping[key.strip()] = value.strip()
+    return mapping
+
+
+def resolve_persona_adapters(
+    personas: Iterable[PersonaProfileModel],
+) -> Tuple[Dict[str, str], Dict[str, Optional[str]]]:
+    """Return `(persona_id -> adapter name, adapter name -> adapter path)`.
+
+    Adapter names come from persona metadata (`lora_adapter`, optional
+    `lora_adapter_path`) and can be overridden with `ADSP_LORA_ADAPTERS`
+    (`persona_id=adapter,...`). Adapters without an explicit path are looked up
+    under `ADSP_LORA_DIR/<adapter>` when that directory is configured.
+    """
+
+    persona_adapters: Dict[str, str] = {}
+    adapter_paths: Dict[str, Optional[str]] = {}
+    for persona in personas:
+        if persona.persona_id and persona.lora_adapter:
+            persona_adapters[persona.persona_id] = persona.lora_adapter
+            if persona.lora_adapter_path:
+                adapter_paths[persona.lora_adapter] = persona.lora_adapter_path
+    persona_adapters.update(_parse_mapping(os.environ.get("ADSP_LORA_ADAPTERS", "")))
+
+    lora_dir = os.environ.get("ADSP_LORA_DIR", "").strip()
+    for adapter in set(persona_adapters.values()):
+        if adapter_paths.get(adapter):
+            continue
+        candidate = Path(lora_dir) / adapter if lora_dir else None
+        adapter_paths[adapter] = str(candidate) if candidate is not None and candidate.exists() else None
+    return persona_adapters, adapter_paths
+
+
 @dataclass
 class PersonaRouter:
-    """Leverages persona metadata to pick the right PEFT adapter/model."""
+    """Leverages persona metadata to pick the right PEFT adapter/model.
+
+    Personas mapped in `adapters` are sent to the backend with the LoRA adapter
+    name as the model; all others use the engine's base model.
+    """
 
     # inference_engine: PersonaInferenceEngine = PersonaInferenceEngine()
     inference_engine: PersonaInferenceEngine = field(default_factory=PersonaInferenceEngine)
+    adapters: Dict[str, str] = field(default_factory=dict)
 
     def dispatch(self, persona_id: str, prompt: str) -> str:
+        adapter = self.adapters.get(persona_id)
+        if adapter:
+            return self.inference_engine.generate(persona_id=persona_id, prompt=prompt, model=adapter)
         return self.inference_engine.generate(persona_id=persona_id, prompt=prompt)
+
+    def preload_adapters(self, adapter_paths: Dict[str, Optional[str]]) -> None:
+        """Load mapped adapters on the backend; personas whose adapter is unavailable fall back to the base model."""
+
+        if not self.adapters:
+            return
+        if (self.inference_engine.backend or "stub").strip().lower() != "openai":
+            return
+        wanted = {name: adapter_paths.get(name) for name in set(self.adapters.values())}
+        available = self.inference_engine.preload_adapters(wanted)
+        missing = sorted(set(wanted) - available)
+        if missing:
+            logger.warning("LoRA adapters unavailable, using base model instead: {}", ", ".join(missing))
+            self.adapters = {pid: name for pid, name in self.adapters.items() if name in available}
+        logger.info("Persona adapter routing ready ({} personas)", len(self.adapters))
@@ -0,0 +1,273 @@
+"""Hot reload of personas and RAG indexes while the process keeps serving.
+
+`HotReloader` polls the persona directory (`ADSP_PERSONAS_DIR`), the traits
+directory (`ADSP_PERSONA_TRAITS_DIR`) and the fact-data markdown directory
+(`ADSP_FACTDATA_MARKDOWN_DIR`) every `ADSP_HOT_RELOAD_INTERVAL_S` seconds and
+diffs the size/mtime of their files. Only the affected entries are rebuilt:
+
+- personas: changed profiles are re-validated and upserted, deleted ones removed
+  from the `PersonaRegistry`, the router and the `PersonaRAGIndex`;
+- fact data: chunks of changed or deleted markdown files are dropped and the
+  changed files re-chunked and embedded (`FactDataRAGIndex.with_files`).
+
+Updates are copy-on-write: each component is rebuilt as a new object from the
+live one plus the changes, and the new router, prompt builder and retriever are
+published together with `Orchestrator.swap`. Requests bind their components
+once when they start (`Orchestrator.components`), so a request in flight keeps
+using its generation throughout; none is ever mutated in place.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from adsp.core.ai_persona_router import resolve_persona_adapters
+from adsp.core.persona_registry.loader import load_persona_file, loads_json, source_fingerprint
+from adsp.core.runtime import (
+    READY,
+    SKIPPED,
+    RuntimeWarmup,
+    build_fact_data_index,
+    resolve_fact_markdown_dir,
+    resolve_persona_paths,
+)
+from adsp.data_pipeline.schema import PersonaProfileModel
+
+Fingerprint = Dict[str, Tuple[int, int]]
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
+
+
+def file_fingerprint(directory: Path, pattern: str) -> Fingerprint:
+    """`{file name: (size, mtime_ns)}` for the files of `directory` matching `pattern`."""
+
+    if not directory.exists():
+        return {}
+    fingerprint: Fingerprint = {}
+    for path in sorted(directory.glob(pattern)):
+        stat = path.stat()
+        fingerprint[path.name] = (stat.st_size, stat.st_mtime_ns)
+    return fingerprint
+
+
+@dataclass
+class SourceDiff:
+    added: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @classmethod
+    def between(cls, old: Fingerprint, new: Fingerprint) -> "SourceDiff":
+        return cls(
+            added=set(new) - set(old),
+            changed={name for name in set(old) & set(new) if old[name] != new[name]},
+            removed=set(old) - set(new),
+        )
+
+
+@dataclass
+class ReloadResult:
+    generation: int
+    upserted: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    fact_files: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+@dataclass
+class HotReloader:
+    """Polls persona and fact-data sources and swaps updated components into `warmup.orchestrator`."""
+
+    warmup: RuntimeWarmup
+    interval_s: float = field(default_factory=lambda: _env_float("ADSP_HOT_RELOAD_INTERVAL_S", 2.0))
+    generation: int = 0
+    last_result: Optional[ReloadResult] = None
+    _persona_sources: Fingerprint = field(default_factory=dict, repr=False)
+    _fact_sources: Fingerprint = field(default_factory=dict, repr=False)
+    # Individual file name -> persona id (ids can differ from file stems).
+    _file_personas: Dict[str, str] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _stop: threading.Event = field(default_factory=threading.Event, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, repr=False)
+
+    def start(self) -> "HotReloader":
+        """Poll on a daemon thread; changes are applied once the warm-up has finished."""
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="adsp-hot-reload", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def prime(self) -> None:
+        """Record the current sources as the baseline that later polls are diffed against."""
+
+        individual_dir, traits_dir, markdown_dir, pattern = self._paths()
+        self._persona_sources = source_fingerprint(individual_dir, traits_dir)
+        self._fact_sources = file_fingerprint(markdown_dir, pattern)
+        self._file_personas = {}
+        for path in sorted(individual_dir.glob("*.json")) if individual_dir.exists() else []:
+            try:
+                payload = loads_json(path.read_bytes())
+            except Exception:
+                continue
+            if isinstance(payload, dict):
+                self._file_personas[path.name] = payload.get("persona_id") or path.stem
+
+    def poll_once(self) -> Optional[ReloadResult]:
+        """Diff the sources against the last poll and apply the changes; None if nothing changed."""
+
+        with self._lock:
+            individual_dir, traits_dir, markdown_dir, pattern = self._paths()
+            persona_sources = source_fingerprint(individual_dir, traits_dir)
+            fact_sources = file_fingerprint(markdown_dir, pattern)
+            persona_diff = SourceDiff.between(self._persona_sources, persona_sources)
+            fact_diff = SourceDiff.between(self._fact_sources, fact_sources)
+            if not persona_diff and not fact_diff:
+                return None
+
+            started = time.perf_counter()
+            self.generation += 1
+            result = ReloadResult(generation=self.generation)
+            if persona_diff:
+                result.upserted, result.removed = self._apply_personas(persona_diff, individual_dir, traits_dir)
+            if fact_diff:
+                result.fact_files = self._apply_facts(fact_diff, markdown_dir, fact_sources)
+            self._persona_sources, self._fact_sources = persona_sources, fact_sources
+            result.seconds = round(time.perf_counter() - started, 3)
+            self.last_result = result
+            logger.info(
+                f"Hot reload generation {result.generation}: {len(result.upserted)} personas upserted, "
+                f"{len(result.removed)} removed, {len(result.fact_files)} fact files in {result.seconds:.2f}s"
+            )
+            return result
+
+    # Internals ----------------------------------------------------------
+
+    def _loop(self) -> None:
+        # Baseline before waiting: a file changed during the warm-up is re-applied afterwards
+        # (upserts are idempotent) rather than missed.
+        self.prime()
+        while not self.warmup.wait(self.interval_s):
+            if self._stop.is_set():
+                return
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception("Hot reload failed; keeping the current generation")
+
+    def _paths(self) -> Tuple[Path, Optional[Path], Path, str]:
+        individual_dir, traits_dir = resolve_persona_paths(self.warmup.processed_dir)
+        markdown_dir, pattern = resolve_fact_markdown_dir(self.warmup.processed_dir)
+        return individual_dir, traits_dir if traits_dir.exists() else None, markdown_dir, pattern
+
+    def _apply_personas(
+        self, diff: SourceDiff, individual_dir: Path, traits_dir: Optional[Path]
+    ) -> Tuple[List[str], List[str]]:
+        files: Set[str] = set()
+        removed_ids: Set[str] = set()
+        by_id = {persona_id: name for name, persona_id in self._file_personas.items()}
+        for key in diff.added | diff.changed | diff.removed:
+            prefix, name = key.split("/", 1)
+            if prefix == "individual":
+                if key in diff.removed:
+                    removed_ids.add(self._file_personas.pop(name, Path(name).stem))
+                else:
+                    files.add(name)
+            else:
+                # A traits file belongs to the persona with that id.
+                persona_id = Path(name).stem
+                name = by_id.get(persona_id, f"{persona_id}.json")
+                if (individual_dir / name).exists():
+                    files.add(name)
+
+        upserts: List[PersonaProfileModel] = []
+        for name in sorted(files):
+            try:
+                persona = load_persona_file(individual_dir / name, traits_dir=traits_dir)
+            except Exception as exc:
+                logger.warning(f"Hot reload skipped persona profile {name}: {exc}")
+                continue
+            if persona is None or not persona.persona_id:
+                continue
+            previous = self._file_personas.get(name)
+            if previous and previous != persona.persona_id:
+                removed_ids.add(previous)
+            self._file_personas[name] = persona.persona_id
+            upserts.append(persona)
+        removed_ids -= {persona.persona_id for persona in upserts}
+
+        orchestrator = self.warmup.orchestrator
+        registry = orchestrator.prompt_builder.registry.copy()
+        for persona in upserts:
+            registry.upsert(persona.persona_id, persona)
+        for persona_id in removed_ids:
+            registry.remove(persona_id)
+        personas = [
+            persona
+            for persona in (registry.get(persona_id) for persona_id in registry.list_personas())
+            if isinstance(persona, PersonaProfileModel)
+        ]
+        adapters, adapter_paths = resolve_persona_adapters(personas)
+        router = replace(orchestrator.router, adapters=adapters)
+        if set(adapters.values()) - set(orchestrator.router.adapters.values()):
+            try:
+                router.preload_adapters(adapter_paths)
+            except Exception as exc:  # pragma: no cover - external server
+                logger.warning(f"LoRA adapter preload failed: {exc}")
+        prompt_builder = replace(orchestrator.prompt_builder, registry=registry)
+
+        retriever = orchestrator.retriever
+        persona_index = retriever.persona_index
+        if persona_index is not None:
+            persona_index = persona_index.with_personas(upserts, removed=removed_ids)
+            retriever = replace(retriever, persona_index=persona_index)
+
+        orchestrator.swap(router=router, prompt_builder=prompt_builder, retriever=retriever)
+        self.warmup.components["personas"].detail = f"{len(personas)} personas"
+        return sorted(p.persona_id for p in upserts), sorted(removed_ids)
+
+    def _apply_facts(self, diff: SourceDiff, markdown_dir: Path, sources: Fingerprint) -> List[str]:
+        orchestrator = self.warmup.orchestrator
+        index = orchestrator.fact_data_index
+        if not sources:
+            updated = None
+        elif index is None:
+            # First pages appeared: build from scratch.
+            updated = build_fact_data_index(processed_dir=self.warmup.processed_dir)
+        else:
+            updated = index.with_files(markdown_dir, changed=diff.added | diff.changed, removed=diff.removed)
+        orchestrator.swap(fact_data_index=updated)
+        component = self.warmup.components["fact_index"]
+        if updated is None:
+            component.state, component.detail = SKIPPED, None
+        else:
+            component.state, component.detail = READY, f"{len(updated.indexed_chunk_ids)} chunks"
+        return sorted(diff.added | diff.changed | diff.removed)
+
+
+__all__ = ["HotReloader", "ReloadResult", "SourceDiff", "file_fingerprint"]
@@ -2,27 +2,59 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+import os
+import threading
 import time
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Iterator, Optional, TYPE_CHECKING
 
 from loguru import logger
 
+from adsp.communication.admission import AdmissionController
 from adsp.communication.cache import CacheClient
+from adsp.communication.single_flight import SingleFlight
 from adsp.core.ai_persona_router import PersonaRouter
 from adsp.core.context_filter import ConversationContextFilter
 from adsp.core.input_handler import InputHandler
 from adsp.core.memory import ConversationMemory
 from adsp.core.prompt_builder import PromptBuilder
 from adsp.core.rag import RAGPipeline
-from adsp.core.types import ChatRequest, ChatResponse, RetrievedContext
+from adsp.core.types import (
+    ChatRequest,
+    ChatResponse,
+    FocusGroupRequest,
+    FocusGroupResult,
+    RetrievedContext,
+)
 from adsp.data_pipeline.schema import PersonaProfileModel
+from adsp.monitoring.metrics import MetricsCollector, record_stage
 
 if TYPE_CHECKING:  # pragma: no cover
     from adsp.core.rag.fact_data_index import FactDataRAGIndex
 
 _CONTEXT_SEPARATOR = "\n\n---\n\n"
 
+STAGE_METRIC = "adsp_orchestrator_stage_seconds"
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
+
 
 def _split_context_blocks(context: str) -> list[str]:
     return [b.strip() for b in (context or "").split(_CONTEXT_SEPARATOR) if b.strip()]
@@ -57,9 +89,36 @@ def _merge_retrieved_contexts(
     )
 
 
+@dataclass(frozen=True)
+class OrchestratorComponents:
+    """The swappable components one request uses from start to finish (see `Orchestrator.swap`)."""
+
+    prompt_builder: PromptBuilder
+    retriever: RAGPipeline
+    fact_data_index: Optional["FactDataRAGIndex"]
+    router: PersonaRouter
+
+
+_SWAPPABLE = frozenset(OrchestratorComponents.__dataclass_fields__)
+
+
 @dataclass
 class Orchestrator:
-    """Wires together preprocessing, retrieval, routing, and memory."""
+    """Wires together preprocessing, retrieval, routing, and memory.
+
+    Configuration (environment variables):
+    - `ADSP_CHAT_SINGLE_FLIGHT`: coalesce identical concurrent requests (default: true)
+    - `ADSP_FOCUS_GROUP_MAX_WORKERS`: concurrent generations per focus group (default: 8)
+    - `ADSP_METRICS_PERSONA_LABEL`: label stage histograms by persona (default: false)
+
+    Every stage duration is observed into `metrics` (`adsp_orchestrator_stage_seconds`,
+    labelled by stage and LLM backend, plus persona when enabled; unregistered ids
+    are labelled "unknown") as well as logged at debug level.
+
+    Each request binds `prompt_builder`, `retriever`, `fact_data_index` and `router`
+    once at its start (`components()`), so replacing them with `swap` while it runs
+    (e.g. a hot reload) never mixes two generations within one request.
+    """
 
     input_handler: InputHandler = field(default_factory=InputHandler)
     context_filter: ConversationContextFilter = field(default_factory=ConversationContextFilter)
@@ -67,14 +126,89 @@ class Orchestrator:
     retriever: RAGPipeline = field(default_factory=RAGPipeline)
     fact_data_index: Optional["FactDataRAGIndex"] = None
     router: PersonaRouter = field(default_factory=PersonaRouter)
+    admission: AdmissionController = field(default_factory=AdmissionController)
     memory: ConversationMemory = field(default_factory=ConversationMemory)
     cache: CacheClient = field(default_factory=CacheClient)
+    single_flight: SingleFlight = field(default_factory=SingleFlight)
+    coalesce_requests: bool = field(default_factory=lambda: _env_flag("ADSP_CHAT_SINGLE_FLIGHT", True))
+    focus_group_max_workers: int = field(
+        default_factory=lambda: _env_int("ADSP_FOCUS_GROUP_MAX_WORKERS", 8)
+    )
+    metrics: MetricsCollector = field(default_factory=MetricsCollector)
+    metrics_persona_label: bool = field(
+        default_factory=lambda: _env_flag("ADSP_METRICS_PERSONA_LABEL", False)
+    )
+
+    _swap_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.metrics.describe(STAGE_METRIC, "Duration of each orchestrator stage in seconds.")
+
+    def components(self) -> OrchestratorComponents:
+        """The current generation of swappable components, read consistently."""
+
+        with self._swap_lock:
+            return OrchestratorComponents(
+                prompt_builder=self.prompt_builder,
+                retriever=self.retriever,
+                fact_data_index=self.fact_data_index,
+                router=self.router,
+            )
 
-    def _build_fact_data_query(self, *, persona_id: str, query: str) -> str:
+    def swap(self, **components: object) -> None:
+        """Replace several components at once; requests see all of them or none."""
+
+        unknown = set(components) - _SWAPPABLE
+        if unknown:
+            raise TypeError(f"Not swappable: {', '.join(sorted(unknown))}")
+        with self._swap_lock:
+            for name, value in components.items():
+                setattr(self, name, value)
+
+    def _persona_label(self, components: OrchestratorComponents, persona_id: str) -> str:
+        """`persona_id` as a metrics label; ids missing from the registry become "unknown".
+
+        Request bodies choose the persona id, so only registered ids may create series.
+        """
+
+        if not self.metrics_persona_label:
+            return persona_id
+        try:
+            registered = components.prompt_builder.registry.has_persona(persona_id)
+        except Exception:
+            registered = False
+        return persona_id if registered else "unknown"
+
+    def _observe(
+        self,
+        stage: str,
+        started: float,
+        persona: str,
+        components: OrchestratorComponents,
+        *,
+        ended: Optional[float] = None,
+    ) -> float:
+        """Record a stage duration in the metrics and the request's timings; returns milliseconds.
+
+        The backend label comes from the request's bound `components`, not the current router.
+        """
+
+        seconds = (ended if ended is not None else time.perf_counter()) - started
+        engine = getattr(components.router, "inference_engine", None)
+        labels = {"stage": stage, "backend": (getattr(engine, "backend", None) or "stub").strip().lower()}
+        if self.metrics_persona_label:
+            labels["persona"] = persona
+        self.metrics.observe(STAGE_METRIC, seconds, **labels)
+        record_stage(stage, seconds * 1000.0)
+        return seconds * 1000.0
+
+    def _build_fact_data_query(
+        self, components: OrchestratorComponents, *, persona_id: str, query: str
+    ) -> str:
         persona_name = None
         persona_summary = None
         try:
-            persona = self.prompt_builder.registry.get(persona_id)
+            persona = components.prompt_builder.registry.get(persona_id)
         except Exception:
             persona = None
 
@@ -96,10 +230,47 @@ class Orchestrator:
 
         return query.strip()
 
+    def _coalesce_key(self, request: ChatRequest) -> tuple:
+        return (
+            request.persona_id,
+            request.session_id,
+            request.persona_display_name,
+            self.input_handler.normalize(request.query),
+            request.top_k,
+            request.priority,
+        )
+
     def handle(self, request: ChatRequest) -> ChatResponse:
+        """Process a chat request, sharing the result with identical in-flight requests.
+
+        Concurrent duplicates (same persona, session, display name, normalized query,
+        top-k and priority) wait for the first execution instead of running retrieval
+        and generation again. Priority is part of the key so an interactive request
+        never waits behind a batch flight in the batch admission queue.
+        """
+
+        if not self.coalesce_requests:
+            return self._handle(request)
+
+        response, shared = self.single_flight.do(
+            self._coalesce_key(request), lambda: self._handle(request)
+        )
+        if shared:
+            self.metrics.incr("adsp_orchestrator_coalesced_total")
+            logger.debug(
+                "orchestrator.coalesced persona_id={} session_id={}",
+                request.persona_id,
+                request.session_id,
+            )
+            return response.model_copy(deep=True)
+        return response
+
+    def _handle(self, request: ChatRequest) -> ChatResponse:
         """Process a chat request end-to-end using the configured components."""
 
         start_total = time.perf_counter()
+        components = self.components()
+        persona_label = self._persona_label(components, request.persona_id)
 
         # cache_key = f"{request.persona_id}:{request.session_id or 'default'}:{request.query}"
         # cached = self.cache.get(cache_key)
@@ -113,21 +284,11 @@ class Orchestrator:
         logger.debug(
             "orchestrator.normalize persona_id={} ms={:.2f}",
             request.persona_id,
-            (time.perf_counter() - start_step) * 1000.0,
+            self._observe("normalize", start_step, persona_label, components),
         )
 
         start_step = time.perf_counter()
-        history = self.memory.get_history(persona_id=request.persona_id, session_id=request.session_id)
-        logger.debug(
-            "orchestrator.get_history persona_id={} session_id={} items={} ms={:.2f}",
-            request.persona_id,
-            request.session_id,
-            len(history or []),
-            (time.perf_counter() - start_step) * 1000.0,
-        )
-
-        start_step = time.perf_counter()
-        persona_retrieved = self.retriever.retrieve_with_metadata(
+        persona_retrieved = components.retriever.retrieve_with_metadata(
             persona_id=request.persona_id, query=normalized, k=request.top_k
         )
         logger.debug(
@@ -136,47 +297,86 @@ class Orchestrator:
             request.top_k,
             len(persona_retrieved.context or ""),
             len(persona_retrieved.citations or []),
-            (time.perf_counter() - start_step) * 1000.0,
+            self._observe("retrieve_persona", start_step, persona_label, components),
         )
-        merged_retrieved = persona_retrieved
 
         fact_retrieved: RetrievedContext | None = None
 
-        if self.fact_data_index is not None:
+        if components.fact_data_index is not None:
             start_step = time.perf_counter()
-            fact_query = self._build_fact_data_query(persona_id=request.persona_id, query=normalized)
+            fact_query = self._build_fact_data_query(
+                components, persona_id=request.persona_id, query=normalized
+            )
             logger.debug(
                 "orchestrator.build_fact_query persona_id={} k={} query_chars={} ms={:.2f}",
                 request.persona_id,
                 request.top_k,
                 len(fact_query),
-                (time.perf_counter() - start_step) * 1000.0,
+                self._observe("build_fact_query", start_step, persona_label, components),
             )
             try:
                 start_step = time.perf_counter()
-                fact_retrieved = self.fact_data_index.retrieve(fact_query, k=request.top_k)
+                fact_retrieved = components.fact_data_index.retrieve(fact_query, k=request.top_k)
                 logger.debug(
                     "orchestrator.retrieve_fact_data persona_id={} k={} context_chars={} citations={} ms={:.2f}",
                     request.persona_id,
                     request.top_k,
                     len((fact_retrieved.context or "").strip()),
                     len(fact_retrieved.citations or []),
-                    (time.perf_counter() - start_step) * 1000.0,
+                    self._observe("retrieve_fact_data", start_step, persona_label, components),
                 )
             except Exception as exc:  # pragma: no cover - defensive retrieval
                 logger.warning("Fact data retrieval failed: {}", exc)
                 fact_retrieved = None
 
-            if fact_retrieved and (fact_retrieved.context or "").strip():
-                start_step = time.perf_counter()
-                merged_retrieved = _merge_retrieved_contexts(persona_retrieved, fact_retrieved)
-                logger.debug(
-                    "orchestrator.merge_context persona_id={} merged_chars={} merged_citations={} ms={:.2f}",
-                    request.persona_id,
-                    len(merged_retrieved.context or ""),
-                    len(merged_retrieved.citations or []),
-                    (time.perf_counter() - start_step) * 1000.0,
-                )
+        response = self._respond(
+            request,
+            components,
+            normalized=normalized,
+            persona_retrieved=persona_retrieved,
+            fact_retrieved=fact_retrieved,
+        )
+        logger.debug(
+            "orchestrator.total persona_id={} ms={:.2f}",
+            request.persona_id,
+            self._observe("total", start_total, persona_label, components),
+        )
+        # self.cache.set(cache_key, response)
+        return response
+
+    def _respond(
+        self,
+        request: ChatRequest,
+        components: OrchestratorComponents,
+        *,
+        normalized: str,
+        persona_retrieved: RetrievedContext,
+        fact_retrieved: RetrievedContext | None,
+    ) -> ChatResponse:
+        """Filter, prompt, generate and remember, given already-retrieved context."""
+
+        persona_label = self._persona_label(components, request.persona_id)
+        start_step = time.perf_counter()
+        history = self.memory.get_history(persona_id=request.persona_id, session_id=request.session_id)
+        logger.debug(
+            "orchestrator.get_history persona_id={} session_id={} items={} ms={:.2f}",
+            request.persona_id,
+            request.session_id,
+            len(history or []),
+            self._observe("get_history", start_step, persona_label, components),
+        )
+
+        merged_retrieved = persona_retrieved
+        if fact_retrieved and (fact_retrieved.context or "").strip():
+            start_step = time.perf_counter()
+            merged_retrieved = _merge_retrieved_contexts(persona_retrieved, fact_retrieved)
+            logger.debug(
+                "orchestrator.merge_context persona_id={} merged_chars={} merged_citations={} ms={:.2f}",
+                request.persona_id,
+                len(merged_retrieved.context or ""),
+                len(merged_retrieved.citations or []),
+                self._observe("merge_context", start_step, persona_label, components),
+            )
 
         start_step = time.perf_counter()
         filtered_history = self.context_filter.filter_history(history, normalized)
@@ -184,7 +384,7 @@ class Orchestrator:
             "orchestrator.filter_history persona_id={} kept_items={} ms={:.2f}",
             request.persona_id,
             len(filtered_history or []),
-            (time.perf_counter() - start_step) * 1000.0,
+            self._observe("filter_history", start_step, persona_label, components),
         )
 
         start_step = time.perf_counter()
@@ -194,11 +394,11 @@ class Orchestrator:
             request.persona_id,
             len(filtered_retrieved.context or ""),
             len(filtered_retrieved.citations or []),
-            (time.perf_counter() - start_step) * 1000.0,
+            self._observe("filter_retrieved", start_step, persona_label, components),
         )
 
         start_step = time.perf_counter()
-        prompt = self.prompt_builder.build(
+        prompt = components.prompt_builder.build(
             persona_id=request.persona_id,
             query=normalized,
             context=filtered_retrieved.context,
@@ -209,16 +409,21 @@ class Orchestrator:
             "orchestrator.build_prompt persona_id={} prompt_chars={} ms={:.2f}",
             request.persona_id,
             len(prompt),
-            (time.perf_counter() - start_step) * 1000.0,
+            self._observe("build_prompt", start_step, persona_label, components),
         )
 
         start_step = time.perf_counter()
-        answer = self.router.dispatch(persona_id=request.persona_id, prompt=prompt)
+        tenant = request.tenant_id or request.session_id
+        with self.admission.slot(priority=request.priority, tenant=tenant):
+            start_dispatch = time.perf_counter()
+            answer = components.router.dispatch(persona_id=request.persona_id, prompt=prompt)
         logger.debug(
-            "orchestrator.dispatch persona_id={} answer_chars={} ms={:.2f}",
+            "orchestrator.dispatch persona_id={} priority={} answer_chars={} queue_ms={:.2f} ms={:.2f}",
             request.persona_id,
+            request.priority,
             len(answer or ""),
-            (time.perf_counter() - start_step) * 1000.0,
+            self._observe("queue", start_step, persona_label, components, ended=start_dispatch),
+            self._observe("llm", start_dispatch, persona_label, components),
         )
 
         start_step = time.perf_counter()
@@ -231,21 +436,99 @@ class Orchestrator:
             "orchestrator.memory_store persona_id={} session_id={} ms={:.2f}",
             request.persona_id,
             request.session_id,
-            (time.perf_counter() - start_step) * 1000.0,
+            self._observe("memory_store", start_step, persona_label, components),
         )
-        response = ChatResponse(
+        return ChatResponse(
             persona_id=request.persona_id,
             answer=answer,
             context=filtered_retrieved.context,
             citations=filtered_retrieved.citations,
         )
+
+    def handle_focus_group(self, request: FocusGroupRequest) -> Iterator[FocusGroupResult]:
+        """Ask one question to several personas, yielding each result as it completes.
+
+        Retrieval is batched: the persona query is embedded once for every persona
+        index and all segment-prefixed fact-data queries go through one batched
+        vector search. Generations are then dispatched concurrently; closing the
+        generator cancels those that have not started.
+        """
+
+        persona_ids = list(dict.fromkeys(request.persona_ids))
+        if not persona_ids:
+            return
+
+        start_total = time.perf_counter()
+        components = self.components()
+        normalized = self.input_handler.normalize(request.query)
+
+        start_step = time.perf_counter()
+        persona_contexts = components.retriever.retrieve_many(persona_ids, normalized, k=request.top_k)
+        logger.debug(
+            "orchestrator.focus_group.retrieve_persona personas={} k={} ms={:.2f}",
+            len(persona_ids),
+            request.top_k,
+            self._observe("focus_group.retrieve_persona", start_step, "_all", components),
+        )
+
+        fact_contexts: Dict[str, RetrievedContext] = {}
+        if components.fact_data_index is not None:
+            start_step = time.perf_counter()
+            fact_queries = [
+                self._build_fact_data_query(components, persona_id=persona_id, query=normalized)
+                for persona_id in persona_ids
+            ]
+            try:
+                fact_contexts = dict(
+                    zip(persona_ids, components.fact_data_index.retrieve_many(fact_queries, k=request.top_k))
+                )
+            except Exception as exc:  # pragma: no cover - defensive retrieval
+                logger.warning("Fact data retrieval failed: {}", exc)
+            logger.debug(
+                "orchestrator.focus_group.retrieve_fact_data personas={} k={} ms={:.2f}",
+                len(persona_ids),
+                request.top_k,
+                self._observe("focus_group.retrieve_fact_data", start_step, "_all", components),
+            )
+
+        max_workers = max(1, min(self.focus_group_max_workers, len(persona_ids)))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            future_map = {
+                executor.submit(
+                    self._respond,
+                    ChatRequest(
+                        persona_id=persona_id,
+                        query=request.query,
+                        session_id=request.session_id,
+                        top_k=request.top_k,
+                        priority=request.priority,
+                        tenant_id=request.tenant_id,
+                    ),
+                    components,
+                    normalized=normalized,
+                    persona_retrieved=persona_contexts.get(persona_id) or RetrievedContext(),
+                    fact_retrieved=fact_contexts.get(persona_id),
+                ): persona_id
+                for persona_id in persona_ids
+            }
+            for future in as_completed(future_map):
+                persona_id = future_map[future]
+                try:
+                    yield FocusGroupResult(persona_id=persona_id, response=future.result())
+                except Exception as exc:
+                    logger.warning("Focus group response failed for persona {}: {}", persona_id, exc)
+                    yield FocusGroupResult(persona_id=persona_id, error=str(exc))
+        finally:
+            # Closed early (e.g. the client disconnected): generations not started yet are
+            # dropped instead of spending LLM capacity on answers nobody reads.
+            executor.shutdown(wait=False, cancel_futures=True)
+
         logger.debug(
-            "orchestrator.total persona_id={} ms={:.2f}",
-            request.persona_id,
-            (time.perf_counter() - start_total) * 1000.0,
+            "orchestrator.focus_group.total personas={} ms={:.2f}",
+            len(persona_ids),
+            self._observe("focus_group.total", start_total, "_all", components),
         )
-        # self.cache.set(cache_key, response)
-        return response
 
     def handle_query(self, persona_id: str, query: str) -> str:
         """Backwards-compatible string-only entrypoint."""
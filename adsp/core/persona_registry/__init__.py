@@ -22,6 +22,9 @@ class PersonaRegistry:
         except KeyError as exc:  # pragma: no cover - defensive message
             raise KeyError(f"Persona '{persona_id}' is not registered") from exc
 
+    def has_persona(self, persona_id: str) -> bool:
+        return persona_id in self._personas
+
     def upsert(self, persona_id: str, metadata: Any) -> None:
         self._personas[persona_id] = metadata
 
@@ -29,5 +32,13 @@ class PersonaRegistry:
         for persona_id, metadata in personas:
             self.upsert(persona_id, metadata)
 
+    def remove(self, persona_id: str) -> None:
+        self._personas.pop(persona_id, None)
+
+    def copy(self) -> "PersonaRegistry":
+        """A registry with the same entries; changing it leaves this one untouched."""
+
+        return PersonaRegistry(_personas=dict(self._personas))
+
     def list_personas(self) -> List[str]:
         return sorted(self._personas.keys())
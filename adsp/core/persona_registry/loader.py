@@ -0,0 +1,123 @@
+"""Persona profile loading from `individual/*.json` and `common_traits/*.json`.
+
+- Files are read and validated on a thread pool (`workers`), so file I/O
+  overlaps instead of running one persona at a time.
+- JSON is parsed with `orjson` when it is installed (falls back to `json`).
+- `source_fingerprint` records the size/mtime of every source file so callers
+  (e.g. the hot reloader) can tell which profiles changed.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from adsp.data_pipeline.schema import PersonaProfileModel
+
+# Keys copied from a persona's `common_traits` file over its base profile.
+TRAIT_KEYS = (
+    "key_indicators",
+    "style_profile",
+    "value_frame",
+    "reasoning_policies",
+    "content_filters",
+    "lora_adapter",
+    "lora_adapter_path",
+)
+
+try:  # optional fast parser
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency guard
+    _orjson = None
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def default_workers() -> int:
+    raw = os.environ.get("ADSP_PERSONA_LOAD_WORKERS", "").strip()
+    try:
+        return max(1, int(raw)) if raw else min(8, os.cpu_count() or 1)
+    except ValueError:
+        return 1
+
+
+def load_persona_file(path: Path, *, traits_dir: Optional[Path] = None) -> Optional[PersonaProfileModel]:
+    """One validated profile from `path` merged with its traits file; None if it is not a profile."""
+
+    base_payload = loads_json(Path(path).read_bytes())
+    if not isinstance(base_payload, dict):
+        return None
+
+    persona_id = base_payload.get("persona_id") or Path(path).stem
+    base_payload["persona_id"] = persona_id
+
+    if traits_dir:
+        traits_path = traits_dir / f"{persona_id}.json"
+        if traits_path.exists():
+            traits_payload = loads_json(traits_path.read_bytes())
+            if isinstance(traits_payload, dict):
+                for key in TRAIT_KEYS:
+                    if key in traits_payload:
+                        base_payload[key] = traits_payload[key]
+
+    return PersonaProfileModel(**base_payload)
+
+
+def _load_or_warn(path: Path, traits_dir: Optional[Path]) -> Optional[PersonaProfileModel]:
+    try:
+        return load_persona_file(path, traits_dir=traits_dir)
+    except Exception as exc:
+        logger.warning(f"Failed to load persona profile {path}: {exc}")
+        return None
+
+
+def load_persona_files(
+    paths: List[Path],
+    *,
+    traits_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> List[PersonaProfileModel]:
+    """Load `paths` (in order) on up to `workers` threads, skipping unreadable files."""
+
+    workers = min(workers or default_workers(), len(paths))
+    if workers <= 1:
+        results = [_load_or_warn(path, traits_dir) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="adsp-personas") as pool:
+            results = list(pool.map(lambda path: _load_or_warn(path, traits_dir), paths))
+    return [persona for persona in results if persona is not None]
+
+
+def source_fingerprint(individual_dir: Path, traits_dir: Optional[Path] = None) -> Dict[str, Tuple[int, int]]:
+    """`{"individual/<name>": (size, mtime_ns), "traits/<name>": ...}` for every source JSON file."""
+
+    fingerprint: Dict[str, Tuple[int, int]] = {}
+    for prefix, directory in (("individual", individual_dir), ("traits", traits_dir)):
+        if directory is None or not directory.exists():
+            continue
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    fingerprint[f"{prefix}/{entry.name}"] = (stat.st_size, stat.st_mtime_ns)
+    return dict(sorted(fingerprint.items()))
+
+
+__all__ = [
+    "TRAIT_KEYS",
+    "load_persona_file",
+    "load_persona_files",
+    "loads_json",
+    "source_fingerprint",
+]
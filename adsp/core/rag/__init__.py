@@ -3,13 +3,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 
-from adsp.core.rag.fact_data_index import FactDataRAGIndex, build_fact_data_index_from_markdown
-from adsp.core.rag.persona_index import PersonaRAGIndex
 from adsp.core.types import RetrievedContext
 from adsp.storage.vector_db import VectorDatabase
 
+if TYPE_CHECKING:  # pragma: no cover
+    from adsp.core.rag.fact_data_index import FactDataRAGIndex, build_fact_data_index_from_markdown
+    from adsp.core.rag.persona_index import PersonaRAGIndex
+
+# The index modules pull in LangChain and the embedding stack; import them on first use.
+_LAZY_ATTRS = {
+    "FactDataRAGIndex": "adsp.core.rag.fact_data_index",
+    "build_fact_data_index_from_markdown": "adsp.core.rag.fact_data_index",
+    "PersonaRAGIndex": "adsp.core.rag.persona_index",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 @dataclass
 class RAGPipeline:
@@ -21,7 +40,7 @@ class RAGPipeline:
     """
 
     vector_db: VectorDatabase = field(default_factory=VectorDatabase)
-    persona_index: Optional[PersonaRAGIndex] = None
+    persona_index: Optional["PersonaRAGIndex"] = None
 
     def retrieve(self, persona_id: str, query: str, *, k: int = 5) -> str:
         return self.retrieve_with_metadata(persona_id=persona_id, query=query, k=k).context
@@ -31,6 +50,21 @@ class RAGPipeline:
             return self.persona_index.retrieve(persona_id, query, k=k)
         return RetrievedContext(context=self.vector_db.search(persona_id=persona_id, query=query))
 
+    def retrieve_many(
+        self, persona_ids: Sequence[str], query: str, *, k: int = 5
+    ) -> Dict[str, RetrievedContext]:
+        """Retrieve context for several personas sharing one query embedding."""
+
+        results: Dict[str, RetrievedContext] = {}
+        if self.persona_index:
+            results.update(self.persona_index.retrieve_many(persona_ids, query, k=k))
+        for persona_id in persona_ids:
+            if persona_id not in results:
+                results[persona_id] = RetrievedContext(
+                    context=self.vector_db.search(persona_id=persona_id, query=query)
+                )
+        return results
+
 
 __all__ = [
     "RAGPipeline",
@@ -2,48 +2,168 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional, Sequence
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
-from langchain_huggingface import HuggingFaceEmbeddings
+from loguru import logger
 
 from adsp.core.types import Citation, RetrievedContext
+from adsp.data_pipeline.embedding_utils import (
+    get_embedding_dimension,
+    get_embedding_model_name,
+    get_embedding_tokenizer,
+)
 from adsp.data_pipeline.fact_data_pipeline.rag.indicator import (
     FactDataRAG,
     documents_to_context_prompt,
+    markdown_source_fingerprint,
+)
+from adsp.data_pipeline.vector_quantization import (
+    index_vectors,
+    is_quantized,
+    load_snapshot,
+    quantization_from_env,
+    read_snapshot_manifest,
 )
 
 DEFAULT_EMBEDDING_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value >= 0 else default
+    except Exception:
+        return default
+
+
 def _default_embeddings() -> Embeddings:
+    from langchain_huggingface import HuggingFaceEmbeddings
+
     return HuggingFaceEmbeddings(model_name=DEFAULT_EMBEDDING_MODEL_NAME)
 
 
 @dataclass
 class FactDataRAGIndex:
-    """In-memory similarity search over fact-data markdown chunks."""
+    """In-memory similarity search over fact-data markdown chunks.
+
+    `ADSP_FACTDATA_CHUNK_MAX_TOKENS` > 0 chunks with the embedding model's
+    tokenizer to that token budget instead of by characters (default: `0`).
+    `ADSP_RAG_QUANTIZATION` (`none` | `fp16` | `sq8`) and `ADSP_RAG_RESCORE_FACTOR`
+    select the vector storage applied by `quantize()` (default: `none`, `0`).
+    """
 
     embeddings: Embeddings = field(default_factory=_default_embeddings)
+    chunk_max_tokens: int = field(default_factory=lambda: _env_int("ADSP_FACTDATA_CHUNK_MAX_TOKENS", 0))
+    quantization: str = field(default_factory=quantization_from_env)
+    rescore_factor: int = field(default_factory=lambda: _env_int("ADSP_RAG_RESCORE_FACTOR", 0))
     rag: FactDataRAG = field(init=False)
     indexed_chunk_ids: List[str] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        self.rag = FactDataRAG(self.embeddings)
+        tokenizer = None
+        if self.chunk_max_tokens > 0:
+            tokenizer, _max_seq_length = get_embedding_tokenizer(self.embeddings)
+            if tokenizer is None:
+                logger.warning("Embedding model has no known tokenizer; chunking fact data by characters")
+        if tokenizer is not None:
+            self.rag = FactDataRAG(
+                self.embeddings, chunk_tokenizer=tokenizer, chunk_max_tokens=self.chunk_max_tokens
+            )
+        else:
+            self.rag = FactDataRAG(self.embeddings)
 
     def index_markdown_directory(self, directory: Path, *, pattern: str = "page_*.md") -> int:
         chunk_ids = self.rag.index_markdown_directory(Path(directory), pattern=pattern)
         self.indexed_chunk_ids.extend(chunk_ids)
         return len(chunk_ids)
 
+    def quantize(self) -> bool:
+        """Store the indexed vectors as `self.quantization` (no-op for `none`)."""
+
+        return self.rag.quantize(self.quantization, rescore_factor=self.rescore_factor)
+
+    def save_snapshot(self, directory: Path, **manifest: Any) -> Path:
+        return self.rag.save_snapshot(directory, **manifest)
+
+    @classmethod
+    def from_snapshot(cls, directory: Path, *, embeddings: Optional[Embeddings] = None) -> "FactDataRAGIndex":
+        """Load an index written by `save_snapshot`, stored as `ADSP_RAG_QUANTIZATION`."""
+
+        index = cls(embeddings=embeddings or _default_embeddings())
+        index.rag.vectorstore = load_snapshot(
+            directory,
+            index.embeddings,
+            quantization=index.quantization,
+            rescore_factor=index.rescore_factor,
+        )
+        index.indexed_chunk_ids = list(index.rag.vectorstore.index_to_docstore_id.values())  # type: ignore[attr-defined]
+        return index
+
+    def with_files(
+        self,
+        directory: Path,
+        *,
+        changed: Iterable[str] = (),
+        removed: Iterable[str] = (),
+    ) -> "FactDataRAGIndex":
+        """A copy with the chunks of `changed` files re-indexed and those of `removed` files dropped.
+
+        File names match the chunks' `source_file` metadata. Other chunks keep their
+        vectors (decoded from the stored index, not re-embedded); `self` is left
+        untouched so requests already holding it keep searching a consistent index.
+        """
+
+        changed = set(changed)
+        stale = changed | set(removed)
+        old = self.rag.vectorstore
+        ids = [old.index_to_docstore_id[i] for i in range(old.index.ntotal)]  # type: ignore[attr-defined]
+        docs = [old.docstore.search(doc_id) for doc_id in ids]  # type: ignore[attr-defined]
+        keep = [
+            i
+            for i, doc in enumerate(docs)
+            if isinstance(doc, Document) and (doc.metadata or {}).get("source_file") not in stale
+        ]
+
+        index = replace(self, indexed_chunk_ids=[])
+        index.rag.indexer = self.rag.indexer
+        if keep:
+            vectors = index_vectors(old.index)  # type: ignore[attr-defined]
+            index.rag.vectorstore.add_embeddings(  # type: ignore[attr-defined]
+                [(docs[i].page_content, vectors[i].tolist()) for i in keep],
+                metadatas=[docs[i].metadata for i in keep],
+                ids=[ids[i] for i in keep],
+            )
+            index.indexed_chunk_ids = [ids[i] for i in keep]
+        for name in sorted(changed):
+            index.indexed_chunk_ids.extend(index.rag.index_markdown_file(Path(directory) / name))
+        if is_quantized(old.index):  # type: ignore[attr-defined]
+            index.quantize()
+        logger.info(
+            f"Fact data index updated: {len(ids) - len(keep)} chunks dropped, "
+            f"{len(index.indexed_chunk_ids) - len(keep)} added from {len(changed)} files"
+        )
+        return index
+
     def search(self, query: str, *, k: int = 10) -> List[Document]:
         return self.rag.search(query, k=k)
 
     def retrieve(self, query: str, *, k: int = 10) -> RetrievedContext:
-        docs = self.search(query, k=k)
+        return self._context_from_docs(self.search(query, k=k))
+
+    def retrieve_many(self, queries: Sequence[str], *, k: int = 10) -> List[RetrievedContext]:
+        """Retrieve context for several queries in one batched vector search (same results as `retrieve`)."""
+
+        return [self._context_from_docs(docs) for docs in self.rag.search_many(queries, k=k)]
+
+    def _context_from_docs(self, docs: List[Document]) -> RetrievedContext:
         if not docs:
             return RetrievedContext(context="", citations=[], raw={"documents": []})
 
@@ -100,14 +220,44 @@ def build_fact_data_index_from_markdown(
     *,
     embeddings: Optional[Embeddings] = None,
     pattern: str = "page_*.md",
+    snapshot_dir: Optional[Path] = None,
 ) -> Optional[FactDataRAGIndex]:
-    """Create and populate a fact-data index from a markdown directory."""
+    """Create and populate a fact-data index from a markdown directory.
+
+    With `snapshot_dir`, a snapshot taken from the same markdown files with the same
+    chunking and embedding model (name and dimension) is loaded instead of re-embedding
+    them, whether the runtime or `run_fact_data_indexing_pipeline` wrote it; otherwise
+    the new index is snapshotted there.
+    """
 
     if not _safe_dir_has_files(markdown_dir, pattern=pattern):
         return None
 
-    index = FactDataRAGIndex(embeddings=embeddings or _default_embeddings())
+    embeddings = embeddings or _default_embeddings()
+    source = markdown_source_fingerprint(markdown_dir, pattern=pattern)
+    embedding_model = get_embedding_model_name(embeddings)
+    index = FactDataRAGIndex(embeddings=embeddings)
+    if snapshot_dir is not None:
+        manifest = read_snapshot_manifest(snapshot_dir)
+        expected = {
+            "source": source,
+            **index.rag.chunking_settings(),
+            "embedding_model": embedding_model,
+            "dim": get_embedding_dimension(embeddings),
+        }
+        if manifest and all(manifest.get(key) == value for key, value in expected.items()):
+            try:
+                index = FactDataRAGIndex.from_snapshot(snapshot_dir, embeddings=embeddings)
+                logger.info(f"Loaded fact data index snapshot from {snapshot_dir}")
+                return index
+            except Exception as exc:
+                logger.warning(f"Ignoring fact data index snapshot {snapshot_dir}: {exc}")
+
     index.index_markdown_directory(markdown_dir, pattern=pattern)
+    if snapshot_dir is not None:
+        # Snapshot the exact vectors; quantizing first would store decoded approximations.
+        index.save_snapshot(snapshot_dir, source=source, embedding_model=embedding_model)
+    index.quantize()
     return index
 
 
@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import math
 import hashlib
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+import os
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
-from langchain_huggingface import HuggingFaceEmbeddings
 
 from adsp.core.types import Citation, RetrievedContext
+from adsp.data_pipeline.indexing_embedder import IndexingEmbedder
+from adsp.data_pipeline.vector_quantization import quantization_from_env, quantize_vectorstore
 from adsp.data_pipeline.persona_data_pipeline.rag.indicator import (
     PersonaIndicatorRAG,
     documents_to_context_prompt,
@@ -21,7 +23,20 @@ from adsp.data_pipeline.schema import PersonaProfileModel
 DEFAULT_EMBEDDING_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value >= 0 else default
+    except Exception:
+        return default
+
+
 def _default_embeddings() -> Embeddings:
+    from langchain_huggingface import HuggingFaceEmbeddings
+
     return HuggingFaceEmbeddings(model_name=DEFAULT_EMBEDDING_MODEL_NAME)
 
 
@@ -64,18 +79,58 @@ class HashEmbeddings(Embeddings):
 
 @dataclass
 class PersonaRAGIndex:
-    """Builds and queries per-persona indicator vector stores."""
+    """Builds and queries per-persona indicator vector stores.
+
+    `ADSP_RAG_QUANTIZATION` (`none` | `fp16` | `sq8`) and `ADSP_RAG_RESCORE_FACTOR`
+    select how each persona's vectors are stored once indexed (default: `none`, `0`).
+    """
 
     embeddings: Embeddings = field(default_factory=_default_embeddings)
+    indexer: Optional[IndexingEmbedder] = None
+    quantization: str = field(default_factory=quantization_from_env)
+    rescore_factor: int = field(default_factory=lambda: _env_int("ADSP_RAG_RESCORE_FACTOR", 0))
     _indexes: Dict[str, PersonaIndicatorRAG] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if self.indexer is None:
+            self.indexer = IndexingEmbedder(self.embeddings)
+
     def index_personas(self, personas: Iterable[PersonaProfileModel]) -> None:
+        """Index each persona into its own store, embedding all indicators in one batched pass."""
+
+        prepared = []
+        texts: List[str] = []
         for persona in personas:
             if not persona.persona_id:
                 continue
-            rag = PersonaIndicatorRAG(self.embeddings)
-            rag.index_persona(persona)
-            self._indexes[persona.persona_id] = rag
+            rag = PersonaIndicatorRAG(self.embeddings, indexer=self.indexer)
+            persona_texts, metadatas = rag.indicator_payloads(persona)
+            prepared.append((persona.persona_id, rag, persona_texts, metadatas))
+            texts.extend(persona_texts)
+
+        with self.indexer.multi_process():
+            vectors = self.indexer.embed_documents(texts)
+        offset = 0
+        for persona_id, rag, persona_texts, metadatas in prepared:
+            rag.add_embedded(persona_texts, vectors[offset : offset + len(persona_texts)], metadatas)
+            offset += len(persona_texts)
+            quantize_vectorstore(rag.vectorstore, self.quantization, rescore_factor=self.rescore_factor)
+            self._indexes[persona_id] = rag
+        if texts:
+            self.indexer.log_throughput("Persona indexing")
+
+    def with_personas(
+        self, personas: Iterable[PersonaProfileModel] = (), *, removed: Iterable[str] = ()
+    ) -> "PersonaRAGIndex":
+        """A copy with `personas` (re-)indexed and `removed` dropped; `self` is left untouched.
+
+        Unchanged personas share their stores with `self`, so only the changed ones are embedded.
+        """
+
+        dropped = set(removed)
+        index = replace(self, _indexes={pid: rag for pid, rag in self._indexes.items() if pid not in dropped})
+        index.index_personas(personas)
+        return index
 
     def has_persona(self, persona_id: str) -> bool:
         return persona_id in self._indexes
@@ -87,7 +142,23 @@ class PersonaRAGIndex:
         return rag.search(query, k=k)
 
     def retrieve(self, persona_id: str, query: str, *, k: int = 5) -> RetrievedContext:
-        docs = self.search(persona_id, query, k=k)
+        return self._context_from_docs(self.search(persona_id, query, k=k))
+
+    def retrieve_many(
+        self, persona_ids: Sequence[str], query: str, *, k: int = 5
+    ) -> Dict[str, RetrievedContext]:
+        """Retrieve context for several personas, embedding the query only once."""
+
+        indexed = [pid for pid in persona_ids if pid in self._indexes]
+        if not indexed:
+            return {}
+        embedding = self.embeddings.embed_query(query)
+        return {
+            pid: self._context_from_docs(self._indexes[pid].search_by_vector(embedding, k=k))
+            for pid in indexed
+        }
+
+    def _context_from_docs(self, docs: List[Document]) -> RetrievedContext:
         context = documents_to_context_prompt(docs) if docs else ""
         citations = [self._citation_from_doc(doc) for doc in docs]
         citations = [c for c in citations if c is not None]
@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
-import json
+from dataclasses import dataclass, field
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from adsp.config import PROCESSED_DATA_DIR
+from adsp.core.ai_persona_router import PersonaRouter, resolve_persona_adapters
 from adsp.core.orchestrator import Orchestrator
 from adsp.core.persona_registry import PersonaRegistry
+from adsp.core.persona_registry.loader import load_persona_files
 from adsp.core.prompt_builder import PromptBuilder
 from adsp.core.rag import RAGPipeline
-from adsp.core.rag.fact_data_index import FactDataRAGIndex, build_fact_data_index_from_markdown
-from adsp.core.rag.persona_index import PersonaRAGIndex
 from adsp.data_pipeline.schema import PersonaProfileModel
 
+if TYPE_CHECKING:  # pragma: no cover
+    from adsp.core.rag.fact_data_index import FactDataRAGIndex
+
 
 def resolve_persona_paths(
     processed_dir: Path = PROCESSED_DATA_DIR,
@@ -43,44 +48,22 @@ def load_personas_from_disk(
     individual_dir: Path,
     *,
     traits_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
 ) -> List[PersonaProfileModel]:
-    """Load persona profiles and optional reasoning traits from disk."""
+    """Load persona profiles and optional reasoning traits from disk.
+
+    Files are loaded on `workers` threads (default `ADSP_PERSONA_LOAD_WORKERS`).
+    """
 
-    personas: List[PersonaProfileModel] = []
     traits_dir = traits_dir if traits_dir and traits_dir.exists() else None
 
     if not individual_dir.exists():
         logger.warning(f"Persona directory does not exist: {individual_dir}")
-        return personas
-
-    for path in sorted(individual_dir.glob("*.json")):
-        try:
-            base_payload = json.loads(path.read_text(encoding="utf-8"))
-            if not isinstance(base_payload, dict):
-                continue
-
-            persona_id = base_payload.get("persona_id") or path.stem
-            base_payload["persona_id"] = persona_id
-
-            if traits_dir:
-                traits_path = traits_dir / f"{persona_id}.json"
-                if traits_path.exists():
-                    traits_payload = json.loads(traits_path.read_text(encoding="utf-8"))
-                    if isinstance(traits_payload, dict):
-                        for key in (
-                            "key_indicators",
-                            "style_profile",
-                            "value_frame",
-                            "reasoning_policies",
-                            "content_filters",
-                        ):
-                            if key in traits_payload:
-                                base_payload[key] = traits_payload[key]
-
-            personas.append(PersonaProfileModel(**base_payload))
-        except Exception as exc:
-            logger.warning(f"Failed to load persona profile {path}: {exc}")
+        return []
 
+    started = time.perf_counter()
+    personas = load_persona_files(sorted(individual_dir.glob("*.json")), traits_dir=traits_dir, workers=workers)
+    logger.info(f"Loaded {len(personas)} persona profiles in {time.perf_counter() - started:.2f}s")
     return personas
 
 
@@ -92,6 +75,19 @@ def build_registry(personas: List[PersonaProfileModel]) -> PersonaRegistry:
     return registry
 
 
+def build_router(personas: List[PersonaProfileModel]) -> PersonaRouter:
+    """Create the persona router and preload any per-persona LoRA adapters."""
+
+    persona_adapters, adapter_paths = resolve_persona_adapters(personas)
+    router = PersonaRouter(adapters=persona_adapters)
+    if persona_adapters:
+        try:
+            router.preload_adapters(adapter_paths)
+        except Exception as exc:  # pragma: no cover - external server
+            logger.warning(f"LoRA adapter preload failed: {exc}")
+    return router
+
+
 def _env_flag(name: str, default: bool) -> bool:
     raw = os.environ.get(name)
     if raw is None:
@@ -99,12 +95,26 @@ def _env_flag(name: str, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def resolve_fact_markdown_dir(processed_dir: Path = PROCESSED_DATA_DIR) -> Tuple[Path, str]:
+    """Return (markdown_dir, glob pattern) of the fact-data pages based on defaults + env overrides."""
+
+    markdown_dir = Path(
+        os.environ.get(
+            "ADSP_FACTDATA_MARKDOWN_DIR",
+            str(processed_dir / "fact_data" / "pages"),
+        )
+    )
+    return markdown_dir, os.environ.get("ADSP_FACTDATA_MARKDOWN_PATTERN", "page_*.md")
+
+
 def build_fact_data_index(*, processed_dir: Path = PROCESSED_DATA_DIR) -> Optional[FactDataRAGIndex]:
     """Build the FactData RAG index at startup (optional)."""
 
     if not _env_flag("ADSP_FACTDATA_RAG_ENABLED", True):
         return None
 
+    from adsp.core.rag.fact_data_index import build_fact_data_index_from_markdown
+
     try:
         from adsp.data_pipeline.fact_data_pipeline.extract_raw.config import FactDataExtractionConfig
     except Exception as exc:  # pragma: no cover - optional dependency guard
@@ -114,15 +124,13 @@ def build_fact_data_index(*, processed_dir: Path = PROCESSED_DATA_DIR) -> Option
     cfg = FactDataExtractionConfig()
     cfg.fact_data_output_dir = processed_dir / "fact_data"
 
-    markdown_dir = Path(
-        os.environ.get(
-            "ADSP_FACTDATA_MARKDOWN_DIR",
-            str(cfg.fact_data_output_dir / "pages"),
-        )
-    )
-    markdown_pattern = os.environ.get("ADSP_FACTDATA_MARKDOWN_PATTERN", "page_*.md")
+    markdown_dir, markdown_pattern = resolve_fact_markdown_dir(processed_dir)
+    snapshot_raw = os.environ.get("ADSP_FACTDATA_SNAPSHOT_DIR", "").strip()
+    snapshot_dir = Path(snapshot_raw) if snapshot_raw else None
 
-    index = build_fact_data_index_from_markdown(markdown_dir, pattern=markdown_pattern)
+    index = build_fact_data_index_from_markdown(
+        markdown_dir, pattern=markdown_pattern, snapshot_dir=snapshot_dir
+    )
     if index is not None:
         logger.info(f"Fact data RAG ready ({len(index.indexed_chunk_ids)} chunks)")
         return index
@@ -151,12 +159,134 @@ def build_fact_data_index(*, processed_dir: Path = PROCESSED_DATA_DIR) -> Option
         logger.warning(f"Fact data extraction pipeline failed: {exc}")
         return None
 
-    index = build_fact_data_index_from_markdown(markdown_dir, pattern=markdown_pattern)
+    index = build_fact_data_index_from_markdown(
+        markdown_dir, pattern=markdown_pattern, snapshot_dir=snapshot_dir
+    )
     if index is not None:
         logger.info(f"Fact data RAG ready ({len(index.indexed_chunk_ids)} chunks)")
     return index
 
 
+# Component states reported by `RuntimeWarmup.status()`.
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+WARMUP_COMPONENTS = ("personas", "persona_index", "fact_index")
+
+
+@dataclass
+class ComponentStatus:
+    state: str = PENDING
+    detail: Optional[str] = None
+    seconds: Optional[float] = None
+
+
+@dataclass
+class RuntimeWarmup:
+    """Builds the orchestrator's components in order, optionally on a background thread.
+
+    `orchestrator` exists from the start with an empty registry and no indexes;
+    each component is swapped in as soon as it is built:
+    1. `personas`: profiles, registry and router (LoRA adapter preload)
+    2. `persona_index`: the persona indicator RAG index
+    3. `fact_index`: the fact-data RAG index (`skipped` when disabled or absent)
+    """
+
+    processed_dir: Path = PROCESSED_DATA_DIR
+    orchestrator: Orchestrator = field(default_factory=Orchestrator)
+    components: Dict[str, ComponentStatus] = field(
+        default_factory=lambda: {name: ComponentStatus() for name in WARMUP_COMPONENTS}
+    )
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, repr=False)
+
+    def start(self) -> "RuntimeWarmup":
+        """Run the warm-up on a daemon thread and return immediately."""
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="adsp-warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def run(self, *, strict: bool = False) -> Orchestrator:
+        """Build every component in the calling thread; `strict` re-raises the first failure."""
+
+        try:
+            personas = self._step("personas", self._load_personas, strict)
+            self._step("persona_index", lambda: self._build_persona_index(personas or []), strict)
+            self._step("fact_index", self._build_fact_index, strict)
+        finally:
+            self._done.set()
+        return self.orchestrator
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def is_ready(self, *names: str) -> bool:
+        """True once the named components (default: all) are ready or skipped."""
+
+        return all(self.components[name].state in (READY, SKIPPED) for name in names or WARMUP_COMPONENTS)
+
+    def pending(self) -> List[str]:
+        """Components not (yet) serving: pending, loading or failed."""
+
+        return [name for name in WARMUP_COMPONENTS if not self.is_ready(name)]
+
+    def status(self) -> Dict[str, Dict[str, object]]:
+        return {
+            name: {"state": c.state, "detail": c.detail, "seconds": c.seconds}
+            for name, c in self.components.items()
+        }
+
+    def _step(self, name: str, build: Callable[[], Any], strict: bool) -> Any:
+        component = self.components[name]
+        component.state = LOADING
+        started = time.perf_counter()
+        try:
+            result = build()
+        except Exception as exc:
+            component.state, component.detail = FAILED, str(exc)
+            component.seconds = round(time.perf_counter() - started, 3)
+            if strict:
+                raise
+            logger.exception(f"Warm-up of {name} failed")
+            return None
+        else:
+            if component.state == LOADING:
+                component.state = READY
+        component.seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Warm-up {name}: {component.state} in {component.seconds:.2f}s")
+        return result
+
+    def _load_personas(self) -> List[PersonaProfileModel]:
+        individual_dir, traits_dir = resolve_persona_paths(self.processed_dir)
+        personas = load_personas_from_disk(individual_dir, traits_dir=traits_dir)
+        # Router and registry are swapped together so no request reaches a persona without its adapter routing.
+        self.orchestrator.swap(
+            router=build_router(personas), prompt_builder=PromptBuilder(registry=build_registry(personas))
+        )
+        self.components["personas"].detail = f"{len(personas)} personas"
+        return personas
+
+    def _build_persona_index(self, personas: List[PersonaProfileModel]) -> None:
+        from adsp.core.rag.persona_index import PersonaRAGIndex
+
+        persona_index = PersonaRAGIndex()
+        persona_index.index_personas(personas)
+        self.orchestrator.swap(retriever=RAGPipeline(persona_index=persona_index))
+
+    def _build_fact_index(self) -> None:
+        index = build_fact_data_index(processed_dir=self.processed_dir)
+        if index is None:
+            self.components["fact_index"].state = SKIPPED
+            return
+        self.orchestrator.swap(fact_data_index=index)
+        self.components["fact_index"].detail = f"{len(index.indexed_chunk_ids)} chunks"
+
+
 def build_default_orchestrator(
     *,
     processed_dir: Path = PROCESSED_DATA_DIR,
@@ -166,31 +296,23 @@ def build_default_orchestrator(
     - Loads persona profiles from `data/processed/personas/individual`
     - Loads reasoning traits from `data/processed/personas/common_traits` when present
     - Builds an in-memory RAG index over persona indicators
-    """
-
-    individual_dir, traits_dir = resolve_persona_paths(processed_dir)
-    personas = load_personas_from_disk(individual_dir, traits_dir=traits_dir)
-
-    registry = build_registry(personas)
-    prompt_builder = PromptBuilder(registry=registry)
+    - Routes personas with a `lora_adapter` to that adapter (preloaded on the backend)
 
-    persona_index = PersonaRAGIndex()
-    persona_index.index_personas(personas)
-    retriever = RAGPipeline(persona_index=persona_index)
-
-    fact_data_index = build_fact_data_index(processed_dir=processed_dir)
+    The components are built synchronously; use `RuntimeWarmup(...).start()` to
+    build them in the background instead.
+    """
 
-    return Orchestrator(
-        prompt_builder=prompt_builder,
-        retriever=retriever,
-        fact_data_index=fact_data_index,
-    )
+    return RuntimeWarmup(processed_dir=processed_dir).run(strict=True)
 
 
 __all__ = [
     "resolve_persona_paths",
     "load_personas_from_disk",
+    "resolve_fact_markdown_dir",
     "build_registry",
+    "build_router",
     "build_fact_data_index",
     "build_default_orchestrator",
+    "ComponentStatus",
+    "RuntimeWarmup",
 ]
@@ -29,6 +29,11 @@ class ChatRequest(BaseModel):
     top_k: int = 5
     use_tools: bool = False
 
+    # Admission control: interactive chat is served ahead of batch work, and
+    # queued calls are interleaved round-robin across tenants.
+    priority: Literal["interactive", "batch"] = "interactive"
+    tenant_id: Optional[str] = None
+
 
 class Citation(BaseModel):
     """Traceability data pointing back to source evidence."""
@@ -71,6 +76,27 @@ class ChatResponse(BaseModel):
     tool_calls: List[ToolCall] = Field(default_factory=list)
 
 
+class FocusGroupRequest(BaseModel):
+    """Input contract for one question asked to several personas at once."""
+
+    persona_ids: List[str] = Field(min_length=1)
+    query: str
+
+    session_id: Optional[str] = None
+    top_k: int = 5
+
+    priority: Literal["interactive", "batch"] = "interactive"
+    tenant_id: Optional[str] = None
+
+
+class FocusGroupResult(BaseModel):
+    """One persona's outcome within a focus group run."""
+
+    persona_id: str
+    response: Optional[ChatResponse] = None
+    error: Optional[str] = None
+
+
 __all__ = [
     "Attachment",
     "ChatRequest",
@@ -78,5 +104,7 @@ __all__ = [
     "RetrievedContext",
     "ToolCall",
     "ChatResponse",
+    "FocusGroupRequest",
+    "FocusGroupResult",
 ]
 
@@ -1,7 +1,30 @@
 """Pipelines that turn PDFs/images/data into structured persona knowledge."""
 
-from .ingestion import DocumentIngestionPipeline
-from .schema import PersonaProfile, PersonaProfileModel
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .ingestion import DocumentIngestionPipeline
+    from .schema import PersonaProfile, PersonaProfileModel
+
+# Submodules are imported on first attribute access so importing the package stays cheap.
+_LAZY_ATTRS = {
+    "DocumentIngestionPipeline": ".ingestion",
+    "PersonaProfile": ".schema",
+    "PersonaProfileModel": ".schema",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DocumentIngestionPipeline",
@@ -0,0 +1,137 @@
+"""Shared asyncio building blocks for the page extractors.
+
+Used by both `VLLMOpenAIExtractor` implementations when
+`async_extraction` is enabled:
+
+- `AIMDLimiter`: adaptive concurrency. The number of in-flight requests grows
+  by one per window of successful, on-target requests and is halved on
+  overload signals (HTTP 429/5xx, timeouts, latency above target).
+- `TokenRateBudget`: a token bucket capping the token rate sent to the server.
+- `backoff_delay`: jittered exponential backoff, slept outside the limiter so a
+  retrying page does not hold a concurrency slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import random
+import time
+from typing import AsyncIterator, Optional
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """True for errors signalling server overload (429, 5xx, timeouts)."""
+
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    name = type(exc).__name__
+    return name in {"APITimeoutError", "RateLimitError", "TimeoutError", "APIConnectionError"}
+
+
+def backoff_delay(attempt: int, *, base_seconds: float, max_seconds: float) -> float:
+    """Full-jitter exponential backoff for the given 1-based attempt."""
+
+    ceiling = min(max_seconds, base_seconds * (2 ** max(0, attempt - 1)))
+    return random.uniform(0.0, max(0.0, ceiling))
+
+
+@dataclass
+class AIMDLimiter:
+    """Additive-increase / multiplicative-decrease concurrency limiter."""
+
+    initial: int = 1
+    minimum: int = 1
+    maximum: int = 16
+    latency_target_s: float = 120.0
+    decrease_factor: float = 0.5
+    decrease_cooldown_s: float = 2.0
+
+    limit: float = field(init=False)
+    in_flight: int = field(init=False, default=0)
+    _cond: asyncio.Condition = field(init=False)
+    _last_decrease: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.minimum = max(1, self.minimum)
+        self.maximum = max(self.minimum, self.maximum)
+        self.limit = float(min(self.maximum, max(self.minimum, self.initial)))
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    def on_success(self, latency_s: float) -> None:
+        if latency_s > self.latency_target_s:
+            self.on_overload()
+            return
+        # +1 slot per `limit` successful requests (one full window).
+        self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+
+    def on_overload(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown_s:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+
+
+@dataclass
+class TokenRateBudget:
+    """Token bucket limiting tokens per minute (`0` disables the budget)."""
+
+    tokens_per_minute: int = 0
+
+    _tokens: float = field(init=False)
+    _updated: float = field(init=False)
+    _lock: asyncio.Lock = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._tokens = float(max(0, self.tokens_per_minute))
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.tokens_per_minute > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.tokens_per_minute / 60.0
+        self._tokens = min(float(self.tokens_per_minute), self._tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until `tokens` (capped at the bucket size) can be spent."""
+
+        if not self.enabled:
+            return
+        needed = float(min(max(0, tokens), self.tokens_per_minute))
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= needed:
+                    self._tokens -= needed
+                    return
+                await asyncio.sleep((needed - self._tokens) / (self.tokens_per_minute / 60.0))
+
+    def settle(self, estimated: int, actual: Optional[int]) -> None:
+        """Correct the bucket once the real token usage of a request is known."""
+
+        if not self.enabled or actual is None:
+            return
+        self._refill()
+        self._tokens -= float(actual - min(estimated, self.tokens_per_minute))
@@ -0,0 +1,252 @@
+"""Columnar docstore for the RAG vector stores.
+
+`InMemoryDocstore` keeps one LangChain `Document` per chunk, each with its own
+metadata dict; for large corpora those objects cost far more memory than the
+vectors. `ColumnarDocstore` stores the same data as columns:
+
+- text: one contiguous UTF-8 blob plus an offsets array (row i is
+  `blob[offsets[i]:offsets[i + 1]]`); a saved store is memory-mapped on load;
+- metadata: one dictionary-encoded column per key (an int32 code per row, -1
+  when the key is absent), so repeated values such as `source_file`, headers
+  or `sources` lists are stored once.
+
+`Document` objects are built only when `search` is called, i.e. for the top-k
+hits of a similarity search. Metadata values round-trip through JSON (tuples
+come back as lists).
+"""
+
+from __future__ import annotations
+
+from array import array
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from langchain_core.documents import Document
+
+from adsp.data_pipeline.run_journal import atomic_write_json
+
+try:
+    from langchain_community.docstore.base import AddableMixin, Docstore
+except ImportError:  # pragma: no cover - optional dependency guard
+
+    class Docstore:  # type: ignore[no-redef]
+        pass
+
+    class AddableMixin:  # type: ignore[no-redef]
+        pass
+
+
+_MISSING = -1
+_ABSENT = object()
+
+
+class _MetadataColumn:
+    """Dictionary-encoded values of one metadata key."""
+
+    __slots__ = ("codes", "values", "lookup")
+
+    def __init__(self, rows: int = 0) -> None:
+        self.codes = array("i", [_MISSING]) * rows
+        self.values: List[str] = []
+        self.lookup: Dict[str, int] = {}
+
+    def append(self, value: Any) -> None:
+        encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+        code = self.lookup.get(encoded)
+        if code is None:
+            code = self.lookup[encoded] = len(self.values)
+            self.values.append(encoded)
+        self.codes.append(code)
+
+    def get(self, row: int) -> Any:
+        code = self.codes[row]
+        return _ABSENT if code == _MISSING else json.loads(self.values[code])
+
+
+class ColumnarDocstore(Docstore, AddableMixin):
+    """Docstore keeping chunk text in one UTF-8 blob and metadata in dictionary-encoded columns."""
+
+    def __init__(self, documents: Optional[Dict[str, Document]] = None) -> None:
+        self._frozen: Union[bytes, mmap.mmap] = b""
+        self._tail = bytearray()
+        self._offsets = array("q", [0])
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, _MetadataColumn] = {}
+        if documents:
+            self.add(documents)
+
+    # Docstore interface -------------------------------------------------
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        overlapping = set(texts).intersection(self._rows)
+        if overlapping:
+            raise ValueError(f"Tried to add ids that already exist: {overlapping}")
+        for doc_id, doc in texts.items():
+            self._append(doc_id, doc.page_content, doc.metadata or {})
+
+    def search(self, search: str) -> Union[str, Document]:
+        row = self._rows.get(search)
+        if row is None:
+            return f"ID {search} not found."
+        return self._document(row)
+
+    def delete(self, ids: List) -> None:
+        missing = set(ids).difference(self._rows)
+        if missing:
+            raise ValueError(f"Tried to delete ids that does not exist: {missing}")
+        # Rows are tombstoned; `save` followed by `load` compacts them away.
+        for doc_id in ids:
+            self._ids[self._rows.pop(doc_id)] = None
+
+    # Introspection ------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._rows
+
+    def ids(self) -> Iterator[str]:
+        """Live document ids in insertion order."""
+        return (doc_id for doc_id in self._ids if doc_id is not None)
+
+    def nbytes(self) -> int:
+        """Approximate payload size: text blob, offsets, metadata codes and dictionaries."""
+        size = len(self._frozen) + len(self._tail) + self._offsets.itemsize * len(self._offsets)
+        for column in self._columns.values():
+            size += column.codes.itemsize * len(column.codes)
+            size += sum(len(value) for value in column.values)
+        return size
+
+    # Persistence --------------------------------------------------------
+
+    def save(self, directory: Path) -> Path:
+        """Write `texts.bin`, `offsets.npy`, `codes.npy` and `columns.json` (live rows only)."""
+
+        import numpy as np
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "columns.json").unlink(missing_ok=True)
+
+        live = [row for row, doc_id in enumerate(self._ids) if doc_id is not None]
+        keys = list(self._columns)
+        offsets = np.zeros(len(live) + 1, dtype=np.int64)
+        codes = np.full((len(live), len(keys)), _MISSING, dtype=np.int32)
+        tmp_texts = directory / f".texts.{os.getpid()}.bin"
+        with tmp_texts.open("wb") as f:
+            for i, row in enumerate(live):
+                chunk = self._text_bytes(row)
+                f.write(chunk)
+                offsets[i + 1] = offsets[i] + len(chunk)
+                for j, key in enumerate(keys):
+                    codes[i, j] = self._columns[key].codes[row]
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_texts, directory / "texts.bin")
+        for name, values in (("offsets", offsets), ("codes", codes)):
+            tmp_path = directory / f".{name}.{os.getpid()}.npy"
+            np.save(tmp_path, values)
+            os.replace(tmp_path, directory / f"{name}.npy")
+        # Written last: its presence marks a complete store.
+        atomic_write_json(
+            directory / "columns.json",
+            {
+                "ids": [self._ids[row] for row in live],
+                "keys": keys,
+                "values": [self._columns[key].values for key in keys],
+            },
+            indent=None,
+        )
+        return directory
+
+    @classmethod
+    def load(cls, directory: Path, *, use_mmap: bool = True) -> "ColumnarDocstore":
+        """Load a saved store; the text blob is memory-mapped unless `use_mmap` is False."""
+
+        import numpy as np
+
+        directory = Path(directory)
+        payload = json.loads((directory / "columns.json").read_text(encoding="utf-8"))
+        offsets = np.load(directory / "offsets.npy")
+        codes = np.load(directory / "codes.npy")
+        ids: List[str] = payload["ids"]
+        if len(offsets) != len(ids) + 1 or codes.shape[0] != len(ids):
+            raise ValueError(f"Columnar docstore {directory} is inconsistent")
+
+        store = cls()
+        texts_path = directory / "texts.bin"
+        if use_mmap and texts_path.stat().st_size > 0:
+            with texts_path.open("rb") as f:
+                store._frozen = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            store._frozen = texts_path.read_bytes()
+        store._offsets = array("q", offsets.astype(np.int64).tobytes())
+        store._ids = list(ids)
+        store._rows = {doc_id: row for row, doc_id in enumerate(ids)}
+        for j, (key, values) in enumerate(zip(payload["keys"], payload["values"])):
+            column = _MetadataColumn()
+            column.codes = array("i", np.ascontiguousarray(codes[:, j], dtype=np.int32).tobytes())
+            column.values = list(values)
+            column.lookup = {value: code for code, value in enumerate(values)}
+            store._columns[key] = column
+        return store
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # mmap objects cannot be pickled (e.g. by FAISS.save_local); copy the blob.
+        state = self.__dict__.copy()
+        state["_frozen"] = bytes(self._frozen)
+        return state
+
+    # Internals ----------------------------------------------------------
+
+    def _append(self, doc_id: str, text: str, metadata: Dict[str, Any]) -> None:
+        row = len(self._ids)
+        encoded = text.encode("utf-8")
+        self._tail.extend(encoded)
+        self._offsets.append(self._offsets[-1] + len(encoded))
+        self._ids.append(doc_id)
+        self._rows[doc_id] = row
+        for key in metadata:
+            if key not in self._columns:
+                self._columns[key] = _MetadataColumn(rows=row)
+        for key, column in self._columns.items():
+            if key in metadata:
+                column.append(metadata[key])
+            else:
+                column.codes.append(_MISSING)
+
+    def _text_bytes(self, row: int) -> bytes:
+        start, end = self._offsets[row], self._offsets[row + 1]
+        frozen = len(self._frozen)
+        if start >= frozen:
+            return bytes(self._tail[start - frozen : end - frozen])
+        return bytes(self._frozen[start:end])
+
+    def _document(self, row: int) -> Document:
+        metadata: Dict[str, Any] = {}
+        for key, column in self._columns.items():
+            value = column.get(row)
+            if value is not _ABSENT:
+                metadata[key] = value
+        return Document(
+            id=self._ids[row],
+            page_content=self._text_bytes(row).decode("utf-8"),
+            metadata=metadata,
+        )
+
+
+def columnar_from_documents(ids: Sequence[str], documents: Iterable[Document]) -> ColumnarDocstore:
+    """A `ColumnarDocstore` holding `documents` under `ids`, in that order."""
+
+    store = ColumnarDocstore()
+    for doc_id, doc in zip(ids, documents):
+        store._append(doc_id, doc.page_content, doc.metadata or {})
+    return store
+
+
+__all__ = ["ColumnarDocstore", "columnar_from_documents"]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 import weakref
 
 if TYPE_CHECKING:
@@ -22,6 +23,14 @@ def _make_cache_key(embeddings: "Embeddings") -> tuple[type, str] | None:
     return None
 
 
+def get_embedding_model_name(embeddings: "Embeddings") -> str:
+    """Identifier of an embedding model: its `model_name` / `model`, else the class name."""
+    cache_key = _make_cache_key(embeddings)
+    if cache_key is not None:
+        return cache_key[1]
+    return f"{type(embeddings).__module__}.{type(embeddings).__qualname__}"
+
+
 def get_embedding_dimension(embeddings: Embeddings) -> int:
     """Get the dimension of the embedding model.
     
@@ -61,3 +70,32 @@ def get_embedding_dimension(embeddings: Embeddings) -> int:
             _dimension_cache_by_key[cache_key] = dimension
     
     return dimension
+
+
+@lru_cache(maxsize=8)
+def load_tokenizer(model_name: str) -> Any:
+    """Fast tokenizer of a Hugging Face model, loaded once per process (from the local HF cache when present)."""
+    try:
+        from transformers import AutoTokenizer  # type: ignore
+    except ImportError as exc:  # pragma: no cover - import guard
+        raise ImportError(
+            "Token-based chunking requires `transformers`. Install with `pip install transformers`."
+        ) from exc
+    return AutoTokenizer.from_pretrained(model_name, use_fast=True)
+
+
+def get_embedding_tokenizer(embeddings: "Embeddings") -> Tuple[Optional[Any], Optional[int]]:
+    """Return `(tokenizer, max_seq_length)` of an embedding model, or `(None, None)` if unknown.
+
+    Reuses the tokenizer a sentence-transformers client (e.g. `HuggingFaceEmbeddings`)
+    already loaded; otherwise loads it by the model name.
+    """
+    client = getattr(embeddings, "_client", None) or getattr(embeddings, "client", None)
+    tokenizer = getattr(client, "tokenizer", None)
+    max_seq_length = getattr(client, "max_seq_length", None)
+    if tokenizer is None:
+        model_name = getattr(embeddings, "model_name", None)
+        if not isinstance(model_name, str) or not model_name:
+            return None, None
+        tokenizer = load_tokenizer(model_name)
+    return tokenizer, max_seq_length if isinstance(max_seq_length, int) else None
@@ -0,0 +1,107 @@
+"""Content-addressed cache keys and manifest for page extraction results.
+
+A cached page response is only reused when every input that went into the
+request is unchanged: the primary and context page images (hashed by content),
+the system prompt, the model and the decoding parameters. The manifest
+(`manifest.json` next to the `page_XXXX.json` responses) records the key each
+response was produced with, plus a digest of the source PDF so page images
+rendered from an older version of the document are not reused.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+import hashlib
+import json
+from pathlib import Path
+import threading
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from .run_journal import atomic_write_text
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@lru_cache(maxsize=4096)
+def _digest(path: str, mtime_ns: int, size: int) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's content, memoised per (path, mtime, size)."""
+
+    stat = path.stat()
+    return _digest(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def request_fingerprint(system_prompt: str, params: Mapping[str, Any]) -> str:
+    """Hash of everything in a request that is the same for all pages."""
+
+    payload = json.dumps({"system_prompt": system_prompt, **params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def page_cache_key(fingerprint: str, page_number: int, images: Sequence[Tuple[int, Path]]) -> str:
+    """Key for one page request: request fingerprint + primary page + content of every image sent."""
+
+    sha = hashlib.sha256(f"{fingerprint}|{page_number}".encode("utf-8"))
+    for number, path in sorted(images):
+        sha.update(f"|{number}:{file_sha256(path)}".encode("utf-8"))
+    return sha.hexdigest()
+
+
+@dataclass
+class ExtractionManifest:
+    """Page number -> cache key of the stored response, plus the source PDF digest."""
+
+    path: Path
+    source_digest: Optional[str] = None
+    entries: Dict[int, str] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "ExtractionManifest":
+        manifest = cls(path=path)
+        if not path.exists():
+            return manifest
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable extraction manifest {path}: {exc}")
+            return manifest
+        if not isinstance(payload, dict) or payload.get("version") != MANIFEST_VERSION:
+            logger.info(f"Extraction manifest {path} has an unknown version; starting fresh")
+            return manifest
+        manifest.source_digest = payload.get("source_digest")
+        manifest.entries = {int(page): key for page, key in (payload.get("pages") or {}).items()}
+        return manifest
+
+    def matches(self, page_number: int, key: str) -> bool:
+        with self._lock:
+            return self.entries.get(page_number) == key
+
+    def record(self, page_number: int, key: Optional[str]) -> None:
+        with self._lock:
+            if key:
+                self.entries[page_number] = key
+            else:
+                self.entries.pop(page_number, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+
+        with self._lock:
+            payload = {
+                "version": MANIFEST_VERSION,
+                "source_digest": self.source_digest,
+                "pages": {str(page): key for page, key in sorted(self.entries.items())},
+            }
+            atomic_write_text(self.path, json.dumps(payload, indent=2))
@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import re
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
 
 from loguru import logger
 
+from adsp.data_pipeline.async_extraction import (
+    AIMDLimiter,
+    TokenRateBudget,
+    backoff_delay,
+    is_overload_error,
+)
+from adsp.data_pipeline.extraction_cache import page_cache_key, request_fingerprint
+
 from .config import FactDataExtractionConfig
 from .models import PageExtractionResult, PageImage
-from .prompts import SYSTEM_PROMPT
-from .utils import encode_image_base64
+from .prompts import PAGE_DELIMITER, SYSTEM_PROMPT
+from .utils import EncodedImageCache
+
+_PAGE_DELIMITER_RE = re.compile(r"^[ \t]*<<<PAGE[ \t]+(\d+)>>>[ \t]*$", re.MULTILINE)
+_FENCE_LINE_RE = re.compile(r"^[ \t]*```[a-zA-Z]*[ \t]*$")
 
 
 class VLLMOpenAIExtractor:
@@ -35,11 +48,43 @@ class VLLMOpenAIExtractor:
         self.backoff_seconds = config.backoff_seconds
         self.max_concurrent = max(1, config.max_concurrent_requests)
         self.context_window = max(0, getattr(config, "context_window", 0))
+        self.slides_per_request = max(1, getattr(config, "slides_per_request", 1))
         self.max_image_bytes = getattr(config, "max_image_bytes", None)
+        self.image_cache = EncodedImageCache(
+            max_entries=getattr(config, "image_cache_entries", 32),
+            disk_dir=getattr(config, "image_cache_dir", None),
+        )
+        self.base_url = config.vllm_base_url
+        self.api_key = config.vllm_api_key
+        self.async_extraction = bool(getattr(config, "async_extraction", False))
+        self.max_concurrent_ceiling = max(
+            self.max_concurrent, getattr(config, "max_concurrent_requests_ceiling", self.max_concurrent)
+        )
+        self.latency_target_seconds = getattr(config, "latency_target_seconds", 120.0)
+        self.tokens_per_minute = max(0, getattr(config, "tokens_per_minute", 0))
+        self.estimated_tokens_per_image = getattr(config, "estimated_tokens_per_image", 1500)
+        self.estimated_output_tokens = getattr(config, "estimated_output_tokens", 2000)
+        self.backoff_max_seconds = getattr(config, "backoff_max_seconds", 60.0)
+        self.request_fingerprint = request_fingerprint(
+            SYSTEM_PROMPT,
+            {
+                "model": self.model,
+                "temperature": self.temperature,
+                "top_p": self.top_p,
+                "max_tokens": self.max_tokens,
+                "max_image_bytes": self.max_image_bytes,
+                "slides_per_request": self.slides_per_request,
+            },
+        )
         if not self.model:
             raise ValueError(
                 "Set VLLM_MODEL to the OpenAI-compatible vision model name (e.g., llava)."
             )
+        if self.async_extraction and self.slides_per_request > 1:
+            logger.warning(
+                "async_extraction is not supported with slides_per_request > 1; "
+                "batched requests run on the thread pool (max_concurrent_requests) instead"
+            )
 
     def extract_pages(
         self,
@@ -53,6 +98,14 @@ class VLLMOpenAIExtractor:
         """
         if not pages:
             return []
+        if self.slides_per_request > 1 and len(pages) > 1:
+            return self._extract_batched(pages, all_pages or pages, context_window, on_result)
+        if self.async_extraction:
+            return asyncio.run(
+                self.aextract_pages(
+                    pages, on_result=on_result, all_pages=all_pages, context_window=context_window
+                )
+            )
         all_pages = all_pages or pages
         window = self.context_window if context_window is None else max(0, context_window)
         page_lookup = {p.page_number: p for p in all_pages}
@@ -83,8 +136,164 @@ class VLLMOpenAIExtractor:
                         )
         return sorted(results, key=lambda r: r.page_number)
 
+    def _extract_batched(
+        self,
+        pages: Sequence[PageImage],
+        all_pages: Sequence[PageImage],
+        context_window: Optional[int],
+        on_result: Optional[Callable[[PageExtractionResult], None]],
+    ) -> List[PageExtractionResult]:
+        """
+        Extract runs of up to `slides_per_request` consecutive pages per request. Each image is
+        uploaded once per batch instead of once per neighbouring request.
+        """
+        window = self.context_window if context_window is None else max(0, context_window)
+        page_lookup = {p.page_number: p for p in all_pages}
+        batches = self._page_batches(pages, self.slides_per_request)
+        logger.info(f"Extracting {len(pages)} pages in {len(batches)} batched requests")
+        results: List[PageExtractionResult] = []
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+            futures = [executor.submit(self._extract_batch, batch, page_lookup, window) for batch in batches]
+            for future in as_completed(futures):
+                for result in future.result():
+                    results.append(result)
+                    if on_result:
+                        try:
+                            on_result(result)
+                        except Exception as exc:  # pragma: no cover - defensive logging
+                            logger.warning(
+                                f"Failed to handle on_result for page {result.page_number}: {exc}"
+                            )
+        return sorted(results, key=lambda r: r.page_number)
+
+    def _extract_batch(
+        self, batch: Sequence[PageImage], page_lookup: Dict[int, PageImage], window: int
+    ) -> List[PageExtractionResult]:
+        """One request for the whole batch; pages missing from the response are extracted one by one."""
+        if len(batch) == 1:
+            return [self._extract_single_page(batch[0], self._build_context_pages(batch[0], page_lookup, window))]
+
+        content = self._build_batch_content(batch, self._batch_context_pages(batch, page_lookup, window))
+        raw_text = ""
+        truncated = False
+        total_attempts = max(1, self.max_retries + 1)
+        for attempt in range(1, total_attempts + 1):
+            try:
+                response = self.client.chat.completions.create(**self._request_kwargs(content))
+                raw_text = response.choices[0].message.content or ""
+                truncated = getattr(response.choices[0], "finish_reason", None) == "length"
+                break
+            except Exception as exc:  # pragma: no cover - external call
+                logger.warning(
+                    f"Batched extraction failed for pages {batch[0].page_number}-{batch[-1].page_number} "
+                    f"(attempt {attempt}/{total_attempts}): {exc}"
+                )
+                if attempt >= total_attempts:
+                    break
+                time.sleep(self.backoff_seconds * attempt)
+
+        sections = self._split_batch_response(raw_text, [p.page_number for p in batch])
+        if truncated and sections:
+            # Hit max_tokens: sections followed by another delimiter are complete, the last one is not.
+            cut = list(sections)[-1]
+            logger.warning(
+                f"Batched response for pages {batch[0].page_number}-{batch[-1].page_number} was truncated "
+                f"at page {cut}; re-extracting the remaining pages one by one"
+            )
+            del sections[cut]
+        results = [
+            self._page_result(page, sections[page.page_number]) for page in batch if page.page_number in sections
+        ]
+        fallback = [page for page in batch if page.page_number not in sections]
+        if fallback:
+            logger.info(
+                f"Batched response missing pages {[p.page_number for p in fallback]}; extracting them individually"
+            )
+        for page in fallback:
+            results.append(self._extract_single_page(page, self._build_context_pages(page, page_lookup, window)))
+        return results
+
+    @staticmethod
+    def _page_batches(pages: Sequence[PageImage], size: int) -> List[List[PageImage]]:
+        """Split pages into runs of consecutive page numbers, each at most `size` long."""
+        batches: List[List[PageImage]] = []
+        for page in sorted(pages, key=lambda p: p.page_number):
+            current = batches[-1] if batches else None
+            if current and len(current) < size and page.page_number == current[-1].page_number + 1:
+                current.append(page)
+            else:
+                batches.append([page])
+        return batches
+
+    @staticmethod
+    def _batch_context_pages(
+        batch: Sequence[PageImage], page_lookup: Dict[int, PageImage], window: int
+    ) -> List[PageImage]:
+        """Batch pages plus up to `window` neighbours before and after the run, in page order."""
+        first, last = batch[0].page_number, batch[-1].page_number
+        numbers = set(range(first - window, first)) | set(range(last + 1, last + window + 1))
+        context = [page_lookup[n] for n in numbers if n in page_lookup]
+        return sorted([*batch, *context], key=lambda p: p.page_number)
+
+    @staticmethod
+    def _split_batch_response(raw_text: str, page_numbers: Sequence[int]) -> Dict[int, str]:
+        """Map page number -> Markdown for each expected page found between `PAGE_DELIMITER` lines."""
+        expected = set(page_numbers)
+        matches = list(_PAGE_DELIMITER_RE.finditer(raw_text or ""))
+        sections: Dict[int, str] = {}
+        for index, match in enumerate(matches):
+            page_number = int(match.group(1))
+            end = matches[index + 1].start() if index + 1 < len(matches) else len(raw_text)
+            lines = raw_text[match.end():end].strip().splitlines()
+            # Drop code fences the model may wrap around the whole answer.
+            while lines and _FENCE_LINE_RE.match(lines[0]):
+                lines.pop(0)
+            while lines and _FENCE_LINE_RE.match(lines[-1]):
+                lines.pop()
+            body = "\n".join(lines).strip()
+            if page_number in expected and body and page_number not in sections:
+                sections[page_number] = body
+        return sections
+
+    def extract_page(
+        self,
+        page: PageImage,
+        context_pages: Sequence[PageImage],
+        image_contents: Optional[Mapping[int, dict]] = None,
+    ) -> PageExtractionResult:
+        """
+        Extract one page given its context pages. `image_contents` maps page number -> pre-encoded
+        image block (see `encode_page`), letting the streaming pipeline encode each image once.
+        """
+        return self._extract_single_page(page, context_pages, image_contents)
+
+    def context_pages(
+        self,
+        page: PageImage,
+        all_pages: Sequence[PageImage],
+        context_window: Optional[int] = None,
+    ) -> List[PageImage]:
+        """Pages sent with `page`: the page itself first, then its neighbours within the window."""
+        window = self.context_window if context_window is None else max(0, context_window)
+        return self._build_context_pages(page, {p.page_number: p for p in all_pages}, window)
+
+    def cache_key(self, page: PageImage, context_pages: Sequence[PageImage]) -> str:
+        """Content-addressed key of the request `extract_page(page, context_pages)` sends."""
+        return page_cache_key(
+            self.request_fingerprint,
+            page.page_number,
+            [(p.page_number, p.image_path) for p in context_pages],
+        )
+
+    def encode_page(self, page: PageImage) -> dict:
+        """Encode a page image into a reusable `image_url` content block."""
+        return self._image_content(page)
+
     def _extract_single_page(
-        self, page: PageImage, context_pages: Sequence[PageImage]
+        self,
+        page: PageImage,
+        context_pages: Sequence[PageImage],
+        image_contents: Optional[Mapping[int, dict]] = None,
     ) -> PageExtractionResult:
         """It handles extraction for a single page"""
         last_error: Optional[str] = None
@@ -93,27 +302,10 @@ class VLLMOpenAIExtractor:
         for attempt in range(1, total_attempts + 1):
             try:
                 response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {
-                            "role": "user",
-                            "content": self._build_user_content(page, context_pages),
-                        },
-                    ],
-                    temperature=self.temperature,
-                    top_p=self.top_p,
-                    max_tokens=self.max_tokens,
-                    timeout=self.response_timeout,
+                    **self._request_kwargs(self._build_user_content(page, context_pages, image_contents))
                 )
                 raw_text = response.choices[0].message.content or ""
-                if not raw_text or not raw_text.strip():
-                    raise ValueError("Model returned empty response.")
-                return PageExtractionResult(
-                    page_number=page.page_number,
-                    markdown_content=raw_text,
-                    error=None,
-                )
+                return self._page_result(page, raw_text)
             except Exception as exc:  # pragma: no cover - external call
                 last_error = str(exc)
                 logger.warning(
@@ -126,12 +318,150 @@ class VLLMOpenAIExtractor:
                     break
                 time.sleep(self.backoff_seconds * attempt)
 
+        return self._failed_result(page, raw_text, last_error)
+
+    async def aextract_pages(
+        self,
+        pages: Sequence[PageImage],
+        on_result: Optional[Callable[[PageExtractionResult], None]] = None,
+        all_pages: Optional[Sequence[PageImage]] = None,
+        context_window: Optional[int] = None,
+    ) -> List[PageExtractionResult]:
+        """
+        Asyncio variant of `extract_pages` built on `AsyncOpenAI`. Concurrency adapts between
+        `max_concurrent_requests` and `max_concurrent_requests_ceiling` (AIMD on latency, 429 and 5xx),
+        retries back off with jitter without holding a slot, and `tokens_per_minute` caps the token rate.
+        """
+        if not pages:
+            return []
+        try:
+            from openai import AsyncOpenAI  # type: ignore
+        except ImportError as exc:  # pragma: no cover - import guard
+            raise ImportError("openai>=1.0 is required for async extraction.") from exc
+
+        all_pages = all_pages or pages
+        window = self.context_window if context_window is None else max(0, context_window)
+        page_lookup = {p.page_number: p for p in all_pages}
+        limiter = AIMDLimiter(
+            initial=self.max_concurrent,
+            maximum=self.max_concurrent_ceiling,
+            latency_target_s=self.latency_target_seconds,
+        )
+        budget = TokenRateBudget(tokens_per_minute=self.tokens_per_minute)
+        # Pages whose content is built but not yet answered: bounds encoded images held in memory.
+        prepared = asyncio.Semaphore(2 * self.max_concurrent_ceiling)
+        client = AsyncOpenAI(base_url=self.base_url, api_key=self.api_key, max_retries=0)
+        results: List[PageExtractionResult] = []
+        try:
+            tasks = [
+                asyncio.ensure_future(
+                    self._aextract_single_page(
+                        client,
+                        limiter,
+                        budget,
+                        page,
+                        self._build_context_pages(page, page_lookup, window),
+                        prepared,
+                    )
+                )
+                for page in pages
+            ]
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                results.append(result)
+                if on_result:
+                    try:
+                        on_result(result)
+                    except Exception as exc:  # pragma: no cover - defensive logging
+                        logger.warning(
+                            f"Failed to handle on_result for page {result.page_number}: {exc}"
+                        )
+        finally:
+            await client.close()
+        logger.info(f"Async extraction finished with concurrency limit {limiter.limit:.1f}")
+        return sorted(results, key=lambda r: r.page_number)
+
+    async def _aextract_single_page(
+        self,
+        client: Any,
+        limiter: AIMDLimiter,
+        budget: TokenRateBudget,
+        page: PageImage,
+        context_pages: Sequence[PageImage],
+        prepared: Optional[asyncio.Semaphore] = None,
+    ) -> PageExtractionResult:
+        """
+        The request content is built before a limiter slot is taken, so the AIMD window and its
+        latency samples cover only the LLM call; `prepared` bounds the pages held encoded meanwhile.
+        """
+        last_error: Optional[str] = None
+        raw_text = ""
+        content: Optional[List[dict]] = None
+        estimate = self.estimated_tokens_per_image * len(context_pages) + self.estimated_output_tokens
+        total_attempts = max(1, self.max_retries + 1)
+        async with prepared or asyncio.Semaphore(1):
+            for attempt in range(1, total_attempts + 1):
+                try:
+                    if content is None:
+                        # Image encoding is CPU-bound; keep it off the event loop.
+                        content = await asyncio.to_thread(self._build_user_content, page, context_pages)
+                    await budget.acquire(estimate)
+                    async with limiter.slot():
+                        start = time.perf_counter()
+                        response = await client.chat.completions.create(**self._request_kwargs(content))
+                        limiter.on_success(time.perf_counter() - start)
+                    budget.settle(estimate, getattr(getattr(response, "usage", None), "total_tokens", None))
+                    raw_text = response.choices[0].message.content or ""
+                    return self._page_result(page, raw_text)
+                except Exception as exc:  # pragma: no cover - external call
+                    if is_overload_error(exc):
+                        limiter.on_overload()
+                    last_error = str(exc)
+                    logger.warning(
+                        (
+                            f"Extraction failed for page {page.page_number} "
+                            f"(attempt {attempt}/{total_attempts}): {exc}"
+                        )
+                    )
+                    if attempt >= total_attempts:
+                        break
+                    await asyncio.sleep(
+                        backoff_delay(attempt, base_seconds=self.backoff_seconds, max_seconds=self.backoff_max_seconds)
+                    )
+
+        return self._failed_result(page, raw_text, last_error)
+
+    def _request_kwargs(self, content: List[dict]) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": content},
+            ],
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "max_tokens": self.max_tokens,
+            "timeout": self.response_timeout,
+        }
+
+    @staticmethod
+    def _page_result(page: PageImage, raw_text: str) -> PageExtractionResult:
+        """Build the result for a response, raising when it cannot be used (triggers a retry)."""
+        if not raw_text or not raw_text.strip():
+            raise ValueError("Model returned empty response.")
         return PageExtractionResult(
             page_number=page.page_number,
             markdown_content=raw_text,
-            error=last_error,
+            error=None,
         )
 
+    @staticmethod
+    def _failed_result(page: PageImage, raw_text: str, error: Optional[str]) -> PageExtractionResult:
+        return PageExtractionResult(
+            page_number=page.page_number,
+            markdown_content=raw_text,
+            error=error,
+        )
 
     @staticmethod
     def _build_context_pages(
@@ -154,7 +484,7 @@ class VLLMOpenAIExtractor:
         return [page_lookup[num] for num in ordered]
 
     def _image_content(self, page: PageImage) -> dict:
-        encoded_image, mime_type = encode_image_base64(
+        encoded_image, mime_type = self.image_cache.encode(
             page.image_path,
             max_bytes=self.max_image_bytes,
         )
@@ -162,7 +492,10 @@ class VLLMOpenAIExtractor:
         return {"type": "image_url", "image_url": {"url": f"data:{mime};base64,{encoded_image}"}}
 
     def _build_user_content(
-        self, primary_page: PageImage, context_pages: Sequence[PageImage]
+        self,
+        primary_page: PageImage,
+        context_pages: Sequence[PageImage],
+        image_contents: Optional[Mapping[int, dict]] = None,
     ) -> List[dict]:
         preface = (
             "Extract and convert to Markdown the primary page below. "
@@ -174,5 +507,25 @@ class VLLMOpenAIExtractor:
         for ctx_page in context_pages:
             label = "Primary page" if ctx_page.page_number == primary_page.page_number else "Context page"
             content.append({"type": "text", "text": f"{label} #{ctx_page.page_number}"})
-            content.append(self._image_content(ctx_page))
-        return content
\ No newline at end of file
+            cached = image_contents.get(ctx_page.page_number) if image_contents else None
+            content.append(cached or self._image_content(ctx_page))
+        return content
+
+    def _build_batch_content(
+        self, batch: Sequence[PageImage], pages: Sequence[PageImage]
+    ) -> List[dict]:
+        primary = {p.page_number for p in batch}
+        example = PAGE_DELIMITER.format(page_number=batch[0].page_number)
+        preface = (
+            f"Extract and convert to Markdown each of the {len(batch)} primary pages below "
+            f"(pages {batch[0].page_number}-{batch[-1].page_number}), in page order. "
+            "Start the Markdown of every primary page with a line containing only its delimiter, "
+            f"for example `{example}`, and return nothing before the first delimiter. "
+            "Use context pages only to understand cross-page continuity; do not return Markdown for them."
+        )
+        content: List[dict] = [{"type": "text", "text": preface}]
+        for page in pages:
+            label = "Primary page" if page.page_number in primary else "Context page"
+            content.append({"type": "text", "text": f"{label} #{page.page_number}"})
+            content.append(self._image_content(page))
+        return content
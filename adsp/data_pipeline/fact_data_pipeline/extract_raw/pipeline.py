@@ -3,23 +3,49 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
 
 from langchain_core.runnables import RunnableLambda, RunnableSequence, RunnableSerializable
 from loguru import logger
 
+from adsp.data_pipeline.extraction_cache import MANIFEST_NAME, ExtractionManifest, file_sha256
+from adsp.data_pipeline.run_journal import (
+    DONE,
+    FAILED,
+    PENDING,
+    STAGE_EXTRACT,
+    STAGE_RUN,
+    ProgressTracker,
+    RunJournal,
+    atomic_write_json,
+    atomic_write_text,
+)
+from adsp.data_pipeline.streaming import run_streaming_extraction
+
 from .config import FactDataExtractionConfig
 from .extractor import VLLMOpenAIExtractor
 from .models import PageExtractionResult, PageImage
 from .renderer import PDFRenderer
+from .utils import RENDER_PNG_BYTES_PER_PIXEL, pixel_budget
 
 
 class FactDataExtractionPipeline:
     def __init__(self, config: Optional[FactDataExtractionConfig] = None):
         self.config = config or FactDataExtractionConfig()
         
-        self.renderer = PDFRenderer(dpi=self.config.dpi)
+        max_pixels = 0
+        if self.config.render_to_image_budget and self.config.max_image_bytes:
+            max_pixels = pixel_budget(self.config.max_image_bytes, RENDER_PNG_BYTES_PER_PIXEL)
+        self.renderer = PDFRenderer(
+            dpi=self.config.dpi,
+            workers=self.config.render_workers,
+            max_pixels=max_pixels,
+        )
         self.extractor = VLLMOpenAIExtractor(self.config)
+        self.manifest = ExtractionManifest.load(self.config.raw_responses_dir / MANIFEST_NAME)
+        self.journal: Optional[RunJournal] = None  # opened per run
+        self.progress: Optional[ProgressTracker] = None
         self._chain: RunnableSequence = self._build_chain()
 
     def _build_chain(self) -> RunnableSerializable[Any, Any]:
@@ -39,7 +65,75 @@ class FactDataExtractionPipeline:
         )
 
     def run(self) -> Dict[str, Any]:
-        return self._chain.invoke({}, config={"run_name": "FactDataExtractionPipeline"})
+        self.journal = RunJournal.open(self._journal_path(), resume=self.config.resume)
+        if self.config.streaming:
+            result = self._run_streaming()
+        else:
+            result = self._chain.invoke({}, config={"run_name": "FactDataExtractionPipeline"})
+        self.journal.record(STAGE_RUN, "pipeline", DONE)
+        return result
+
+    @property
+    def reuse_cache(self) -> bool:
+        # Resuming means reusing the work recorded as done, whatever `reuse_cache` says.
+        return self.config.reuse_cache or self.config.resume
+
+    def _journal_path(self) -> Path:
+        return self.config.run_journal_path or self.config.raw_responses_dir.parent / "run_journal.jsonl"
+
+    def _run_streaming(self) -> Dict[str, Any]:
+        """
+        Pipelined variant of the chain: pages are extracted while later pages are still rendering,
+        and each page's markdown is written as soon as it is extracted.
+        """
+        if not self.config.pdf_path.exists():
+            raise FileNotFoundError(f"PDF not found at {self.config.pdf_path}")
+        logger.info("Starting fact data extraction pipeline (streaming)")
+        page_numbers = self.renderer.page_numbers(self.config.pdf_path, self.config.page_range)
+        reuse_images = self._reuse_page_images()
+        cached_results: Dict[int, PageExtractionResult] = {}
+        if self.reuse_cache and reuse_images:
+            # Pages are not rendered yet: key cached responses on the images already on disk.
+            existing = self.renderer.existing_pages(self.config.page_images_dir, page_numbers)
+            cached_results = self._load_cached_results(self._cache_keys(existing, existing))
+            if cached_results:
+                logger.info(f"Reusing cached responses for {len(cached_results)} pages")
+        self._journal_plan(cached_results, [n for n in page_numbers if n not in cached_results])
+        cache_keys: Dict[int, str] = {}
+
+        def _extract(
+            page: PageImage, context_pages: List[PageImage], contents: Dict[int, Any]
+        ) -> PageExtractionResult:
+            cache_keys[page.page_number] = self.extractor.cache_key(page, context_pages)
+            return self.extractor.extract_page(page, context_pages, contents)
+
+        output_dir = self.config.fact_data_output_dir / "pages"
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        def _on_result(result: PageExtractionResult) -> None:
+            self._persist_page_results([result], cache_keys)
+            self._write_markdown_file(result, output_dir)
+
+        new_results = run_streaming_extraction(
+            self.renderer.iter_render(
+                self.config.pdf_path,
+                self.config.page_images_dir,
+                self.config.page_range,
+                reuse_existing_images=reuse_images,
+            ),
+            page_numbers=page_numbers,
+            extract_numbers=set(page_numbers) - set(cached_results),
+            context_window=self.config.context_window,
+            encode=self.extractor.encode_page,
+            extract=_extract,
+            on_result=_on_result,
+            encode_workers=self.config.encode_workers,
+            extract_workers=self.extractor.max_concurrent,
+            queue_size=self.config.stream_queue_size,
+        )
+        logger.info(f"Wrote {len([r for r in new_results if not r.error])} markdown files to {output_dir}")
+        page_results = sorted([*cached_results.values(), *new_results], key=lambda r: r.page_number)
+        return {"cached_results": cached_results, "page_results": page_results}
 
     def _render_pages(self, _: Dict[str, Any]) -> Dict[str, Any]:
         if not self.config.pdf_path.exists():
@@ -49,7 +143,7 @@ class FactDataExtractionPipeline:
             self.config.pdf_path,
             self.config.page_images_dir,
             self.config.page_range,
-            reuse_existing_images=self.config.reuse_cache,
+            reuse_existing_images=self._reuse_page_images(),
         )
         logger.info(f"Rendered {len(pages)} pages from {self.config.pdf_path}")
 
@@ -57,9 +151,10 @@ class FactDataExtractionPipeline:
 
     def _prepare_extraction_plan(self, state: Dict[str, Any]) -> Dict[str, Any]:
         pages: Sequence[PageImage] = state["pages"]
+        cache_keys = self._cache_keys(pages, pages)
         cached_results: Dict[int, PageExtractionResult] = {}
-        if self.config.reuse_cache:
-            cached_results = self._load_cached_results(pages)
+        if self.reuse_cache:
+            cached_results = self._load_cached_results(cache_keys)
             if cached_results:
                 logger.info(
                     f"Reusing cached responses for {len(cached_results)} pages from "
@@ -69,7 +164,13 @@ class FactDataExtractionPipeline:
             logger.info("Cache reuse disabled; all pages will be extracted.")
 
         pages_to_extract = [page for page in pages if page.page_number not in cached_results]
-        return {**state, "cached_results": cached_results, "pages_to_extract": pages_to_extract}
+        self._journal_plan(cached_results, [page.page_number for page in pages_to_extract])
+        return {
+            **state,
+            "cache_keys": cache_keys,
+            "cached_results": cached_results,
+            "pages_to_extract": pages_to_extract,
+        }
 
     def _extract_and_collect(self, state: Dict[str, Any]) -> Dict[str, Any]:
         pages_to_extract: Sequence[PageImage] = state["pages_to_extract"]
@@ -84,7 +185,7 @@ class FactDataExtractionPipeline:
                 pages_to_extract,
                 all_pages=state["pages"],
                 context_window=self.config.context_window,
-                on_result=lambda r: self._persist_page_results([r]),
+                on_result=lambda r: self._persist_page_results([r], state["cache_keys"]),
             )
         else:
             logger.info("No remaining pages to extract after applying cache.")
@@ -110,39 +211,84 @@ class FactDataExtractionPipeline:
         output_dir.mkdir(parents=True, exist_ok=True)
         
         for result in page_results:
-            if result.error:
-                logger.warning(f"Skipping page {result.page_number} due to error: {result.error}")
-                continue
-            
-            output_path = output_dir / f"page_{result.page_number:04d}.md"
-            with output_path.open("w", encoding="utf-8") as f:
-                f.write(result.markdown_content)
-            logger.debug(f"Wrote markdown for page {result.page_number} -> {output_path}")
+            self._write_markdown_file(result, output_dir)
         
         logger.info(f"Wrote {len([r for r in page_results if not r.error])} markdown files to {output_dir}")
 
-    def _load_cached_results(self, pages: Sequence[PageImage]) -> Dict[int, PageExtractionResult]:
+    @staticmethod
+    def _write_markdown_file(result: PageExtractionResult, output_dir: Path) -> None:
+        if result.error:
+            logger.warning(f"Skipping page {result.page_number} due to error: {result.error}")
+            return
+
+        output_path = output_dir / f"page_{result.page_number:04d}.md"
+        atomic_write_text(output_path, result.markdown_content)
+        logger.debug(f"Wrote markdown for page {result.page_number} -> {output_path}")
+
+    def _reuse_page_images(self) -> bool:
+        """Rendered images are reused only when they were rendered from the same PDF content.
+
+        Images of an older PDF are deleted before the new digest is recorded, so a re-render
+        that is interrupted never leaves them behind to be reused (and matched to cached
+        responses) as if they were current.
+        """
+        source_digest = file_sha256(self.config.pdf_path)
+        reuse = self.reuse_cache and self.manifest.source_digest == source_digest
+        if self.reuse_cache and not reuse:
+            logger.info("Source PDF is new or changed; re-rendering page images")
+        if self.manifest.source_digest != source_digest:
+            for stale in self.config.page_images_dir.glob("page_*.png"):
+                stale.unlink(missing_ok=True)
+            self.manifest.source_digest = source_digest
+            self.manifest.save()
+        return reuse
+
+    def _cache_keys(self, pages: Sequence[PageImage], all_pages: Sequence[PageImage]) -> Dict[int, str]:
+        return {
+            page.page_number: self.extractor.cache_key(
+                page, self.extractor.context_pages(page, all_pages, self.config.context_window)
+            )
+            for page in pages
+        }
+
+    def _journal_plan(self, cached_results: Mapping[int, PageExtractionResult], to_extract: Sequence[int]) -> None:
+        """Record the extraction plan and start measuring throughput over the outstanding pages."""
+        for page_number in sorted(cached_results):
+            if self.journal.status(STAGE_EXTRACT, page_number) != DONE:
+                self.journal.record(STAGE_EXTRACT, page_number, DONE, cached=True)
+        for page_number in to_extract:
+            self.journal.record(STAGE_EXTRACT, page_number, PENDING)
+        self.progress = ProgressTracker("Extraction", len(to_extract), unit="pages")
+
+    def _load_cached_results(self, cache_keys: Mapping[int, str]) -> Dict[int, PageExtractionResult]:
+        """Load stored responses whose manifest key matches the current request inputs."""
         cached: Dict[int, PageExtractionResult] = {}
-        for page in pages:
+        stale = 0
+        for page_number, cache_key in cache_keys.items():
+            if not self.journal.is_reusable(STAGE_EXTRACT, page_number):
+                continue  # resuming: not recorded as done, extract again
+            if not self.manifest.matches(page_number, cache_key):
+                stale += 1
+                continue
             # Check markdown cache first
-            markdown_cache_path = self.config.fact_data_output_dir / "pages" / f"page_{page.page_number:04d}.md"
+            markdown_cache_path = self.config.fact_data_output_dir / "pages" / f"page_{page_number:04d}.md"
             if markdown_cache_path.exists():
                 try:
                     with markdown_cache_path.open("r", encoding="utf-8") as f:
                         markdown_content = f.read()
-                    cached[page.page_number] = PageExtractionResult(
-                        page_number=page.page_number,
+                    cached[page_number] = PageExtractionResult(
+                        page_number=page_number,
                         markdown_content=markdown_content,
                         error=None,
                     )
                     continue
                 except Exception as exc:
                     logger.warning(
-                        f"Could not load cached markdown for page {page.page_number} ({markdown_cache_path}): {exc}"
+                        f"Could not load cached markdown for page {page_number} ({markdown_cache_path}): {exc}"
                     )
             
             # Fall back to old JSON cache format if it exists
-            cache_path = self.config.raw_responses_dir / f"page_{page.page_number:04d}.json"
+            cache_path = self.config.raw_responses_dir / f"page_{page_number:04d}.json"
             if not cache_path.exists():
                 continue
             try:
@@ -152,22 +298,26 @@ class FactDataExtractionPipeline:
                 error = payload.get("error") if isinstance(payload, dict) else None
                 if error:
                     logger.info(
-                        f"Skipping cached page {page.page_number} because previous run failed: {error}"
+                        f"Skipping cached page {page_number} because previous run failed: {error}"
                     )
                     continue
                 if markdown_content:
-                    cached[page.page_number] = PageExtractionResult(
-                        page_number=page.page_number,
+                    cached[page_number] = PageExtractionResult(
+                        page_number=page_number,
                         markdown_content=markdown_content,
                         error=error,
                     )
             except Exception as exc:
                 logger.warning(
-                    f"Could not load cached result for page {page.page_number} ({cache_path}): {exc}"
+                    f"Could not load cached result for page {page_number} ({cache_path}): {exc}"
                 )
+        if stale:
+            logger.info(f"{stale} pages have no cached response for their current inputs (image, prompt, model)")
         return cached
 
-    def _persist_page_results(self, results: Iterable[PageExtractionResult]) -> None:
+    def _persist_page_results(
+        self, results: Iterable[PageExtractionResult], cache_keys: Mapping[int, str]
+    ) -> None:
         self.config.raw_responses_dir.mkdir(parents=True, exist_ok=True)
         if self.config.debug:
             self.config.debug_dir.mkdir(parents=True, exist_ok=True)
@@ -177,16 +327,25 @@ class FactDataExtractionPipeline:
                 "page": result.page_number,
                 "markdown_content": result.markdown_content,
                 "error": result.error,
+                "cache_key": cache_keys.get(result.page_number),
             }
-            with out_path.open("w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            atomic_write_json(out_path, payload)
             logger.debug(f"Wrote raw response for page {result.page_number} -> {out_path}")
+            self.manifest.record(result.page_number, None if result.error else payload["cache_key"])
             if self.config.debug:
                 debug_path = self.config.debug_dir / f"page_{result.page_number:04d}.md"
                 debug_payload = result.markdown_content or ""
-                with debug_path.open("w", encoding="utf-8") as f:
-                    f.write(debug_payload)
+                atomic_write_text(debug_path, debug_payload)
                 logger.debug(f"Wrote debug markdown for page {result.page_number} -> {debug_path}")
+        self.manifest.save()
+        # Journal last: a page recorded as done has its response and manifest key on disk.
+        for result in results:
+            if result.error:
+                self.journal.record(STAGE_EXTRACT, result.page_number, FAILED, error=result.error)
+            else:
+                self.journal.record(STAGE_EXTRACT, result.page_number, DONE)
+            if self.progress is not None:
+                self.progress.advance()
 
 
 def run_fact_data_extraction_pipeline(
@@ -181,4 +181,7 @@ Final Constraints:
 	*	Do not infer missing values
 	*	If unreadable, explicitly state: “Value not readable”
 	*	Markdown must be self-contained and fully understandable
-"""
\ No newline at end of file
+"""
+
+# Marks the start of each page's Markdown when several pages are extracted in one request.
+PAGE_DELIMITER = "<<<PAGE {page_number}>>>"
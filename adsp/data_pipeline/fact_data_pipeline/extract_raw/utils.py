@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import base64
+from collections import OrderedDict
+from concurrent.futures import Future
+import hashlib
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -30,10 +34,60 @@ def strip_json_markdown(text: str) -> str:
     return text.strip()
 
 
+# JPEG quality bounds for the compression search, and the share of `max_bytes`
+# aimed for when predicting sizes (leaves room for estimation error).
+_JPEG_QUALITY_MAX = 85
+_JPEG_QUALITY_MIN = 50
+_JPEG_QUALITY_STEP = 5
+_SIZE_HEADROOM = 0.9
+# Conservative PNG size of a rendered slide/report page, used to derive a render pixel budget.
+RENDER_PNG_BYTES_PER_PIXEL = 1.0
+
+
+def pixel_budget(max_bytes: int, bytes_per_pixel: float) -> int:
+    """Pixel count an image can have so that its encoding stays below `max_bytes`."""
+    return max(1, int(max_bytes * _SIZE_HEADROOM / max(bytes_per_pixel, 1e-6)))
+
+
+def _encode_jpeg(img, quality: int) -> bytes:
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", optimize=True, quality=quality)
+    return buffer.getvalue()
+
+
+def _search_jpeg_quality(img, max_bytes: int, high: int) -> Tuple[Optional[bytes], Optional[bytes], int]:
+    """
+    Binary search for the highest quality in [_JPEG_QUALITY_MIN, high] that fits `max_bytes`.
+
+    Returns (best fitting encoding or None, smallest encoding seen, number of encodes).
+    """
+    qualities = list(range(_JPEG_QUALITY_MIN, high + 1, _JPEG_QUALITY_STEP))
+    low_idx, high_idx = 0, len(qualities) - 1
+    best: Optional[bytes] = None
+    smallest: Optional[bytes] = None
+    encodes = 0
+    while low_idx <= high_idx:
+        mid = (low_idx + high_idx) // 2
+        data = _encode_jpeg(img, qualities[mid])
+        encodes += 1
+        if smallest is None or len(data) < len(smallest):
+            smallest = data
+        if len(data) <= max_bytes:
+            best = data
+            low_idx = mid + 1
+        else:
+            high_idx = mid - 1
+    return best, smallest, encodes
+
+
 def encode_image_base64(image_path: Path, max_bytes: Optional[int] = None) -> Tuple[str, str]:
     """
     Encode an image to base64, compressing to JPEG if the PNG exceeds max_bytes.
 
+    Compression uses the size of a first JPEG encode to pick the next step: a binary search on
+    quality when the overshoot is small, otherwise a single resize to the pixel budget that
+    size implies. Most oversized pages are encoded in one or two passes.
+
     Returns:
         (base64_string, mime_type)
     """
@@ -46,40 +100,139 @@ def encode_image_base64(image_path: Path, max_bytes: Optional[int] = None) -> Tu
         from PIL import Image  # type: ignore
 
         img = Image.open(image_path).convert("RGB")
-        quality_candidates = [85, 75, 65, 55, 45, 35]
-        best_data = raw
-        best_mime = mime
-
-        for quality in quality_candidates:
-            buffer = BytesIO()
-            img.save(buffer, format="JPEG", optimize=True, quality=quality)
-            data = buffer.getvalue()
+        passes = 1
+        first = _encode_jpeg(img, _JPEG_QUALITY_MAX)
+        best_data = first if len(first) < len(raw) else raw
+        fitted: Optional[bytes] = first if len(first) <= max_bytes else None
+
+        ratio = max_bytes * _SIZE_HEADROOM / len(first)
+        if fitted is None and ratio >= 0.5:
+            # Small overshoot: lowering the quality keeps full resolution.
+            fitted, smallest, encodes = _search_jpeg_quality(
+                img, max_bytes, _JPEG_QUALITY_MAX - _JPEG_QUALITY_STEP
+            )
+            passes += encodes
+            if smallest is not None and len(smallest) < len(best_data):
+                best_data = smallest
+
+        resized, reference = img, first
+        while fitted is None and resized.width * resized.height > 1:
+            # JPEG size scales roughly with pixel count: resize once to the predicted budget.
+            bytes_per_pixel = len(reference) / (resized.width * resized.height)
+            scale = min(0.9, (pixel_budget(max_bytes, bytes_per_pixel) / (resized.width * resized.height)) ** 0.5)
+            resized = resized.resize(
+                (max(1, int(resized.width * scale)), max(1, int(resized.height * scale))),
+                Image.LANCZOS,
+            )
+            data = reference = _encode_jpeg(resized, _JPEG_QUALITY_MAX)
+            passes += 1
             if len(data) < len(best_data):
-                best_data, best_mime = data, "image/jpeg"
-            if max_bytes and len(data) <= max_bytes:
-                best_data, best_mime = data, "image/jpeg"
-                break
-
-        if max_bytes and len(best_data) > max_bytes:
-            # Gradually downscale if quality tweaks are insufficient.
-            scale = 0.9
-            while len(best_data) > max_bytes and scale >= 0.4:
-                buffer = BytesIO()
-                new_width = max(1, int(img.width * scale))
-                new_height = max(1, int(img.height * scale))
-                resized = img.resize((new_width, new_height), Image.LANCZOS)
-                resized.save(buffer, format="JPEG", optimize=True, quality=65)
-                data = buffer.getvalue()
-                if len(data) < len(best_data):
-                    best_data, best_mime = data, "image/jpeg"
-                if len(best_data) <= max_bytes:
-                    break
-                scale -= 0.1
+                best_data = data
+            if len(data) <= max_bytes:
+                fitted = data
 
+        if fitted is not None:
+            best_data = fitted
+        best_mime = "image/png" if best_data is raw else "image/jpeg"
         logger.debug(
-            f"Compressed image {image_path.name} from {len(raw)} to {len(best_data)} bytes (mime={best_mime})"
+            f"Compressed image {image_path.name} from {len(raw)} to {len(best_data)} bytes "
+            f"in {passes} passes (mime={best_mime})"
         )
         return base64.b64encode(best_data).decode("utf-8"), best_mime
     except Exception as exc:  # pragma: no cover - compression guardrail
         logger.warning(f"Falling back to raw image for {image_path.name}: {exc}")
         return base64.b64encode(raw).decode("utf-8"), mime
+
+
+class EncodedImageCache:
+    """
+    Bounded, thread-safe LRU of `encode_image_base64` results shared by all extractor workers.
+
+    Entries are keyed by (path, mtime, size, max_bytes), so a re-rendered image is re-encoded.
+    Concurrent misses on the same key wait for the first caller's encode instead of repeating it.
+    With `disk_dir`, compressed JPEGs are also written to disk and reused by later runs.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_total_bytes: int = 256 * 1024 * 1024,
+        disk_dir: Optional[Path] = None,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_total_bytes = max_total_bytes
+        self.disk_dir = disk_dir
+        self._entries: "OrderedDict[tuple, Tuple[str, str]]" = OrderedDict()
+        self._pending: Dict[tuple, "Future[Tuple[str, str]]"] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, image_path: Path, max_bytes: Optional[int] = None) -> Tuple[str, str]:
+        """Return `(base64_string, mime_type)` for `image_path`, encoding it at most once."""
+        stat = image_path.stat()
+        key = (str(image_path.resolve()), stat.st_mtime_ns, stat.st_size, max_bytes)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._pending[key] = Future()
+        if pending is not None:
+            return pending.result()  # another worker is encoding this image
+
+        try:
+            encoded = self._load_from_disk(key) or encode_image_base64(image_path, max_bytes=max_bytes)
+            if encoded[1] == "image/jpeg":
+                self._store_on_disk(key, encoded[0])
+        except BaseException as exc:
+            with self._lock:
+                self._pending.pop(key).set_exception(exc)
+            raise
+
+        with self._lock:
+            self._pending.pop(key).set_result(encoded)
+            if key not in self._entries:
+                self._entries[key] = encoded
+                self._total_bytes += len(encoded[0])
+                while len(self._entries) > self.max_entries or (
+                    self._total_bytes > self.max_total_bytes and len(self._entries) > 1
+                ):
+                    _, (evicted, _mime) = self._entries.popitem(last=False)
+                    self._total_bytes -= len(evicted)
+        return encoded
+
+    def _disk_path(self, key: tuple) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:20]
+        return self.disk_dir / f"{Path(key[0]).stem}-{digest}.jpg"
+
+    def _load_from_disk(self, key: tuple) -> Optional[Tuple[str, str]]:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return base64.b64encode(path.read_bytes()).decode("utf-8"), "image/jpeg"
+        except OSError as exc:
+            logger.debug(f"Could not read cached image {path}: {exc}")
+            return None
+
+    def _store_on_disk(self, key: tuple, encoded: str) -> None:
+        path = self._disk_path(key)
+        if path is None or path.exists():
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(base64.b64decode(encoded))
+            tmp_path.replace(path)
+        except OSError as exc:
+            logger.debug(f"Could not write cached image {path}: {exc}")
@@ -1,13 +1,15 @@
 """RAG utilities for fact data pipeline."""
 
-from .indicator import FactDataRAG, documents_to_context_prompt
-from .chunker import FactDataMarkdownChunker, estimate_tokens
+from .indicator import FactDataRAG, documents_to_context_prompt, markdown_source_fingerprint
+from .chunker import FactDataMarkdownChunker, chunk_length_report, estimate_tokens
 from .pipeline import run_fact_data_indexing_pipeline
 
 __all__ = [
     "FactDataRAG",
     "documents_to_context_prompt",
+    "markdown_source_fingerprint",
     "FactDataMarkdownChunker",
+    "chunk_length_report",
     "estimate_tokens",
     "run_fact_data_indexing_pipeline",
 ]
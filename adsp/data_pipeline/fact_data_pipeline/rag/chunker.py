@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from langchain_text_splitters import MarkdownHeaderTextSplitter, RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 from loguru import logger
 
+from adsp.data_pipeline.embedding_utils import load_tokenizer
+
+# [text](url) -> text
+_INLINE_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+# [text][ref] -> text
+_REFERENCE_LINK_RE = re.compile(r'\[([^\]]+)\]\[[^\]]+\]')
+
+# Below this many files, process start-up costs more than it saves.
+_MIN_FILES_FOR_POOL = 32
+
+_worker_chunker: Optional["FactDataMarkdownChunker"] = None
+
+
+def _init_chunker_worker(settings: Dict[str, Any]) -> None:
+    """Build the splitters once per worker process."""
+    global _worker_chunker
+    _worker_chunker = FactDataMarkdownChunker(**settings)
+
+
+def _chunk_file_in_worker(file_path: Path) -> List[Document]:
+    return _worker_chunker.chunk_markdown_file(file_path)
+
 
 class FactDataMarkdownChunker:
     """Chunks markdown files for embedding with all-mpnet-base-v2 model.
@@ -22,12 +46,18 @@ class FactDataMarkdownChunker:
     # Using ~300 chars per token as rough estimate, and leaving buffer
     DEFAULT_CHUNK_SIZE = 1200  # characters (~300-350 tokens)
     DEFAULT_CHUNK_OVERLAP = 50  # characters for context continuity
+    DEFAULT_MAX_TOKENS = 384  # all-mpnet-base-v2 max_seq_length, special tokens included
+    DEFAULT_TOKEN_OVERLAP = 16  # tokens for context continuity
     
     def __init__(
         self,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
         min_chunk_size: int = 50,
+        workers: int = 1,
+        tokenizer: Any = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        token_overlap: int = DEFAULT_TOKEN_OVERLAP,
     ):
         """
         Initialize the chunker.
@@ -36,10 +66,24 @@ class FactDataMarkdownChunker:
             chunk_size: Maximum size of each chunk in characters
             chunk_overlap: Overlap between chunks for context
             min_chunk_size: Minimum chunk size to avoid tiny fragments
+            workers: Processes splitting files in `iter_chunks` (1 = in-process, 0 = one per CPU core)
+            tokenizer: Embedding model tokenizer (or its Hugging Face name). When set, chunks are
+                measured in tokens and `max_tokens`/`token_overlap` replace `chunk_size`/`chunk_overlap`
+            max_tokens: Token budget per chunk, header lines and special tokens included
+            token_overlap: Overlap between chunks in tokens
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.max_tokens = max_tokens
+        self.token_overlap = token_overlap
+        self._tokenizer_spec = tokenizer
+        self.tokenizer = load_tokenizer(tokenizer) if isinstance(tokenizer, str) else tokenizer
+        self._special_tokens = 0
+        if self.tokenizer is not None:
+            count_special = getattr(self.tokenizer, "num_special_tokens_to_add", None)
+            self._special_tokens = int(count_special(pair=False)) if callable(count_special) else 0
         
         # Define markdown headers to split on (preserves structure)
         self.headers_to_split_on = [
@@ -54,10 +98,22 @@ class FactDataMarkdownChunker:
             strip_headers=False,
         )
         
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
+        self.text_splitter = self._text_splitter(chunk_size, chunk_overlap, len)
+
+    @property
+    def token_mode(self) -> bool:
+        return self.tokenizer is not None
+
+    def count_tokens(self, text: str) -> int:
+        """Tokens the embedding model sees for `text`, without special tokens."""
+        return len(self.tokenizer.encode(text, add_special_tokens=False, verbose=False))
+
+    @staticmethod
+    def _text_splitter(size: int, overlap: int, length_function: Callable[[str], int]) -> RecursiveCharacterTextSplitter:
+        return RecursiveCharacterTextSplitter(
+            chunk_size=size,
+            chunk_overlap=min(overlap, size // 2),
+            length_function=length_function,
             is_separator_regex=False,
             separators=["\n\n", "\n", ". ", " ", ""],
         )
@@ -101,11 +157,8 @@ class FactDataMarkdownChunker:
         
         Converts [link text](url) to link text
         """
-        # Remove markdown links: [text](url) -> text
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-        # Remove reference-style links: [text][ref] -> text
-        text = re.sub(r'\[([^\]]+)\]\[[^\]]+\]', r'\1', text)
-        return text
+        text = _INLINE_LINK_RE.sub(r'\1', text)
+        return _REFERENCE_LINK_RE.sub(r'\1', text)
     
     @staticmethod
     def _extract_header_lines(content: str) -> str:
@@ -157,11 +210,19 @@ class FactDataMarkdownChunker:
         # First split by markdown headers to preserve structure
         header_splits = self.markdown_splitter.split_text(content)
         
+        length, limit, text_splitter = len, self.chunk_size, self.text_splitter
+        if self.token_mode:
+            # The header lines are prepended to every chunk and count against the budget.
+            length = self.count_tokens
+            header_tokens = length(f"{header_prefix}\n\n") if header_prefix else 0
+            limit = max(self.max_tokens // 2, self.max_tokens - self._special_tokens - header_tokens)
+            text_splitter = self._text_splitter(limit, self.token_overlap, length)
+        
         # Then further split large sections
         chunks: List[Document] = []
         for idx, doc in enumerate(header_splits):
             # Check if document needs further splitting
-            if len(doc.page_content) <= self.chunk_size:
+            if length(doc.page_content) <= limit:
                 # Small enough, prepend header and keep as is
                 content_with_header = f"{header_prefix}\n\n{doc.page_content}" if header_prefix else doc.page_content
                 chunks.append(
@@ -172,7 +233,7 @@ class FactDataMarkdownChunker:
                 )
             else:
                 # Split into smaller chunks
-                sub_chunks = self.text_splitter.split_documents([doc])
+                sub_chunks = text_splitter.split_documents([doc])
                 for sub_idx, sub_doc in enumerate(sub_chunks):
                     chunk_id = f"{idx}_{sub_idx}"
                     # Prepend header to each sub-chunk
@@ -226,33 +287,97 @@ class FactDataMarkdownChunker:
         Returns:
             List of all Document chunks from all files
         """
+        all_chunks = list(self.iter_chunks(directory, pattern))
+        logger.info(f"Chunked {directory} into {len(all_chunks)} total chunks")
+        return all_chunks
+
+    def iter_chunks(
+        self,
+        directory: Path,
+        pattern: str = "page_*.md",
+    ) -> Iterator[Document]:
+        """
+        Stream the chunks of every markdown file in a directory, file by file in sorted order.
+        
+        With `workers` > 1 and enough files, files are split in a process pool while the
+        caller consumes earlier chunks (e.g. embeds them). Output order matches the serial mode.
+        
+        Args:
+            directory: Directory containing markdown files
+            pattern: Glob pattern for matching files
+            
+        Yields:
+            Document chunks
+        """
         directory = Path(directory)
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory}")
         
-        all_chunks: List[Document] = []
         markdown_files = sorted(directory.glob(pattern))
+        if self.workers > 1 and len(markdown_files) >= _MIN_FILES_FOR_POOL:
+            yield from self._iter_chunks_parallel(markdown_files)
+            return
         
         logger.info(f"Chunking {len(markdown_files)} markdown files from {directory}")
-        
         for file_path in markdown_files:
-            chunks = self.chunk_markdown_file(file_path)
-            all_chunks.extend(chunks)
-        
-        logger.info(
-            f"Chunked {len(markdown_files)} files into {len(all_chunks)} total chunks"
-        )
-        
-        return all_chunks
+            yield from self.chunk_markdown_file(file_path)
+
+    def _iter_chunks_parallel(self, markdown_files: List[Path]) -> Iterator[Document]:
+        """Split files in a process pool; each worker builds its own splitters once."""
+        workers = min(self.workers, len(markdown_files))
+        logger.info(f"Chunking {len(markdown_files)} markdown files with {workers} worker processes")
+        settings = {
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "min_chunk_size": self.min_chunk_size,
+            "tokenizer": self._tokenizer_spec,
+            "max_tokens": self.max_tokens,
+            "token_overlap": self.token_overlap,
+        }
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_chunker_worker,
+            initargs=(settings,),
+        ) as executor:
+            # map keeps file order; small batches amortise the IPC round trips.
+            batch = max(1, len(markdown_files) // (workers * 8))
+            for chunks in executor.map(_chunk_file_in_worker, markdown_files, chunksize=batch):
+                yield from chunks
 
 
-def estimate_tokens(text: str) -> int:
+def estimate_tokens(text: str, tokenizer: Any = None) -> int:
     """
-    Rough estimate of token count for all-mpnet-base-v2.
+    Token count for all-mpnet-base-v2.
     
-    Uses a simple heuristic: ~4 characters per token on average.
+    Exact (special tokens excluded) when a tokenizer is given; otherwise a simple
+    heuristic of ~4 characters per token on average.
     """
+    if tokenizer is not None:
+        return len(tokenizer.encode(text, add_special_tokens=False, verbose=False))
     return len(text) // 4
 
 
-__all__ = ["FactDataMarkdownChunker", "estimate_tokens"]
+def chunk_length_report(
+    chunks: Sequence[Document],
+    tokenizer: Any,
+    max_tokens: int = FactDataMarkdownChunker.DEFAULT_MAX_TOKENS,
+) -> Dict[str, Any]:
+    """Chunk count and token-length statistics, including how many chunks the encoder would truncate."""
+    count_special = getattr(tokenizer, "num_special_tokens_to_add", None)
+    special = int(count_special(pair=False)) if callable(count_special) else 0
+    lengths = sorted(estimate_tokens(c.page_content, tokenizer) + special for c in chunks)
+    if not lengths:
+        return {"chunks": 0, "max_tokens": max_tokens}
+    return {
+        "chunks": len(lengths),
+        "max_tokens": max_tokens,
+        "mean_tokens": round(sum(lengths) / len(lengths), 1),
+        "p50_tokens": lengths[len(lengths) // 2],
+        "p95_tokens": lengths[min(len(lengths) - 1, int(len(lengths) * 0.95))],
+        "longest_tokens": lengths[-1],
+        "truncated_chunks": sum(1 for n in lengths if n > max_tokens),
+        "budget_utilisation": round(sum(min(n, max_tokens) for n in lengths) / (len(lengths) * max_tokens), 3),
+    }
+
+
+__all__ = ["FactDataMarkdownChunker", "chunk_length_report", "estimate_tokens"]
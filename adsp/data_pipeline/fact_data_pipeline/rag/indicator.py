@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Sequence
 
 # a fundamental data structure in LangChain to represent a piece of text content along with its metadata
 from langchain_core.documents import Document
@@ -15,7 +17,10 @@ from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore, VectorStoreRetriever
 from loguru import logger
 
+from adsp.data_pipeline.columnar_docstore import ColumnarDocstore
 from adsp.data_pipeline.embedding_utils import get_embedding_dimension
+from adsp.data_pipeline.indexing_embedder import IndexingEmbedder
+from adsp.data_pipeline.vector_quantization import quantize_vectorstore, save_snapshot
 
 from .chunker import FactDataMarkdownChunker
 
@@ -23,7 +28,6 @@ from .chunker import FactDataMarkdownChunker
 def _default_vectorstore(embeddings: Embeddings) -> VectorStore:
     try:
         import faiss  # type: ignore
-        from langchain_community.docstore.in_memory import InMemoryDocstore
         from langchain_community.vectorstores import FAISS
     except Exception as exc:
         raise RuntimeError(
@@ -35,11 +39,56 @@ def _default_vectorstore(embeddings: Embeddings) -> VectorStore:
     return FAISS(
         embedding_function=embeddings,
         index=index,
-        docstore=InMemoryDocstore(),
+        docstore=ColumnarDocstore(),
         index_to_docstore_id={},
     )
 
 
+def markdown_source_fingerprint(directory: Path, *, pattern: str = "page_*.md") -> Dict[str, Any]:
+    """File count plus a digest of every file's name, size and mtime (any edit or swap changes it).
+
+    Stored as `source` in index snapshots so a snapshot is only reused for the same files.
+    """
+    files = sorted(Path(directory).glob(pattern))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return {"files": len(files), "digest": digest.hexdigest(), "pattern": pattern}
+
+
+def _search_by_vectors(
+    vectorstore: VectorStore, vectors: Sequence[List[float]], *, k: int
+) -> List[List[Document]]:
+    """Run several vector searches, in one FAISS call when the store exposes its index."""
+    index = getattr(vectorstore, "index", None)
+    index_to_docstore_id = getattr(vectorstore, "index_to_docstore_id", None)
+    docstore = getattr(vectorstore, "docstore", None)
+    if index is None or index_to_docstore_id is None or docstore is None:
+        return [vectorstore.similarity_search_by_vector(vector, k=k) for vector in vectors]
+
+    import numpy as np
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if getattr(vectorstore, "_normalize_L2", False):
+        import faiss  # type: ignore
+
+        faiss.normalize_L2(matrix)
+    _scores, indices = index.search(matrix, k)
+
+    results: List[List[Document]] = []
+    for row in indices:
+        docs: List[Document] = []
+        for i in row:
+            if i == -1:
+                continue
+            doc = docstore.search(index_to_docstore_id[i])
+            if isinstance(doc, Document):
+                docs.append(doc)
+        results.append(docs)
+    return results
+
+
 class FactDataRAG:
     """Embeds fact indicators and exposes similarity search over them."""
 
@@ -50,44 +99,99 @@ class FactDataRAG:
         vectorstore: VectorStore | None = None,
         chunk_size: int = 1200,
         chunk_overlap: int = 50,
+        chunk_workers: int = 1,
+        chunk_tokenizer: Any = None,
+        chunk_max_tokens: int = FactDataMarkdownChunker.DEFAULT_MAX_TOKENS,
+        indexer: IndexingEmbedder | None = None,
     ) -> None:
         self.embeddings = embeddings
         self.vectorstore = vectorstore or _default_vectorstore(embeddings)
+        self.indexer = indexer or IndexingEmbedder(embeddings)
         self.chunker = FactDataMarkdownChunker(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
+            workers=chunk_workers,
+            tokenizer=chunk_tokenizer,
+            max_tokens=chunk_max_tokens,
         )
 
     def search(self, query: str, *, k: int = 10) -> List[Document]:
         """Similarity search against indexed facts."""
         return self.vectorstore.similarity_search(query, k=k)
 
+    def search_many(self, queries: Sequence[str], *, k: int = 10) -> List[List[Document]]:
+        """Similarity search for several queries with one batched vector search.
+
+        Queries go through `embed_query`, like `search`, so instruction/asymmetric models
+        apply their query-side prefix. Duplicate queries are embedded and searched only once.
+        """
+        if not queries:
+            return []
+        unique: Dict[str, int] = {}
+        for query in queries:
+            unique.setdefault(query, len(unique))
+        vectors = [self.embeddings.embed_query(query) for query in unique]
+        docs = _search_by_vectors(self.vectorstore, vectors, k=k)
+        return [list(docs[unique[query]]) for query in queries]
+
     def as_retriever(self, *, k: int = 10) -> VectorStoreRetriever:
         """Expose a LangChain retriever with a fixed top-k."""
         return self.vectorstore.as_retriever(search_kwargs={"k": k})
 
+    def quantize(self, mode: str, *, rescore_factor: int = 0) -> bool:
+        """Swap the built index for a scalar-quantized one (`fp16` or `sq8`)."""
+        return quantize_vectorstore(self.vectorstore, mode, rescore_factor=rescore_factor)
+
+    def chunking_settings(self) -> Dict[str, int]:
+        """Chunker settings that determine the chunks; recorded in every snapshot."""
+        chunker = self.chunker
+        return {
+            "chunk_size": chunker.chunk_size,
+            "chunk_overlap": chunker.chunk_overlap,
+            "chunk_max_tokens": chunker.max_tokens if chunker.token_mode else 0,
+        }
+
+    def save_snapshot(self, directory: Path, **manifest: Any) -> Path:
+        """Write the indexed vectors (float16) and chunks to `directory` for `load_snapshot`."""
+        return save_snapshot(self.vectorstore, directory, **self.chunking_settings(), **manifest)
+
     def index_markdown_file(self, file_path: Path) -> List[str]:
         """Index a single markdown file by chunking and adding to vector store."""
         chunks = self.chunker.chunk_markdown_file(file_path)
         if not chunks:
             return []
-        
-        return self.vectorstore.add_documents(chunks)
+
+        with self.indexer.multi_process():
+            return self.indexer.add_documents(self.vectorstore, chunks)
     
     def index_markdown_directory(
         self,
         directory: Path,
         pattern: str = "page_*.md",
+        batch_size: int = 256,
     ) -> List[str]:
-        """Index all markdown files in a directory."""
-        chunks = self.chunker.chunk_directory(directory, pattern)
-        
-        if not chunks:
+        """Index all markdown files in a directory.
+
+        Chunks are embedded and added in batches of `batch_size` as the chunker yields them,
+        so embedding starts while later files are still being split. Each batch goes through
+        `self.indexer` (length-sorted encode batches, optional multi-process pool).
+        """
+        chunks = self.chunker.iter_chunks(directory, pattern)
+        ids: List[str] = []
+        with self.indexer.multi_process():
+            while True:
+                batch = list(islice(chunks, max(1, batch_size)))
+                if not batch:
+                    break
+                ids.extend(self.indexer.add_documents(self.vectorstore, batch))
+                logger.debug(f"Indexed {len(ids)} chunks so far")
+
+        if not ids:
             logger.warning(f"No chunks created from {directory}")
             return []
-        
-        logger.info(f"Indexing {len(chunks)} chunks into vector store")
-        return self.vectorstore.add_documents(chunks)
+        logger.info(f"Indexed {len(ids)} chunks into vector store")
+        self.indexer.log_throughput("Fact data indexing")
+        return ids
 
 
 def documents_to_context_prompt(documents: Iterable[Document]) -> str:
@@ -120,4 +224,4 @@ def documents_to_context_prompt(documents: Iterable[Document]) -> str:
     return "\n\n---\n\n".join(blocks)
 
 
-__all__ = ["FactDataRAG", "documents_to_context_prompt"]
+__all__ = ["FactDataRAG", "documents_to_context_prompt", "markdown_source_fingerprint"]
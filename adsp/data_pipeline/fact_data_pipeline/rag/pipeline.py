@@ -7,10 +7,13 @@ from typing import List, Optional
 
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
-from langchain_huggingface import HuggingFaceEmbeddings
 from loguru import logger
 
-from .indicator import FactDataRAG
+from adsp.data_pipeline.embedding_utils import get_embedding_model_name, get_embedding_tokenizer
+from adsp.data_pipeline.indexing_embedder import IndexingEmbedder
+
+from .chunker import FactDataMarkdownChunker
+from .indicator import FactDataRAG, markdown_source_fingerprint
 
 
 def run_fact_data_indexing_pipeline(
@@ -21,6 +24,14 @@ def run_fact_data_indexing_pipeline(
     chunk_overlap: int = 50,
     pattern: str = "page_*.md",
     vectorstore: Optional[VectorStore] = None,
+    chunk_workers: int = 1,
+    token_chunking: bool = False,
+    max_tokens: Optional[int] = None,
+    embed_batch_size: Optional[int] = None,
+    embed_processes: Optional[int] = None,
+    quantization: str = "none",
+    rescore_factor: int = 0,
+    snapshot_dir: Optional[Path] = None,
 ) -> FactDataRAG:
     """
     Run the complete fact data indexing pipeline: chunk markdown files and index into RAG.
@@ -33,6 +44,16 @@ def run_fact_data_indexing_pipeline(
         chunk_overlap: Overlap between chunks in characters (default: 50)
         pattern: Glob pattern for markdown files (default: page_*.md)
         vectorstore: Optional pre-initialized vector store. If None, uses the default FAISS store
+        chunk_workers: Processes splitting markdown files (1 = in-process, 0 = one per CPU core)
+        token_chunking: Measure chunks with the embedding model's tokenizer instead of characters
+        max_tokens: Token budget per chunk in token mode (default: the model's max sequence length, else 384)
+        embed_batch_size: Texts per encode call (default: ADSP_EMBED_BATCH_SIZE, else 64)
+        embed_processes: Encoder processes for sentence-transformers models (default: ADSP_EMBED_PROCESSES, else 1)
+        quantization: Vector storage after indexing: none (float32), fp16 or sq8 (int8)
+        rescore_factor: With sq8, re-rank k * rescore_factor candidates against float16 vectors (0 = off)
+        snapshot_dir: Optional directory to write a float16 snapshot of the index to. It records the
+            markdown fingerprint, chunking and embedding model, so the runtime
+            (`ADSP_FACTDATA_SNAPSHOT_DIR`) loads it when those match its own settings
         
     Returns:
         FactDataRAG instance with indexed data ready for search
@@ -47,19 +68,37 @@ def run_fact_data_indexing_pipeline(
     logger.info("=" * 70)
     logger.info(f"Markdown directory: {markdown_dir}")
     logger.info(f"Embedding model: {embedding_model_name}")
-    logger.info(f"Chunk size: {chunk_size} characters")
-    logger.info(f"Chunk overlap: {chunk_overlap} characters")
     logger.info(f"File pattern: {pattern}")
     
     # Initialize embedding model if not provided
     if embedding_model is None:
         logger.info("Loading embedding model...")
+        from langchain_huggingface import HuggingFaceEmbeddings
+
         embedding_model = HuggingFaceEmbeddings(model_name=embedding_model_name)
         logger.info("Embedding model loaded")
     
+    tokenizer = None
+    if token_chunking:
+        tokenizer, max_seq_length = get_embedding_tokenizer(embedding_model)
+        if tokenizer is None:
+            raise ValueError("Token chunking needs an embedding model with a known Hugging Face tokenizer")
+        max_tokens = max_tokens or max_seq_length or FactDataMarkdownChunker.DEFAULT_MAX_TOKENS
+        logger.info(f"Chunk budget: {max_tokens} tokens (embedding model tokenizer)")
+    else:
+        logger.info(f"Chunk size: {chunk_size} characters")
+        logger.info(f"Chunk overlap: {chunk_overlap} characters")
+    
     if vectorstore is None:
         logger.info("Using default FAISS vector store...")
     
+    indexer = IndexingEmbedder(embedding_model)
+    if embed_batch_size:
+        indexer.batch_size = embed_batch_size
+    if embed_processes:
+        indexer.processes = embed_processes
+    logger.info(f"Embedding batch size: {indexer.batch_size}, processes: {indexer.processes}")
+
     # Initialize RAG with chunking parameters
     logger.info("Initializing RAG system with chunker...")
     rag = FactDataRAG(
@@ -67,12 +106,24 @@ def run_fact_data_indexing_pipeline(
         vectorstore=vectorstore,
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
+        chunk_workers=chunk_workers,
+        chunk_tokenizer=tokenizer,
+        chunk_max_tokens=max_tokens or FactDataMarkdownChunker.DEFAULT_MAX_TOKENS,
+        indexer=indexer,
     )
     logger.info("RAG system initialized")
     
     # Chunk and index markdown files
     logger.info(f"Chunking and indexing markdown files from {markdown_dir}...")
+    source = markdown_source_fingerprint(markdown_dir, pattern=pattern)
     chunk_ids = rag.index_markdown_directory(markdown_dir, pattern=pattern)
+
+    if snapshot_dir is not None and chunk_ids:
+        rag.save_snapshot(
+            Path(snapshot_dir), source=source, embedding_model=get_embedding_model_name(embedding_model)
+        )
+    if rag.quantize(quantization, rescore_factor=rescore_factor):
+        logger.info(f"Vectors stored as {quantization}")
     
     logger.info("=" * 70)
     logger.success(f"Pipeline complete! Indexed {len(chunk_ids)} chunks")
@@ -0,0 +1,203 @@
+"""Bulk document embedding for building the RAG indexes.
+
+`IndexingEmbedder` wraps the `Embeddings` model used for retrieval and takes
+over the indexing-side `embed_documents` calls:
+
+- texts are sorted by length before batching, so each batch pads to similar
+  lengths, and results are returned in input order;
+- batches have an explicit size (`ADSP_EMBED_BATCH_SIZE`);
+- with `ADSP_EMBED_PROCESSES` > 1, sentence-transformers models encode through a
+  multi-process pool (`start_multi_process_pool`) opened for the duration of a
+  `multi_process()` block;
+- throughput (chunks/s) is accumulated in `stats` and logged.
+
+Queries keep going through the wrapped model unchanged.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from loguru import logger
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
+
+
+def _sentence_transformer(embeddings: Embeddings) -> Any:
+    """The sentence-transformers model behind `HuggingFaceEmbeddings`, if any."""
+
+    client = getattr(embeddings, "_client", None) or getattr(embeddings, "client", None)
+    return client if callable(getattr(client, "encode", None)) else None
+
+
+def add_embedded(
+    vectorstore: VectorStore,
+    texts: Sequence[str],
+    vectors: Sequence[List[float]],
+    metadatas: Optional[Sequence[dict]] = None,
+) -> List[str]:
+    """Add texts with pre-computed vectors; stores without `add_embeddings` embed them again."""
+
+    if not texts:
+        return []
+    metadatas = list(metadatas) if metadatas is not None else None
+    add_embeddings = getattr(vectorstore, "add_embeddings", None)
+    if not callable(add_embeddings):
+        return vectorstore.add_texts(list(texts), metadatas=metadatas)
+    return add_embeddings(list(zip(texts, vectors)), metadatas=metadatas)
+
+
+@dataclass
+class EmbeddingStats:
+    texts: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def chunks_per_s(self) -> float:
+        return self.texts / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class IndexingEmbedder:
+    """Length-sorted, batched (optionally multi-process) `embed_documents` for index builds.
+
+    Configuration (environment variables):
+    - `ADSP_EMBED_BATCH_SIZE`: texts per encode call (default: `64`)
+    - `ADSP_EMBED_PROCESSES`: encoder processes for sentence-transformers models;
+      `1` encodes in-process (default: `1`)
+    """
+
+    embeddings: Embeddings
+    batch_size: int = field(default_factory=lambda: _env_int("ADSP_EMBED_BATCH_SIZE", 64))
+    processes: int = field(default_factory=lambda: _env_int("ADSP_EMBED_PROCESSES", 1))
+    sort_by_length: bool = True
+    stats: EmbeddingStats = field(default_factory=EmbeddingStats)
+
+    _pool: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    @contextmanager
+    def multi_process(self) -> Iterator["IndexingEmbedder"]:
+        """Keep a sentence-transformers process pool open for the calls made inside the block."""
+
+        model = _sentence_transformer(self.embeddings)
+        if self.processes <= 1 or model is None or self._pool is not None:
+            yield self
+            return
+        logger.info(f"Starting {self.processes} embedding processes")
+        self._pool = model.start_multi_process_pool(target_devices=["cpu"] * self.processes)
+        try:
+            yield self
+        finally:
+            pool, self._pool = self._pool, None
+            model.stop_multi_process_pool(pool)
+
+    def embed_documents(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed `texts` in length-sorted batches; vectors come back in input order."""
+
+        if not texts:
+            return []
+        order = list(range(len(texts)))
+        if self.sort_by_length:
+            order.sort(key=lambda i: len(texts[i]))
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        size = max(1, self.batch_size)
+
+        started = time.perf_counter()
+        batches = 0
+        if self._pool is not None:
+            # The pool splits work across processes itself; hand it everything at once.
+            batch_vectors = self._encode_with_pool([texts[i] for i in order])
+            for i, vector in zip(order, batch_vectors):
+                vectors[i] = vector
+            batches = (len(order) + size - 1) // size
+        else:
+            for start in range(0, len(order), size):
+                batch = order[start : start + size]
+                for i, vector in zip(batch, self._encode([texts[i] for i in batch])):
+                    vectors[i] = vector
+                batches += 1
+        elapsed = time.perf_counter() - started
+
+        self.stats.texts += len(texts)
+        self.stats.batches += batches
+        self.stats.seconds += elapsed
+        logger.debug(
+            f"Embedded {len(texts)} texts in {batches} batches ({len(texts) / elapsed if elapsed else 0:.1f} chunks/s)"
+        )
+        return vectors  # type: ignore[return-value]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+    def add_documents(self, vectorstore: VectorStore, documents: Sequence[Document]) -> List[str]:
+        """Embed `documents` here and add them with their vectors (falls back to `add_documents`)."""
+
+        if not callable(getattr(vectorstore, "add_embeddings", None)):
+            return vectorstore.add_documents(list(documents)) if documents else []
+        return self.add_texts(
+            vectorstore,
+            [doc.page_content for doc in documents],
+            [doc.metadata for doc in documents],
+        )
+
+    def add_texts(
+        self,
+        vectorstore: VectorStore,
+        texts: Sequence[str],
+        metadatas: Optional[Sequence[dict]] = None,
+    ) -> List[str]:
+        """Embed `texts` here and add them with their vectors (falls back to `add_texts`)."""
+
+        if not texts:
+            return []
+        if not callable(getattr(vectorstore, "add_embeddings", None)):
+            return vectorstore.add_texts(list(texts), metadatas=list(metadatas) if metadatas is not None else None)
+        return add_embedded(vectorstore, texts, self.embed_documents(texts), metadatas)
+
+    def log_throughput(self, label: str) -> None:
+        logger.info(
+            f"{label}: embedded {self.stats.texts} chunks in {self.stats.seconds:.1f}s "
+            f"({self.stats.chunks_per_s:.1f} chunks/s, batch_size={self.batch_size}, processes={self.processes})"
+        )
+
+    def _encode(self, batch: List[str]) -> List[List[float]]:
+        model = _sentence_transformer(self.embeddings)
+        if model is None:
+            return self.embeddings.embed_documents(batch)
+        # Same preprocessing and options as HuggingFaceEmbeddings.embed_documents.
+        encode_kwargs = dict(getattr(self.embeddings, "encode_kwargs", None) or {})
+        encode_kwargs["batch_size"] = len(batch)
+        cleaned = [text.replace("\n", " ") for text in batch]
+        return model.encode(cleaned, show_progress_bar=False, **encode_kwargs).tolist()
+
+    def _encode_with_pool(self, texts: List[str]) -> List[List[float]]:
+        model = _sentence_transformer(self.embeddings)
+        encode_kwargs = getattr(self.embeddings, "encode_kwargs", None) or {}
+        cleaned = [text.replace("\n", " ") for text in texts]
+        vectors = model.encode_multi_process(
+            cleaned,
+            self._pool,
+            batch_size=max(1, self.batch_size),
+            normalize_embeddings=bool(encode_kwargs.get("normalize_embeddings", False)),
+        )
+        return vectors.tolist()
+
+
+__all__ = ["EmbeddingStats", "IndexingEmbedder", "add_embedded"]
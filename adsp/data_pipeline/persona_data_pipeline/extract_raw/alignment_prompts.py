@@ -8,19 +8,7 @@ Return strict JSON with keys: style_profile, value_frame, reasoning_policies, co
 - If you are unsure, leave the field empty or pick "medium"/"balanced"/"varies_by_question".
 """
 
-ALIGNMENT_USER_TEMPLATE = """
-Persona:
-- persona_id: {persona_id}
-- persona_name: {persona_name}
-- summary_bio: {summary_bio}
-
-Existing partial profile (may be empty):
-{partial_profile}
-
-Salient key_indicators (statements where salience.is_salient=true):
-{key_indicators}
-
-Required JSON schema:
+_PROFILE_SCHEMA = """Required JSON schema:
 {{
   "style_profile": {{
     "tone_adjectives": [ "string" ],
@@ -63,5 +51,39 @@ Required JSON schema:
   }}
 }}
 
+"""
+
+ALIGNMENT_USER_TEMPLATE = """
+Persona:
+- persona_id: {persona_id}
+- persona_name: {persona_name}
+- summary_bio: {summary_bio}
+
+Existing partial profile (may be empty):
+{partial_profile}
+
+Salient key_indicators (statements where salience.is_salient=true):
+{key_indicators}
+
+""" + _PROFILE_SCHEMA + """Return only valid JSON for this persona.
+"""
+
+RECONCILE_USER_TEMPLATE = """
+Persona:
+- persona_id: {persona_id}
+- persona_name: {persona_name}
+- summary_bio: {summary_bio}
+
+The salient evidence for this persona was analysed in {chunk_count} independent parts.
+Partial profiles, one per part:
+{partial_profiles}
+
+Mechanical merge of the partial profiles (lists concatenated, first value kept for scalar fields):
+{merged_profile}
+
+Reconcile these into one consistent profile: resolve conflicting scalar values by the weight of the evidence,
+drop duplicate or near-duplicate list items and keep lists concise.
+
+""" + _PROFILE_SCHEMA + """
 Return only valid JSON for this persona.
 """
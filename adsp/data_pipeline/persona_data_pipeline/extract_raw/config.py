@@ -27,6 +27,8 @@ class PersonaExtractionConfig:
     debug: bool = False
     debug_dir: Path = config.INTERIM_DATA_DIR / "persona_extraction" / "debug"
     reuse_cache: bool = True
+    resume: bool = False  # continue an interrupted run from its journal; only outstanding work is redone
+    run_journal_path: Optional[Path] = None  # defaults to run_journal.jsonl next to raw_responses_dir
     structured_pages_output_path: Path = (
         config.INTERIM_DATA_DIR / "persona_extraction" / "pages_structured.json"
     )
@@ -44,12 +46,26 @@ class PersonaExtractionConfig:
     max_concurrent_requests: int = 1
     max_retries: int = 1  # number of retries after the first attempt
     backoff_seconds: float = 1.5
+    async_extraction: bool = False  # asyncio extractor with adaptive (AIMD) concurrency
+    max_concurrent_requests_ceiling: int = 16  # AIMD upper bound; max_concurrent_requests is the start
+    latency_target_seconds: float = 120.0  # slower responses count as overload and shrink concurrency
+    tokens_per_minute: int = 0  # async token-rate budget sent to the server (0 = unlimited)
+    estimated_tokens_per_image: int = 1500  # budget estimate, settled against reported usage
+    estimated_output_tokens: int = 2000
+    backoff_max_seconds: float = 60.0  # cap for jittered exponential backoff (async mode)
     dpi: int = 300
+    render_workers: int = 1  # processes for PDF rendering (1 = in-process, 0 = one per CPU core)
+    render_to_image_budget: bool = False  # lower the render DPI so PNGs fit `max_image_bytes` without re-encoding
+    streaming: bool = False  # pipelined render -> encode -> extract instead of stage-by-stage
+    stream_queue_size: int = 8  # rendered pages buffered ahead of encoding (back-pressure)
+    encode_workers: int = 2  # threads encoding page images in streaming mode
     page_range: Optional[tuple[int, int]] = None  # inclusive 1-based page range
     merge_strategy: Dict[str, str] = field(
         default_factory=dict
     )  # dotted path -> fill|overwrite|append
     max_image_bytes: int = 10 * 1024 * 1024  # compress images to stay below payload limits
+    image_cache_entries: int = 32  # encoded page images kept in memory and shared by extractor workers
+    image_cache_dir: Optional[Path] = None  # optional on-disk cache of compressed JPEGs
     generate_reasoning_profiles: bool = True
     reasoning_base_url: str = field(
         default_factory=lambda: os.environ.get(
@@ -65,3 +81,6 @@ class PersonaExtractionConfig:
     reasoning_max_tokens: int = 100000
     reasoning_max_input_chars: int = 100000
     reasoning_max_concurrent: int = 2
+    reasoning_map_reduce: bool = False  # reason over indicator chunks concurrently, then merge
+    reasoning_chunk_workers: int = 4  # concurrent chunk calls per persona in map-reduce mode
+    reasoning_reconcile: bool = False  # extra call reconciling the merged chunk profiles (map-reduce mode)
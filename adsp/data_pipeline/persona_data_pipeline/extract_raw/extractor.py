@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, List, Optional, Sequence
+from typing import Any, Callable, List, Mapping, Optional, Sequence
 
 from loguru import logger
 
+from adsp.data_pipeline.async_extraction import (
+    AIMDLimiter,
+    TokenRateBudget,
+    backoff_delay,
+    is_overload_error,
+)
+from adsp.data_pipeline.extraction_cache import page_cache_key, request_fingerprint
+
 from .config import PersonaExtractionConfig
 from .models import PageExtractionResult, PageImage
 from .prompts import SYSTEM_PROMPT
-from .utils import encode_image_base64, strip_json_markdown
+from .utils import EncodedImageCache, strip_json_markdown
 
 
 class VLLMOpenAIExtractor:
@@ -36,6 +45,31 @@ class VLLMOpenAIExtractor:
         self.max_concurrent = max(1, config.max_concurrent_requests)
         self.context_window = max(0, getattr(config, "context_window", 0))
         self.max_image_bytes = getattr(config, "max_image_bytes", None)
+        self.image_cache = EncodedImageCache(
+            max_entries=getattr(config, "image_cache_entries", 32),
+            disk_dir=getattr(config, "image_cache_dir", None),
+        )
+        self.base_url = config.vllm_base_url
+        self.api_key = config.vllm_api_key
+        self.async_extraction = bool(getattr(config, "async_extraction", False))
+        self.max_concurrent_ceiling = max(
+            self.max_concurrent, getattr(config, "max_concurrent_requests_ceiling", self.max_concurrent)
+        )
+        self.latency_target_seconds = getattr(config, "latency_target_seconds", 120.0)
+        self.tokens_per_minute = max(0, getattr(config, "tokens_per_minute", 0))
+        self.estimated_tokens_per_image = getattr(config, "estimated_tokens_per_image", 1500)
+        self.estimated_output_tokens = getattr(config, "estimated_output_tokens", 2000)
+        self.backoff_max_seconds = getattr(config, "backoff_max_seconds", 60.0)
+        self.request_fingerprint = request_fingerprint(
+            SYSTEM_PROMPT,
+            {
+                "model": self.model,
+                "temperature": self.temperature,
+                "top_p": self.top_p,
+                "max_tokens": self.max_tokens,
+                "max_image_bytes": self.max_image_bytes,
+            },
+        )
         if not self.model:
             raise ValueError(
                 "Set VLLM_MODEL to the OpenAI-compatible vision model name (e.g., llava)."
@@ -53,6 +87,12 @@ class VLLMOpenAIExtractor:
         """
         if not pages:
             return []
+        if self.async_extraction:
+            return asyncio.run(
+                self.aextract_pages(
+                    pages, on_result=on_result, all_pages=all_pages, context_window=context_window
+                )
+            )
         all_pages = all_pages or pages
         window = self.context_window if context_window is None else max(0, context_window)
         page_lookup = {p.page_number: p for p in all_pages}
@@ -83,8 +123,45 @@ class VLLMOpenAIExtractor:
                         )
         return sorted(results, key=lambda r: r.page_number)
 
+    def extract_page(
+        self,
+        page: PageImage,
+        context_pages: Sequence[PageImage],
+        image_contents: Optional[Mapping[int, dict]] = None,
+    ) -> PageExtractionResult:
+        """
+        Extract one page given its context pages. `image_contents` maps page number -> pre-encoded
+        image block (see `encode_page`), letting the streaming pipeline encode each image once.
+        """
+        return self._extract_single_page(page, context_pages, image_contents)
+
+    def context_pages(
+        self,
+        page: PageImage,
+        all_pages: Sequence[PageImage],
+        context_window: Optional[int] = None,
+    ) -> List[PageImage]:
+        """Pages sent with `page`: the page itself first, then its neighbours within the window."""
+        window = self.context_window if context_window is None else max(0, context_window)
+        return self._build_context_pages(page, {p.page_number: p for p in all_pages}, window)
+
+    def cache_key(self, page: PageImage, context_pages: Sequence[PageImage]) -> str:
+        """Content-addressed key of the request `extract_page(page, context_pages)` sends."""
+        return page_cache_key(
+            self.request_fingerprint,
+            page.page_number,
+            [(p.page_number, p.image_path) for p in context_pages],
+        )
+
+    def encode_page(self, page: PageImage) -> dict:
+        """Encode a page image into a reusable `image_url` content block."""
+        return self._image_content(page)
+
     def _extract_single_page(
-        self, page: PageImage, context_pages: Sequence[PageImage]
+        self,
+        page: PageImage,
+        context_pages: Sequence[PageImage],
+        image_contents: Optional[Mapping[int, dict]] = None,
     ) -> PageExtractionResult:
         """It handles extraction for a single page"""
         last_error: Optional[str] = None
@@ -93,31 +170,10 @@ class VLLMOpenAIExtractor:
         for attempt in range(1, total_attempts + 1):
             try:
                 response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {
-                            "role": "user",
-                            "content": self._build_user_content(page, context_pages),
-                        },
-                    ],
-                    temperature=self.temperature,
-                    top_p=self.top_p,
-                    max_tokens=self.max_tokens,
-                    timeout=self.response_timeout,
+                    **self._request_kwargs(self._build_user_content(page, context_pages, image_contents))
                 )
                 raw_text = response.choices[0].message.content or ""
-                parsed = self._select_parsed_for_page(
-                    self._parse_raw_response(raw_text), page.page_number
-                )
-                if parsed is None:
-                    raise ValueError("Model returned unparsable JSON.")
-                return PageExtractionResult(
-                    page_number=page.page_number,
-                    raw_text=raw_text,
-                    parsed=parsed,
-                    error=None,
-                )
+                return self._page_result(page, raw_text)
             except Exception as exc:  # pragma: no cover - external call
                 last_error = str(exc)
                 logger.warning(
@@ -130,11 +186,151 @@ class VLLMOpenAIExtractor:
                     break
                 time.sleep(self.backoff_seconds * attempt)
 
+        return self._failed_result(page, raw_text, last_error)
+
+    async def aextract_pages(
+        self,
+        pages: Sequence[PageImage],
+        on_result: Optional[Callable[[PageExtractionResult], None]] = None,
+        all_pages: Optional[Sequence[PageImage]] = None,
+        context_window: Optional[int] = None,
+    ) -> List[PageExtractionResult]:
+        """
+        Asyncio variant of `extract_pages` built on `AsyncOpenAI`. Concurrency adapts between
+        `max_concurrent_requests` and `max_concurrent_requests_ceiling` (AIMD on latency, 429 and 5xx),
+        retries back off with jitter without holding a slot, and `tokens_per_minute` caps the token rate.
+        """
+        if not pages:
+            return []
+        try:
+            from openai import AsyncOpenAI  # type: ignore
+        except ImportError as exc:  # pragma: no cover - import guard
+            raise ImportError("openai>=1.0 is required for async extraction.") from exc
+
+        all_pages = all_pages or pages
+        window = self.context_window if context_window is None else max(0, context_window)
+        page_lookup = {p.page_number: p for p in all_pages}
+        limiter = AIMDLimiter(
+            initial=self.max_concurrent,
+            maximum=self.max_concurrent_ceiling,
+            latency_target_s=self.latency_target_seconds,
+        )
+        budget = TokenRateBudget(tokens_per_minute=self.tokens_per_minute)
+        # Pages whose content is built but not yet answered: bounds encoded images held in memory.
+        prepared = asyncio.Semaphore(2 * self.max_concurrent_ceiling)
+        client = AsyncOpenAI(base_url=self.base_url, api_key=self.api_key, max_retries=0)
+        results: List[PageExtractionResult] = []
+        try:
+            tasks = [
+                asyncio.ensure_future(
+                    self._aextract_single_page(
+                        client,
+                        limiter,
+                        budget,
+                        page,
+                        self._build_context_pages(page, page_lookup, window),
+                        prepared,
+                    )
+                )
+                for page in pages
+            ]
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                results.append(result)
+                if on_result:
+                    try:
+                        on_result(result)
+                    except Exception as exc:  # pragma: no cover - defensive logging
+                        logger.warning(
+                            f"Failed to handle on_result for page {result.page_number}: {exc}"
+                        )
+        finally:
+            await client.close()
+        logger.info(f"Async extraction finished with concurrency limit {limiter.limit:.1f}")
+        return sorted(results, key=lambda r: r.page_number)
+
+    async def _aextract_single_page(
+        self,
+        client: Any,
+        limiter: AIMDLimiter,
+        budget: TokenRateBudget,
+        page: PageImage,
+        context_pages: Sequence[PageImage],
+        prepared: Optional[asyncio.Semaphore] = None,
+    ) -> PageExtractionResult:
+        """
+        The request content is built before a limiter slot is taken, so the AIMD window and its
+        latency samples cover only the LLM call; `prepared` bounds the pages held encoded meanwhile.
+        """
+        last_error: Optional[str] = None
+        raw_text = ""
+        content: Optional[List[dict]] = None
+        estimate = self.estimated_tokens_per_image * len(context_pages) + self.estimated_output_tokens
+        total_attempts = max(1, self.max_retries + 1)
+        async with prepared or asyncio.Semaphore(1):
+            for attempt in range(1, total_attempts + 1):
+                try:
+                    if content is None:
+                        # Image encoding is CPU-bound; keep it off the event loop.
+                        content = await asyncio.to_thread(self._build_user_content, page, context_pages)
+                    await budget.acquire(estimate)
+                    async with limiter.slot():
+                        start = time.perf_counter()
+                        response = await client.chat.completions.create(**self._request_kwargs(content))
+                        limiter.on_success(time.perf_counter() - start)
+                    budget.settle(estimate, getattr(getattr(response, "usage", None), "total_tokens", None))
+                    raw_text = response.choices[0].message.content or ""
+                    return self._page_result(page, raw_text)
+                except Exception as exc:  # pragma: no cover - external call
+                    if is_overload_error(exc):
+                        limiter.on_overload()
+                    last_error = str(exc)
+                    logger.warning(
+                        (
+                            f"Extraction failed for page {page.page_number} "
+                            f"(attempt {attempt}/{total_attempts}): {exc}"
+                        )
+                    )
+                    if attempt >= total_attempts:
+                        break
+                    await asyncio.sleep(
+                        backoff_delay(attempt, base_seconds=self.backoff_seconds, max_seconds=self.backoff_max_seconds)
+                    )
+
+        return self._failed_result(page, raw_text, last_error)
+
+    def _request_kwargs(self, content: List[dict]) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": content},
+            ],
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "max_tokens": self.max_tokens,
+            "timeout": self.response_timeout,
+        }
+
+    def _page_result(self, page: PageImage, raw_text: str) -> PageExtractionResult:
+        """Build the result for a response, raising when it cannot be used (triggers a retry)."""
+        parsed = self._select_parsed_for_page(self._parse_raw_response(raw_text), page.page_number)
+        if parsed is None:
+            raise ValueError("Model returned unparsable JSON.")
+        return PageExtractionResult(
+            page_number=page.page_number,
+            raw_text=raw_text,
+            parsed=parsed,
+            error=None,
+        )
+
+    @staticmethod
+    def _failed_result(page: PageImage, raw_text: str, error: Optional[str]) -> PageExtractionResult:
         return PageExtractionResult(
             page_number=page.page_number,
             raw_text=raw_text,
             parsed=None,
-            error=last_error,
+            error=error,
         )
 
     @staticmethod
@@ -186,7 +382,7 @@ class VLLMOpenAIExtractor:
         return [page_lookup[num] for num in ordered]
 
     def _image_content(self, page: PageImage) -> dict:
-        encoded_image, mime_type = encode_image_base64(
+        encoded_image, mime_type = self.image_cache.encode(
             page.image_path,
             max_bytes=self.max_image_bytes,
         )
@@ -194,7 +390,10 @@ class VLLMOpenAIExtractor:
         return {"type": "image_url", "image_url": {"url": f"data:{mime};base64,{encoded_image}"}}
 
     def _build_user_content(
-        self, primary_page: PageImage, context_pages: Sequence[PageImage]
+        self,
+        primary_page: PageImage,
+        context_pages: Sequence[PageImage],
+        image_contents: Optional[Mapping[int, dict]] = None,
     ) -> List[dict]:
         preface = (
             "Extract structured JSON for the primary slide below. "
@@ -206,7 +405,8 @@ class VLLMOpenAIExtractor:
         for ctx_page in context_pages:
             label = "Primary slide" if ctx_page.page_number == primary_page.page_number else "Context slide"
             content.append({"type": "text", "text": f"{label} #{ctx_page.page_number}"})
-            content.append(self._image_content(ctx_page))
+            cached = image_contents.get(ctx_page.page_number) if image_contents else None
+            content.append(cached or self._image_content(ctx_page))
         return content
 
     @staticmethod
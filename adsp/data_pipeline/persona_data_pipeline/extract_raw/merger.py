@@ -2,16 +2,45 @@
 
 from __future__ import annotations
 
-import json
+from dataclasses import dataclass, field
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Hashable, List, Optional, Sequence
 
 from loguru import logger
 
+from adsp.data_pipeline.run_journal import atomic_write_json
+
 from .models import PageExtractionResult
 
 
+def _structural_key(value: Any) -> Hashable:
+    """Hashable, order-insensitive (for dict keys) form of a JSON-like value, used for dedup.
+
+    Two JSON-like values get the same key exactly when they compare equal with `==`, so `1`,
+    `1.0` and `True` are one item, also inside dicts and lists. (The `json.dumps` markers used
+    before kept `{"a": 1}` and `{"a": true}` apart while merging the scalars `1` and `True`.)
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _structural_key(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_structural_key(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+@dataclass
+class _ListIndex:
+    """Dedup state kept alongside one merged list so each page only pays for its own items."""
+
+    items: List[Any]
+    seen: set = field(default_factory=set)  # structural keys of plain (non-indicator) items
+    by_key: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # indicator key -> indicator
+
+
 class PersonaMerger:
     def __init__(self, document_name: str, merge_strategy: Optional[Dict[str, str]] = None):
         self.document_name = document_name
@@ -20,6 +49,8 @@ class PersonaMerger:
         self.general_content: List[dict] = []
         self.pages: List[dict] = []
         self.parse_failures: List[dict] = []
+        # id(list) -> index; the index holds the list, so ids are not reused while indexed.
+        self._indexes: Dict[int, _ListIndex] = {}
 
     def apply_page_result(self, result: PageExtractionResult) -> None:
         """
@@ -100,46 +131,57 @@ class PersonaMerger:
                 return self._slugify(text)
         return None
 
+    def _list_index(self, items: List[Any], path: str, indicators: bool) -> _ListIndex:
+        """
+        Return the persistent index of a merged list, building it on first use. Building also drops
+        duplicates already in the list (e.g. a list stored as-is by the overwrite strategy).
+        """
+        index = self._indexes.get(id(items))
+        if index is not None and index.items is items:
+            return index
+        index = _ListIndex(items=items)
+        existing = list(items)
+        items.clear()
+        for item in existing:
+            if indicators:
+                self._add_indicator(index, item, path)
+            else:
+                self._add_unique(index, item)
+        self._indexes[id(items)] = index
+        return index
+
+    @staticmethod
+    def _add_unique(index: _ListIndex, item: Any) -> None:
+        marker = _structural_key(item)
+        if marker in index.seen:
+            return
+        index.seen.add(marker)
+        index.items.append(item)
+
+    def _add_indicator(self, index: _ListIndex, item: Any, path: str) -> None:
+        if not isinstance(item, dict):
+            self._add_unique(index, item)
+            return
+        key = self._indicator_key(item)
+        if key and key in index.by_key:
+            self._deep_merge(index.by_key[key], item, path)
+            return
+        index.items.append(item)
+        if key:
+            index.by_key[key] = item
+
     def _merge_indicator_lists(
         self, existing: List[Any], incoming: List[Any], path: str
     ) -> List[Any]:
         """
         A specialized function for merging lists of indicators. It can find indicators with the same ID/label and
-        deep-merge their contents, rather than just appending duplicates
+        deep-merge their contents, rather than just appending duplicates. `existing` is extended in place using its
+        persistent index, so the cost is proportional to `incoming`
         """
-        merged: List[Any] = []
-        lookup: Dict[str, Dict[str, Any]] = {}
-        seen_misc: set[Any] = set()
-
-        def handle(item: Any) -> None:
-            if not isinstance(item, dict):
-                if isinstance(item, (int, float, str)):
-                    marker = item
-                else:
-                    try:
-                        marker = json.dumps(item, sort_keys=True)
-                    except Exception:
-                        marker = repr(item)
-                if marker in seen_misc:
-                    return
-                seen_misc.add(marker)
-                merged.append(item)
-                return
-
-            key = self._indicator_key(item)
-            if key and key in lookup:
-                self._deep_merge(lookup[key], item, path)
-                return
-
-            merged.append(item)
-            if key:
-                lookup[key] = item
-
-        for item in existing:
-            handle(item)
+        index = self._list_index(existing, path, indicators=True)
         for item in incoming:
-            handle(item)
-        return merged
+            self._add_indicator(index, item, path)
+        return existing
 
     def _stamp_indicator_sources(self, persona_data: Dict[str, Any], page_number: int) -> None:
         indicators = persona_data.get("indicators")
@@ -190,29 +232,18 @@ class PersonaMerger:
                     target[key] = value
             elif isinstance(value, list):
                 strategy = self.merge_strategy.get(path, "append")
-                if path.endswith("indicators") and strategy != "overwrite":
-                    existing_list = target.get(key, [])
-                    if not isinstance(existing_list, list):
-                        existing_list = []
-                    target[key] = self._merge_indicator_lists(existing_list, value, path)
-                    continue
-                target.setdefault(key, [])
                 if strategy == "overwrite":
-                    target[key] = value
-                else:
-                    existing = target.get(key, [])
-                    merged = existing + value
-                    seen = set()
-                    deduped = []
-                    for item in merged:
-                        marker = (
-                            json.dumps(item, sort_keys=True) if isinstance(item, dict) else item
-                        )
-                        if marker in seen:
-                            continue
-                        seen.add(marker)
-                        deduped.append(item)
-                    target[key] = deduped
+                    target[key] = list(value)
+                    continue
+                existing = target.get(key)
+                if not isinstance(existing, list):
+                    existing = target[key] = []
+                if path.endswith("indicators"):
+                    self._merge_indicator_lists(existing, value, path)
+                    continue
+                index = self._list_index(existing, path, indicators=False)
+                for item in value:
+                    self._add_unique(index, item)
             else:
                 strategy = self.merge_strategy.get(path, "fill")
                 if strategy == "overwrite" or target.get(key) in (None, "", [], {}):
@@ -245,15 +276,13 @@ class PersonaMerger:
             "general_content": self.general_content,
             "pages": self.pages,
         }
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(merged_payload, f, indent=2, ensure_ascii=False)
+        atomic_write_json(output_path, merged_payload)
 
         if persona_output_dir:
             persona_output_dir.mkdir(parents=True, exist_ok=True)
             for persona_id, payload in self.personas.items():
                 out_path = persona_output_dir / f"{persona_id}.json"
-                with out_path.open("w", encoding="utf-8") as pf:
-                    json.dump(payload, pf, indent=2, ensure_ascii=False)
+                atomic_write_json(out_path, payload)
             logger.info(f"Wrote individual persona files to {persona_output_dir}")
 
         qa_report = {
@@ -267,7 +296,6 @@ class PersonaMerger:
                 if r.parsed and isinstance(r.parsed.get("personas"), list) and r.parsed.get("personas")
             ],
         }
-        with qa_report_path.open("w", encoding="utf-8") as f:
-            json.dump(qa_report, f, indent=2, ensure_ascii=False)
+        atomic_write_json(qa_report_path, qa_report)
         logger.info(f"Wrote merged persona bundle to {output_path}")
         logger.info(f"Wrote QA report to {qa_report_path}")
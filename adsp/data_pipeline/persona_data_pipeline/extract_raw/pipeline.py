@@ -3,24 +3,51 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
 
 from langchain_core.runnables import RunnableLambda, RunnableSequence, RunnableSerializable
 from loguru import logger
 
+from adsp.data_pipeline.extraction_cache import MANIFEST_NAME, ExtractionManifest, file_sha256
+from adsp.data_pipeline.run_journal import (
+    DONE,
+    FAILED,
+    PENDING,
+    STAGE_EXTRACT,
+    STAGE_RUN,
+    STAGE_MERGE,
+    ProgressTracker,
+    RunJournal,
+    atomic_write_json,
+    atomic_write_text,
+)
+from adsp.data_pipeline.streaming import run_streaming_extraction
+
 from .config import PersonaExtractionConfig
 from .extractor import VLLMOpenAIExtractor
 from .merger import PersonaMerger
 from .models import PageExtractionResult, PageImage
 from .renderer import PDFRenderer
 from .reasoner import PersonaReasoner
+from .utils import RENDER_PNG_BYTES_PER_PIXEL, pixel_budget
 
 
 class PersonaExtractionPipeline:
     def __init__(self, config: Optional[PersonaExtractionConfig] = None):
         self.config = config or PersonaExtractionConfig()
-        self.renderer = PDFRenderer(dpi=self.config.dpi)
+        max_pixels = 0
+        if self.config.render_to_image_budget and self.config.max_image_bytes:
+            max_pixels = pixel_budget(self.config.max_image_bytes, RENDER_PNG_BYTES_PER_PIXEL)
+        self.renderer = PDFRenderer(
+            dpi=self.config.dpi,
+            workers=self.config.render_workers,
+            max_pixels=max_pixels,
+        )
         self.extractor = VLLMOpenAIExtractor(self.config)
+        self.manifest = ExtractionManifest.load(self.config.raw_responses_dir / MANIFEST_NAME)
+        self.journal: Optional[RunJournal] = None  # opened per run
+        self.progress: Optional[ProgressTracker] = None
         self.merger = PersonaMerger(
             document_name=self.config.pdf_path.name,
             merge_strategy=self.config.merge_strategy,
@@ -47,7 +74,82 @@ class PersonaExtractionPipeline:
         )
 
     def run(self) -> Dict[str, Any]:
-        return self._chain.invoke({}, config={"run_name": "PersonaExtractionPipeline"})
+        self.journal = RunJournal.open(self._journal_path(), resume=self.config.resume)
+        if self.config.streaming:
+            result = self._run_streaming()
+        else:
+            result = self._chain.invoke({}, config={"run_name": "PersonaExtractionPipeline"})
+        self.journal.record(STAGE_RUN, "pipeline", DONE)
+        return result
+
+    @property
+    def reuse_cache(self) -> bool:
+        # Resuming means reusing the work recorded as done, whatever `reuse_cache` says.
+        return self.config.reuse_cache or self.config.resume
+
+    def _journal_path(self) -> Path:
+        return self.config.run_journal_path or self.config.raw_responses_dir.parent / "run_journal.jsonl"
+
+    def _run_streaming(self) -> Dict[str, Any]:
+        """
+        Pipelined variant of the chain: pages are extracted while later pages are still rendering,
+        and results are merged in page order as soon as every earlier page is available.
+        """
+        if not self.config.pdf_path.exists():
+            raise FileNotFoundError(f"PDF not found at {self.config.pdf_path}")
+        logger.info("Starting persona extraction pipeline (streaming)")
+        page_numbers = self.renderer.page_numbers(self.config.pdf_path, self.config.page_range)
+        reuse_images = self._reuse_page_images()
+        cached_results: Dict[int, PageExtractionResult] = {}
+        if self.reuse_cache and reuse_images:
+            # Pages are not rendered yet: key cached responses on the images already on disk.
+            existing = self.renderer.existing_pages(self.config.page_images_dir, page_numbers)
+            cached_results = self._load_cached_results(self._cache_keys(existing, existing))
+            if cached_results:
+                logger.info(f"Reusing cached responses for {len(cached_results)} pages")
+        self._journal_plan(cached_results, [n for n in page_numbers if n not in cached_results])
+        cache_keys: Dict[int, str] = {}
+
+        def _extract(
+            page: PageImage, context_pages: List[PageImage], contents: Dict[int, Any]
+        ) -> PageExtractionResult:
+            cache_keys[page.page_number] = self.extractor.cache_key(page, context_pages)
+            return self.extractor.extract_page(page, context_pages, contents)
+
+        pending: Dict[int, PageExtractionResult] = dict(cached_results)
+        merge_order = iter(page_numbers)
+        next_page = [next(merge_order, None)]
+
+        def _merge_ready() -> None:
+            while next_page[0] is not None and next_page[0] in pending:
+                self.merger.apply_page_result(pending.pop(next_page[0]))
+                next_page[0] = next(merge_order, None)
+
+        def _on_result(result: PageExtractionResult) -> None:
+            self._persist_page_results([result], cache_keys)
+            pending[result.page_number] = result
+            _merge_ready()
+
+        _merge_ready()
+        new_results = run_streaming_extraction(
+            self.renderer.iter_render(
+                self.config.pdf_path,
+                self.config.page_images_dir,
+                self.config.page_range,
+                reuse_existing_images=reuse_images,
+            ),
+            page_numbers=page_numbers,
+            extract_numbers=set(page_numbers) - set(cached_results),
+            context_window=self.config.context_window,
+            encode=self.extractor.encode_page,
+            extract=_extract,
+            on_result=_on_result,
+            encode_workers=self.config.encode_workers,
+            extract_workers=self.extractor.max_concurrent,
+            queue_size=self.config.stream_queue_size,
+        )
+        page_results = sorted([*cached_results.values(), *new_results], key=lambda r: r.page_number)
+        return self._run_reasoner(self._write_merged(page_results))
 
     def _render_pages(self, _: Dict[str, Any]) -> Dict[str, Any]:
         if not self.config.pdf_path.exists():
@@ -57,7 +159,7 @@ class PersonaExtractionPipeline:
             self.config.pdf_path,
             self.config.page_images_dir,
             self.config.page_range,
-            reuse_existing_images=self.config.reuse_cache,
+            reuse_existing_images=self._reuse_page_images(),
         )
         logger.info(f"Rendered {len(pages)} pages from {self.config.pdf_path}")
 
@@ -65,9 +167,10 @@ class PersonaExtractionPipeline:
 
     def _prepare_extraction_plan(self, state: Dict[str, Any]) -> Dict[str, Any]:
         pages: Sequence[PageImage] = state["pages"]
+        cache_keys = self._cache_keys(pages, pages)
         cached_results: Dict[int, PageExtractionResult] = {}
-        if self.config.reuse_cache:
-            cached_results = self._load_cached_results(pages)
+        if self.reuse_cache:
+            cached_results = self._load_cached_results(cache_keys)
             if cached_results:
                 logger.info(
                     f"Reusing cached responses for {len(cached_results)} pages from "
@@ -77,7 +180,13 @@ class PersonaExtractionPipeline:
             logger.info("Cache reuse disabled; all pages will be extracted.")
 
         pages_to_extract = [page for page in pages if page.page_number not in cached_results]
-        return {**state, "cached_results": cached_results, "pages_to_extract": pages_to_extract}
+        self._journal_plan(cached_results, [page.page_number for page in pages_to_extract])
+        return {
+            **state,
+            "cache_keys": cache_keys,
+            "cached_results": cached_results,
+            "pages_to_extract": pages_to_extract,
+        }
 
     def _extract_and_collect(self, state: Dict[str, Any]) -> Dict[str, Any]:
         pages_to_extract: Sequence[PageImage] = state["pages_to_extract"]
@@ -92,7 +201,7 @@ class PersonaExtractionPipeline:
                 pages_to_extract,
                 all_pages=state["pages"],
                 context_window=self.config.context_window,
-                on_result=lambda r: self._persist_page_results([r]),
+                on_result=lambda r: self._persist_page_results([r], state["cache_keys"]),
             )
         else:
             logger.info("No remaining pages to extract after applying cache.")
@@ -108,7 +217,9 @@ class PersonaExtractionPipeline:
         logger.info(f"Merging and writing outputs for {len(page_results)} pages processed")
         for result in page_results:
             self.merger.apply_page_result(result)
+        return self._write_merged(page_results)
 
+    def _write_merged(self, page_results: Sequence[PageExtractionResult]) -> Dict[str, Any]:
         self.merger.write_outputs(
             self.config.merged_output_path,
             self.config.qa_report_path,
@@ -116,6 +227,7 @@ class PersonaExtractionPipeline:
             persona_output_dir=self.config.persona_output_dir,
         )
         self._write_page_outputs(page_results)
+        self.journal.record(STAGE_MERGE, "outputs", DONE)
         return {
             "personas": list(self.merger.personas.values()),
             "personas_map": self.merger.personas,
@@ -129,7 +241,8 @@ class PersonaExtractionPipeline:
         self.reasoner.process(
             persona_map,
             output_dir=self.config.reasoning_output_dir,
-            reuse_cache=self.config.reuse_cache,
+            reuse_cache=self.reuse_cache,
+            journal=self.journal,
         )
         return state
 
@@ -147,14 +260,55 @@ class PersonaExtractionPipeline:
             }
             for r in page_results
         ]
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        atomic_write_json(path, payload)
         logger.info(f"Wrote structured page outputs to {path}")
 
-    def _load_cached_results(self, pages: Sequence[PageImage]) -> Dict[int, PageExtractionResult]:
+    def _reuse_page_images(self) -> bool:
+        """Rendered images are reused only when they were rendered from the same PDF content.
+
+        Images of an older PDF are deleted before the new digest is recorded, so a re-render
+        that is interrupted never leaves them behind to be reused (and matched to cached
+        responses) as if they were current.
+        """
+        source_digest = file_sha256(self.config.pdf_path)
+        reuse = self.reuse_cache and self.manifest.source_digest == source_digest
+        if self.reuse_cache and not reuse:
+            logger.info("Source PDF is new or changed; re-rendering page images")
+        if self.manifest.source_digest != source_digest:
+            for stale in self.config.page_images_dir.glob("page_*.png"):
+                stale.unlink(missing_ok=True)
+            self.manifest.source_digest = source_digest
+            self.manifest.save()
+        return reuse
+
+    def _cache_keys(self, pages: Sequence[PageImage], all_pages: Sequence[PageImage]) -> Dict[int, str]:
+        return {
+            page.page_number: self.extractor.cache_key(
+                page, self.extractor.context_pages(page, all_pages, self.config.context_window)
+            )
+            for page in pages
+        }
+
+    def _journal_plan(self, cached_results: Mapping[int, PageExtractionResult], to_extract: Sequence[int]) -> None:
+        """Record the extraction plan and start measuring throughput over the outstanding pages."""
+        for page_number in sorted(cached_results):
+            if self.journal.status(STAGE_EXTRACT, page_number) != DONE:
+                self.journal.record(STAGE_EXTRACT, page_number, DONE, cached=True)
+        for page_number in to_extract:
+            self.journal.record(STAGE_EXTRACT, page_number, PENDING)
+        self.progress = ProgressTracker("Extraction", len(to_extract), unit="pages")
+
+    def _load_cached_results(self, cache_keys: Mapping[int, str]) -> Dict[int, PageExtractionResult]:
+        """Load stored responses whose manifest key matches the current request inputs."""
         cached: Dict[int, PageExtractionResult] = {}
-        for page in pages:
-            cache_path = self.config.raw_responses_dir / f"page_{page.page_number:04d}.json"
+        stale = 0
+        for page_number, cache_key in cache_keys.items():
+            if not self.journal.is_reusable(STAGE_EXTRACT, page_number):
+                continue  # resuming: not recorded as done, extract again
+            if not self.manifest.matches(page_number, cache_key):
+                stale += 1
+                continue
+            cache_path = self.config.raw_responses_dir / f"page_{page_number:04d}.json"
             if not cache_path.exists():
                 continue
             try:
@@ -167,22 +321,26 @@ class PersonaExtractionPipeline:
                 error = payload.get("error") if isinstance(payload, dict) else None
                 if error:
                     logger.info(
-                        f"Skipping cached page {page.page_number} because previous run failed: {error}"
+                        f"Skipping cached page {page_number} because previous run failed: {error}"
                     )
                     continue
-                cached[page.page_number] = PageExtractionResult(
-                    page_number=page.page_number,
+                cached[page_number] = PageExtractionResult(
+                    page_number=page_number,
                     raw_text=raw_text,
                     parsed=parsed,
                     error=error,
                 )
             except Exception as exc:
                 logger.warning(
-                    f"Could not load cached result for page {page.page_number} ({cache_path}): {exc}"
+                    f"Could not load cached result for page {page_number} ({cache_path}): {exc}"
                 )
+        if stale:
+            logger.info(f"{stale} pages have no cached response for their current inputs (image, prompt, model)")
         return cached
 
-    def _persist_page_results(self, results: Iterable[PageExtractionResult]) -> None:
+    def _persist_page_results(
+        self, results: Iterable[PageExtractionResult], cache_keys: Mapping[int, str]
+    ) -> None:
         self.config.raw_responses_dir.mkdir(parents=True, exist_ok=True)
         if self.config.debug:
             self.config.debug_dir.mkdir(parents=True, exist_ok=True)
@@ -193,16 +351,25 @@ class PersonaExtractionPipeline:
                 "parsed": result.parsed,
                 "error": result.error,
                 "raw_text": result.raw_text,
+                "cache_key": cache_keys.get(result.page_number),
             }
-            with out_path.open("w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            atomic_write_json(out_path, payload)
             logger.debug(f"Wrote raw response for page {result.page_number} -> {out_path}")
+            self.manifest.record(result.page_number, None if result.error else payload["cache_key"])
             if self.config.debug:
                 debug_path = self.config.debug_dir / f"page_{result.page_number:04d}.txt"
                 debug_payload = result.raw_text or ""
-                with debug_path.open("w", encoding="utf-8") as f:
-                    f.write(debug_payload)
+                atomic_write_text(debug_path, debug_payload)
                 logger.debug(f"Wrote debug raw text for page {result.page_number} -> {debug_path}")
+        self.manifest.save()
+        # Journal last: a page recorded as done has its response and manifest key on disk.
+        for result in results:
+            if result.error:
+                self.journal.record(STAGE_EXTRACT, result.page_number, FAILED, error=result.error)
+            else:
+                self.journal.record(STAGE_EXTRACT, result.page_number, DONE)
+            if self.progress is not None:
+                self.progress.advance()
 
 
 def run_persona_extraction_pipeline(
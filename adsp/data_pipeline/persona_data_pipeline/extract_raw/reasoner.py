@@ -8,7 +8,9 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
-from .alignment_prompts import ALIGNMENT_SYSTEM_PROMPT, ALIGNMENT_USER_TEMPLATE
+from adsp.data_pipeline.run_journal import DONE, FAILED, STAGE_REASONING, ProgressTracker, RunJournal, atomic_write_json
+
+from .alignment_prompts import ALIGNMENT_SYSTEM_PROMPT, ALIGNMENT_USER_TEMPLATE, RECONCILE_USER_TEMPLATE
 from .config import PersonaExtractionConfig
 from .utils import strip_json_markdown
 
@@ -32,13 +34,21 @@ class PersonaReasoner:
         self.top_p = config.reasoning_top_p
         self.max_tokens = config.reasoning_max_tokens
         self.max_input_chars = config.reasoning_max_input_chars
+        self.map_reduce = bool(getattr(config, "reasoning_map_reduce", False))
+        self.chunk_workers = max(1, getattr(config, "reasoning_chunk_workers", 4))
+        self.reconcile = bool(getattr(config, "reasoning_reconcile", False))
 
     def process(
         self,
         personas: Dict[str, Dict[str, Any]],
         output_dir,
         reuse_cache: bool = True,
+        journal: Optional[RunJournal] = None,
     ) -> Dict[str, Dict[str, Any]]:
+        """
+        Enrich every persona concurrently. With a `journal`, each persona's outcome is recorded and, when resuming,
+        only personas recorded as done reuse their stored profile.
+        """
         if not self.enabled:
             logger.info("Reasoning profiles disabled or reasoning model not set; skipping enrichment.")
             return {}
@@ -50,6 +60,7 @@ class PersonaReasoner:
         )
 
         results: Dict[str, Dict[str, Any]] = {}
+        progress = ProgressTracker("Reasoning", len(personas), unit="personas")
         with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
             future_map = {
                 executor.submit(
@@ -58,6 +69,7 @@ class PersonaReasoner:
                     persona,
                     output_dir,
                     reuse_cache,
+                    journal,
                 ): persona_id
                 for persona_id, persona in personas.items()
             }
@@ -69,6 +81,9 @@ class PersonaReasoner:
                         results[persona_id] = result
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.warning(f"Failed to enrich persona {persona_id}: {exc}")
+                    if journal is not None:
+                        journal.record(STAGE_REASONING, persona_id, FAILED, error=str(exc))
+                progress.advance()
         return results
 
     def _process_single_persona(
@@ -77,12 +92,16 @@ class PersonaReasoner:
         persona: Dict[str, Any],
         output_dir,
         reuse_cache: bool,
+        journal: Optional[RunJournal] = None,
     ) -> Optional[Dict[str, Any]]:
         path = output_dir / f"{persona_id}.json"
-        if reuse_cache and path.exists():
+        reusable = journal is None or journal.is_reusable(STAGE_REASONING, persona_id)
+        if reuse_cache and reusable and path.exists():
             try:
                 cached = json.loads(path.read_text(encoding="utf-8"))
                 logger.info(f"[Reasoning] Reusing cached profile for persona_id={persona_id}")
+                if journal is not None and journal.status(STAGE_REASONING, persona_id) != DONE:
+                    journal.record(STAGE_REASONING, persona_id, DONE, cached=True)
                 return cached
             except Exception:
                 logger.warning(f"[Reasoning] Failed to load cached profile for {persona_id}, regenerating.")
@@ -98,7 +117,11 @@ class PersonaReasoner:
         }
         if profile:
             payload.update(profile)
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        atomic_write_json(path, payload)
+        if journal is not None:
+            # Salient indicators but no profile means every reasoning call failed: retry on resume.
+            failed = bool(key_indicators) and not profile
+            journal.record(STAGE_REASONING, persona_id, FAILED if failed else DONE)
         logger.info(
             f"[Reasoning] Done persona_id={persona_id} (salient={len(key_indicators)}) -> {path}"
         )
@@ -145,6 +168,8 @@ class PersonaReasoner:
             return {}
 
         chunks = self._chunk_key_indicators(key_indicators, self.max_input_chars)
+        if self.map_reduce and len(chunks) > 1:
+            return self._build_profile_map_reduce(persona, chunks)
         aggregated: Dict[str, Any] = {}
         for idx, chunk in enumerate(chunks, start=1):
             logger.info(
@@ -163,6 +188,66 @@ class PersonaReasoner:
                 aggregated = self._merge_profiles(aggregated, response)
         return aggregated
 
+    def _build_profile_map_reduce(self, persona: Dict[str, Any], chunks: List[List[dict]]) -> Dict[str, Any]:
+        """
+        Map: every chunk is reasoned about independently and concurrently (no partial profile in the prompt).
+        Reduce: the chunk profiles are folded with _merge_profiles in chunk order, then optionally reconciled
+        by one more call that resolves conflicting values and duplicates; the merged profile only fills fields
+        the reconciliation left missing or empty. Latency is about one (or two) calls deep.
+        """
+        persona_id = persona.get("persona_id")
+        logger.info(
+            f"[Reasoning] persona_id={persona_id} map-reduce over {len(chunks)} chunks "
+            f"(workers={min(self.chunk_workers, len(chunks))})"
+        )
+        prompts = [
+            ALIGNMENT_USER_TEMPLATE.format(
+                persona_id=persona_id,
+                persona_name=persona.get("persona_name"),
+                summary_bio=persona.get("summary_bio", ""),
+                key_indicators=json.dumps(chunk, ensure_ascii=False, indent=2),
+                partial_profile="{}",
+            )
+            for chunk in chunks
+        ]
+        with ThreadPoolExecutor(max_workers=min(self.chunk_workers, len(chunks))) as executor:
+            partials = [p for p in executor.map(self._invoke, prompts) if p]
+
+        aggregated: Dict[str, Any] = {}
+        for partial in partials:
+            aggregated = self._merge_profiles(aggregated, partial)
+        if not self.reconcile or len(partials) < 2:
+            return aggregated
+
+        reconciled = self._invoke(
+            RECONCILE_USER_TEMPLATE.format(
+                persona_id=persona_id,
+                persona_name=persona.get("persona_name"),
+                summary_bio=persona.get("summary_bio", ""),
+                chunk_count=len(partials),
+                partial_profiles=json.dumps(partials, ensure_ascii=False, indent=2),
+                merged_profile=json.dumps(aggregated, ensure_ascii=False, indent=2),
+            )
+        )
+        if not isinstance(reconciled, dict):
+            logger.warning(f"[Reasoning] persona_id={persona_id} reconciliation failed; keeping merged profile")
+            return aggregated
+        # Fill only what the reconciliation left out; its lists are final (items it merged,
+        # reworded or dropped must not come back from the mechanical merge).
+        return self._fill_missing(reconciled, aggregated)
+
+    @classmethod
+    def _fill_missing(cls, primary: Dict[str, Any], fallback: Dict[str, Any]) -> Dict[str, Any]:
+        """`primary` with keys that are missing or empty there taken from `fallback`, recursively for dicts."""
+        result = dict(primary)
+        for key, value in fallback.items():
+            current = result.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                result[key] = cls._fill_missing(current, value)
+            elif current in (None, "", [], {}):
+                result[key] = value
+        return result
+
     def _invoke(self, prompt: str) -> Optional[Dict[str, Any]]:
         try:
             completion = self.client.chat.completions.create(
@@ -2,17 +2,105 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
 from .models import PageImage
 
+# Below this many pages to render, process start-up costs more than it saves.
+_MIN_PAGES_FOR_POOL = 4
+# pdf2image decodes every page of a call into memory; calls cover at least this many
+# pages (or `workers` pages) so peak memory does not grow with the deck.
+_MIN_PAGES_PER_CONVERT = 4
+
+_worker_doc: Any = None
+
+
+def _init_pymupdf_worker(pdf_path: str) -> None:
+    """Open the PDF once per worker process."""
+    global _worker_doc
+    import fitz  # type: ignore
+
+    _worker_doc = fitz.open(pdf_path)
+
+
+def _fitted_dpi(page: Any, dpi: int, max_pixels: int) -> int:
+    """Highest DPI <= `dpi` at which `page` renders within `max_pixels` (0 = no limit)."""
+    if max_pixels <= 0:
+        return dpi
+    area_in2 = (page.rect.width / 72.0) * (page.rect.height / 72.0)
+    if area_in2 <= 0:
+        return dpi
+    return max(1, min(dpi, int((max_pixels / area_in2) ** 0.5)))
+
+
+def _render_pymupdf_page(page_number: int, out_path: str, dpi: int, max_pixels: int = 0) -> Tuple[int, int, int]:
+    page = _worker_doc.load_page(page_number - 1)
+    pix = page.get_pixmap(dpi=_fitted_dpi(page, dpi, max_pixels))
+    pix.save(out_path)
+    return page_number, pix.width, pix.height
+
+
+def _contiguous_runs(page_numbers: Iterable[int], max_pages: int = 0) -> List[Tuple[int, int]]:
+    """(first, last) runs of consecutive pages, each at most `max_pages` long (0 = unbounded)."""
+    runs: List[Tuple[int, int]] = []
+    for number in sorted(page_numbers):
+        if runs and number == runs[-1][1] + 1 and (max_pages <= 0 or number - runs[-1][0] < max_pages):
+            runs[-1] = (runs[-1][0], number)
+        else:
+            runs.append((number, number))
+    return runs
+
+
+class _Progress:
+    """Reports rendered pages through a tqdm bar (when installed) and an optional callback."""
+
+    def __init__(self, total: int, on_progress: Optional[Callable[[int, int], None]]):
+        self.total = total
+        self.done = 0
+        self.on_progress = on_progress
+        try:
+            from tqdm import tqdm  # type: ignore
+
+            self.bar = tqdm(total=total, desc="Rendering pages", unit="page", leave=False)
+        except ImportError:
+            self.bar = None
+
+    def advance(self, count: int = 1) -> None:
+        self.done += count
+        if self.bar is not None:
+            self.bar.update(count)
+        if self.on_progress:
+            self.on_progress(self.done, self.total)
+
+    def close(self) -> None:
+        if self.bar is not None:
+            self.bar.close()
+
 
 class PDFRenderer:
-    def __init__(self, dpi: int = 300):
+    def __init__(
+        self,
+        dpi: int = 300,
+        workers: int = 1,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        max_pixels: int = 0,
+    ):
+        """
+        `workers` > 1 renders missing pages in a process pool (0 = one worker per CPU core).
+        `on_progress(done, total)` is called as each page finishes rendering.
+        `max_pixels` > 0 lowers the DPI of pages that would exceed that pixel count (PyMuPDF only),
+        so they need no resizing before upload.
+        """
         self.dpi = dpi
+        self.max_pixels = max(0, max_pixels)
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.on_progress = on_progress
 
     def render(
         self,
@@ -66,6 +154,44 @@ class PDFRenderer:
             logger.warning(f"Failed to read existing page image {image_path}: {exc}")
             return None
 
+    def existing_pages(self, output_dir: Path, page_numbers: Iterable[int]) -> List[PageImage]:
+        """Previously rendered images in `output_dir` for `page_numbers` (what `render` would reuse)."""
+        pages = (self._load_existing_image(output_dir / f"page_{n:04d}.png", n) for n in page_numbers)
+        return [page for page in pages if page]
+
+    def page_numbers(self, pdf_path: Path, page_range: Optional[tuple[int, int]] = None) -> List[int]:
+        """Return the 1-based page numbers `render` would produce, without rendering."""
+        if page_range:
+            return list(range(page_range[0], page_range[1] + 1))
+        try:
+            import fitz  # type: ignore
+
+            with fitz.open(pdf_path) as doc:
+                return list(range(1, doc.page_count + 1))
+        except ImportError:
+            from pdf2image import pdfinfo_from_path  # type: ignore
+
+            return list(range(1, int(pdfinfo_from_path(pdf_path).get("Pages", 0)) + 1))
+
+    def iter_render(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        page_range: Optional[tuple[int, int]] = None,
+        reuse_existing_images: bool = True,
+    ) -> Iterator[PageImage]:
+        """
+        Like `render`, but yields each page as soon as it is available (reused pages first, then
+        rendered pages in completion order) so downstream stages can start before rendering ends.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            import fitz  # type: ignore  # noqa: F401
+        except ImportError:
+            yield from self.render(pdf_path, output_dir, page_range, reuse_existing_images)
+            return
+        yield from self._iter_render_with_pymupdf(pdf_path, output_dir, page_range, reuse_existing_images)
+
     def _render_with_pymupdf(
         self,
         pdf_path: Path,
@@ -73,33 +199,90 @@ class PDFRenderer:
         page_range: Optional[tuple[int, int]],
         reuse_existing_images: bool,
     ) -> List[PageImage]:
+        images = self._iter_render_with_pymupdf(pdf_path, output_dir, page_range, reuse_existing_images)
+        return sorted(images, key=lambda p: p.page_number)
+
+    def _iter_render_with_pymupdf(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        page_range: Optional[tuple[int, int]],
+        reuse_existing_images: bool,
+    ) -> Iterator[PageImage]:
         import fitz  # type: ignore
 
         doc = fitz.open(pdf_path)
         start, end = page_range if page_range else (1, doc.page_count)
-        images: List[PageImage] = []
+        missing_pages: List[int] = []
 
-        for page_idx in range(start - 1, end):
-            out_path = output_dir / f"page_{page_idx + 1:04d}.png"
+        for page_number in range(start, end + 1):
+            out_path = output_dir / f"page_{page_number:04d}.png"
             if reuse_existing_images:
-                existing = self._load_existing_image(out_path, page_idx + 1)
+                existing = self._load_existing_image(out_path, page_number)
                 if existing:
-                    images.append(existing)
-                    logger.debug(f"Reusing rendered page {page_idx + 1} -> {out_path}")
+                    logger.debug(f"Reusing rendered page {page_number} -> {out_path}")
+                    yield existing
                     continue
-            page = doc.load_page(page_idx)
-            pix = page.get_pixmap(dpi=self.dpi)
-            pix.save(out_path)
-            images.append(
-                PageImage(
-                    page_number=page_idx + 1,
+            missing_pages.append(page_number)
+
+        progress = _Progress(len(missing_pages), self.on_progress)
+        try:
+            if self.workers > 1 and len(missing_pages) >= _MIN_PAGES_FOR_POOL:
+                doc.close()
+                yield from self._iter_render_pymupdf_parallel(pdf_path, output_dir, missing_pages, progress)
+                return
+            for page_number in missing_pages:
+                out_path = output_dir / f"page_{page_number:04d}.png"
+                page = doc.load_page(page_number - 1)
+                pix = page.get_pixmap(dpi=_fitted_dpi(page, self.dpi, self.max_pixels))
+                pix.save(out_path)
+                progress.advance()
+                logger.debug(f"Rendered page {page_number} -> {out_path}")
+                yield PageImage(
+                    page_number=page_number,
                     image_path=out_path,
                     width=pix.width,
                     height=pix.height,
                 )
-            )
-            logger.debug(f"Rendered page {page_idx + 1} -> {out_path}")
-        return images
+        finally:
+            progress.close()
+
+    def _iter_render_pymupdf_parallel(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        page_numbers: List[int],
+        progress: _Progress,
+    ) -> Iterator[PageImage]:
+        """Render pages in a process pool; each worker opens its own `fitz` document.
+
+        Workers are spawned rather than forked: in streaming mode rendering runs next to
+        encode/extract threads, and forking a threaded process can deadlock the child.
+        """
+        workers = min(self.workers, len(page_numbers))
+        logger.info(f"Rendering {len(page_numbers)} pages with {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pymupdf_worker,
+            initargs=(str(pdf_path),),
+        ) as executor:
+            future_map = {
+                executor.submit(
+                    _render_pymupdf_page,
+                    page_number,
+                    str(output_dir / f"page_{page_number:04d}.png"),
+                    self.dpi,
+                    self.max_pixels,
+                ): page_number
+                for page_number in page_numbers
+            }
+            for future in as_completed(future_map):
+                page_number, width, height = future.result()
+                out_path = output_dir / f"page_{page_number:04d}.png"
+                progress.advance()
+                logger.debug(f"Rendered page {page_number} -> {out_path}")
+                yield PageImage(page_number=page_number, image_path=out_path, width=width, height=height)
 
     def _render_with_pdf2image(
         self,
@@ -142,28 +325,38 @@ class PDFRenderer:
             if not missing_pages:
                 return sorted(page_images, key=lambda p: p.page_number)
 
-            for page_number in missing_pages:
-                images = convert_from_path(
-                    pdf_path,
-                    dpi=self.dpi,
-                    first_page=page_number,
-                    last_page=page_number,
-                )
-                for image in images:
-                    out_path = output_dir / f"page_{page_number:04d}.png"
-                    image.save(out_path, "PNG")
-                    page_images.append(
-                        PageImage(
-                            page_number=page_number,
-                            image_path=out_path,
-                            width=image.width,
-                            height=image.height,
-                        )
+            # One poppler invocation per contiguous run of missing pages, using
+            # poppler's own worker threads instead of one process per page. Runs are
+            # split into chunks because each call holds all of its pages in memory.
+            chunk = max(self.workers, _MIN_PAGES_PER_CONVERT)
+            progress = _Progress(len(missing_pages), self.on_progress)
+            try:
+                for first, last in _contiguous_runs(missing_pages, chunk):
+                    images = convert_from_path(
+                        pdf_path,
+                        dpi=self.dpi,
+                        first_page=first,
+                        last_page=last,
+                        thread_count=self.workers,
                     )
-                    logger.debug(f"Rendered page {page_number} -> {out_path}")
+                    for page_number, image in enumerate(images, start=first):
+                        out_path = output_dir / f"page_{page_number:04d}.png"
+                        image.save(out_path, "PNG")
+                        page_images.append(
+                            PageImage(
+                                page_number=page_number,
+                                image_path=out_path,
+                                width=image.width,
+                                height=image.height,
+                            )
+                        )
+                        progress.advance()
+                        logger.debug(f"Rendered page {page_number} -> {out_path}")
+            finally:
+                progress.close()
             return sorted(page_images, key=lambda p: p.page_number)
 
-        images = convert_from_path(pdf_path, dpi=self.dpi)
+        images = convert_from_path(pdf_path, dpi=self.dpi, thread_count=self.workers)
         for idx, image in enumerate(images, start=start):
             out_path = output_dir / f"page_{idx:04d}.png"
             if reuse_existing_images:
@@ -13,14 +13,15 @@ from langchain_core.embeddings import Embeddings
 # vector store interfaces for similarity search and retrieval
 from langchain_core.vectorstores import VectorStore, VectorStoreRetriever
 
+from adsp.data_pipeline.columnar_docstore import ColumnarDocstore
 from adsp.data_pipeline.embedding_utils import get_embedding_dimension
+from adsp.data_pipeline.indexing_embedder import IndexingEmbedder, add_embedded
 from adsp.data_pipeline.schema import Indicator, PersonaProfileModel, Statement
 
 
 def _default_vectorstore(embeddings: Embeddings) -> VectorStore:
     try:
         import faiss  # type: ignore
-        from langchain_community.docstore.in_memory import InMemoryDocstore
         from langchain_community.vectorstores import FAISS
     except Exception as exc:
         raise RuntimeError(
@@ -32,7 +33,7 @@ def _default_vectorstore(embeddings: Embeddings) -> VectorStore:
     return FAISS(
         embedding_function=embeddings,
         index=index,
-        docstore=InMemoryDocstore(),
+        docstore=ColumnarDocstore(),
         index_to_docstore_id={},
     )
 
@@ -45,37 +46,53 @@ class PersonaIndicatorRAG:
         embeddings: Embeddings,
         *,
         vectorstore: VectorStore | None = None,
+        indexer: IndexingEmbedder | None = None,
     ) -> None:
         self.embeddings = embeddings
         self.vectorstore = vectorstore or _default_vectorstore(embeddings)
+        self.indexer = indexer or IndexingEmbedder(embeddings)
 
     def index_persona(self, persona: PersonaProfileModel) -> List[str]:
         """Add a persona's indicators to the vector store, so index all indicators of the given persona"""
         # for each indicator of the persona generate text content and associated metadata
-        texts, metadatas = self._indicator_payloads(persona)
+        texts, metadatas = self.indicator_payloads(persona)
         if not texts:
             return []
-        # add_texts method of the vectorstore is used to embed the generated texts and store them along with their metadatas. This is where
-        # the embedding model (provided in __init__) is used
-        return self.vectorstore.add_texts(texts=texts, metadatas=metadatas)
+        # the indexer embeds the generated texts in length-sorted batches with the embedding model (provided in __init__),
+        # then the vectors are stored along with their metadatas
+        return self.indexer.add_texts(self.vectorstore, texts, metadatas)
 
     def index_personas(self, personas: Iterable[PersonaProfileModel]) -> List[str]:
-        """Batch index multiple personas."""
-        ids: List[str] = []
+        """Batch index multiple personas with one embedding pass over all their indicators."""
+        texts: List[str] = []
+        metadatas: List[dict] = []
         for persona in personas:
-            ids.extend(self.index_persona(persona))
-        return ids
+            persona_texts, persona_metadatas = self.indicator_payloads(persona)
+            texts.extend(persona_texts)
+            metadatas.extend(persona_metadatas)
+        with self.indexer.multi_process():
+            return self.indexer.add_texts(self.vectorstore, texts, metadatas)
+
+    def add_embedded(
+        self, texts: List[str], vectors: List[List[float]], metadatas: List[dict]
+    ) -> List[str]:
+        """Add indicator texts whose embeddings were computed elsewhere (e.g. in a shared batch)."""
+        return add_embedded(self.vectorstore, texts, vectors, metadatas)
 
     def search(self, query: str, *, k: int = 5) -> List[Document]:
         """Similarity search against indexed indicators."""
         return self.vectorstore.similarity_search(query, k=k)
 
+    def search_by_vector(self, embedding: List[float], *, k: int = 5) -> List[Document]:
+        """Similarity search with a pre-computed query embedding."""
+        return self.vectorstore.similarity_search_by_vector(embedding, k=k)
+
     def as_retriever(self, *, k: int = 5) -> VectorStoreRetriever:
         """Expose a LangChain retriever with a fixed top-k."""
         return self.vectorstore.as_retriever(search_kwargs={"k": k})
 
-    def _indicator_payloads(self, persona: PersonaProfileModel) -> Tuple[List[str], List[dict]]:
-        """Helper method to prepare data for indexing. It will return a tuple of two lists: texts (the content to embed) and metadatas (associated dictionaries)"""
+    def indicator_payloads(self, persona: PersonaProfileModel) -> Tuple[List[str], List[dict]]:
+        """Prepare data for indexing. It will return a tuple of two lists: texts (the content to embed) and metadatas (associated dictionaries)"""
         texts: List[str] = []
         metadatas: List[dict] = []
 
@@ -0,0 +1,159 @@
+"""Append-only run journal, atomic writes and progress/ETA for extraction runs.
+
+Every state change of a run is appended as one JSON line to the journal
+(`run_journal.jsonl`): each page's extraction (`pending` -> `done`/`failed`),
+each persona's reasoning, and the run itself. After a crash the journal is
+replayed with `resume=True` so only work not recorded as `done` is scheduled
+again; outputs are written with `atomic_write_text` (temp file + rename), so a
+`done` entry always refers to a complete file.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+STAGE_RUN = "run"
+STAGE_EXTRACT = "extract"
+STAGE_MERGE = "merge"
+STAGE_REASONING = "reasoning"
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write `text` to `path` through a temp file in the same directory and an atomic rename."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def atomic_write_json(path: Path, payload: Any, indent: Optional[int] = 2) -> None:
+    atomic_write_text(path, json.dumps(payload, indent=indent, ensure_ascii=False))
+
+
+@dataclass
+class RunJournal:
+    """(stage, item) -> last recorded status, backed by an append-only JSONL file."""
+
+    path: Path
+    resumed: bool = False
+    states: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def open(cls, path: Path, resume: bool = False) -> "RunJournal":
+        """Replay `path` when resuming; otherwise start a new journal for a fresh run."""
+
+        journal = cls(path=path, resumed=resume)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and path.exists():
+            journal._replay()
+        elif not resume:
+            path.write_text("", encoding="utf-8")
+        done = sum(1 for status in journal.states.values() if status == DONE)
+        journal.record(STAGE_RUN, "pipeline", "resumed" if resume else "started")
+        if resume:
+            logger.info(f"Resuming from run journal {path} ({done} items already done)")
+        return journal
+
+    def _replay(self) -> None:
+        with self.path.open("r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    entry = json.loads(line)
+                    self.states[(entry["stage"], str(entry["item"]))] = entry["status"]
+                except (ValueError, KeyError, TypeError):
+                    # A crash can leave the last line torn; anything unreadable is simply not done.
+                    logger.warning(f"Ignoring unreadable run journal line {line_number} in {self.path}")
+
+    def record(self, stage: str, item: Any, status: str, **details: Any) -> None:
+        """Append one state change (flushed and fsynced before returning)."""
+
+        entry = {"ts": round(time.time(), 3), "stage": stage, "item": str(item), "status": status, **details}
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self.states[(stage, str(item))] = status
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def status(self, stage: str, item: Any) -> Optional[str]:
+        with self._lock:
+            return self.states.get((stage, str(item)))
+
+    def completed(self, stage: str) -> Set[str]:
+        with self._lock:
+            return {item for (s, item), status in self.states.items() if s == stage and status == DONE}
+
+    def outstanding(self, stage: str, items: Iterable[Any]) -> List[Any]:
+        """Items (in the given order) not recorded as done for `stage`."""
+
+        done = self.completed(stage)
+        return [item for item in items if str(item) not in done]
+
+    def is_reusable(self, stage: str, item: Any) -> bool:
+        """Stored output for `item` may be reused: always in a fresh run, only if recorded done when resuming."""
+
+        return not self.resumed or self.status(stage, item) == DONE
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(max(0.0, seconds)))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+@dataclass
+class ProgressTracker:
+    """Completed/total counter logging observed throughput and the ETA for the rest."""
+
+    label: str
+    total: int
+    unit: str = "items"
+    done: int = 0
+    started: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta_seconds(self) -> Optional[float]:
+        rate = self.rate()
+        if rate <= 0:
+            return None
+        return max(0, self.total - self.done) / rate
+
+    def advance(self, count: int = 1) -> None:
+        with self._lock:
+            self.done += count
+            eta = self.eta_seconds()
+            logger.info(
+                f"[{self.label}] {self.done}/{self.total} {self.unit} "
+                f"({self.rate():.2f}/s, ETA {format_duration(eta) if eta is not None else '?'})"
+            )
@@ -153,6 +153,9 @@ class PersonaProfileModel(BaseModel):
     value_frame: Optional[ValueFrame] = None
     reasoning_policies: Optional[ReasoningPolicies] = None
     content_filters: Optional[ContentFilters] = None
+    # Optional fine-tuned voice: LoRA adapter name served by vLLM (+ path for runtime loading)
+    lora_adapter: Optional[str] = None
+    lora_adapter_path: Optional[str] = None
 
     class Config:
         extra = "allow"
@@ -0,0 +1,215 @@
+"""Pipelined render -> encode -> extract scheduling for the extraction pipelines.
+
+`run_streaming_extraction` connects three stages with bounded hand-offs:
+
+1. a render thread pulls pages from the renderer's iterator into a bounded
+   queue (back-pressure: rendering pauses when encoding falls behind);
+2. encode workers turn each page image into its request content block once;
+3. as soon as a page and every neighbour in its context window are encoded,
+   the page is submitted to the extraction pool.
+
+Results are handed to `on_result` on the calling thread as they complete, so
+callers can persist and merge incrementally. Encoded content is released once
+every page that uses it as context has been extracted. While extractions are
+running, no more than `max_encoded_pages(...)` pages are held encoded (or being
+encoded), so a slow extractor pauses encoding instead of letting base64 pages
+pile up in memory.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Set, TypeVar
+
+from loguru import logger
+
+R = TypeVar("R")
+
+_RENDER_DONE = object()
+
+
+def context_window_numbers(page_number: int, known: Set[int], window: int) -> List[int]:
+    """Primary page first, then existing neighbours within `window`, sorted."""
+
+    neighbours = {
+        candidate
+        for offset in range(1, max(0, window) + 1)
+        for candidate in (page_number - offset, page_number + offset)
+        if candidate in known
+    }
+    return [page_number, *sorted(neighbours)]
+
+
+def max_encoded_pages(extract_workers: int, context_window: int) -> int:
+    """Encoded pages kept ahead of extraction: two windows' worth per extract worker slot."""
+
+    return 2 * max(1, extract_workers) + 2 * max(0, context_window) + 1
+
+
+def run_streaming_extraction(
+    page_source: Iterable[Any],
+    *,
+    page_numbers: Sequence[int],
+    extract_numbers: Set[int],
+    context_window: int,
+    encode: Callable[[Any], Any],
+    extract: Callable[[Any, List[Any], Dict[int, Any]], R],
+    on_result: Callable[[R], None],
+    encode_workers: int = 2,
+    extract_workers: int = 1,
+    queue_size: int = 8,
+) -> List[R]:
+    """Run the pipelined stages and return the extraction results (completion order).
+
+    - `page_source`: iterator of rendered pages (e.g. `PDFRenderer.iter_render`)
+    - `page_numbers`: every page in the document range (context neighbours)
+    - `extract_numbers`: pages that need an extraction request
+    - `encode(page)`: builds the reusable content for one page image
+    - `extract(page, context_pages, encoded)`: performs one extraction
+    """
+
+    known = set(page_numbers)
+    targets = set(extract_numbers) & known
+    windows = {n: context_window_numbers(n, known, context_window) for n in targets}
+    dependents: Dict[int, int] = {}
+    for numbers in windows.values():
+        for n in numbers:
+            dependents[n] = dependents.get(n, 0) + 1
+    needed = set(dependents)
+
+    events: "queue.Queue[tuple]" = queue.Queue()
+    rendered: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+    stop = threading.Event()
+    # Encoded-but-not-released pages; guarded by `budget` together with `extracting`.
+    budget = threading.Condition()
+    budget_limit = max_encoded_pages(extract_workers, context_window)
+    resident = 0
+    extracting = 0
+
+    def _render() -> None:
+        try:
+            for page in page_source:
+                if stop.is_set():
+                    return
+                if page.page_number in needed:
+                    rendered.put(page)
+        except BaseException as exc:  # propagate to the scheduler thread
+            events.put(("error", exc))
+        finally:
+            rendered.put(_RENDER_DONE)
+
+    def _encode_one(page: Any) -> None:
+        try:
+            events.put(("encoded", page, encode(page)))
+        except BaseException as exc:
+            events.put(("error", exc))
+
+    def _dispatch_encodes(encode_pool: ThreadPoolExecutor) -> None:
+        nonlocal resident
+        slots = threading.BoundedSemaphore(max(1, queue_size))
+        submitted_encodes = 0
+        while True:
+            page = rendered.get()
+            if page is _RENDER_DONE or stop.is_set():
+                events.put(("render_done", submitted_encodes))
+                return
+            with budget:
+                # Only wait while an extraction is running: its completion frees pages. With
+                # none running, the pages held cannot complete a window, so keep encoding.
+                while resident >= budget_limit and extracting and not stop.is_set():
+                    budget.wait(0.1)
+                resident += 1
+            slots.acquire()
+            submitted_encodes += 1
+            future = encode_pool.submit(_encode_one, page)
+            future.add_done_callback(lambda _f: slots.release())
+
+    pages: Dict[int, Any] = {}
+    encoded: Dict[int, Any] = {}
+    submitted: Set[int] = set()
+    results: List[R] = []
+    outstanding = 0
+    encodes_expected = -1  # known once rendering has finished
+
+    render_thread = threading.Thread(target=_render, name="pipeline-render", daemon=True)
+    with ThreadPoolExecutor(max_workers=max(1, encode_workers), thread_name_prefix="pipeline-encode") as encode_pool, \
+            ThreadPoolExecutor(max_workers=max(1, extract_workers), thread_name_prefix="pipeline-extract") as extract_pool:
+        dispatcher = threading.Thread(
+            target=_dispatch_encodes, args=(encode_pool,), name="pipeline-encode-dispatch", daemon=True
+        )
+        render_thread.start()
+        dispatcher.start()
+
+        def _submit_ready(candidates: Iterable[int]) -> None:
+            nonlocal outstanding, extracting
+            for n in candidates:
+                if n not in targets or n in submitted:
+                    continue
+                if not all(m in encoded for m in windows[n]):
+                    continue
+                submitted.add(n)
+                outstanding += 1
+                with budget:
+                    extracting += 1
+                context_pages = [pages[m] for m in windows[n]]
+                contents = {m: encoded[m] for m in windows[n]}
+                future = extract_pool.submit(extract, pages[n], context_pages, contents)
+                future.add_done_callback(lambda f, n=n: events.put(("extracted", n, f)))
+
+        try:
+            while True:
+                encoding_done = encodes_expected == len(pages)
+                if encoding_done and outstanding == 0:
+                    if len(submitted) < len(targets):
+                        missing = sorted(targets - submitted)
+                        raise RuntimeError(f"Pages never became ready for extraction: {missing[:10]}")
+                    break
+                event = events.get()
+                kind = event[0]
+                if kind == "error":
+                    raise event[1]
+                if kind == "render_done":
+                    encodes_expected = event[1]
+                elif kind == "encoded":
+                    page, content = event[1], event[2]
+                    pages[page.page_number] = page
+                    encoded[page.page_number] = content
+                    # A newly encoded page can complete its own window and its neighbours'.
+                    _submit_ready(context_window_numbers(page.page_number, known, context_window))
+                elif kind == "extracted":
+                    n, future = event[1], event[2]
+                    outstanding -= 1
+                    result = future.result()
+                    results.append(result)
+                    on_result(result)
+                    released = 0
+                    for m in windows[n]:
+                        dependents[m] -= 1
+                        if dependents[m] == 0:
+                            encoded.pop(m, None)
+                            released += 1
+                    with budget:
+                        extracting -= 1
+                        resident -= released
+                        budget.notify_all()
+        except BaseException:
+            stop.set()
+            # Unblock the render thread if it is waiting on a full queue.
+            while render_thread.is_alive():
+                try:
+                    rendered.get_nowait()
+                except queue.Empty:
+                    render_thread.join(timeout=0.05)
+            try:
+                rendered.put_nowait(_RENDER_DONE)  # the drain may have consumed the dispatcher's sentinel
+            except queue.Full:
+                pass
+            raise
+        finally:
+            render_thread.join()
+            dispatcher.join()
+
+    logger.debug(f"Streaming extraction finished: {len(results)} pages")
+    return results
@@ -0,0 +1,248 @@
+"""Scalar-quantized FAISS indexes and float16 snapshots for the RAG vector stores.
+
+The RAG stores are built with an exact `IndexFlatL2` (float32, 4 bytes per
+dimension). `quantize_vectorstore` swaps a built store's index for a
+scalar-quantized one trained on its vectors:
+
+- `fp16`: `IndexScalarQuantizer(QT_fp16)`, 2 bytes per dimension (2x smaller)
+- `sq8`:  `IndexScalarQuantizer(QT_8bit)`, 1 byte per dimension (4x smaller)
+
+With `rescore_factor` > 1, `sq8` searches `k * rescore_factor` candidates in
+int8 and re-ranks them against float16 copies (`IndexRefine`), 3 bytes per
+dimension in total.
+
+`save_snapshot` / `load_snapshot` write and read a store as float16 vectors
+(`vectors.npy`), its documents as a `ColumnarDocstore` (`docstore/`, text
+memory-mapped on load) and a manifest (`snapshot.json`), so an index can be
+reloaded without re-embedding.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from loguru import logger
+
+from adsp.data_pipeline.columnar_docstore import ColumnarDocstore, columnar_from_documents
+from adsp.data_pipeline.embedding_utils import get_embedding_dimension
+from adsp.data_pipeline.run_journal import atomic_write_json
+
+QUANTIZATION_MODES = ("none", "fp16", "sq8")
+SNAPSHOT_VERSION = 2
+SNAPSHOT_DTYPES = ("float16", "float32")
+
+
+def normalize_quantization(mode: Optional[str]) -> str:
+    value = (mode or "none").strip().lower()
+    if value in ("", "off", "float32", "flat"):
+        return "none"
+    if value == "int8":
+        return "sq8"
+    if value not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown vector quantization {mode!r}; expected one of {QUANTIZATION_MODES}")
+    return value
+
+
+def quantization_from_env(name: str = "ADSP_RAG_QUANTIZATION") -> str:
+    try:
+        return normalize_quantization(os.environ.get(name))
+    except ValueError as exc:
+        logger.warning(f"{exc}; keeping float32 vectors")
+        return "none"
+
+
+def _scalar_quantizer(dim: int, qtype: str) -> Any:
+    import faiss  # type: ignore
+
+    quantizer = faiss.ScalarQuantizer.QT_8bit if qtype == "sq8" else faiss.ScalarQuantizer.QT_fp16
+    return faiss.IndexScalarQuantizer(dim, quantizer, faiss.METRIC_L2)
+
+
+def build_faiss_index(vectors: Any, mode: str = "none", *, rescore_factor: int = 0) -> Any:
+    """A FAISS L2 index of type `mode`, trained on and filled with `vectors` (n x dim, float32)."""
+
+    import faiss  # type: ignore
+    import numpy as np
+
+    mode = normalize_quantization(mode)
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    dim = matrix.shape[1]
+    if mode == "none" or not len(matrix):
+        # Nothing to train the quantizer on yet.
+        index = faiss.IndexFlatL2(dim)
+    elif mode == "sq8" and rescore_factor > 1:
+        base = _scalar_quantizer(dim, "sq8")
+        refine = _scalar_quantizer(dim, "fp16")
+        index = faiss.IndexRefine(base, refine)
+        index.k_factor = float(rescore_factor)
+        # The SWIG wrapper does not own the sub-indexes; keep them alive with the refine index.
+        index.referenced_objects = [base, refine]
+    else:
+        index = _scalar_quantizer(dim, mode)
+    if not index.is_trained:
+        index.train(matrix)
+    if len(matrix):
+        index.add(matrix)
+    return index
+
+
+def index_vectors(index: Any) -> Any:
+    """All vectors held by `index` as an (ntotal x dim) float32 array (decoded if quantized)."""
+
+    import numpy as np
+
+    if index.ntotal == 0:
+        return np.zeros((0, index.d), dtype=np.float32)
+    return index.reconstruct_n(0, index.ntotal)
+
+
+def bytes_per_vector(index: Any) -> int:
+    """Stored code size of one vector, summed over base and refine indexes."""
+
+    import faiss  # type: ignore
+
+    if hasattr(index, "base_index") and hasattr(index, "refine_index"):
+        return bytes_per_vector(faiss.downcast_index(index.base_index)) + bytes_per_vector(
+            faiss.downcast_index(index.refine_index)
+        )
+    return int(getattr(index, "code_size", 4 * index.d))
+
+
+def is_quantized(index: Any) -> bool:
+    return bytes_per_vector(index) < 4 * index.d
+
+
+def quantize_vectorstore(vectorstore: VectorStore, mode: str, *, rescore_factor: int = 0) -> bool:
+    """Replace a built FAISS store's exact index with a quantized one; False if nothing changed.
+
+    Stores that are empty, already quantized or not FAISS-backed are left as they are.
+    """
+
+    mode = normalize_quantization(mode)
+    index = getattr(vectorstore, "index", None)
+    if mode == "none" or index is None or index.ntotal == 0 or is_quantized(index):
+        return False
+    before = bytes_per_vector(index)
+    vectorstore.index = build_faiss_index(index_vectors(index), mode, rescore_factor=rescore_factor)  # type: ignore[attr-defined]
+    after = bytes_per_vector(vectorstore.index)  # type: ignore[attr-defined]
+    logger.debug(f"Quantized {index.ntotal} vectors to {mode}: {before} -> {after} bytes/vector")
+    return True
+
+
+def save_snapshot(vectorstore: VectorStore, directory: Path, *, dtype: str = "float16", **manifest: Any) -> Path:
+    """Write a FAISS store's vectors (`dtype`, default float16) and documents to `directory`.
+
+    Extra keyword arguments are stored in `snapshot.json` (e.g. the embedding model name).
+    """
+
+    import numpy as np
+
+    if dtype not in SNAPSHOT_DTYPES:
+        raise ValueError(f"Snapshot dtype must be one of {SNAPSHOT_DTYPES}")
+    index = vectorstore.index  # type: ignore[attr-defined]
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    # Invalidate the previous snapshot first; the new manifest is written last.
+    (directory / "snapshot.json").unlink(missing_ok=True)
+
+    vectors = index_vectors(index).astype(dtype)
+    tmp_path = directory / f".vectors.{os.getpid()}.npy"
+    np.save(tmp_path, vectors)
+    os.replace(tmp_path, directory / "vectors.npy")
+
+    ids = [vectorstore.index_to_docstore_id[i] for i in range(index.ntotal)]  # type: ignore[attr-defined]
+    docstore = vectorstore.docstore  # type: ignore[attr-defined]
+    documents = (docstore.search(doc_id) for doc_id in ids)
+    columnar_from_documents(
+        ids, (doc if isinstance(doc, Document) else Document(page_content="") for doc in documents)
+    ).save(directory / "docstore")
+
+    atomic_write_json(
+        directory / "snapshot.json",
+        {
+            "version": SNAPSHOT_VERSION,
+            "count": int(index.ntotal),
+            "dim": int(index.d),
+            "dtype": dtype,
+            "normalize_L2": bool(getattr(vectorstore, "_normalize_L2", False)),
+            **manifest,
+        },
+    )
+    logger.info(f"Saved {index.ntotal} vectors ({dtype}) to snapshot {directory}")
+    return directory
+
+
+def read_snapshot_manifest(directory: Path) -> Optional[Dict[str, Any]]:
+    path = Path(directory) / "snapshot.json"
+    if not path.exists():
+        return None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+    return manifest if manifest.get("version") == SNAPSHOT_VERSION else None
+
+
+def load_snapshot(
+    directory: Path,
+    embeddings: Embeddings,
+    *,
+    quantization: str = "none",
+    rescore_factor: int = 0,
+) -> VectorStore:
+    """Rebuild a FAISS store from `save_snapshot` output, optionally into a quantized index.
+
+    Raises `ValueError` when `embeddings` produce vectors of another dimension than the
+    snapshot's, i.e. the snapshot was built with a different embedding model.
+    """
+
+    try:
+        from langchain_community.vectorstores import FAISS
+        import numpy as np
+    except Exception as exc:
+        raise RuntimeError(
+            "FAISS vectorstore requires `faiss-cpu` and `langchain-community` to be installed."
+        ) from exc
+
+    directory = Path(directory)
+    manifest = read_snapshot_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(f"No readable vector snapshot in {directory}")
+    dim = get_embedding_dimension(embeddings)
+    if dim != manifest["dim"]:
+        raise ValueError(
+            f"Vector snapshot {directory} has {manifest['dim']}-dim vectors but the embedding model "
+            f"produces {dim}-dim vectors"
+        )
+    vectors = np.load(directory / "vectors.npy").astype(np.float32)
+    docstore = ColumnarDocstore.load(directory / "docstore")
+    ids = list(docstore.ids())
+    if len(ids) != len(vectors) or len(vectors) != manifest["count"]:
+        raise ValueError(f"Vector snapshot {directory} is inconsistent ({len(vectors)} vectors, {len(ids)} documents)")
+
+    return FAISS(
+        embedding_function=embeddings,
+        index=build_faiss_index(vectors.reshape(-1, manifest["dim"]), quantization, rescore_factor=rescore_factor),
+        docstore=docstore,
+        index_to_docstore_id=dict(enumerate(ids)),
+        normalize_L2=bool(manifest.get("normalize_L2", False)),
+    )
+
+
+__all__ = [
+    "QUANTIZATION_MODES",
+    "build_faiss_index",
+    "bytes_per_vector",
+    "load_snapshot",
+    "normalize_quantization",
+    "quantization_from_env",
+    "quantize_vectorstore",
+    "read_snapshot_manifest",
+    "save_snapshot",
+]
@@ -1,9 +1,10 @@
 """API client for backend communication."""
 
 import base64
+import json
 import requests
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Union
 from dataclasses import dataclass
 
 
@@ -136,6 +137,40 @@ class APIClient:
             print(f"Error sending chat message: {e}")
             return None
     
+    def stream_focus_group(
+        self,
+        persona_ids: List[str],
+        query: str,
+        session_id: Optional[str] = None,
+        top_k: int = 5,
+    ) -> Iterator[Dict[str, Any]]:
+        """Ask one question to several personas, yielding each result as it arrives.
+
+        Each item has `persona_id` plus either `response` (a chat response) or `error`.
+        """
+        payload = {
+            "persona_ids": persona_ids,
+            "query": query,
+            "top_k": top_k,
+        }
+        if session_id:
+            payload["session_id"] = session_id
+        try:
+            with requests.post(
+                f"{self.base_url}/v1/focus-group",
+                json=payload,
+                headers=self._get_headers(),
+                timeout=(5, 300),  # (connect, read)
+                stream=True,
+            ) as response:
+                if response.status_code != 200:
+                    return
+                for line in response.iter_lines(decode_unicode=True):
+                    if line:
+                        yield json.loads(line)
+        except Exception as e:
+            print(f"Error streaming focus group: {e}")
+
     def upload_file(
         self,
         filename: str,
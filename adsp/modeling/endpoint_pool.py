@@ -0,0 +1,227 @@
+"""Pool of OpenAI-compatible endpoints with load balancing and circuit breaking.
+
+Each endpoint (typically one vLLM replica) tracks outstanding requests and a
+latency EWMA. Failures are observed passively from real traffic: after
+`failure_threshold` consecutive errors the endpoint's circuit opens and it is
+skipped for `cooldown_s`, after which a single trial request is let through
+(half-open) to decide whether to close the circuit again. `acquire` hands out an
+`EndpointLease` that is passed back to `release`, so only the trial request's own
+outcome closes or re-opens the circuit; stragglers started before it tripped do not.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import os
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
+
+
+def _rendezvous_weight(key: str, base_url: str) -> int:
+    digest = hashlib.blake2b(f"{key}|{base_url}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+@dataclass
+class Endpoint:
+    """One OpenAI-compatible server. `models` empty means it serves any model."""
+
+    base_url: str
+    models: FrozenSet[str] = frozenset()
+
+    outstanding: int = 0
+    ewma_ms: Optional[float] = None
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    half_open_probe: bool = False
+    requests_total: int = 0
+    failures_total: int = 0
+
+    def serves(self, model: Optional[str]) -> bool:
+        return not model or not self.models or model in self.models
+
+
+@dataclass(frozen=True)
+class EndpointLease:
+    """A request reserved on `endpoint` by `EndpointPool.acquire`; `probe` marks the half-open trial."""
+
+    endpoint: Endpoint
+    probe: bool = False
+
+    @property
+    def base_url(self) -> str:
+        return self.endpoint.base_url
+
+
+def parse_endpoints(raw: str) -> List[Endpoint]:
+    """Parse `url[=model+model],url,...` into endpoints.
+
+    `http://a:8000/v1,http://b:8000/v1=persona-a+persona-b` declares two replicas,
+    the second one restricted to the two listed models (e.g. LoRA adapters).
+    """
+
+    endpoints: List[Endpoint] = []
+    for item in (raw or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        url, _, models = item.partition("=")
+        names = frozenset(m.strip() for m in models.split("+") if m.strip())
+        endpoints.append(Endpoint(base_url=url.strip().rstrip("/"), models=names))
+    return endpoints
+
+
+@dataclass
+class EndpointPool:
+    """Picks a healthy endpoint per request and records the outcome.
+
+    Configuration (environment variables):
+    - `ADSP_LLM_ENDPOINTS`: comma-separated base URLs (see `parse_endpoints`)
+    - `ADSP_LLM_BALANCER`: `least_outstanding` (default) or `ewma`
+    - `ADSP_LLM_CB_FAILURES`: consecutive failures that open a circuit (default: `3`)
+    - `ADSP_LLM_CB_COOLDOWN`: seconds an open circuit stays open (default: `30`)
+    - `ADSP_LLM_AFFINITY_SLACK`: extra outstanding requests tolerated on an
+      affinity replica before balancing away from it (default: `4`)
+    """
+
+    endpoints: List[Endpoint] = field(default_factory=list)
+    strategy: str = field(default_factory=lambda: os.environ.get("ADSP_LLM_BALANCER", "least_outstanding"))
+    failure_threshold: int = field(default_factory=lambda: _env_int("ADSP_LLM_CB_FAILURES", 3))
+    cooldown_s: float = field(default_factory=lambda: _env_float("ADSP_LLM_CB_COOLDOWN", 30.0))
+    affinity_slack: int = field(default_factory=lambda: _env_int("ADSP_LLM_AFFINITY_SLACK", 4))
+    ewma_alpha: float = 0.3
+
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @classmethod
+    def from_urls(cls, urls: Iterable[str], **kwargs) -> "EndpointPool":
+        return cls(endpoints=parse_endpoints(",".join(u for u in urls if u)), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def acquire(
+        self,
+        *,
+        model: Optional[str] = None,
+        exclude: Iterable[str] = (),
+        affinity_key: Optional[str] = None,
+    ) -> Optional[EndpointLease]:
+        """Reserve the best available endpoint for `model`, or `None` if none is usable.
+
+        With `affinity_key` (e.g. a LoRA adapter name) requests stick to one
+        replica chosen by rendezvous hashing, so same-adapter requests batch
+        together, unless that replica is `affinity_slack` requests busier than
+        the least-loaded one.
+        """
+
+        excluded = set(exclude)
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                ep
+                for ep in self.endpoints
+                if ep.base_url not in excluded and ep.serves(model) and self._available(ep, now)
+            ]
+            if not candidates:
+                return None
+            chosen = min(candidates, key=self._score)
+            if affinity_key and len(candidates) > 1:
+                preferred = max(candidates, key=lambda ep: _rendezvous_weight(affinity_key, ep.base_url))
+                if preferred.outstanding <= chosen.outstanding + self.affinity_slack:
+                    chosen = preferred
+            probe = bool(chosen.open_until) and now >= chosen.open_until
+            if probe:
+                chosen.half_open_probe = True
+            chosen.outstanding += 1
+            chosen.requests_total += 1
+            return EndpointLease(endpoint=chosen, probe=probe)
+
+    def release(self, lease: EndpointLease, *, ok: bool, latency_s: float) -> None:
+        """Record the outcome of a request started with `acquire`."""
+
+        endpoint = lease.endpoint
+        with self._lock:
+            endpoint.outstanding = max(0, endpoint.outstanding - 1)
+            if ok:
+                latency_ms = latency_s * 1000.0
+                endpoint.ewma_ms = (
+                    latency_ms
+                    if endpoint.ewma_ms is None
+                    else self.ewma_alpha * latency_ms + (1.0 - self.ewma_alpha) * endpoint.ewma_ms
+                )
+            else:
+                endpoint.failures_total += 1
+            if lease.probe:
+                # The half-open trial decides: close on success, re-trip on failure.
+                endpoint.half_open_probe = False
+                endpoint.consecutive_failures = 0 if ok else endpoint.consecutive_failures + 1
+                endpoint.open_until = 0.0 if ok else time.monotonic() + self.cooldown_s
+                return
+            if endpoint.open_until:
+                # Started before the circuit tripped; only the probe may change its state.
+                return
+            if ok:
+                endpoint.consecutive_failures = 0
+                return
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.failure_threshold:
+                endpoint.open_until = time.monotonic() + self.cooldown_s
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "base_url": ep.base_url,
+                    "models": sorted(ep.models),
+                    "outstanding": ep.outstanding,
+                    "ewma_ms": ep.ewma_ms,
+                    "circuit": self._circuit_state(ep, now),
+                    "requests_total": ep.requests_total,
+                    "failures_total": ep.failures_total,
+                }
+                for ep in self.endpoints
+            ]
+
+    def _available(self, endpoint: Endpoint, now: float) -> bool:
+        if not endpoint.open_until:
+            return True
+        return now >= endpoint.open_until and not endpoint.half_open_probe
+
+    def _score(self, endpoint: Endpoint) -> tuple:
+        ewma = endpoint.ewma_ms if endpoint.ewma_ms is not None else 0.0
+        if (self.strategy or "").strip().lower() == "ewma":
+            # Expected wait: latency scaled by the queue already in front of us.
+            return (ewma * (endpoint.outstanding + 1), endpoint.outstanding)
+        return (endpoint.outstanding, ewma)
+
+    @staticmethod
+    def _circuit_state(endpoint: Endpoint, now: float) -> str:
+        if not endpoint.open_until:
+            return "closed"
+        return "half_open" if now >= endpoint.open_until else "open"
@@ -4,13 +4,32 @@ This repo supports two runtime modes:
 - A local, dependency-free stub generator (default) so the system can run end-to-end
   without an external LLM server.
 - An OpenAI-compatible backend (e.g., vLLM) when `ADSP_LLM_BACKEND=openai` is set.
+  Several replicas can be listed in `ADSP_LLM_ENDPOINTS`; requests are balanced
+  across them by `EndpointPool` and retried on another replica on failure.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 import os
-from typing import Optional, Tuple
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from loguru import logger
+
+from adsp.modeling.endpoint_pool import EndpointPool, parse_endpoints
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except Exception:
+        return default
 
 
 @dataclass
@@ -22,6 +41,9 @@ class PersonaInferenceEngine:
     - `ADSP_LLM_BASE_URL`: OpenAI-compatible base URL (for `openai` backend)
     - `ADSP_LLM_MODEL`: model name (for `openai` backend)
     - `ADSP_LLM_API_KEY`: API key (can be dummy for local servers)
+    - `ADSP_LLM_ENDPOINTS`: optional comma-separated replica base URLs; overrides
+      `ADSP_LLM_BASE_URL` (see `adsp.modeling.endpoint_pool.parse_endpoints`)
+    - `ADSP_LLM_MAX_ATTEMPTS`: replicas tried per request before falling back (default: `2`)
     """
 
     backend: str = field(default_factory=lambda: os.environ.get("ADSP_LLM_BACKEND", "stub"))
@@ -41,24 +63,99 @@ class PersonaInferenceEngine:
     temperature: float = field(default_factory=lambda: float(os.environ.get("ADSP_LLM_TEMPERATURE", "0.2")))
     max_tokens: int = field(default_factory=lambda: int(os.environ.get("ADSP_LLM_MAX_TOKENS", "512")))
     timeout_s: float = field(default_factory=lambda: float(os.environ.get("ADSP_LLM_TIMEOUT", "60")))
+    max_attempts: int = field(default_factory=lambda: _env_int("ADSP_LLM_MAX_ATTEMPTS", 2))
+    pool: Optional[EndpointPool] = None
+
+    _clients: Dict[str, Any] = field(default_factory=dict, repr=False)
+    _clients_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.pool is None:
+            raw = os.environ.get("ADSP_LLM_ENDPOINTS", "").strip() or self.base_url
+            self.pool = EndpointPool(endpoints=parse_endpoints(raw))
+
+    def generate(self, persona_id: str, prompt: str, *, model: Optional[str] = None) -> str:
+        """Generate an answer; `model` overrides `self.model` (e.g. a LoRA adapter name)."""
 
-    def generate(self, persona_id: str, prompt: str) -> str:
         backend = (self.backend or "stub").strip().lower()
         if backend == "openai":
-            answer = self._generate_openai(prompt)
+            answer = self._generate_openai(prompt, model=model)
             if answer:
                 return answer
         return self._generate_stub(persona_id=persona_id, prompt=prompt)
 
-    def _generate_openai(self, prompt: str) -> Optional[str]:
-        if not (self.base_url and self.model):
+    def _client(self, base_url: str) -> Any:
+        """Return a cached OpenAI client for `base_url` (clients hold connection pools)."""
+
+        with self._clients_lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                from openai import OpenAI  # type: ignore
+
+                # With several replicas, retry on another replica instead of the same one.
+                retries = {"max_retries": 0} if len(self.pool or ()) > 1 else {}
+                client = OpenAI(base_url=base_url, api_key=self.api_key, **retries)
+                self._clients[base_url] = client
+            return client
+
+    def preload_adapters(self, adapters: Mapping[str, Optional[str]]) -> Set[str]:
+        """Make sure LoRA adapters are loaded on the replicas that may serve them.
+
+        `adapters` maps adapter name -> adapter path (or `None` when the server is
+        expected to have it already, e.g. via `vllm serve --lora-modules`). Missing
+        adapters with a path are loaded through vLLM's `/load_lora_adapter`
+        endpoint (requires `VLLM_ALLOW_RUNTIME_LORA_UPDATING=True` on the server).
+        Returns the adapter names available on at least one replica.
+        """
+
+        backend = (self.backend or "stub").strip().lower()
+        if backend != "openai" or not self.pool or not adapters:
+            return set()
+        try:
+            import httpx  # type: ignore
+        except ImportError:
+            return set()
+
+        available: Set[str] = set()
+        for endpoint in self.pool.endpoints:
+            wanted = [name for name in adapters if endpoint.serves(name)]
+            if not wanted:
+                continue
+            try:
+                client = self._client(endpoint.base_url)
+                served = {item.id for item in client.models.list()}
+            except Exception as exc:
+                logger.warning("Could not list models on {}: {}", endpoint.base_url, exc)
+                continue
+            for name in wanted:
+                if name in served:
+                    available.add(name)
+                    continue
+                path = adapters[name]
+                if not path:
+                    continue
+                try:
+                    client.post(
+                        "/load_lora_adapter",
+                        body={"lora_name": name, "lora_path": path},
+                        cast_to=httpx.Response,
+                    )
+                    available.add(name)
+                    logger.info("Loaded LoRA adapter {} on {}", name, endpoint.base_url)
+                except Exception as exc:
+                    logger.warning("Failed to load LoRA adapter {} on {}: {}", name, endpoint.base_url, exc)
+        return available
+
+    def _generate_openai(self, prompt: str, *, model: Optional[str] = None) -> Optional[str]:
+        adapter = model if model and model != self.model else None
+        model = model or self.model
+        if not (self.pool and model):
             return None
         try:
-            from openai import OpenAI  # type: ignore
+            import openai  # type: ignore  # noqa: F401
         except ImportError:
             return None
 
-        client = OpenAI(base_url=self.base_url, api_key=self.api_key)
         system, context, question = self._split_prompt(prompt)
         messages = []
         system = (system or "").strip()
@@ -74,17 +171,28 @@ class PersonaInferenceEngine:
             user_parts.append(f"Question:\n{question}")
 
         user_message = "\n\n".join(user_parts).strip() or prompt
-        try:
-            completion = client.chat.completions.create(
-                model=self.model,
-                messages=[*messages, {"role": "user", "content": user_message}],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                timeout=self.timeout_s,
-            )
+        tried: list[str] = []
+        for _ in range(self.max_attempts):
+            lease = self.pool.acquire(model=model, exclude=tried, affinity_key=adapter)
+            if lease is None:
+                break
+            tried.append(lease.base_url)
+            start = time.perf_counter()
+            try:
+                completion = self._client(lease.base_url).chat.completions.create(
+                    model=model,
+                    messages=[*messages, {"role": "user", "content": user_message}],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    timeout=self.timeout_s,
+                )
+            except Exception as exc:
+                self.pool.release(lease, ok=False, latency_s=time.perf_counter() - start)
+                logger.warning("LLM request to {} failed: {}", lease.base_url, exc)
+                continue
+            self.pool.release(lease, ok=True, latency_s=time.perf_counter() - start)
             return completion.choices[0].message.content or ""
-        except Exception:
-            return None
+        return None
 
     @staticmethod
     def _split_prompt(prompt: str) -> Tuple[str, str, str]:
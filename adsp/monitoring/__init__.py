@@ -1,13 +1,39 @@
 """Monitoring and evaluation utilities."""
 
-from .evaluation import EvaluationSuite
-from .evaluation_pipeline import (
-    AuthenticityEvaluator,
-    FactExtractionEvaluator,
-    PersonaExtractionEvaluator,
-    RAGRetrievalEvaluator,
-)
-from .metrics import MetricsCollector
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .evaluation import EvaluationSuite
+    from .evaluation_pipeline import (
+        AuthenticityEvaluator,
+        FactExtractionEvaluator,
+        PersonaExtractionEvaluator,
+        RAGRetrievalEvaluator,
+    )
+    from .metrics import MetricsCollector
+
+# Submodules are imported on first attribute access so importing the package stays cheap.
+_LAZY_ATTRS = {
+    "EvaluationSuite": ".evaluation",
+    "MetricsCollector": ".metrics",
+    "PersonaExtractionEvaluator": ".evaluation_pipeline",
+    "FactExtractionEvaluator": ".evaluation_pipeline",
+    "RAGRetrievalEvaluator": ".evaluation_pipeline",
+    "AuthenticityEvaluator": ".evaluation_pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "EvaluationSuite",
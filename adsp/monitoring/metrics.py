@@ -1,21 +1,221 @@
-"""Collects runtime metrics for observability."""
+"""Collects runtime metrics for observability.
+
+`MetricsCollector` keeps plain counters/gauges (`incr`, `write`, `read`) and
+fixed-bucket histograms keyed by name and labels (`observe`). Histograms give
+cumulative bucket counts for Prometheus (`render_prometheus`, served on the API's
+`/metrics`) and bucket-interpolated quantiles (`quantile`) for local checks.
+
+`collect_stage_timings()` additionally gathers the stage durations of the
+current request (the orchestrator reports them through `record_stage`), e.g.
+to build a `Server-Timing` header.
+"""
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Dict
+import math
+import re
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; covers in-memory steps (sub-millisecond) up to slow LLM generations.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_NAME_RE = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def _metric_name(name: str) -> str:
+    return _NAME_RE.sub("_", name)
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [*labels, extra] if extra else list(labels)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_label_value(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Histogram:
+    """Fixed-bucket histogram: counts per upper bound plus a +Inf bucket, sum and count."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate of the `q` quantile, interpolated linearly inside its bucket (0 if empty)."""
+
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                if i == len(self.bounds):  # +Inf bucket: best guess is its lower bound
+                    return lower
+                return lower + (self.bounds[i] - lower) * max(0.0, rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
 
 
 @dataclass
 class MetricsCollector:
-    """Stores counters/gauges as a quick placeholder."""
+    """Counters/gauges and labelled latency histograms; safe to share between threads."""
 
     _metrics: Dict[str, float] = field(default_factory=dict)
+    _histograms: Dict[str, Dict[Labels, Histogram]] = field(default_factory=dict)
+    _help: Dict[str, str] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def incr(self, name: str, value: float = 1.0) -> None:
-        self._metrics[name] = self._metrics.get(name, 0.0) + value
+        with self._lock:
+            self._metrics[name] = self._metrics.get(name, 0.0) + value
+
     def write(self, name: str, value: float = 1.0) -> float:
-        self._metrics[name] = value
-        return self._metrics.get(name)
+        with self._lock:
+            self._metrics[name] = value
+        return value
+
     def read(self, name: str) -> float:
         return self._metrics.get(name, 0.0)
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        *,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        **labels: str,
+    ) -> None:
+        """Add `value` to the histogram `name` with these labels (created on first use)."""
+
+        key: Labels = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        """A copy of the histogram of exactly these labels, or of all series of `name` merged when none are given."""
+
+        with self._lock:
+            series = self._histograms.get(name, {})
+            if labels:
+                key: Labels = tuple(sorted((k, str(v)) for k, v in labels.items()))
+                parts = [series[key]] if key in series else []
+            else:
+                parts = list(series.values())
+            if not parts:
+                return None
+            merged = Histogram(parts[0].bounds)
+            for part in parts:
+                merged.counts = [a + b for a, b in zip(merged.counts, part.counts)]
+                merged.sum += part.sum
+                merged.count += part.count
+        return merged
+
+    def quantile(self, name: str, q: float, **labels: str) -> float:
+        histogram = self.histogram(name, **labels)
+        return histogram.quantile(q) if histogram is not None else 0.0
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+
+        lines: List[str] = []
+        with self._lock:
+            scalars = sorted(self._metrics.items())
+            histograms = {
+                name: [(labels, list(h.counts), h.sum, h.count, h.bounds) for labels, h in sorted(series.items())]
+                for name, series in sorted(self._histograms.items())
+            }
+        for name, value in scalars:
+            metric = _metric_name(name)
+            if name in self._help:
+                lines.append(f"# HELP {metric} {self._help[name]}")
+            lines.append(f"# TYPE {metric} untyped")
+            lines.append(f"{metric} {_format_value(value)}")
+        for name, series in histograms.items():
+            metric = _metric_name(name)
+            if name in self._help:
+                lines.append(f"# HELP {metric} {self._help[name]}")
+            lines.append(f"# TYPE {metric} histogram")
+            for labels, counts, total, count, bounds in series:
+                cumulative = 0
+                for bound, bucket_count in zip((*bounds, math.inf), counts):
+                    cumulative += bucket_count
+                    le = ("le", _format_value(bound))
+                    lines.append(f"{metric}_bucket{_format_labels(labels, le)} {cumulative}")
+                lines.append(f"{metric}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+# Stage durations (ms) of the request running in this context, when collected.
+_stage_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("adsp_stage_timings", default=None)
+
+
+@contextmanager
+def collect_stage_timings() -> Iterator[Dict[str, float]]:
+    """Collect the `record_stage` calls made in this context into the yielded dict."""
+
+    timings: Dict[str, float] = {}
+    token = _stage_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _stage_timings.reset(token)
+
+
+def record_stage(stage: str, ms: float) -> None:
+    timings = _stage_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + ms
+
+
+def server_timing_header(timings: Dict[str, float]) -> str:
+    """`Server-Timing` value, e.g. `retrieve_persona;dur=3.1, llm;dur=812.4`."""
+
+    return ", ".join(f"{_metric_name(stage)};dur={ms:.1f}" for stage, ms in timings.items())
+
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "Histogram",
+    "MetricsCollector",
+    "collect_stage_timings",
+    "record_stage",
+    "server_timing_header",
+]
@@ -39,6 +39,53 @@ def main():
         default=50,
         help="Overlap between chunks in characters (default: 50)",
     )
+    parser.add_argument(
+        "--token-chunking",
+        action="store_true",
+        help="Measure chunks in tokens of the embedding model's tokenizer instead of characters",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=None,
+        help="Token budget per chunk with --token-chunking (default: the model's max sequence length)",
+    )
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=1,
+        help="Processes splitting markdown files (1 = in-process, 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=None,
+        help="Texts per embedding batch (default: ADSP_EMBED_BATCH_SIZE, else 64)",
+    )
+    parser.add_argument(
+        "--embed-processes",
+        type=int,
+        default=None,
+        help="Encoder processes for sentence-transformers models (default: ADSP_EMBED_PROCESSES, else 1)",
+    )
+    parser.add_argument(
+        "--quantization",
+        choices=["none", "fp16", "sq8"],
+        default="none",
+        help="Vector storage after indexing: none (float32), fp16 or sq8 (int8) (default: none)",
+    )
+    parser.add_argument(
+        "--rescore-factor",
+        type=int,
+        default=0,
+        help="With sq8, re-rank k * N candidates against float16 vectors (default: 0 = off)",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        type=str,
+        default=None,
+        help="Write a float16 snapshot of the index (vectors + chunks) to this directory",
+    )
     parser.add_argument(
         "--pattern",
         type=str,
@@ -78,6 +125,14 @@ def main():
             chunk_size=args.chunk_size,
             chunk_overlap=args.chunk_overlap,
             pattern=args.pattern,
+            chunk_workers=args.chunk_workers,
+            token_chunking=args.token_chunking,
+            max_tokens=args.max_tokens,
+            embed_batch_size=args.embed_batch_size,
+            embed_processes=args.embed_processes,
+            quantization=args.quantization,
+            rescore_factor=args.rescore_factor,
+            snapshot_dir=Path(args.snapshot_dir) if args.snapshot_dir else None,
         )
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
@@ -7,7 +7,7 @@ from typing import Optional
 
 import typer
 
-from adsp.app import QAService
+# QAService builds the full orchestrator (embedding model + indexes); commands import it only when needed.
 
 app = typer.Typer(add_completion=False)
 
@@ -27,8 +27,10 @@ def _print_citations(response) -> None:
 def list_personas() -> None:
     """List available personas loaded from processed data."""
 
-    qa = QAService()
-    registry = qa.orchestrator.prompt_builder.registry
+    from adsp.core.runtime import build_registry, load_personas_from_disk, resolve_persona_paths
+
+    individual_dir, traits_dir = resolve_persona_paths()
+    registry = build_registry(load_personas_from_disk(individual_dir, traits_dir=traits_dir))
     for persona_id in registry.list_personas():
         persona = registry.get(persona_id)
         name = getattr(persona, "persona_name", None) or getattr(persona, "persona_id", None) or ""
@@ -45,6 +47,8 @@ def ask(
 ) -> None:
     """Ask a single question and print the persona response."""
 
+    from adsp.app import QAService
+
     qa = QAService()
     response = qa.ask_with_metadata(
         persona_id=persona_id,
@@ -67,6 +71,8 @@ def chat(
 ) -> None:
     """Interactive chat loop (type 'exit' to quit)."""
 
+    from adsp.app import QAService
+
     qa = QAService()
     typer.echo(f"Persona: {persona_id} (session_id={session_id})")
     typer.echo("Type 'exit' to quit.\n")
@@ -45,14 +45,26 @@ def build_config(args: argparse.Namespace) -> FactDataExtractionConfig:
     cfg.max_concurrent_requests = args.concurrency
     cfg.max_retries = args.max_retries
     cfg.backoff_seconds = args.backoff
+    cfg.async_extraction = args.async_extraction
+    cfg.max_concurrent_requests_ceiling = args.max_concurrency
+    cfg.tokens_per_minute = args.tokens_per_minute
     cfg.dpi = args.dpi
+    cfg.render_workers = args.render_workers
+    cfg.render_to_image_budget = args.render_to_image_budget
+    cfg.streaming = args.streaming
+    cfg.encode_workers = args.encode_workers
+    cfg.image_cache_entries = args.image_cache_entries
+    cfg.image_cache_dir = Path(args.image_cache_dir) if args.image_cache_dir else None
     cfg.page_images_dir = Path(args.page_images_dir)
     cfg.raw_responses_dir = Path(args.raw_responses_dir)
     cfg.reuse_cache = args.reuse_cache
+    cfg.resume = args.resume
+    cfg.run_journal_path = Path(args.run_journal_path) if args.run_journal_path else None
     cfg.fact_data_output_dir = Path(args.fact_data_output_dir)
     cfg.qa_report_path = Path(args.qa_report_path)
     cfg.structured_pages_output_path = Path(args.structured_pages_output_path)
     cfg.context_window = args.context_window
+    cfg.slides_per_request = args.slides_per_request
     return cfg
 
 
@@ -137,12 +149,66 @@ def main(raw_args: Optional[list[str]] = None) -> None:
         default=default_cfg.backoff_seconds,
         help="Backoff seconds between retries.",
     )
+    parser.add_argument(
+        "--async-extraction",
+        action="store_true",
+        default=default_cfg.async_extraction,
+        help="Use the asyncio extractor with adaptive concurrency (starts at --concurrency).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=default_cfg.max_concurrent_requests_ceiling,
+        help="Upper bound for adaptive concurrency in async mode.",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        default=default_cfg.tokens_per_minute,
+        help="Token-rate budget for async mode (0 = unlimited).",
+    )
     parser.add_argument(
         "--dpi",
         type=int,
         default=default_cfg.dpi,
         help="Render DPI for page images.",
     )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=default_cfg.render_workers,
+        help="Processes for PDF page rendering (1 = in-process, 0 = one per CPU core).",
+    )
+    parser.add_argument(
+        "--render-to-image-budget",
+        action="store_true",
+        default=default_cfg.render_to_image_budget,
+        help="Lower the render DPI of large pages so images fit the upload size limit (max_image_bytes).",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=default_cfg.streaming,
+        help="Pipeline rendering, image encoding and extraction instead of running them stage by stage.",
+    )
+    parser.add_argument(
+        "--encode-workers",
+        type=int,
+        default=default_cfg.encode_workers,
+        help="Image encoding threads in streaming mode.",
+    )
+    parser.add_argument(
+        "--image-cache-entries",
+        type=int,
+        default=default_cfg.image_cache_entries,
+        help="Encoded page images kept in memory and shared by extraction workers.",
+    )
+    parser.add_argument(
+        "--image-cache-dir",
+        type=str,
+        default=None,
+        help="Optional dir to keep compressed page JPEGs between runs.",
+    )
     parser.add_argument(
         "--page-images-dir",
         type=str,
@@ -156,6 +222,18 @@ def main(raw_args: Optional[list[str]] = None) -> None:
         default=default_cfg.reuse_cache,
         help="Ignore cached page responses and force re-extraction.",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=default_cfg.resume,
+        help="Continue an interrupted run from its run journal; only work not recorded as done is redone.",
+    )
+    parser.add_argument(
+        "--run-journal-path",
+        type=str,
+        default=None,
+        help="Run journal (JSONL). Defaults to run_journal.jsonl next to the raw responses dir.",
+    )
     parser.add_argument(
         "--raw-responses-dir",
         type=str,
@@ -186,6 +264,12 @@ def main(raw_args: Optional[list[str]] = None) -> None:
         default=default_cfg.context_window,
         help="Number of adjacent pages to send alongside each primary page for context.",
     )
+    parser.add_argument(
+        "--slides-per-request",
+        type=int,
+        default=default_cfg.slides_per_request,
+        help="Consecutive pages extracted per VLM request (1 = one request per page).",
+    )
     args = parser.parse_args(raw_args)
 
     config = build_config(args)
@@ -44,10 +44,21 @@ def build_config(args: argparse.Namespace) -> PersonaExtractionConfig:
     cfg.max_concurrent_requests = args.concurrency
     cfg.max_retries = args.max_retries
     cfg.backoff_seconds = args.backoff
+    cfg.async_extraction = args.async_extraction
+    cfg.max_concurrent_requests_ceiling = args.max_concurrency
+    cfg.tokens_per_minute = args.tokens_per_minute
     cfg.dpi = args.dpi
+    cfg.render_workers = args.render_workers
+    cfg.render_to_image_budget = args.render_to_image_budget
+    cfg.streaming = args.streaming
+    cfg.encode_workers = args.encode_workers
+    cfg.image_cache_entries = args.image_cache_entries
+    cfg.image_cache_dir = Path(args.image_cache_dir) if args.image_cache_dir else None
     cfg.page_images_dir = Path(args.page_images_dir)
     cfg.raw_responses_dir = Path(args.raw_responses_dir)
     cfg.reuse_cache = args.reuse_cache
+    cfg.resume = args.resume
+    cfg.run_journal_path = Path(args.run_journal_path) if args.run_journal_path else None
     cfg.merged_output_path = Path(args.merged_output_path)
     cfg.persona_output_dir = Path(args.persona_output_dir)
     cfg.reasoning_output_dir = Path(args.reasoning_output_dir)
@@ -63,6 +74,9 @@ def build_config(args: argparse.Namespace) -> PersonaExtractionConfig:
     cfg.reasoning_max_tokens = args.reasoning_max_tokens
     cfg.reasoning_max_input_chars = args.reasoning_max_input_chars
     cfg.reasoning_max_concurrent = args.reasoning_max_concurrent
+    cfg.reasoning_map_reduce = args.reasoning_map_reduce
+    cfg.reasoning_chunk_workers = args.reasoning_chunk_workers
+    cfg.reasoning_reconcile = args.reasoning_reconcile
     return cfg
 
 
@@ -147,12 +161,66 @@ def main(raw_args: Optional[list[str]] = None) -> None:
         default=default_cfg.backoff_seconds,
         help="Backoff seconds between retries.",
     )
+    parser.add_argument(
+        "--async-extraction",
+        action="store_true",
+        default=default_cfg.async_extraction,
+        help="Use the asyncio extractor with adaptive concurrency (starts at --concurrency).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=default_cfg.max_concurrent_requests_ceiling,
+        help="Upper bound for adaptive concurrency in async mode.",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        default=default_cfg.tokens_per_minute,
+        help="Token-rate budget for async mode (0 = unlimited).",
+    )
     parser.add_argument(
         "--dpi",
         type=int,
         default=default_cfg.dpi,
         help="Render DPI for page images.",
     )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=default_cfg.render_workers,
+        help="Processes for PDF page rendering (1 = in-process, 0 = one per CPU core).",
+    )
+    parser.add_argument(
+        "--render-to-image-budget",
+        action="store_true",
+        default=default_cfg.render_to_image_budget,
+        help="Lower the render DPI of large pages so images fit the upload size limit (max_image_bytes).",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=default_cfg.streaming,
+        help="Pipeline rendering, image encoding and extraction instead of running them stage by stage.",
+    )
+    parser.add_argument(
+        "--encode-workers",
+        type=int,
+        default=default_cfg.encode_workers,
+        help="Image encoding threads in streaming mode.",
+    )
+    parser.add_argument(
+        "--image-cache-entries",
+        type=int,
+        default=default_cfg.image_cache_entries,
+        help="Encoded page images kept in memory and shared by extraction workers.",
+    )
+    parser.add_argument(
+        "--image-cache-dir",
+        type=str,
+        default=None,
+        help="Optional dir to keep compressed page JPEGs between runs.",
+    )
     parser.add_argument(
         "--page-images-dir",
         type=str,
@@ -166,6 +234,18 @@ def main(raw_args: Optional[list[str]] = None) -> None:
         default=default_cfg.reuse_cache,
         help="Ignore cached page responses and force re-extraction.",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=default_cfg.resume,
+        help="Continue an interrupted run from its run journal; only work not recorded as done is redone.",
+    )
+    parser.add_argument(
+        "--run-journal-path",
+        type=str,
+        default=None,
+        help="Run journal (JSONL). Defaults to run_journal.jsonl next to the raw responses dir.",
+    )
     parser.add_argument(
         "--raw-responses-dir",
         type=str,
@@ -268,6 +348,24 @@ def main(raw_args: Optional[list[str]] = None) -> None:
         default=default_cfg.reasoning_max_concurrent,
         help="Max concurrent requests for the reasoning model.",
     )
+    parser.add_argument(
+        "--reasoning-map-reduce",
+        action="store_true",
+        default=default_cfg.reasoning_map_reduce,
+        help="Reason over indicator chunks concurrently and merge, instead of chunk by chunk.",
+    )
+    parser.add_argument(
+        "--reasoning-chunk-workers",
+        type=int,
+        default=default_cfg.reasoning_chunk_workers,
+        help="Concurrent chunk requests per persona in map-reduce mode.",
+    )
+    parser.add_argument(
+        "--reasoning-reconcile",
+        action="store_true",
+        default=default_cfg.reasoning_reconcile,
+        help="Add one reconciliation request after the map-reduce merge.",
+    )
     args = parser.parse_args(raw_args)
 
     config = build_config(args)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Sequence, Set
 
 from adsp.core.rag.fact_data_index import build_fact_data_index_from_markdown
 
@@ -28,6 +28,14 @@ def _default_evaluation_output() -> Path:
     return REPO_ROOT / "data/evaluation/rag_retrieval/evaluation_results.json"
 
 
+def _default_chunking_output() -> Path:
+    return REPO_ROOT / "data/evaluation/rag_retrieval/chunking_comparison.json"
+
+
+def _default_quantization_output() -> Path:
+    return REPO_ROOT / "data/evaluation/rag_retrieval/quantization_comparison.json"
+
+
 def _default_fact_data_dir() -> Path:
     return REPO_ROOT / "data/processed/fact_data/pages"
 
@@ -162,6 +170,37 @@ def _compute_metrics(
     }
 
 
+def _relevant_pages(labeled_results: List[Dict[str, Any]]) -> Dict[str, Set[int]]:
+    """Query text -> pages of the chunks labeled relevant (chunk labels do not transfer across chunkings)."""
+    pages: Dict[str, Set[int]] = {}
+    for entry in labeled_results:
+        docs = entry.get("retrieved_docs") or entry.get("relevant_docs") or []
+        for doc in docs if isinstance(docs, list) else []:
+            page = (doc.get("metadata") or {}).get("page_number")
+            if _is_relevant(doc) and isinstance(page, int):
+                pages.setdefault(entry.get("query") or "", set()).add(page)
+    return pages
+
+
+def _page_level_metrics(
+    ranked_pages: List[List[int]],
+    relevant_pages: List[Set[int]],
+    k_values: Sequence[int],
+) -> Dict[str, float]:
+    """Precision@k (share of top-k chunks from a relevant page) and recall@k (relevant pages reached)."""
+    metrics: Dict[str, float] = {}
+    count = len(ranked_pages)
+    for k in k_values:
+        precision = recall = 0.0
+        for pages, relevant in zip(ranked_pages, relevant_pages):
+            top_k = pages[:k]
+            precision += sum(1 for p in top_k if p in relevant) / k
+            recall += len(relevant.intersection(top_k)) / len(relevant) if relevant else 0.0
+        metrics[f"precision_at_{k}"] = precision / count if count else 0.0
+        metrics[f"recall_at_{k}"] = recall / count if count else 0.0
+    return metrics
+
+
 def _add_retrieval_subparser(subparsers: argparse._SubParsersAction) -> None:
     parser = subparsers.add_parser("retrieve", help="Run retrieval for all test queries.")
     parser.add_argument(
@@ -214,11 +253,114 @@ def _add_evaluate_subparser(subparsers: argparse._SubParsersAction) -> None:
     )
 
 
+def _add_compare_chunking_subparser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "compare-chunking", help="Compare character-based and token-based chunking (chunk counts + retrieval)."
+    )
+    parser.add_argument(
+        "--labeled-results",
+        type=Path,
+        default=_default_retrieval_output(),
+        help="Labeled retrieval results; pages of relevant chunks are the relevance judgments.",
+    )
+    parser.add_argument(
+        "--fact-data-dir",
+        "--markdown-dir",
+        type=Path,
+        dest="fact_data_dir",
+        default=_default_fact_data_dir(),
+        help="Directory containing fact data markdown pages to index.",
+    )
+    parser.add_argument(
+        "--embedding-model",
+        type=str,
+        default="sentence-transformers/all-mpnet-base-v2",
+        help="Embedding model whose tokenizer defines the token budget.",
+    )
+    parser.add_argument("--chunk-size", type=int, default=1200, help="Character mode chunk size.")
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=None,
+        help="Token mode budget (default: the model's max sequence length).",
+    )
+    parser.add_argument(
+        "--k-values",
+        type=_parse_k_values,
+        default=_parse_k_values("3,5,10"),
+        help="Comma-separated list of K values for page-level precision/recall.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=_default_chunking_output(),
+        help="Where to write the comparison report JSON.",
+    )
+
+
+def _add_compare_quantization_subparser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "compare-quantization", help="Compare float32, fp16 and int8 vector storage (memory + retrieval)."
+    )
+    parser.add_argument(
+        "--labeled-results",
+        type=Path,
+        default=_default_retrieval_output(),
+        help="Labeled retrieval results; pages of relevant chunks are the relevance judgments.",
+    )
+    parser.add_argument(
+        "--fact-data-dir",
+        "--markdown-dir",
+        type=Path,
+        dest="fact_data_dir",
+        default=_default_fact_data_dir(),
+        help="Directory containing fact data markdown pages to index.",
+    )
+    parser.add_argument(
+        "--embedding-model",
+        type=str,
+        default="sentence-transformers/all-mpnet-base-v2",
+        help="Embedding model used for the index.",
+    )
+    parser.add_argument(
+        "--rescore-factor",
+        type=int,
+        default=4,
+        help="Candidates per result re-ranked in float16 for the `sq8_rescore` mode.",
+    )
+    parser.add_argument(
+        "--k-values",
+        type=_parse_k_values,
+        default=_parse_k_values("3,5,10"),
+        help="Comma-separated list of K values for recall against float32 and page-level metrics.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=_default_quantization_output(),
+        help="Where to write the comparison report JSON.",
+    )
+
+
+def _overlap_at_k(ranked_ids: List[List[str]], exact_ids: List[List[str]], k_values: Sequence[int]) -> Dict[str, float]:
+    """Share of the exact (float32) top-k results also returned in the top-k."""
+    metrics: Dict[str, float] = {}
+    for k in k_values:
+        total = 0.0
+        for ids, exact in zip(ranked_ids, exact_ids):
+            expected = set(exact[:k])
+            total += len(expected.intersection(ids[:k])) / len(expected) if expected else 1.0
+        metrics[f"recall_vs_float32_at_{k}"] = total / len(ranked_ids) if ranked_ids else 0.0
+    return metrics
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="RAG retrieval evaluation pipelines.")
     subparsers = parser.add_subparsers(dest="command", required=True)
     _add_retrieval_subparser(subparsers)
     _add_evaluate_subparser(subparsers)
+    _add_compare_chunking_subparser(subparsers)
+    _add_compare_quantization_subparser(subparsers)
     return parser.parse_args()
 
 
@@ -297,12 +439,143 @@ def _run_evaluation(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_compare_chunking(args: argparse.Namespace) -> int:
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    from adsp.data_pipeline.embedding_utils import get_embedding_tokenizer
+    from adsp.data_pipeline.fact_data_pipeline.rag import FactDataRAG, chunk_length_report
+
+    if not args.labeled_results.exists():
+        raise FileNotFoundError(f"Labeled results file not found: {args.labeled_results}")
+    payload = json.loads(args.labeled_results.read_text(encoding="utf-8"))
+    labeled = payload.get("results", payload) if isinstance(payload, dict) else payload
+    judged = _relevant_pages(labeled)
+    if not judged:
+        raise ValueError("No relevant chunks with a page_number in the labeled results.")
+    queries = sorted(judged)
+
+    embeddings = HuggingFaceEmbeddings(model_name=args.embedding_model)
+    tokenizer, max_seq_length = get_embedding_tokenizer(embeddings)
+    max_tokens = args.max_tokens or max_seq_length or 384
+    modes = {
+        "characters": {"chunk_size": args.chunk_size},
+        "tokens": {"chunk_tokenizer": tokenizer, "chunk_max_tokens": max_tokens},
+    }
+
+    report: Dict[str, Any] = {"queries": len(queries), "max_tokens": max_tokens}
+    k = max(args.k_values)
+    for mode, settings in modes.items():
+        rag = FactDataRAG(embeddings, **settings)
+        chunks = rag.chunker.chunk_directory(args.fact_data_dir)
+        rag.vectorstore.add_documents(chunks)
+        ranked = [
+            [doc.metadata.get("page_number") for doc in docs]
+            for docs in rag.search_many(queries, k=k)
+        ]
+        report[mode] = {
+            **chunk_length_report(chunks, tokenizer, max_tokens),
+            **_page_level_metrics(ranked, [judged[q] for q in queries], args.k_values),
+        }
+    report["delta"] = {
+        key: round(report["tokens"][key] - value, 4)
+        for key, value in report["characters"].items()
+        if isinstance(value, (int, float)) and key != "max_tokens"
+    }
+
+    print("Chunking comparison (tokens vs characters)")
+    for key, value in report["delta"].items():
+        print(f"{key}: {report['characters'][key]} -> {report['tokens'][key]} ({value:+})")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results saved to {args.output}")
+    return 0
+
+
+def _run_compare_quantization(args: argparse.Namespace) -> int:
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    from adsp.data_pipeline.fact_data_pipeline.rag import FactDataRAG
+    from adsp.data_pipeline.vector_quantization import build_faiss_index, bytes_per_vector, index_vectors
+
+    if not args.labeled_results.exists():
+        raise FileNotFoundError(f"Labeled results file not found: {args.labeled_results}")
+    payload = json.loads(args.labeled_results.read_text(encoding="utf-8"))
+    labeled = payload.get("results", payload) if isinstance(payload, dict) else payload
+    judged = _relevant_pages(labeled)
+    if not judged:
+        raise ValueError("No relevant chunks with a page_number in the labeled results.")
+    queries = sorted(judged)
+
+    rag = FactDataRAG(HuggingFaceEmbeddings(model_name=args.embedding_model))
+    rag.index_markdown_directory(args.fact_data_dir)
+    store = rag.vectorstore
+    vectors = index_vectors(store.index)
+    modes = {
+        "float32": ("none", 0),
+        "fp16": ("fp16", 0),
+        "sq8": ("sq8", 0),
+        "sq8_rescore": ("sq8", args.rescore_factor),
+    }
+
+    report: Dict[str, Any] = {"queries": len(queries), "vectors": int(len(vectors)), "dim": int(vectors.shape[1])}
+    k = max(args.k_values)
+    exact_ids: List[List[str]] = []
+    for name, (mode, rescore_factor) in modes.items():
+        store.index = build_faiss_index(vectors, mode, rescore_factor=rescore_factor)
+        results = rag.search_many(queries, k=k)
+        ranked_ids = [
+            [f"{doc.metadata.get('source_file')}#{doc.metadata.get('chunk_id')}" for doc in docs] for docs in results
+        ]
+        if name == "float32":
+            exact_ids = ranked_ids
+        size = bytes_per_vector(store.index)
+        report[name] = {
+            "bytes_per_vector": size,
+            "compression": round(4 * vectors.shape[1] / size, 2),
+            **_overlap_at_k(ranked_ids, exact_ids, args.k_values),
+            **_page_level_metrics(
+                [[doc.metadata.get("page_number") for doc in docs] for docs in results],
+                [judged[q] for q in queries],
+                args.k_values,
+            ),
+        }
+    report["delta_vs_float32"] = {
+        name: {
+            key: round(value - report["float32"][key], 4)
+            for key, value in report[name].items()
+            if key.startswith(("precision_at_", "recall_at_", "recall_vs_float32_at_"))
+        }
+        for name in modes
+        if name != "float32"
+    }
+
+    print("Quantization comparison (vs float32)")
+    for name in modes:
+        row = report[name]
+        print(
+            f"{name}: {row['bytes_per_vector']} bytes/vector ({row['compression']}x), "
+            f"recall_vs_float32_at_{k}={row[f'recall_vs_float32_at_{k}']:.2%}, recall_at_{k}={row[f'recall_at_{k}']:.2%}"
+        )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results saved to {args.output}")
+    return 0
+
+
 def main() -> int:
     args = parse_args()
     if args.command == "retrieve":
         return _run_retrieval(args)
     if args.command == "evaluate":
         return _run_evaluation(args)
+    if args.command == "compare-chunking":
+        return _run_compare_chunking(args)
+    if args.command == "compare-quantization":
+        return _run_compare_quantization(args)
     raise ValueError(f"Unknown command: {args.command}")
 
 
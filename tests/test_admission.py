@@ -0,0 +1,127 @@
+"""
+Admission control tests: bounded concurrency, priority ordering, tenant
+fairness and back-pressure when the queue is full.
+"""
+
+import threading
+import time
+
+import pytest
+
+from adsp.communication.admission import AdmissionController, AdmissionRejected
+
+
+def _wait_for_queue(controller: AdmissionController, depth: int) -> None:
+    deadline = time.monotonic() + 2.0
+    while controller.snapshot()['queue_depth'] < depth:
+        assert time.monotonic() < deadline, 'waiters never queued'
+        time.sleep(0.005)
+
+
+def _queue_worker(controller, order, label, **kwargs):
+    def run():
+        with controller.slot(**kwargs):
+            order.append(label)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_admission_rejects_when_queue_is_full():
+    controller = AdmissionController(max_concurrency=1, max_queue_depth=1, queue_timeout_s=2.0)
+    controller.acquire()
+    order: list[str] = []
+    thread = _queue_worker(controller, order, 'queued')
+    _wait_for_queue(controller, 1)
+
+    with pytest.raises(AdmissionRejected):
+        controller.acquire()
+
+    controller.release()
+    thread.join(timeout=2.0)
+    assert order == ['queued']
+    stats = controller.snapshot()
+    assert stats['rejected_total'] == 1
+    assert stats['in_flight'] == 0
+    assert stats['queue_depth'] == 0
+
+
+def test_admission_serves_interactive_before_batch_and_rotates_tenants():
+    controller = AdmissionController(max_concurrency=1, max_queue_depth=10, queue_timeout_s=2.0)
+    controller.acquire()
+    order: list[str] = []
+    threads = []
+    for label, kwargs in [
+        ('batch', {'priority': 'batch'}),
+        ('a1', {'tenant': 'a'}),
+        ('a2', {'tenant': 'a'}),
+        ('b1', {'tenant': 'b'}),
+    ]:
+        threads.append(_queue_worker(controller, order, label, **kwargs))
+        _wait_for_queue(controller, len(threads))
+
+    controller.release()
+    for thread in threads:
+        thread.join(timeout=2.0)
+
+    assert order == ['a1', 'b1', 'a2', 'batch']
+    assert controller.snapshot()['wait_ms_max'] > 0
+
+
+def test_admission_times_out_waiting_for_slot():
+    controller = AdmissionController(max_concurrency=1, max_queue_depth=4, queue_timeout_s=0.05)
+    controller.acquire()
+
+    with pytest.raises(AdmissionRejected):
+        controller.acquire()
+
+    stats = controller.snapshot()
+    assert stats['timed_out_total'] == 1
+    assert stats['queue_depth'] == 0
+    controller.release()
+    assert controller.snapshot()['in_flight'] == 0
+
+
+def test_api_takes_tenant_from_authenticated_user_or_client_address(tmp_path, monkeypatch):
+    pytest.importorskip('fastapi')
+    pytest.importorskip('httpx')
+    from fastapi.testclient import TestClient
+
+    import adsp.app.api_server as api_server
+    from adsp.core.runtime import RuntimeWarmup
+    from adsp.core.types import ChatResponse
+
+    class NoDataWarmup(RuntimeWarmup):
+        def _load_personas(self):
+            return []
+
+        def _build_persona_index(self, personas):
+            return None
+
+        def _build_fact_index(self):
+            return None
+
+    monkeypatch.setattr(api_server, 'RuntimeWarmup', NoDataWarmup)
+    monkeypatch.setenv('ADSP_API_BACKGROUND_WARMUP', 'false')
+    monkeypatch.setenv('ADSP_REPORTS_DIR', str(tmp_path / 'reports'))
+    monkeypatch.delenv('ADSP_REQUIRE_AUTH', raising=False)
+
+    tenants = []
+    with TestClient(api_server.create_app()) as client:
+        orchestrator = client.app.state.services.qa.orchestrator
+        orchestrator.handle = lambda request: tenants.append(request.tenant_id) or ChatResponse(
+            persona_id=request.persona_id, answer='ok'
+        )
+        chat = {'persona_id': 'default', 'query': 'Coffee?'}
+        for tenant in ('t1', 't2'):
+            assert client.post('/v1/chat', json={**chat, 'tenant_id': tenant}).status_code == 200
+        # Without auth, X-User is unchecked and therefore ignored as well.
+        assert client.post('/v1/chat', json={**chat, 'tenant_id': 't3'}, headers={'X-User': 'alice'}).status_code == 200
+
+        monkeypatch.setenv('ADSP_REQUIRE_AUTH', 'true')
+        client.app.state.services.auth.register('alice', 'secret')
+        headers = {'X-User': 'alice', 'X-Token': 'secret'}
+        assert client.post('/v1/chat', json={**chat, 'tenant_id': 't4'}, headers=headers).status_code == 200
+
+    assert tenants == ['client:testclient'] * 3 + ['alice']
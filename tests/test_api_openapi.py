@@ -9,12 +9,18 @@ unused_fastapi = fastapi
 
 API_PATHS = [
     '/' 'health',
+    '/ready',
+    '/metrics',
     '/v1/auth/register',
     '/v1/auth/validate',
     '/v1/personas',
     '/v1/personas/{persona_id}/profile',
     '/v1/personas/{persona_id}/system-prompt',
     '/v1/' 'chat',
+    '/v1/focus-group',
+    '/v1/system/admission',
+    '/v1/system/llm-endpoints',
+    '/v1/system/reload',
     '/v1/ingestion/upload',
     '/v1/reports/{persona_id}',
 ]
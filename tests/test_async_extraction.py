@@ -0,0 +1,116 @@
+"""
+Async extraction tests: AIMD concurrency, token budget, jittered backoff and
+retrying a page after an overload response.
+"""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from adsp.data_pipeline.async_extraction import (
+    AIMDLimiter,
+    TokenRateBudget,
+    backoff_delay,
+    is_overload_error,
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f'status {status_code}')
+        self.status_code = status_code
+
+
+def test_aimd_limiter_grows_per_window_and_halves_on_overload():
+    limiter = AIMDLimiter(initial=2, maximum=4, latency_target_s=1.0, decrease_cooldown_s=0.0)
+    limiter.on_success(0.1)
+    limiter.on_success(0.1)
+    assert limiter.limit == pytest.approx(2.0 + 1 / 2 + 1 / 2.5)
+
+    limiter.on_overload()
+    assert limiter.limit == pytest.approx((2.0 + 1 / 2 + 1 / 2.5) / 2)
+
+    limiter.on_success(5.0)  # above latency target counts as overload
+    assert limiter.limit == 1.0
+
+
+def test_aimd_limiter_bounds_in_flight():
+    async def run():
+        limiter = AIMDLimiter(initial=2, maximum=2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        return peak, limiter.in_flight
+
+    assert asyncio.run(run()) == (2, 0)
+
+
+def test_token_budget_waits_for_refill():
+    async def run():
+        budget = TokenRateBudget(tokens_per_minute=6000)  # 100 tokens/s
+        await budget.acquire(6000)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await budget.acquire(5)
+        return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.04
+
+
+def test_backoff_and_overload_classification():
+    for attempt in range(1, 6):
+        assert 0.0 <= backoff_delay(attempt, base_seconds=1.0, max_seconds=4.0) <= min(4.0, 2 ** (attempt - 1))
+    assert is_overload_error(_StatusError(429))
+    assert is_overload_error(_StatusError(503))
+    assert not is_overload_error(_StatusError(400))
+    assert not is_overload_error(ValueError('bad json'))
+
+
+def test_async_page_extraction_retries_after_overload(tmp_path: Path):
+    pytest.importorskip('openai')
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.config import FactDataExtractionConfig
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.extractor import VLLMOpenAIExtractor
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.models import PageImage
+
+    cfg = FactDataExtractionConfig(vllm_model='vlm', backoff_seconds=0.0, max_retries=2, max_concurrent_requests=4)
+    extractor = VLLMOpenAIExtractor(cfg)
+    limiter = None
+    in_flight_while_building = []
+
+    def build_user_content(page, ctx):
+        in_flight_while_building.append(limiter.in_flight)
+        return [{'type': 'text', 'text': str(page.page_number)}]
+
+    extractor._build_user_content = build_user_content
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs['messages'][1]['content'])
+        if len(calls) == 1:
+            raise _StatusError(429)
+        message = SimpleNamespace(content='# Page')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    page = PageImage(page_number=3, image_path=tmp_path / 'page_0003.png', width=10, height=10)
+
+    async def run():
+        nonlocal limiter
+        limiter = AIMDLimiter(initial=4, maximum=8, decrease_cooldown_s=0.0)
+        result = await extractor._aextract_single_page(client, limiter, TokenRateBudget(), page, [page])
+        return result, limiter.limit
+
+    result, limit = asyncio.run(run())
+    assert result.error is None
+    assert result.markdown_content == '# Page'
+    assert len(calls) == 2
+    assert limit < 4
+    assert in_flight_while_building == [0]  # encoded once, outside the limiter's window
@@ -0,0 +1,112 @@
+"""
+Columnar docstore tests: documents round-trip through the text blob and the
+dictionary-encoded metadata, saved stores are memory-mapped, and FAISS stores
+use it transparently.
+"""
+
+import pickle
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from langchain_core.documents import Document
+
+from adsp.data_pipeline.columnar_docstore import ColumnarDocstore
+
+
+def _docs(n):
+    return {
+        f'id{i}': Document(
+            page_content=f'Käffee chunk {i} – {"dense table row " * (i % 5)}',
+            metadata={
+                'source_file': f'page_{i % 3:04d}.md',
+                'page_number': i % 3 + 1,
+                'chunk_id': f'{i}_0',
+                'sources': [{'doc_id': 'deck', 'pages': [i % 3 + 1]}],
+                **({'section': 'Brands'} if i % 2 else {}),
+            },
+        )
+        for i in range(n)
+    }
+
+
+def test_documents_round_trip_and_metadata_is_dictionary_encoded():
+    docs = _docs(30)
+    store = ColumnarDocstore(docs)
+    for doc_id, doc in docs.items():
+        found = store.search(doc_id)
+        assert found.page_content == doc.page_content
+        assert found.metadata == doc.metadata
+        assert found.id == doc_id
+    assert store.search('nope') == 'ID nope not found.'
+    assert len(store._columns['source_file'].values) == 3
+    assert len(store._columns['sources'].values) == 3
+    assert store._columns['section'].values == ['"Brands"']
+
+    # Metadata keys first seen after earlier rows, and values equal to the missing code.
+    store.add({'late': Document(page_content='x', metadata={'score': -1, 'page_number': 2})})
+    assert store.search('late').metadata == {'page_number': 2, 'score': -1}
+    assert 'score' not in store.search('id0').metadata
+
+    with pytest.raises(ValueError):
+        store.add({'id0': Document(page_content='dup')})
+    store.delete(['id1'])
+    assert 'id1' not in store and len(store) == 30
+    with pytest.raises(ValueError):
+        store.delete(['id1'])
+
+
+def test_save_load_memory_maps_text_and_compacts_deleted_rows(tmp_path: Path):
+    docs = _docs(20)
+    store = ColumnarDocstore(docs)
+    store.delete(['id5'])
+    store.save(tmp_path / 'docstore')
+
+    loaded = ColumnarDocstore.load(tmp_path / 'docstore')
+    assert not isinstance(loaded._frozen, bytes)  # mmap
+    assert list(loaded.ids()) == [f'id{i}' for i in range(20) if i != 5]
+    assert loaded.search('id7').metadata == docs['id7'].metadata
+    loaded.add({'new': Document(page_content='appended after load', metadata={'page_number': 9})})
+    assert loaded.search('new').page_content == 'appended after load'
+    assert loaded.search('id19').page_content == docs['id19'].page_content
+
+    restored = pickle.loads(pickle.dumps(loaded))
+    assert restored.search('new').metadata == {'page_number': 9}
+    assert restored.search('id3').page_content == docs['id3'].page_content
+
+
+def test_columnar_store_is_smaller_than_document_objects():
+    docs = _docs(2000)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    columnar = ColumnarDocstore(docs)
+    columnar_bytes = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    # What InMemoryDocstore holds: one Document and metadata dict (with its own sources list) per chunk.
+    copies = {
+        k: Document(page_content=d.page_content, metadata={**d.metadata, 'sources': [dict(d.metadata['sources'][0])]})
+        for k, d in docs.items()
+    }
+    document_bytes = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    tracemalloc.stop()
+
+    assert len(copies) == len(columnar)
+    assert columnar_bytes < document_bytes / 2
+
+
+def test_faiss_store_searches_through_columnar_docstore():
+    pytest.importorskip('faiss')
+    pytest.importorskip('langchain_community')
+    from adsp.core.rag.persona_index import HashEmbeddings
+    from adsp.data_pipeline.fact_data_pipeline.rag.indicator import FactDataRAG
+
+    rag = FactDataRAG(HashEmbeddings(dim=64))
+    assert isinstance(rag.vectorstore.docstore, ColumnarDocstore)
+    texts = ['espresso machines at home', 'tea rituals in the evening', 'cold brew in summer']
+    rag.vectorstore.add_texts(texts, metadatas=[{'page_number': i} for i in range(3)])
+    hit = rag.search('tea rituals evening', k=1)[0]
+    assert hit.page_content == texts[1] and hit.metadata == {'page_number': 1}
+    assert [docs[0].metadata['page_number'] for docs in rag.search_many(['cold brew summer'], k=1)] == [2]
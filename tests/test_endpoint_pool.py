@@ -0,0 +1,110 @@
+"""
+LLM endpoint pool tests: load balancing, passive circuit breaking and retry
+on a different replica.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from adsp.modeling.endpoint_pool import EndpointPool, parse_endpoints
+from adsp.modeling.inference import PersonaInferenceEngine
+
+
+def test_parse_endpoints_with_model_restrictions():
+    endpoints = parse_endpoints('http://a:8000/v1/, http://b:8000/v1=persona-a+persona-b,')
+
+    assert [ep.base_url for ep in endpoints] == ['http://a:8000/v1', 'http://b:8000/v1']
+    assert endpoints[0].serves('anything')
+    assert endpoints[1].serves('persona-a')
+    assert not endpoints[1].serves('base')
+
+
+def test_pool_prefers_least_outstanding_then_ewma():
+    pool = EndpointPool.from_urls(['http://a', 'http://b'], strategy='least_outstanding')
+    first = pool.acquire()
+    second = pool.acquire()
+    assert {first.base_url, second.base_url} == {'http://a', 'http://b'}
+
+    pool.release(first, ok=True, latency_s=0.5)
+    pool.release(second, ok=True, latency_s=0.1)
+    assert pool.acquire().base_url == second.base_url
+
+
+def test_pool_opens_circuit_and_recovers_after_cooldown():
+    pool = EndpointPool.from_urls(['http://a', 'http://b'], failure_threshold=2, cooldown_s=60.0)
+    bad = pool.endpoints[0]
+    for _ in range(2):
+        pool.release(pool.acquire(exclude=['http://b']), ok=False, latency_s=0.01)
+
+    assert pool.snapshot()[0]['circuit'] == 'open'
+    assert pool.acquire(exclude=['http://b']) is None
+
+    bad.open_until = 1.0  # cooldown elapsed -> half-open, one probe allowed
+    probe = pool.acquire(exclude=['http://b'])
+    assert probe.endpoint is bad and probe.probe
+    assert pool.acquire(exclude=['http://b']) is None
+    pool.release(probe, ok=True, latency_s=0.01)
+    assert pool.snapshot()[0]['circuit'] == 'closed'
+
+
+def test_only_the_probe_decides_a_half_open_circuit():
+    pool = EndpointPool.from_urls(['http://a'], failure_threshold=2, cooldown_s=60.0)
+    bad = pool.endpoints[0]
+    stragglers = [pool.acquire(), pool.acquire()]  # in flight while the circuit trips
+    for _ in range(2):
+        pool.release(pool.acquire(), ok=False, latency_s=0.01)
+    assert pool.snapshot()[0]['circuit'] == 'open'
+
+    # A late success from before the trip does not close the circuit.
+    pool.release(stragglers[0], ok=True, latency_s=0.01)
+    assert pool.snapshot()[0]['circuit'] == 'open'
+
+    bad.open_until = 1.0
+    probe = pool.acquire()
+    assert probe.probe and not stragglers[1].probe
+    # A late release while the probe is out does not let a second probe through.
+    pool.release(stragglers[1], ok=False, latency_s=0.01)
+    assert pool.acquire() is None
+    pool.release(probe, ok=False, latency_s=0.01)
+    assert pool.snapshot()[0]['circuit'] == 'open' and not bad.half_open_probe
+
+    bad.open_until = 1.0
+    pool.release(pool.acquire(), ok=True, latency_s=0.01)
+    assert pool.snapshot()[0]['circuit'] == 'closed'
+
+
+def test_engine_falls_back_on_malformed_max_attempts(monkeypatch):
+    monkeypatch.setenv('ADSP_LLM_MAX_ATTEMPTS', 'two')
+    assert PersonaInferenceEngine(pool=EndpointPool()).max_attempts == 2
+
+
+class _FakeClient:
+    def __init__(self, answer=None):
+        self.answer = answer
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):  # noqa: ARG002
+        self.calls += 1
+        if self.answer is None:
+            raise ConnectionError('replica down')
+        message = SimpleNamespace(content=self.answer)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_engine_retries_on_other_replica():
+    pytest.importorskip('openai')
+    pool = EndpointPool.from_urls(['http://a', 'http://b'])
+    engine = PersonaInferenceEngine(backend='openai', model='m', pool=pool)
+    down, up = _FakeClient(), _FakeClient('hello')
+    engine._clients.update({'http://a': down, 'http://b': up})
+    pool.endpoints[1].outstanding = 1  # steer the first attempt to the failing replica
+    answer = engine.generate(persona_id='p1', prompt='sys\n\nContext:\nctx\n\nQuestion:\nq')
+    pool.endpoints[1].outstanding = 0
+
+    assert answer == 'hello'
+    assert (down.calls, up.calls) == (1, 1)
+    stats = {row['base_url']: row for row in pool.snapshot()}
+    assert stats['http://a']['failures_total'] == 1
+    assert stats['http://b']['failures_total'] == 0
@@ -0,0 +1,129 @@
+"""
+Extraction cache tests: keys follow page image content, prompt and model, and
+the pipelines only re-extract pages whose inputs changed.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from adsp.data_pipeline.extraction_cache import (
+    ExtractionManifest,
+    page_cache_key,
+    request_fingerprint,
+)
+
+
+def _write(path: Path, content: bytes) -> Path:
+    path.write_bytes(content)
+    return path
+
+
+def test_page_cache_key_follows_inputs(tmp_path: Path):
+    a = _write(tmp_path / 'a.png', b'page-a')
+    b = _write(tmp_path / 'b.png', b'page-b')
+    fingerprint = request_fingerprint('system', {'model': 'vlm', 'temperature': 0.0})
+
+    key = page_cache_key(fingerprint, 1, [(1, a), (2, b)])
+
+    assert key == page_cache_key(fingerprint, 1, [(2, b), (1, a)])
+    assert key != page_cache_key(fingerprint, 2, [(1, a), (2, b)])
+    assert key != page_cache_key(request_fingerprint('system v2', {'model': 'vlm', 'temperature': 0.0}), 1, [(1, a), (2, b)])
+    assert key != page_cache_key(request_fingerprint('system', {'model': 'vlm', 'temperature': 0.2}), 1, [(1, a), (2, b)])
+
+    c = _write(tmp_path / 'c.png', b'page-b changed')
+    assert key != page_cache_key(fingerprint, 1, [(1, a), (2, c)])
+
+
+def test_manifest_round_trip(tmp_path: Path):
+    path = tmp_path / 'raw' / 'manifest.json'
+    manifest = ExtractionManifest.load(path)
+    manifest.source_digest = 'pdf-digest'
+    manifest.record(1, 'key-1')
+    manifest.record(2, 'key-2')
+    manifest.record(2, None)
+    manifest.save()
+
+    loaded = ExtractionManifest.load(path)
+    assert loaded.source_digest == 'pdf-digest'
+    assert loaded.matches(1, 'key-1')
+    assert not loaded.matches(2, 'key-2')
+
+
+def test_manifest_ignores_unreadable_file(tmp_path: Path):
+    path = _write(tmp_path / 'manifest.json', b'{not json')
+    assert ExtractionManifest.load(path).entries == {}
+
+
+def _make_pdf(fitz, path: Path, labels) -> None:
+    doc = fitz.open()
+    for label in labels:
+        doc.new_page(width=120, height=80).insert_text((10, 40), label)
+    doc.save(path)
+    doc.close()
+
+
+def test_fact_pipeline_reextracts_only_changed_pages(tmp_path: Path):
+    fitz = pytest.importorskip('fitz')
+    pytest.importorskip('openai')
+    pytest.importorskip('langchain_core')
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.config import FactDataExtractionConfig
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.models import PageExtractionResult
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.pipeline import FactDataExtractionPipeline
+
+    pdf_path = tmp_path / 'deck.pdf'
+    _make_pdf(fitz, pdf_path, ['One', 'Two', 'Three', 'Four', 'Five'])
+
+    def make_config(**overrides):
+        return FactDataExtractionConfig(
+            pdf_path=pdf_path,
+            page_images_dir=tmp_path / 'images',
+            raw_responses_dir=tmp_path / 'raw',
+            fact_data_output_dir=tmp_path / 'out',
+            vllm_model='vlm',
+            dpi=20,
+            render_workers=1,
+            context_window=1,
+            **overrides,
+        )
+
+    def run(config) -> list:
+        extracted = []
+
+        def fake_extract_pages(pages, on_result=None, all_pages=None, context_window=None):
+            results = []
+            for page in pages:
+                extracted.append(page.page_number)
+                result = PageExtractionResult(page_number=page.page_number, markdown_content=f'# {page.page_number}')
+                on_result(result)
+                results.append(result)
+            return results
+
+        pipeline = FactDataExtractionPipeline(config)
+        pipeline.extractor.extract_pages = fake_extract_pages
+        state = pipeline.run()
+        assert [r.page_number for r in state['page_results']] == [1, 2, 3, 4, 5]
+        return sorted(extracted)
+
+    assert run(make_config()) == [1, 2, 3, 4, 5]
+    assert run(make_config()) == []
+
+    # Page 3 changed and the re-render is interrupted after the first page: the
+    # next run must not mistake the old images of pages 2-5 for current ones.
+    _make_pdf(fitz, pdf_path, ['One', 'Two', 'Three (revised)', 'Four', 'Five'])
+    interrupted = FactDataExtractionPipeline(make_config())
+    render = interrupted.renderer.render
+
+    def render_first_page_then_fail(pdf_path, output_dir, page_range=None, **kwargs):
+        render(pdf_path, output_dir, (1, 1), **kwargs)
+        raise RuntimeError('interrupted')
+
+    interrupted.renderer.render = render_first_page_then_fail
+    with pytest.raises(RuntimeError, match='interrupted'):
+        interrupted.run()
+
+    # It and the pages using it as context are re-extracted.
+    assert run(make_config()) == [2, 3, 4]
+
+    # A different decoding setup invalidates every page.
+    assert run(make_config(temperature=0.3)) == [1, 2, 3, 4, 5]
@@ -0,0 +1,126 @@
+"""
+Batched fact-data extraction tests: runs of consecutive pages share one request,
+responses are split on page delimiters, and missing pages fall back to
+per-page requests.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('openai')
+
+from adsp.data_pipeline.fact_data_pipeline.extract_raw.config import FactDataExtractionConfig
+from adsp.data_pipeline.fact_data_pipeline.extract_raw.extractor import VLLMOpenAIExtractor
+from adsp.data_pipeline.fact_data_pipeline.extract_raw.models import PageImage
+
+
+class _FakeCompletions:
+    def __init__(self, reply):
+        self.reply = reply
+        self.requests = []
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        text = self.reply(kwargs['messages'][1]['content'])
+        text, finish_reason = text if isinstance(text, tuple) else (text, 'stop')
+        choice = SimpleNamespace(message=SimpleNamespace(content=text), finish_reason=finish_reason)
+        return SimpleNamespace(choices=[choice], usage=None)
+
+
+def _primary_pages(content):
+    return [int(block['text'].split('#')[1]) for block in content if block.get('text', '').startswith('Primary page #')]
+
+
+def _context_pages(content):
+    return [int(block['text'].split('#')[1]) for block in content if block.get('text', '').startswith('Context page #')]
+
+
+def _extractor(tmp_path: Path, reply, slides_per_request=3):
+    cfg = FactDataExtractionConfig(vllm_model='vlm', slides_per_request=slides_per_request, context_window=1)
+    extractor = VLLMOpenAIExtractor(cfg)
+    completions = _FakeCompletions(reply)
+    extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    extractor._image_content = lambda page: {'type': 'image_url', 'image_url': {'url': f'data:,{page.page_number}'}}
+    return extractor, completions
+
+
+def _pages(tmp_path: Path, numbers):
+    return [PageImage(page_number=n, image_path=tmp_path / f'page_{n:04d}.png', width=10, height=10) for n in numbers]
+
+
+def test_page_batches_split_on_gaps_and_size(tmp_path: Path):
+    pages = _pages(tmp_path, [1, 2, 3, 4, 6, 7])
+    batches = VLLMOpenAIExtractor._page_batches(pages, 3)
+    assert [[p.page_number for p in batch] for batch in batches] == [[1, 2, 3], [4], [6, 7]]
+
+
+def test_split_batch_response_handles_fences_and_unknown_pages():
+    raw = '```markdown\n<<<PAGE 1>>>\n# Page 1\n\n<<<PAGE 2>>>\n# Page 2\n<<<PAGE 9>>>\nnope\n```'
+    sections = VLLMOpenAIExtractor._split_batch_response(raw, [1, 2, 3])
+    assert sections == {1: '# Page 1', 2: '# Page 2'}
+    assert VLLMOpenAIExtractor._split_batch_response('no delimiters here', [1, 2]) == {}
+
+
+def test_batched_extraction_uses_one_request_per_run(tmp_path: Path):
+    def reply(content):
+        return '\n'.join(f'<<<PAGE {n}>>>\n# Slide {n}' for n in _primary_pages(content))
+
+    extractor, completions = _extractor(tmp_path, reply)
+    pages = _pages(tmp_path, range(1, 7))
+    seen = []
+
+    results = extractor.extract_pages(pages, all_pages=pages, on_result=lambda r: seen.append(r.page_number))
+
+    assert len(completions.requests) == 2
+    assert [r.markdown_content for r in results] == [f'# Slide {n}' for n in range(1, 7)]
+    assert sorted(seen) == [1, 2, 3, 4, 5, 6]
+    contexts = sorted(_context_pages(req['messages'][1]['content']) for req in completions.requests)
+    assert contexts == [[3], [4]]
+
+
+def test_missing_pages_fall_back_to_single_requests(tmp_path: Path):
+    def reply(content):
+        primary = _primary_pages(content)
+        if len(primary) > 1:
+            return f'<<<PAGE {primary[0]}>>>\n# Slide {primary[0]}'  # drops the other pages
+        return f'# Single {primary[0]}'
+
+    extractor, completions = _extractor(tmp_path, reply)
+    pages = _pages(tmp_path, [1, 2, 3])
+
+    results = extractor.extract_pages(pages, all_pages=pages)
+
+    assert [r.markdown_content for r in results] == ['# Slide 1', '# Single 2', '# Single 3']
+    assert len(completions.requests) == 3
+    assert all(r.error is None for r in results)
+
+
+def test_truncated_batch_retries_the_cut_off_pages_per_slide(tmp_path: Path):
+    def reply(content):
+        primary = _primary_pages(content)
+        if len(primary) > 1:
+            return '<<<PAGE 1>>>\n# Slide 1\n<<<PAGE 2>>>\n# Slide 2 half a ta', 'length'
+        return f'# Single {primary[0]}'
+
+    extractor, completions = _extractor(tmp_path, reply)
+    pages = _pages(tmp_path, [1, 2, 3])
+
+    results = extractor.extract_pages(pages, all_pages=pages)
+
+    assert [r.markdown_content for r in results] == ['# Slide 1', '# Single 2', '# Single 3']
+    assert len(completions.requests) == 3
+
+
+def test_async_extraction_with_batching_is_reported(tmp_path: Path):
+    from loguru import logger
+
+    messages = []
+    sink = logger.add(messages.append, level='WARNING')
+    try:
+        cfg = FactDataExtractionConfig(vllm_model='vlm', slides_per_request=3, async_extraction=True)
+        VLLMOpenAIExtractor(cfg)
+    finally:
+        logger.remove(sink)
+    assert any('async_extraction is not supported' in str(message) for message in messages)
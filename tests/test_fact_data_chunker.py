@@ -0,0 +1,124 @@
+"""
+Fact-data chunker tests: `iter_chunks` streams the same chunks as
+`chunk_directory`, the process-pool mode keeps file order, and indexing adds
+chunks to the vector store in batches as they are produced.
+"""
+
+from pathlib import Path
+
+from adsp.data_pipeline.fact_data_pipeline.rag import chunker as chunker_module
+from adsp.data_pipeline.fact_data_pipeline.rag.chunker import FactDataMarkdownChunker
+
+
+def _write_pages(directory: Path, count: int) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for n in range(1, count + 1):
+        body = '\n\n'.join(f'Paragraph {n}.{i} with a [link](http://example.com/{i}) ' * 6 for i in range(8))
+        (directory / f'page_{n:04d}.md').write_text(
+            f'# Segment: S{n % 3}\n## Page: {n}\n### Section: Facts\n\n{body}', encoding='utf-8'
+        )
+
+
+def _key(doc):
+    return (doc.metadata['source_file'], doc.metadata['chunk_id'], doc.page_content)
+
+
+def test_iter_chunks_streams_same_chunks_as_chunk_directory(tmp_path: Path):
+    _write_pages(tmp_path, 5)
+    chunker = FactDataMarkdownChunker(chunk_size=300, chunk_overlap=0)
+
+    stream = chunker.iter_chunks(tmp_path)
+    first = next(stream)
+    assert first.metadata['source_file'] == 'page_0001.md'
+    assert [_key(d) for d in [first, *stream]] == [_key(d) for d in chunker.chunk_directory(tmp_path)]
+    assert all('](' not in d.page_content for d in chunker.chunk_directory(tmp_path))
+
+
+def test_process_pool_mode_matches_serial_order(tmp_path: Path):
+    _write_pages(tmp_path, chunker_module._MIN_FILES_FOR_POOL)
+    serial = FactDataMarkdownChunker(chunk_size=300, chunk_overlap=0)
+    parallel = FactDataMarkdownChunker(chunk_size=300, chunk_overlap=0, workers=2)
+
+    assert [_key(d) for d in parallel.iter_chunks(tmp_path)] == [_key(d) for d in serial.iter_chunks(tmp_path)]
+
+
+def test_index_markdown_directory_adds_chunks_in_batches(tmp_path: Path):
+    from adsp.data_pipeline.fact_data_pipeline.rag.indicator import FactDataRAG
+
+    class _Store:
+        def __init__(self):
+            self.batches = []
+
+        def add_documents(self, docs):
+            self.batches.append(len(docs))
+            return [f'id-{sum(self.batches) - len(docs) + i}' for i in range(len(docs))]
+
+    _write_pages(tmp_path, 4)
+    store = _Store()
+    rag = FactDataRAG(embeddings=None, vectorstore=store, chunk_size=300, chunk_overlap=0)
+    ids = rag.index_markdown_directory(tmp_path, batch_size=5)
+
+    total = len(FactDataMarkdownChunker(chunk_size=300, chunk_overlap=0).chunk_directory(tmp_path))
+    assert len(ids) == total == sum(store.batches)
+    assert len(set(ids)) == total
+    assert store.batches[:-1] == [5] * (len(store.batches) - 1)
+
+
+class _WhitespaceTokenizer:
+    """Stands in for a fast tokenizer: one token per whitespace-separated word, [CLS]/[SEP] added."""
+
+    def encode(self, text, add_special_tokens=True, verbose=True):
+        return text.split() + (['[CLS]', '[SEP]'] if add_special_tokens else [])
+
+    def num_special_tokens_to_add(self, pair=False):
+        return 2
+
+
+def test_token_mode_keeps_every_chunk_within_the_budget(tmp_path: Path):
+    from adsp.data_pipeline.fact_data_pipeline.rag.chunker import chunk_length_report
+
+    _write_pages(tmp_path, 3)
+    tokenizer = _WhitespaceTokenizer()
+    by_tokens = FactDataMarkdownChunker(tokenizer=tokenizer, max_tokens=64, token_overlap=4)
+    by_chars = FactDataMarkdownChunker(chunk_size=1200, chunk_overlap=50)
+
+    token_chunks = by_tokens.chunk_directory(tmp_path)
+    char_report = chunk_length_report(by_chars.chunk_directory(tmp_path), tokenizer, max_tokens=64)
+    token_report = chunk_length_report(token_chunks, tokenizer, max_tokens=64)
+
+    assert char_report['truncated_chunks'] > 0
+    assert token_report['truncated_chunks'] == 0
+    assert token_report['longest_tokens'] <= 64
+    # Header lines are prepended to every chunk and counted in the budget.
+    assert all(c.page_content.startswith('# Segment:') for c in token_chunks)
+
+
+def test_token_mode_matches_in_process_pool(tmp_path: Path):
+    _write_pages(tmp_path, chunker_module._MIN_FILES_FOR_POOL)
+    serial = FactDataMarkdownChunker(tokenizer=_WhitespaceTokenizer(), max_tokens=64)
+    parallel = FactDataMarkdownChunker(tokenizer=_WhitespaceTokenizer(), max_tokens=64, workers=2)
+
+    assert [_key(d) for d in parallel.iter_chunks(tmp_path)] == [_key(d) for d in serial.iter_chunks(tmp_path)]
+
+
+def test_page_level_metrics_for_chunking_comparison():
+    from tests.evaluation.evaluate_rag_retrieval import _page_level_metrics, _relevant_pages
+
+    labeled = [
+        {
+            'query': 'q1',
+            'relevant_docs': [
+                {'metadata': {'page_number': 4}, 'relevance': 1},
+                {'metadata': {'page_number': 9}, 'relevance': 0},
+                {'metadata': {'page_number': 7}, 'relevance': 1},
+            ],
+        }
+    ]
+    judged = _relevant_pages(labeled)
+    assert judged == {'q1': {4, 7}}
+
+    metrics = _page_level_metrics([[4, 4, 9, 7]], [judged['q1']], [2, 4])
+    assert metrics['precision_at_2'] == 1.0
+    assert metrics['recall_at_2'] == 0.5
+    assert metrics['precision_at_4'] == 0.75
+    assert metrics['recall_at_4'] == 1.0
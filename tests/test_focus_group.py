@@ -0,0 +1,187 @@
+"""
+Focus group tests: one question fanned out to several personas with shared
+query embedding, batched fact-data retrieval and per-persona results; closing
+the stream early cancels the generations that have not started.
+"""
+
+from pathlib import Path
+import threading
+
+import pytest
+
+pytest.importorskip('langchain_core')
+
+from adsp.core.orchestrator import Orchestrator
+from adsp.core.persona_registry import PersonaRegistry
+from adsp.core.prompt_builder import PromptBuilder
+from adsp.core.rag import RAGPipeline
+from adsp.core.rag.fact_data_index import build_fact_data_index_from_markdown
+from adsp.core.rag.persona_index import HashEmbeddings, PersonaRAGIndex
+from adsp.core.types import FocusGroupRequest
+from adsp.data_pipeline.schema import Indicator, PersonaProfileModel, Statement
+
+
+class CountingEmbeddings(HashEmbeddings):
+    def __init__(self) -> None:
+        super().__init__(dim=64)
+        self.query_calls = 0
+        self.document_calls = 0
+
+    def embed_query(self, text):
+        self.query_calls += 1
+        return super().embed_query(text)
+
+    def embed_documents(self, texts):
+        self.document_calls += 1
+        return super().embed_documents(texts)
+
+
+class EchoRouter:
+    def dispatch(self, persona_id: str, prompt: str) -> str:  # noqa: ARG002
+        if persona_id == 'broken':
+            raise RuntimeError('backend down')
+        return f'answer from {persona_id}'
+
+
+def _persona(persona_id: str, name: str) -> PersonaProfileModel:
+    return PersonaProfileModel(
+        persona_id=persona_id,
+        persona_name=name,
+        indicators=[
+            Indicator(
+                id='price',
+                label='Price sensitivity',
+                statements=[Statement(label='Price', description=f'{name} compares coffee price')],
+            )
+        ],
+    )
+
+
+def _orchestrator(embeddings: CountingEmbeddings, fact_dir: Path | None = None) -> Orchestrator:
+    personas = [_persona('p1', 'Alpha'), _persona('p2', 'Beta'), _persona('broken', 'Gamma')]
+    registry = PersonaRegistry()
+    for persona in personas:
+        registry.upsert(persona.persona_id, persona)
+    persona_index = PersonaRAGIndex(embeddings=embeddings)
+    persona_index.index_personas(personas)
+    fact_index = None
+    if fact_dir is not None:
+        fact_index = build_fact_data_index_from_markdown(fact_dir, embeddings=embeddings)
+    return Orchestrator(
+        prompt_builder=PromptBuilder(registry=registry),
+        retriever=RAGPipeline(persona_index=persona_index),
+        fact_data_index=fact_index,
+        router=EchoRouter(),  # type: ignore[arg-type]
+    )
+
+
+def test_focus_group_embeds_persona_query_once():
+    embeddings = CountingEmbeddings()
+    orchestrator = _orchestrator(embeddings)
+    embeddings.query_calls = 0
+
+    results = list(
+        orchestrator.handle_focus_group(
+            FocusGroupRequest(persona_ids=['p1', 'p2', 'p1'], query='coffee price')
+        )
+    )
+
+    assert embeddings.query_calls == 1
+    assert sorted(r.persona_id for r in results) == ['p1', 'p2']
+    for result in results:
+        assert result.error is None
+        assert result.response.answer == f'answer from {result.persona_id}'
+        assert 'coffee price' in result.response.context
+
+
+def test_focus_group_reports_per_persona_errors():
+    orchestrator = _orchestrator(CountingEmbeddings())
+
+    results = {
+        r.persona_id: r
+        for r in orchestrator.handle_focus_group(
+            FocusGroupRequest(persona_ids=['p1', 'broken'], query='coffee price')
+        )
+    }
+
+    assert results['p1'].response is not None
+    assert results['broken'].response is None
+    assert 'backend down' in results['broken'].error
+
+
+def test_closing_the_stream_cancels_pending_generations():
+    orchestrator = _orchestrator(CountingEmbeddings())
+    orchestrator.focus_group_max_workers = 1
+    dispatched = []
+    second_started = threading.Event()
+    release = threading.Event()
+
+    class SlowRouter(EchoRouter):
+        def dispatch(self, persona_id: str, prompt: str) -> str:
+            dispatched.append(persona_id)
+            if len(dispatched) > 1:
+                second_started.set()
+                assert release.wait(5)
+            return super().dispatch(persona_id, prompt)
+
+    orchestrator.swap(router=SlowRouter())
+    stream = orchestrator.handle_focus_group(
+        FocusGroupRequest(persona_ids=['p1', 'p2', 'broken'], query='coffee price')
+    )
+    first = next(stream)
+    assert second_started.wait(5)
+    stream.close()  # the client went away after the first result
+    release.set()
+
+    assert first.persona_id == 'p1' and first.response is not None
+    # p2 was already running when the stream closed; 'broken' never started.
+    assert dispatched == ['p1', 'p2']
+
+
+def test_focus_group_batches_fact_data_queries(tmp_path: Path):
+    (tmp_path / 'page_0001.md').write_text(
+        '# Segment: Alpha\n\nAlpha consumers compare coffee price in supermarkets every week.',
+        encoding='utf-8',
+    )
+    embeddings = CountingEmbeddings()
+    orchestrator = _orchestrator(embeddings, fact_dir=tmp_path)
+    embeddings.query_calls = embeddings.document_calls = 0
+
+    results = list(
+        orchestrator.handle_focus_group(FocusGroupRequest(persona_ids=['p1', 'p2', 'p1'], query='coffee price'))
+    )
+
+    # One persona query plus one fact query per distinct segment; nothing goes through embed_documents.
+    assert (embeddings.query_calls, embeddings.document_calls) == (3, 0)
+    assert all('supermarkets' in r.response.context for r in results)
+
+
+def test_fact_data_retrieve_many_matches_single_retrieve(tmp_path: Path):
+    (tmp_path / 'page_0001.md').write_text('# Segment: A\n\nEspresso is preferred at breakfast time.', encoding='utf-8')
+    (tmp_path / 'page_0002.md').write_text('# Segment: B\n\nCapsules are bought online by young families.', encoding='utf-8')
+    index = build_fact_data_index_from_markdown(tmp_path, embeddings=HashEmbeddings(dim=64))
+
+    queries = ['espresso breakfast', 'capsules online', 'espresso breakfast']
+    batched = index.retrieve_many(queries, k=1)
+
+    assert [r.context for r in batched] == [index.retrieve(q, k=1).context for q in queries]
+
+
+class PrefixedQueryEmbeddings(HashEmbeddings):
+    """Asymmetric model stand-in: queries are embedded with an instruction prefix."""
+
+    def embed_query(self, text):
+        return super().embed_query(f'query: instruct {text}')
+
+
+def test_fact_data_search_many_embeds_like_search():
+    from adsp.data_pipeline.fact_data_pipeline.rag.indicator import FactDataRAG
+
+    pytest.importorskip('faiss')
+    rag = FactDataRAG(PrefixedQueryEmbeddings(dim=64))
+    texts = [f'query instruct filler {i}' for i in range(4)] + ['espresso at breakfast', 'capsules online']
+    rag.vectorstore.add_texts(texts)
+
+    for query in ('espresso breakfast', 'capsules bought online'):
+        single = [doc.page_content for doc in rag.search(query, k=3)]
+        assert [[doc.page_content for doc in docs] for docs in rag.search_many([query], k=3)] == [single]
@@ -0,0 +1,181 @@
+"""
+Hot reload tests: file changes are diffed and applied per persona / per
+markdown file, updated components are new objects swapped into the
+orchestrator (the previous generation is left untouched), a request in
+flight uses one generation throughout, and unchanged fact chunks keep their
+vectors instead of being re-embedded.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('faiss')
+pytest.importorskip('langchain_community')
+
+from adsp.core.hot_reload import HotReloader, SourceDiff
+from adsp.core.prompt_builder import PromptBuilder
+from adsp.core.rag import RAGPipeline
+from adsp.core.rag.persona_index import HashEmbeddings, PersonaRAGIndex
+from adsp.core.runtime import RuntimeWarmup, build_registry, load_personas_from_disk
+
+
+def _touch(path: Path, text: str) -> None:
+    path.write_text(text, encoding='utf-8')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _persona(persona_id: str, topic: str) -> str:
+    return json.dumps(
+        {
+            'persona_id': persona_id,
+            'persona_name': persona_id.title(),
+            'indicators': [{'id': 'i1', 'label': f'{topic} habits', 'description': f'Drinks {topic} daily'}],
+        }
+    )
+
+
+def _page(segment: str) -> str:
+    body = '\n'.join(f'Respondents in the {segment} segment rate item {i} at {i} points.' for i in range(8))
+    return f'# Segment: {segment}\n## Page: 1\n\n{body}\n'
+
+
+@pytest.fixture
+def runtime(tmp_path: Path, monkeypatch):
+    individual = tmp_path / 'personas' / 'individual'
+    traits = tmp_path / 'personas' / 'common_traits'
+    pages = tmp_path / 'fact_data' / 'pages'
+    for directory in (individual, traits, pages):
+        directory.mkdir(parents=True)
+    monkeypatch.setenv('ADSP_PERSONAS_DIR', str(individual))
+    monkeypatch.setenv('ADSP_PERSONA_TRAITS_DIR', str(traits))
+    monkeypatch.setenv('ADSP_FACTDATA_MARKDOWN_DIR', str(pages))
+    (individual / 'anna.json').write_text(_persona('anna', 'espresso'), encoding='utf-8')
+    (individual / 'bruno.json').write_text(_persona('bruno', 'tea'), encoding='utf-8')
+    (pages / 'page_0001.md').write_text(_page('Coffee'), encoding='utf-8')
+    (pages / 'page_0002.md').write_text(_page('Tea'), encoding='utf-8')
+
+    from adsp.core.rag.fact_data_index import build_fact_data_index_from_markdown
+
+    warmup = RuntimeWarmup(processed_dir=tmp_path)
+    personas = load_personas_from_disk(individual, traits_dir=traits)
+    persona_index = PersonaRAGIndex(embeddings=HashEmbeddings())
+    persona_index.index_personas(personas)
+    orchestrator = warmup.orchestrator
+    orchestrator.prompt_builder = PromptBuilder(registry=build_registry(personas))
+    orchestrator.retriever = RAGPipeline(persona_index=persona_index)
+    orchestrator.fact_data_index = build_fact_data_index_from_markdown(pages, embeddings=HashEmbeddings())
+    warmup._done.set()
+
+    reloader = HotReloader(warmup)
+    reloader.prime()
+    return reloader, individual, traits, pages
+
+
+def test_source_diff():
+    diff = SourceDiff.between({'a': (1, 1), 'b': (1, 1), 'c': (1, 1)}, {'a': (1, 1), 'b': (2, 2), 'd': (1, 1)})
+    assert (diff.added, diff.changed, diff.removed) == ({'d'}, {'b'}, {'c'})
+    assert not SourceDiff.between({'a': (1, 1)}, {'a': (1, 1)})
+
+
+def test_persona_changes_are_swapped_in_copy_on_write(runtime):
+    reloader, individual, traits, _pages = runtime
+    orchestrator = reloader.warmup.orchestrator
+    assert reloader.poll_once() is None
+
+    old_builder, old_retriever = orchestrator.prompt_builder, orchestrator.retriever
+    old_anna_store = old_retriever.persona_index._indexes['anna']
+
+    _touch(individual / 'bruno.json', _persona('bruno', 'matcha'))
+    (individual / 'carla.json').write_text(_persona('carla', 'cold brew'), encoding='utf-8')
+    (traits / 'anna.json').write_text(json.dumps({'lora_adapter': 'anna-lora'}), encoding='utf-8')
+    result = reloader.poll_once()
+    assert result.generation == 1
+    assert result.upserted == ['anna', 'bruno', 'carla'] and result.removed == []
+
+    registry = orchestrator.prompt_builder.registry
+    assert registry.get('anna').lora_adapter == 'anna-lora'
+    assert orchestrator.router.adapters == {'anna': 'anna-lora'}
+    assert 'matcha' in orchestrator.retriever.retrieve('bruno', 'matcha habits', k=1)
+    assert orchestrator.retriever.persona_index.has_persona('carla')
+
+    # The previous generation is untouched: in-flight requests holding it stay consistent.
+    assert orchestrator.prompt_builder is not old_builder
+    assert 'carla' not in old_builder.registry.list_personas()
+    assert not old_retriever.persona_index.has_persona('carla')
+    assert 'tea' in old_retriever.retrieve('bruno', 'tea habits', k=1)
+    assert old_retriever.persona_index._indexes['anna'] is old_anna_store
+
+    (individual / 'bruno.json').unlink()
+    result = reloader.poll_once()
+    assert result.removed == ['bruno'] and result.upserted == []
+    assert 'bruno' not in orchestrator.prompt_builder.registry.list_personas()
+    assert not orchestrator.retriever.persona_index.has_persona('bruno')
+
+
+def test_fact_changes_reembed_only_affected_files(runtime, monkeypatch):
+    reloader, _individual, _traits, pages = runtime
+    orchestrator = reloader.warmup.orchestrator
+    old_index = orchestrator.fact_data_index
+    old_ids = list(old_index.indexed_chunk_ids)
+
+    embedded = []
+    original = HashEmbeddings.embed_documents
+    monkeypatch.setattr(HashEmbeddings, 'embed_documents', lambda self, texts: embedded.extend(texts) or original(self, texts))
+
+    _touch(pages / 'page_0002.md', _page('Matcha'))
+    (pages / 'page_0003.md').write_text(_page('Cocoa'), encoding='utf-8')
+    result = reloader.poll_once()
+    assert result.fact_files == ['page_0002.md', 'page_0003.md']
+
+    index = orchestrator.fact_data_index
+    assert index is not old_index
+    assert embedded and all('Coffee' not in text for text in embedded)
+    sources = {doc.metadata['source_file'] for doc in index.search('Respondents segment rate item', k=50)}
+    assert sources == {'page_0001.md', 'page_0002.md', 'page_0003.md'}
+    assert 'Matcha' in index.search('Matcha segment', k=1)[0].page_content
+    kept = [doc_id for doc_id in old_ids if doc_id in index.indexed_chunk_ids]
+    assert kept and len(old_index.indexed_chunk_ids) == len(old_ids)
+    assert all('Tea' not in doc.page_content for doc in index.search('Tea segment', k=50))
+    assert any('Tea' in doc.page_content for doc in old_index.search('Tea segment', k=50))
+
+    for name in ('page_0001.md', 'page_0002.md', 'page_0003.md'):
+        (pages / name).unlink()
+    reloader.poll_once()
+    assert orchestrator.fact_data_index is None
+    assert reloader.warmup.components['fact_index'].state == 'skipped'
+
+
+def test_request_uses_one_generation_when_a_reload_lands_mid_request(runtime, monkeypatch):
+    from adsp.core.ai_persona_router import PersonaRouter
+    from adsp.core.types import ChatRequest
+
+    reloader, individual, _traits, _pages = runtime
+    orchestrator = reloader.warmup.orchestrator
+    orchestrator.coalesce_requests = False
+    old_router = orchestrator.router
+    payload = json.loads(_persona('bruno', 'matcha'))
+    _touch(individual / 'bruno.json', json.dumps({**payload, 'persona_name': 'Bruno Reloaded'}))
+
+    dispatched = []
+    monkeypatch.setattr(PersonaRouter, 'dispatch', lambda self, persona_id, prompt: dispatched.append((self, prompt)) or 'ok')
+    retrieve = RAGPipeline.retrieve_with_metadata
+
+    def retrieve_then_reload(self, *args, **kwargs):
+        retrieved = retrieve(self, *args, **kwargs)
+        if reloader.generation == 0:
+            assert reloader.poll_once() is not None  # the swap lands between retrieval and prompt building
+        return retrieved
+
+    monkeypatch.setattr(RAGPipeline, 'retrieve_with_metadata', retrieve_then_reload)
+    response = orchestrator.handle(ChatRequest(persona_id='bruno', query='tea habits'))
+
+    (router, prompt), = dispatched
+    assert router is old_router and orchestrator.router is not old_router
+    assert 'tea' in response.context and 'Bruno (id: bruno)' in prompt and 'Reloaded' not in prompt
+
+    orchestrator.handle(ChatRequest(persona_id='bruno', query='matcha habits'))
+    assert dispatched[1][0] is orchestrator.router and 'Bruno Reloaded' in dispatched[1][1]
@@ -0,0 +1,147 @@
+"""
+Encoded-image cache tests: hits for unchanged images, one encode for concurrent
+misses, re-encode after a change, LRU bounds and the optional on-disk JPEG cache.
+"""
+
+import os
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+from adsp.data_pipeline.fact_data_pipeline.extract_raw.utils import (
+    EncodedImageCache as FactEncodedImageCache,
+)
+from adsp.data_pipeline.persona_data_pipeline.extract_raw import utils as persona_utils
+from adsp.data_pipeline.persona_data_pipeline.extract_raw.utils import EncodedImageCache
+
+
+def _make_png(path: Path, size=(64, 32), color=(200, 30, 30)) -> Path:
+    Image.new('RGB', size, color).save(path, format='PNG')
+    return path
+
+
+def _noisy_png(path: Path, size=(256, 256)) -> Path:
+    Image.frombytes('RGB', size, os.urandom(size[0] * size[1] * 3)).save(path, format='PNG')
+    return path
+
+
+def test_cache_hits_for_unchanged_image(tmp_path: Path, monkeypatch):
+    image = _make_png(tmp_path / 'page_001.png')
+    calls = []
+    original = persona_utils.encode_image_base64
+
+    def _counting(path, max_bytes=None):
+        calls.append(path)
+        return original(path, max_bytes=max_bytes)
+
+    monkeypatch.setattr(persona_utils, 'encode_image_base64', _counting)
+    cache = EncodedImageCache()
+
+    first = cache.encode(image)
+    second = cache.encode(image)
+
+    assert first == second
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_concurrent_misses_share_one_encode(tmp_path: Path, monkeypatch):
+    image = _make_png(tmp_path / 'page_001.png')
+    calls = []
+    release = threading.Event()
+    original = persona_utils.encode_image_base64
+
+    def _slow(path, max_bytes=None):
+        calls.append(path)
+        assert release.wait(5)
+        return original(path, max_bytes=max_bytes)
+
+    monkeypatch.setattr(persona_utils, 'encode_image_base64', _slow)
+    cache = EncodedImageCache()
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(cache.encode(image))) for _ in range(6)]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.1)  # every worker has looked the key up while the first encode is running
+    release.set()
+    for worker in workers:
+        worker.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 6 and len(set(results)) == 1
+    assert (cache.hits, cache.misses) == (5, 1)
+
+
+def test_failed_encode_is_not_cached(tmp_path: Path, monkeypatch):
+    image = _make_png(tmp_path / 'page_001.png')
+    monkeypatch.setattr(persona_utils, 'encode_image_base64', lambda path, max_bytes=None: 1 / 0)
+    cache = EncodedImageCache()
+    with pytest.raises(ZeroDivisionError):
+        cache.encode(image)
+
+    monkeypatch.undo()
+    assert cache.encode(image)[1] == 'image/png'
+
+
+def test_cache_reencodes_after_image_changes(tmp_path: Path):
+    image = _make_png(tmp_path / 'page_001.png')
+    cache = EncodedImageCache()
+    first = cache.encode(image)
+
+    _make_png(image, size=(80, 40), color=(0, 0, 255))
+    stat = image.stat()
+    os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.encode(image) != first
+    assert cache.misses == 2
+
+
+def test_cache_key_includes_max_bytes(tmp_path: Path):
+    image = _noisy_png(tmp_path / 'page_001.png')
+    cache = EncodedImageCache()
+
+    _, raw_mime = cache.encode(image)
+    _, small_mime = cache.encode(image, max_bytes=50_000)
+
+    assert raw_mime == 'image/png'
+    assert small_mime == 'image/jpeg'
+    assert cache.misses == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    images = [_make_png(tmp_path / f'page_{n:03d}.png', color=(n, n, n)) for n in range(1, 4)]
+    cache = EncodedImageCache(max_entries=2)
+
+    cache.encode(images[0])
+    cache.encode(images[1])
+    cache.encode(images[0])  # page 1 becomes most recent
+    cache.encode(images[2])  # evicts page 2
+
+    cache.encode(images[0])
+    assert cache.hits == 2
+    cache.encode(images[1])
+    assert cache.misses == 4
+
+
+def test_disk_cache_reused_across_instances(tmp_path: Path, monkeypatch):
+    image = _noisy_png(tmp_path / 'page_001.png')
+    disk_dir = tmp_path / 'jpeg_cache'
+
+    first = EncodedImageCache(disk_dir=disk_dir).encode(image, max_bytes=50_000)
+    assert first[1] == 'image/jpeg'
+    assert len(list(disk_dir.glob('page_001-*.jpg'))) == 1
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError('image should come from the disk cache')
+
+    monkeypatch.setattr(persona_utils, 'encode_image_base64', _fail)
+    assert EncodedImageCache(disk_dir=disk_dir).encode(image, max_bytes=50_000) == first
+
+
+def test_fact_pipeline_cache_matches_persona(tmp_path: Path):
+    image = _make_png(tmp_path / 'page_001.png')
+    assert FactEncodedImageCache().encode(image) == EncodedImageCache().encode(image)
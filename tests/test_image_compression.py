@@ -0,0 +1,90 @@
+"""
+Image compression tests: oversized images land under the byte budget in few
+encodes, and the renderer can target a pixel budget directly.
+"""
+
+import base64
+import os
+from pathlib import Path
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+from adsp.data_pipeline.persona_data_pipeline.extract_raw import utils
+
+
+def _noisy_png(path: Path, size=(600, 600)) -> Path:
+    Image.frombytes('RGB', size, os.urandom(size[0] * size[1] * 3)).save(path, format='PNG')
+    return path
+
+
+def _count_encodes(monkeypatch) -> list:
+    calls = []
+    original = utils._encode_jpeg
+
+    def _counting(img, quality):
+        calls.append((img.size, quality))
+        return original(img, quality)
+
+    monkeypatch.setattr(utils, '_encode_jpeg', _counting)
+    return calls
+
+
+def test_pixel_budget_keeps_headroom():
+    assert utils.pixel_budget(1_000_000, 0.5) == 1_800_000
+    assert utils.pixel_budget(10, 1e9) == 1
+
+
+def test_png_under_budget_is_not_reencoded(tmp_path: Path, monkeypatch):
+    image = _noisy_png(tmp_path / 'page.png', size=(32, 32))
+    calls = _count_encodes(monkeypatch)
+
+    _, mime = utils.encode_image_base64(image, max_bytes=10 * 1024 * 1024)
+
+    assert mime == 'image/png'
+    assert calls == []
+
+
+def test_large_overshoot_resizes_in_one_step(tmp_path: Path, monkeypatch):
+    image = _noisy_png(tmp_path / 'page.png')
+    calls = _count_encodes(monkeypatch)
+
+    encoded, mime = utils.encode_image_base64(image, max_bytes=40_000)
+
+    assert mime == 'image/jpeg'
+    assert len(base64.b64decode(encoded)) <= 40_000
+    assert len(calls) <= 3
+    assert calls[0] == ((600, 600), 85)
+    assert calls[1][0] < (600, 600)
+
+
+def test_small_overshoot_searches_quality_at_full_resolution(tmp_path: Path, monkeypatch):
+    image = _noisy_png(tmp_path / 'page.png')
+    first = len(utils._encode_jpeg(Image.open(image).convert('RGB'), 85))
+    calls = _count_encodes(monkeypatch)
+
+    encoded, mime = utils.encode_image_base64(image, max_bytes=int(first * 0.85))
+
+    assert mime == 'image/jpeg'
+    assert len(base64.b64decode(encoded)) <= int(first * 0.85)
+    assert all(size == (600, 600) for size, _ in calls)
+    assert len(calls) <= 4
+
+
+def test_renderer_caps_pixels(tmp_path: Path):
+    fitz = pytest.importorskip('fitz')
+    from adsp.data_pipeline.persona_data_pipeline.extract_raw.renderer import PDFRenderer
+
+    doc = fitz.open()
+    doc.new_page(width=720, height=360)  # 10in x 5in
+    pdf = tmp_path / 'deck.pdf'
+    doc.save(pdf)
+    doc.close()
+
+    full = PDFRenderer(dpi=100).render(pdf, tmp_path / 'full', reuse_existing_images=False)[0]
+    capped = PDFRenderer(dpi=100, max_pixels=200_000).render(pdf, tmp_path / 'capped', reuse_existing_images=False)[0]
+
+    assert (full.width, full.height) == (1000, 500)
+    assert capped.width * capped.height <= 200_000
+    assert capped.width < full.width
@@ -0,0 +1,80 @@
+"""
+Import-time budget: the package, the runtime wiring and the CLI entry points
+must not load the embedding stack (LangChain integrations, sentence-transformers,
+torch, FAISS) until an index is actually built.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = (
+    'torch',
+    'transformers',
+    'sentence_transformers',
+    'langchain_huggingface',
+    'langchain_community',
+    'langchain_text_splitters',
+    'faiss',
+    'tqdm',
+)
+
+# Cumulative import time of the statement below, measured with `-X importtime`
+# (a cold start is ~0.3s; the embedding stack alone takes several seconds).
+IMPORT_BUDGET_S = 1.0
+
+
+def _import_report(statement: str) -> dict:
+    code = (
+        'import json, sys\n'
+        f'{statement}\n'
+        f'print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith(' ' * 2):  # top-level imports only
+            total_us += int(cumulative)
+    return {'heavy': json.loads(result.stdout.strip().splitlines()[-1]), 'seconds': total_us / 1e6}
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'import adsp',
+        'import adsp.core, adsp.app, adsp.monitoring, adsp.data_pipeline',
+        'from adsp.core.runtime import build_registry, load_personas_from_disk, resolve_persona_paths',
+        'from adsp.app.qa_service import QAService',
+    ],
+)
+def test_startup_imports_skip_the_embedding_stack(statement):
+    report = _import_report(statement)
+    assert report['heavy'] == []
+    assert report['seconds'] < IMPORT_BUDGET_S, report
+
+
+def test_lazy_attributes_resolve_on_access():
+    import adsp
+    import adsp.core
+    import adsp.core.rag
+
+    assert adsp.core.PromptBuilder.__name__ == 'PromptBuilder'
+    assert adsp.core.rag.PersonaRAGIndex.__name__ == 'PersonaRAGIndex'
+    assert adsp.storage.VectorDatabase.__name__ == 'VectorDatabase'
+    with pytest.raises(AttributeError):
+        adsp.core.NotAThing
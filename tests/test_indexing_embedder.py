@@ -0,0 +1,85 @@
+"""
+Indexing embedder tests: length-sorted batches return vectors in input order,
+stats are accumulated, and persona indexing embeds all personas in one pass.
+"""
+
+from typing import List
+
+import pytest
+
+from adsp.data_pipeline.indexing_embedder import IndexingEmbedder
+
+
+class _RecordingEmbeddings:
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text))]
+
+
+def test_batches_are_length_sorted_and_results_keep_input_order():
+    embeddings = _RecordingEmbeddings()
+    indexer = IndexingEmbedder(embeddings, batch_size=2)
+    texts = ['ccc', 'a', 'eeeee', 'bb', 'dddd']
+
+    vectors = indexer.embed_documents(texts)
+
+    assert vectors == [[3.0], [1.0], [5.0], [2.0], [4.0]]
+    assert embeddings.calls == [['a', 'bb'], ['ccc', 'dddd'], ['eeeee']]
+    assert indexer.stats.texts == 5 and indexer.stats.batches == 3
+    assert indexer.embed_documents([]) == []
+
+
+def test_batch_size_and_processes_from_env(monkeypatch):
+    monkeypatch.setenv('ADSP_EMBED_BATCH_SIZE', '16')
+    monkeypatch.setenv('ADSP_EMBED_PROCESSES', 'zero')
+    indexer = IndexingEmbedder(_RecordingEmbeddings())
+    assert indexer.batch_size == 16
+    assert indexer.processes == 1
+    # No sentence-transformers model behind the embeddings: the pool is never started.
+    with indexer.multi_process() as active:
+        assert active._pool is None
+
+
+def test_persona_index_embeds_all_personas_in_one_pass():
+    pytest.importorskip('faiss')
+    pytest.importorskip('langchain_community')
+    from adsp.core.rag.persona_index import HashEmbeddings, PersonaRAGIndex
+    from adsp.data_pipeline.schema import PersonaProfileModel
+
+    class CountingHashEmbeddings(HashEmbeddings):
+        def __init__(self) -> None:
+            super().__init__()
+            self.document_calls = 0
+
+        def embed_documents(self, texts):
+            self.document_calls += 1
+            return super().embed_documents(texts)
+
+    embeddings = CountingHashEmbeddings()
+    personas = [
+        PersonaProfileModel.model_validate(
+            {
+                'persona_id': pid,
+                'persona_name': pid.title(),
+                'indicators': [
+                    {'id': f'{pid}_{i}', 'label': label, 'domain': 'lifestyle'}
+                    for i, label in enumerate(labels)
+                ],
+            }
+        )
+        for pid, labels in (('alpha', ['espresso at home', 'cycling']), ('beta', ['tea rituals']))
+    ]
+    index = PersonaRAGIndex(embeddings=embeddings)
+    index.index_personas(personas)
+
+    assert embeddings.document_calls == 1
+    assert index.indexer.stats.texts == 3
+    docs = index.search('beta', 'tea', k=5)
+    assert [doc.metadata['indicator_id'] for doc in docs] == ['beta_0']
+    assert {doc.metadata['persona_id'] for doc in index.search('alpha', 'espresso', k=5)} == {'alpha'}
@@ -0,0 +1,172 @@
+"""
+Metrics tests: fixed-bucket histograms estimate quantiles and render in the
+Prometheus text format, the orchestrator observes every stage by backend (and
+by registered persona when enabled), and the API serves /metrics and optional
+Server-Timing headers.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from adsp.core.orchestrator import STAGE_METRIC, Orchestrator
+from adsp.core.types import ChatRequest
+from adsp.monitoring.metrics import (
+    Histogram,
+    MetricsCollector,
+    collect_stage_timings,
+    record_stage,
+    server_timing_header,
+)
+
+
+class EchoRouter:
+    def dispatch(self, persona_id: str, prompt: str) -> str:  # noqa: ARG002
+        return f'answer from {persona_id}'
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram(bounds=(0.1, 0.2, 0.5, 1.0))
+    for i in range(100):
+        histogram.observe(i / 100)
+    assert histogram.count == 100 and histogram.sum == pytest.approx(49.5)
+    assert histogram.counts == [11, 10, 30, 49, 0]
+    assert 0.45 <= histogram.quantile(0.5) <= 0.55
+    assert 0.95 <= histogram.quantile(0.99) <= 1.0
+    histogram.observe(7.0)
+    assert histogram.quantile(1.0) == 1.0  # +Inf bucket reports its lower bound
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_render_prometheus_text_format():
+    metrics = MetricsCollector()
+    metrics.describe('req_seconds', 'Request time.')
+    metrics.observe('req_seconds', 0.05, buckets=(0.01, 0.1), route='/a"b')
+    metrics.observe('req_seconds', 0.5, buckets=(0.01, 0.1), route='/a"b')
+    metrics.incr('hits.total', 2)
+
+    lines = metrics.render_prometheus().splitlines()
+    assert '# TYPE hits_total untyped' in lines and 'hits_total 2' in lines
+    assert '# HELP req_seconds Request time.' in lines
+    assert '# TYPE req_seconds histogram' in lines
+    assert 'req_seconds_bucket{route="/a\\"b",le="0.01"} 0' in lines
+    assert 'req_seconds_bucket{route="/a\\"b",le="0.1"} 1' in lines
+    assert 'req_seconds_bucket{route="/a\\"b",le="+Inf"} 2' in lines
+    assert 'req_seconds_sum{route="/a\\"b"} 0.55' in lines
+    assert 'req_seconds_count{route="/a\\"b"} 2' in lines
+
+    snapshot = metrics.histogram('req_seconds', route='/a"b')
+    metrics.observe('req_seconds', 0.5, buckets=(0.01, 0.1), route='/a"b')
+    assert snapshot.count == 2 and metrics.histogram('req_seconds').count == 3
+    assert metrics.histogram('req_seconds', route='/other') is None
+
+    # Legacy counter/gauge behaviour is unchanged.
+    metrics.write('gauge', 3)
+    assert metrics.read('gauge') == 3 and metrics.read('missing') == 0.0
+
+
+def test_stage_timings_are_collected_per_context():
+    record_stage('outside', 1.0)  # no collector active: ignored
+    with collect_stage_timings() as timings:
+        record_stage('retrieve_persona', 1.25)
+        record_stage('llm', 800.0)
+        record_stage('llm', 12.5)
+    assert timings == {'retrieve_persona': 1.25, 'llm': 812.5}
+    assert server_timing_header(timings) == 'retrieve_persona;dur=1.2, llm;dur=812.5'
+
+
+def test_orchestrator_observes_each_stage(monkeypatch):
+    monkeypatch.setenv('ADSP_CHAT_SINGLE_FLIGHT', 'false')
+    monkeypatch.delenv('ADSP_METRICS_PERSONA_LABEL', raising=False)
+    orchestrator = Orchestrator(router=EchoRouter())
+    with collect_stage_timings() as timings:
+        orchestrator.handle(ChatRequest(persona_id='default', query='Which coffee?'))
+    orchestrator.handle(ChatRequest(persona_id='default', query='And tea?'))
+
+    for stage in ('normalize', 'retrieve_persona', 'filter_retrieved', 'build_prompt', 'queue', 'llm', 'total'):
+        assert stage in timings
+        histogram = orchestrator.metrics.histogram(STAGE_METRIC, stage=stage, backend='stub')
+        assert histogram is not None and histogram.count == 2
+    assert orchestrator.metrics.quantile(STAGE_METRIC, 0.5) > 0
+
+
+def test_backend_label_follows_the_router_the_request_bound(monkeypatch):
+    monkeypatch.setenv('ADSP_CHAT_SINGLE_FLIGHT', 'false')
+    orchestrator = Orchestrator()
+
+    class SwappingRouter(EchoRouter):
+        inference_engine = SimpleNamespace(backend='vllm')
+
+        def dispatch(self, persona_id: str, prompt: str) -> str:
+            new_router = EchoRouter()
+            new_router.inference_engine = SimpleNamespace(backend='openai')
+            orchestrator.swap(router=new_router)  # a hot reload lands mid-request
+            return super().dispatch(persona_id, prompt)
+
+    orchestrator.swap(router=SwappingRouter())
+    orchestrator.handle(ChatRequest(persona_id='default', query='Which coffee?'))
+
+    for stage in ('llm', 'memory_store', 'total'):
+        assert orchestrator.metrics.histogram(STAGE_METRIC, stage=stage, backend='vllm').count == 1
+    assert orchestrator.metrics.histogram(STAGE_METRIC, stage='total', backend='openai') is None
+
+
+def test_persona_label_is_opt_in_and_limited_to_registered_personas(monkeypatch):
+    monkeypatch.setenv('ADSP_CHAT_SINGLE_FLIGHT', 'false')
+    monkeypatch.setenv('ADSP_METRICS_PERSONA_LABEL', 'true')
+    orchestrator = Orchestrator(router=EchoRouter())
+    orchestrator.handle(ChatRequest(persona_id='default', query='Which coffee?'))
+    for i in range(3):
+        with pytest.raises(KeyError):  # no prompt for an unregistered persona, but earlier stages are observed
+            orchestrator.handle(ChatRequest(persona_id=f'made-up-{i}', query='Which coffee?'))
+
+    assert orchestrator.metrics.histogram(STAGE_METRIC, stage='llm', persona='default', backend='stub').count == 1
+    unknown = orchestrator.metrics.histogram(STAGE_METRIC, stage='retrieve_persona', persona='unknown', backend='stub')
+    assert unknown.count == 3
+    assert 'made-up' not in orchestrator.metrics.render_prometheus()
+
+
+def test_api_serves_metrics_and_server_timing(tmp_path, monkeypatch):
+    pytest.importorskip('fastapi')
+    pytest.importorskip('httpx')
+    from fastapi.testclient import TestClient
+
+    import adsp.app.api_server as api_server
+    from adsp.core.runtime import RuntimeWarmup
+
+    class NoDataWarmup(RuntimeWarmup):
+        def _load_personas(self):
+            return []
+
+        def _build_persona_index(self, personas):
+            return None
+
+        def _build_fact_index(self):
+            return None
+
+    monkeypatch.setattr(api_server, 'RuntimeWarmup', NoDataWarmup)
+    monkeypatch.setenv('ADSP_API_BACKGROUND_WARMUP', 'false')
+    monkeypatch.setenv('ADSP_REPORTS_DIR', str(tmp_path / 'reports'))
+    monkeypatch.delenv('ADSP_REQUIRE_AUTH', raising=False)
+    monkeypatch.delenv('ADSP_METRICS_PERSONA_LABEL', raising=False)
+
+    with TestClient(api_server.create_app()) as client:
+        client.app.state.services.qa.orchestrator.router = EchoRouter()
+        chat = {'persona_id': 'default', 'query': 'Coffee?'}
+
+        plain = client.post('/v1/chat', json=chat)
+        assert plain.status_code == 200 and 'Server-Timing' not in plain.headers
+
+        monkeypatch.setenv('ADSP_API_SERVER_TIMING', 'true')
+        timed = client.post('/v1/chat', json={**chat, 'query': 'Tea?'})
+        entries = dict(part.split(';dur=') for part in timed.headers['Server-Timing'].split(', '))
+        assert {'retrieve_persona', 'build_prompt', 'llm', 'total'} <= set(entries)
+        assert all(float(ms) >= 0 for ms in entries.values())
+
+        scraped = client.get('/metrics')
+        assert scraped.headers['content-type'].startswith('text/plain; version=0.0.4')
+        body = scraped.text
+        assert '# TYPE adsp_orchestrator_stage_seconds histogram' in body
+        assert 'adsp_orchestrator_stage_seconds_count{backend="stub",stage="llm"} 2' in body
+        assert 'adsp_http_request_seconds_count{method="POST",route="/v1/chat",status="200"} 2' in body
+        assert 'adsp_admission_in_flight 0' in body
@@ -0,0 +1,107 @@
+"""
+Concurrency test for Orchestrator: identical in-flight requests should share a
+single retrieval + generation instead of hitting the LLM backend twice.
+"""
+
+from dataclasses import dataclass, field
+import threading
+
+from adsp.core.orchestrator import Orchestrator
+from adsp.core.types import ChatRequest, RetrievedContext
+
+
+class StaticPromptBuilder:
+    def build(self, persona_id: str, query: str, context: str, **_: object) -> str:  # noqa: ARG002
+        return f"PROMPT:{query}"
+
+
+@dataclass
+class CountingRetriever:
+    calls: int = 0
+
+    def retrieve_with_metadata(self, persona_id: str, query: str, *, k: int = 5) -> RetrievedContext:  # noqa: ARG002
+        self.calls += 1
+        return RetrievedContext(context="")
+
+
+@dataclass
+class BlockingRouter:
+    started: threading.Event = field(default_factory=threading.Event)
+    release: threading.Event = field(default_factory=threading.Event)
+    calls: int = 0
+
+    def dispatch(self, persona_id: str, prompt: str) -> str:  # noqa: ARG002
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return f"ANSWER {self.calls}"
+
+
+def _orchestrator(router: BlockingRouter, retriever: CountingRetriever, *, coalesce: bool) -> Orchestrator:
+    return Orchestrator(
+        prompt_builder=StaticPromptBuilder(),  # type: ignore[arg-type]
+        retriever=retriever,  # type: ignore[arg-type]
+        router=router,  # type: ignore[arg-type]
+        coalesce_requests=coalesce,
+    )
+
+
+def _run_pair(orchestrator: Orchestrator, router: BlockingRouter, second: ChatRequest) -> list:
+    responses = []
+    first = threading.Thread(
+        target=lambda: responses.append(orchestrator.handle(ChatRequest(persona_id="p1", query="price?")))
+    )
+    first.start()
+    router.started.wait(timeout=5)
+    other = threading.Thread(target=lambda: responses.append(orchestrator.handle(second)))
+    other.start()
+    other.join(timeout=0.1)
+    router.release.set()
+    first.join(timeout=5)
+    other.join(timeout=5)
+    return responses
+
+
+def test_identical_concurrent_requests_share_one_execution():
+    router = BlockingRouter()
+    retriever = CountingRetriever()
+    orchestrator = _orchestrator(router, retriever, coalesce=True)
+
+    responses = _run_pair(orchestrator, router, ChatRequest(persona_id="p1", query="  price?  "))
+
+    assert router.calls == 1
+    assert retriever.calls == 1
+    assert [r.answer for r in responses] == ["ANSWER 1", "ANSWER 1"]
+    assert responses[0] is not responses[1]
+
+
+def test_different_top_k_is_not_coalesced():
+    router = BlockingRouter()
+    retriever = CountingRetriever()
+    orchestrator = _orchestrator(router, retriever, coalesce=True)
+
+    _run_pair(orchestrator, router, ChatRequest(persona_id="p1", query="price?", top_k=3))
+
+    assert router.calls == 2
+    assert retriever.calls == 2
+
+
+def test_different_priority_is_not_coalesced():
+    router = BlockingRouter()
+    retriever = CountingRetriever()
+    orchestrator = _orchestrator(router, retriever, coalesce=True)
+
+    _run_pair(orchestrator, router, ChatRequest(persona_id="p1", query="price?", priority="batch"))
+
+    assert router.calls == 2
+    assert retriever.calls == 2
+
+
+def test_coalescing_can_be_disabled():
+    router = BlockingRouter()
+    retriever = CountingRetriever()
+    orchestrator = _orchestrator(router, retriever, coalesce=False)
+
+    _run_pair(orchestrator, router, ChatRequest(persona_id="p1", query="price?"))
+
+    assert router.calls == 2
@@ -0,0 +1,58 @@
+"""
+PDF renderer tests: process-pool rendering matches in-process rendering,
+reports progress per page and reuses existing images.
+"""
+
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip('fitz')
+pytest.importorskip('PIL')
+
+from adsp.data_pipeline.persona_data_pipeline.extract_raw.renderer import PDFRenderer, _contiguous_runs
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    doc = fitz.open()
+    for number in range(1, pages + 1):
+        page = doc.new_page(width=200, height=100)
+        page.insert_text((20, 50), f'Slide {number}')
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_contiguous_runs():
+    assert _contiguous_runs([5, 1, 2, 3, 7, 8]) == [(1, 3), (5, 5), (7, 8)]
+    assert _contiguous_runs(range(1, 11), max_pages=4) == [(1, 4), (5, 8), (9, 10)]
+    assert _contiguous_runs([1, 2, 3, 5, 6], max_pages=2) == [(1, 2), (3, 3), (5, 6)]
+
+
+def test_process_pool_rendering_matches_sequential(tmp_path: Path):
+    pdf = _make_pdf(tmp_path / 'deck.pdf', pages=6)
+    progress = []
+
+    parallel = PDFRenderer(dpi=36, workers=2, on_progress=lambda done, total: progress.append((done, total)))
+    pooled = parallel.render(pdf, tmp_path / 'pooled', reuse_existing_images=False)
+    sequential = PDFRenderer(dpi=36, workers=1).render(pdf, tmp_path / 'seq', reuse_existing_images=False)
+
+    assert [p.page_number for p in pooled] == [1, 2, 3, 4, 5, 6]
+    assert [(p.width, p.height) for p in pooled] == [(p.width, p.height) for p in sequential]
+    assert all(p.image_path.exists() for p in pooled)
+    assert progress[-1] == (6, 6)
+    assert len(progress) == 6
+
+
+def test_rendering_only_renders_missing_pages(tmp_path: Path):
+    pdf = _make_pdf(tmp_path / 'deck.pdf', pages=5)
+    out_dir = tmp_path / 'pages'
+    renderer = PDFRenderer(dpi=36, workers=2)
+    renderer.render(pdf, out_dir, page_range=(2, 3))
+
+    progress = []
+    renderer.on_progress = lambda done, total: progress.append((done, total))
+    pages = renderer.render(pdf, out_dir)
+
+    assert [p.page_number for p in pages] == [1, 2, 3, 4, 5]
+    assert progress[-1] == (3, 3)
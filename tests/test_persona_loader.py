@@ -0,0 +1,63 @@
+"""
+Persona loader tests: the thread-pooled loader matches the serial one, the
+JSON fallback parser works, and the source fingerprint tracks every persona
+and traits file.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import adsp.core.persona_registry.loader as loader
+from adsp.core.runtime import load_personas_from_disk
+
+
+def _write_personas(tmp_path: Path, n: int = 12):
+    individual = tmp_path / 'individual'
+    traits = tmp_path / 'traits'
+    individual.mkdir()
+    traits.mkdir()
+    for i in range(n):
+        payload = {
+            'persona_name': f'Persona {i}',
+            'indicators': [{'id': f'ind{j}', 'statements': [{'label': f's{j}', 'metrics': [{'value': j}]}]} for j in range(3)],
+        }
+        (individual / f'p{i:02d}.json').write_text(json.dumps(payload), encoding='utf-8')
+        if i % 2:
+            (traits / f'p{i:02d}.json').write_text(json.dumps({'lora_adapter': f'lora-{i}', 'ignored': 1}), encoding='utf-8')
+    return individual, traits
+
+
+def test_parallel_loading_matches_serial_and_skips_bad_files(tmp_path: Path):
+    individual, traits = _write_personas(tmp_path)
+    (individual / 'broken.json').write_text('{not json', encoding='utf-8')
+    (individual / 'list.json').write_text('[1, 2]', encoding='utf-8')
+
+    serial = load_personas_from_disk(individual, traits_dir=traits, workers=1)
+    parallel = load_personas_from_disk(individual, traits_dir=traits, workers=4)
+    assert [p.model_dump() for p in parallel] == [p.model_dump() for p in serial]
+    assert [p.persona_id for p in serial] == [f'p{i:02d}' for i in range(12)]
+    assert serial[1].lora_adapter == 'lora-1' and serial[2].lora_adapter is None
+    assert serial[0].indicators[2].statements[0].metrics[0].value == 2
+
+
+def test_stdlib_json_fallback(tmp_path: Path, monkeypatch):
+    individual, traits = _write_personas(tmp_path, n=2)
+    monkeypatch.setattr(loader, '_orjson', None)
+    assert loader.loads_json(b'{"a": [1]}') == {'a': [1]}
+    assert [p.persona_name for p in load_personas_from_disk(individual, traits_dir=traits)] == ['Persona 0', 'Persona 1']
+
+
+def test_source_fingerprint_tracks_persona_and_traits_files(tmp_path: Path):
+    individual, traits = _write_personas(tmp_path, n=3)
+    (individual / 'notes.txt').write_text('ignored', encoding='utf-8')
+    before = loader.source_fingerprint(individual, traits)
+    assert list(before) == ['individual/p00.json', 'individual/p01.json', 'individual/p02.json', 'traits/p01.json']
+
+    traits_file = traits / 'p01.json'
+    traits_file.write_text(json.dumps({'lora_adapter': 'lora-new'}), encoding='utf-8')
+    stat = traits_file.stat()
+    os.utime(traits_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    after = loader.source_fingerprint(individual, traits)
+    assert [name for name in before if before[name] != after[name]] == ['traits/p01.json']
+    assert loader.source_fingerprint(individual, None).keys() == {name for name in before if name.startswith('individual/')}
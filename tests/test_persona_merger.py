@@ -0,0 +1,81 @@
+"""
+PersonaMerger tests: list dedup across pages, indicator merge by key, merge
+strategies and the per-list indexes that keep page merges incremental.
+"""
+
+from adsp.data_pipeline.persona_data_pipeline.extract_raw import merger as merger_module
+from adsp.data_pipeline.persona_data_pipeline.extract_raw.merger import PersonaMerger
+from adsp.data_pipeline.persona_data_pipeline.extract_raw.models import PageExtractionResult
+
+
+def _page(number: int, **persona) -> PageExtractionResult:
+    payload = {'persona_name': 'Eco Shopper', **persona}
+    return PageExtractionResult(page_number=number, raw_text='', parsed={'personas': [payload]})
+
+
+def test_lists_are_deduplicated_structurally_across_pages():
+    merger = PersonaMerger('deck.pdf')
+    merger.apply_page_result(_page(1, tags=['green', 'price'], likes=[{'a': 1, 'b': 2}], grid=[[1, 2]]))
+    merger.apply_page_result(_page(2, tags=['price', 'local'], likes=[{'b': 2, 'a': 1}, {'a': 3}], grid=[[1, 2], [3]]))
+
+    persona = merger.personas['eco-shopper']
+    assert persona['tags'] == ['green', 'price', 'local']
+    assert persona['likes'] == [{'a': 1, 'b': 2}, {'a': 3}]
+    assert persona['grid'] == [[1, 2], [3]]
+    assert persona['source_pages'] == [1, 2]
+
+
+def test_structural_dedup_matches_equality_for_mixed_numbers_and_bools():
+    values = [1, 1.0, True, 0, False, 2.5, {'a': 1}, {'a': True}, {'a': 1.0}, {'a': 0}, [1, 2], [True, 2.0], ['1'], '1']
+    expected = []
+    for value in values:
+        if not any(value == kept for kept in expected):
+            expected.append(value)
+
+    merger = PersonaMerger('deck.pdf')
+    merger.apply_page_result(_page(1, mixed=values[:7]))
+    merger.apply_page_result(_page(2, mixed=values[7:]))
+
+    assert merger.personas['eco-shopper']['mixed'] == expected == [1, 0, 2.5, {'a': 1}, {'a': 0}, [1, 2], ['1'], '1']
+
+
+def test_indicators_merge_by_key_and_keep_statements_unique():
+    merger = PersonaMerger('deck.pdf')
+    statement = {'label': 'Buys organic', 'metrics': {'share': 0.4}}
+    merger.apply_page_result(_page(1, indicators=[{'id': 'Organic', 'statements': [statement]}]))
+    merger.apply_page_result(
+        _page(2, indicators=[{'id': 'organic', 'statements': [statement, {'label': 'Reads labels'}]}, {'id': 'price'}])
+    )
+
+    indicators = merger.personas['eco-shopper']['indicators']
+    assert [ind['id'] for ind in indicators] == ['Organic', 'price']
+    assert [s['label'] for s in indicators[0]['statements']] == ['Buys organic', 'Reads labels']
+    assert [src['pages'] for src in indicators[0]['sources']] == [[1], [2]]
+
+
+def test_overwrite_strategy_replaces_list_and_reindexes():
+    merger = PersonaMerger('deck.pdf', merge_strategy={'tags': 'overwrite'})
+    merger.apply_page_result(_page(1, tags=['a', 'b']))
+    merger.apply_page_result(_page(2, tags=['c', 'c']))
+
+    assert merger.personas['eco-shopper']['tags'] == ['c', 'c']
+
+
+def test_each_item_is_keyed_once(monkeypatch):
+    calls = []
+    original = merger_module._structural_key
+
+    def counting(value):
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(merger_module, '_structural_key', counting)
+    merger = PersonaMerger('deck.pdf')
+    for number in range(1, 51):
+        merger.apply_page_result(_page(number, tags=[f'tag-{number}', 'shared']))
+
+    assert merger.personas['eco-shopper']['tags'][:2] == ['tag-1', 'shared']
+    assert len(merger.personas['eco-shopper']['tags']) == 51
+    # Two tags per page, each keyed once; the accumulated list is never re-keyed.
+    top_level = [value for value in calls if isinstance(value, str) and (value == 'shared' or value.startswith('tag-'))]
+    assert len(top_level) == 100
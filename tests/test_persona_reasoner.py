@@ -0,0 +1,126 @@
+"""
+PersonaReasoner map-reduce tests: chunks are reasoned about concurrently,
+merged in chunk order and optionally reconciled.
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('openai')
+
+from adsp.data_pipeline.persona_data_pipeline.extract_raw.config import PersonaExtractionConfig
+from adsp.data_pipeline.persona_data_pipeline.extract_raw.reasoner import PersonaReasoner
+
+
+class _FakeCompletions:
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        prompt = kwargs['messages'][1]['content']
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(self.reply(prompt))))])
+
+
+def _persona(count: int) -> dict:
+    statements = [
+        {'label': f'statement-{n}', 'salience': {'is_salient': True}, 'description': 'x' * 40}
+        for n in range(count)
+    ]
+    return {'persona_id': 'p1', 'persona_name': 'Pat', 'indicators': [{'id': 'i1', 'statements': statements}]}
+
+
+def _reasoner(reply, **overrides):
+    settings = {'reasoning_map_reduce': True, 'reasoning_chunk_workers': 4, **overrides}
+    cfg = PersonaExtractionConfig(vllm_model='vlm', reasoning_max_input_chars=300, **settings)
+    reasoner = PersonaReasoner(cfg)
+    completions = _FakeCompletions(reply)
+    reasoner.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return reasoner, completions
+
+
+def _chunk_reply(prompt):
+    first = prompt.split('"statement_label": "')[1].split('"')[0]
+    return {
+        'style_profile': {'tone_adjectives': [first], 'formality_level': 'high' if first == 'statement-0' else 'low'},
+    }
+
+
+def test_map_reduce_runs_chunks_concurrently_and_merges_in_order():
+    reasoner, completions = _reasoner(_chunk_reply)
+    persona = _persona(8)
+    indicators = reasoner._collect_key_indicators(persona)
+    chunks = reasoner._chunk_key_indicators(indicators, reasoner.max_input_chars)
+    assert len(chunks) > 2
+
+    profile = reasoner._build_profile(persona, indicators)
+
+    assert len(completions.prompts) == len(chunks)
+    assert completions.peak > 1
+    assert all('Existing partial profile (may be empty):\n{}' in p for p in completions.prompts)
+    firsts = [chunk[0]['statement_label'] for chunk in chunks]
+    assert profile['style_profile']['tone_adjectives'] == firsts
+    assert profile['style_profile']['formality_level'] == 'high'
+
+
+def test_reconciliation_call_overrides_merged_scalars():
+    def reply(prompt):
+        if 'Reconcile these into one consistent profile' in prompt:
+            return {'style_profile': {'formality_level': 'medium', 'tone_adjectives': ['calm']}}
+        return _chunk_reply(prompt)
+
+    reasoner, completions = _reasoner(reply, reasoning_reconcile=True)
+    persona = _persona(8)
+    indicators = reasoner._collect_key_indicators(persona)
+
+    profile = reasoner._build_profile(persona, indicators)
+
+    assert 'Reconcile these into one consistent profile' in completions.prompts[-1]
+    assert profile['style_profile']['formality_level'] == 'medium'
+    assert profile['style_profile']['tone_adjectives'] == ['calm']
+
+
+def test_reconciled_lists_are_not_unioned_with_the_merge():
+    def reply(prompt):
+        if 'Reconcile these into one consistent profile' in prompt:
+            # Collapses the two near-duplicate adjectives into one and omits value_frame.
+            return {'style_profile': {'tone_adjectives': ['warm'], 'preferred_structures': []}}
+        first = prompt.split('"statement_label": "')[1].split('"')[0]
+        adjective = 'warm' if first == 'statement-0' else 'warm-hearted'
+        return {
+            'style_profile': {'tone_adjectives': [adjective], 'preferred_structures': ['lists']},
+            'value_frame': {'priority_rank': ['price'], 'price_sensitivity': 'high'},
+        }
+
+    reasoner, _completions = _reasoner(reply, reasoning_reconcile=True)
+    persona = _persona(8)
+
+    profile = reasoner._build_profile(persona, reasoner._collect_key_indicators(persona))
+
+    assert profile['style_profile']['tone_adjectives'] == ['warm']
+    # Missing or empty fields still come from the mechanical merge.
+    assert profile['style_profile']['preferred_structures'] == ['lists']
+    assert profile['value_frame'] == {'priority_rank': ['price'], 'price_sensitivity': 'high'}
+
+
+def test_sequential_mode_threads_partial_profile():
+    reasoner, completions = _reasoner(_chunk_reply, reasoning_map_reduce=False)
+    persona = _persona(8)
+    reasoner._build_profile(persona, reasoner._collect_key_indicators(persona))
+
+    assert completions.peak == 1
+    assert 'statement-0' in completions.prompts[1].split('Salient key_indicators')[0]
@@ -0,0 +1,68 @@
+"""
+Persona router tests: persona -> LoRA adapter mapping, adapter dispatch and
+adapter affinity in the endpoint pool.
+"""
+
+from pathlib import Path
+
+from adsp.core.ai_persona_router import PersonaRouter, resolve_persona_adapters
+from adsp.data_pipeline.schema import PersonaProfileModel
+from adsp.modeling.endpoint_pool import EndpointPool
+
+
+class RecordingEngine:
+    backend = 'openai'
+
+    def __init__(self, available=()):
+        self.available = set(available)
+        self.calls = []
+        self.preloaded = None
+
+    def generate(self, persona_id, prompt, *, model=None):  # noqa: ARG002
+        self.calls.append((persona_id, model))
+        return 'ok'
+
+    def preload_adapters(self, adapters):
+        self.preloaded = dict(adapters)
+        return self.available & set(adapters)
+
+
+def test_resolve_persona_adapters_from_metadata_and_env(monkeypatch, tmp_path: Path):
+    (tmp_path / 'voice-b').mkdir()
+    monkeypatch.setenv('ADSP_LORA_DIR', str(tmp_path))
+    monkeypatch.setenv('ADSP_LORA_ADAPTERS', 'p2=voice-b, bad-entry')
+    personas = [
+        PersonaProfileModel(persona_id='p1', lora_adapter='voice-a', lora_adapter_path='/adapters/a'),
+        PersonaProfileModel(persona_id='p2'),
+        PersonaProfileModel(persona_id='p3'),
+    ]
+
+    persona_adapters, adapter_paths = resolve_persona_adapters(personas)
+
+    assert persona_adapters == {'p1': 'voice-a', 'p2': 'voice-b'}
+    assert adapter_paths == {'voice-a': '/adapters/a', 'voice-b': str(tmp_path / 'voice-b')}
+
+
+def test_router_dispatches_adapter_as_model_and_drops_unavailable():
+    engine = RecordingEngine(available={'voice-a'})
+    router = PersonaRouter(inference_engine=engine, adapters={'p1': 'voice-a', 'p2': 'voice-b'})
+
+    router.preload_adapters({'voice-a': '/adapters/a'})
+    router.dispatch('p1', 'prompt')
+    router.dispatch('p2', 'prompt')
+
+    assert engine.preloaded == {'voice-a': '/adapters/a', 'voice-b': None}
+    assert engine.calls == [('p1', 'voice-a'), ('p2', None)]
+
+
+def test_pool_keeps_adapter_on_one_replica_until_overloaded():
+    pool = EndpointPool.from_urls(['http://a', 'http://b', 'http://c'], affinity_slack=2)
+    picks = set()
+    for _ in range(3):
+        endpoint = pool.acquire(model='voice-a', affinity_key='voice-a')
+        picks.add(endpoint.base_url)
+    assert len(picks) == 1
+
+    # Over the slack the request spills to the least-loaded replica.
+    spilled = pool.acquire(model='voice-a', affinity_key='voice-a')
+    assert spilled.base_url not in picks
@@ -0,0 +1,163 @@
+"""
+Run journal tests: state is replayed on resume, torn lines are ignored, writes
+are atomic, and a resumed run only redoes work not recorded as done.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from adsp.data_pipeline.run_journal import (
+    DONE,
+    FAILED,
+    PENDING,
+    STAGE_EXTRACT,
+    STAGE_REASONING,
+    ProgressTracker,
+    RunJournal,
+    atomic_write_json,
+    format_duration,
+)
+
+
+def test_atomic_write_replaces_file_without_leftovers(tmp_path: Path):
+    path = tmp_path / 'out' / 'page.json'
+    atomic_write_json(path, {'page': 1})
+    atomic_write_json(path, {'page': 2})
+    assert json.loads(path.read_text(encoding='utf-8')) == {'page': 2}
+    assert [p.name for p in path.parent.iterdir()] == ['page.json']
+
+
+def test_journal_replays_last_status_per_item(tmp_path: Path):
+    path = tmp_path / 'run_journal.jsonl'
+    journal = RunJournal.open(path)
+    journal.record(STAGE_EXTRACT, 1, PENDING)
+    journal.record(STAGE_EXTRACT, 2, PENDING)
+    journal.record(STAGE_EXTRACT, 1, DONE)
+    journal.record(STAGE_EXTRACT, 2, FAILED, error='timeout')
+    with path.open('a', encoding='utf-8') as f:
+        f.write('{"stage": "extract", "item": "3", "sta')  # crash mid-append
+
+    resumed = RunJournal.open(path, resume=True)
+    assert resumed.completed(STAGE_EXTRACT) == {'1'}
+    assert resumed.status(STAGE_EXTRACT, 2) == FAILED
+    assert resumed.outstanding(STAGE_EXTRACT, [1, 2, 3]) == [2, 3]
+    assert resumed.is_reusable(STAGE_EXTRACT, 1)
+    assert not resumed.is_reusable(STAGE_EXTRACT, 2)
+
+    fresh = RunJournal.open(path)
+    assert fresh.completed(STAGE_EXTRACT) == set()
+    assert fresh.is_reusable(STAGE_EXTRACT, 2)
+
+
+def test_progress_eta_from_observed_throughput():
+    progress = ProgressTracker('Extraction', total=10, unit='pages')
+    progress.started -= 4.0
+    progress.advance(2)
+    assert progress.rate() == pytest.approx(0.5, rel=0.05)
+    assert progress.eta_seconds() == pytest.approx(16.0, rel=0.05)
+    assert format_duration(3725) == '1h02m'
+    assert format_duration(75) == '1m15s'
+
+
+def _make_pdf(fitz, path: Path, labels) -> None:
+    doc = fitz.open()
+    for label in labels:
+        doc.new_page(width=120, height=80).insert_text((10, 40), label)
+    doc.save(path)
+    doc.close()
+
+
+def test_fact_pipeline_resume_redoes_only_outstanding_pages(tmp_path: Path):
+    fitz = pytest.importorskip('fitz')
+    pytest.importorskip('openai')
+    pytest.importorskip('langchain_core')
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.config import FactDataExtractionConfig
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.models import PageExtractionResult
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.pipeline import FactDataExtractionPipeline
+
+    pdf_path = tmp_path / 'deck.pdf'
+    _make_pdf(fitz, pdf_path, ['One', 'Two', 'Three', 'Four', 'Five'])
+
+    def make_config(**overrides):
+        return FactDataExtractionConfig(
+            pdf_path=pdf_path,
+            page_images_dir=tmp_path / 'images',
+            raw_responses_dir=tmp_path / 'raw',
+            fact_data_output_dir=tmp_path / 'out',
+            vllm_model='vlm',
+            dpi=20,
+            render_workers=1,
+            **overrides,
+        )
+
+    def run(config, crash_at=None) -> list:
+        extracted = []
+
+        def fake_extract_pages(pages, on_result=None, all_pages=None, context_window=None):
+            results = []
+            for page in pages:
+                if page.page_number == crash_at:
+                    raise KeyboardInterrupt
+                extracted.append(page.page_number)
+                error = 'bad response' if crash_at and page.page_number == 3 else None
+                result = PageExtractionResult(page_number=page.page_number, markdown_content='# page', error=error)
+                on_result(result)
+                results.append(result)
+            return results
+
+        pipeline = FactDataExtractionPipeline(config)
+        pipeline.extractor.extract_pages = fake_extract_pages
+        pipeline.run()
+        return sorted(extracted)
+
+    with pytest.raises(KeyboardInterrupt):
+        run(make_config(), crash_at=4)
+    journal_path = tmp_path / 'run_journal.jsonl'
+    states = RunJournal.open(journal_path, resume=True).states
+    assert states[(STAGE_EXTRACT, '2')] == DONE
+    assert states[(STAGE_EXTRACT, '3')] == FAILED
+    assert states[(STAGE_EXTRACT, '4')] == PENDING
+
+    # Resuming reuses recorded work even with cache reuse disabled.
+    assert run(make_config(resume=True, reuse_cache=False)) == [3, 4, 5]
+    assert RunJournal.open(journal_path, resume=True).outstanding(STAGE_EXTRACT, range(1, 6)) == []
+    # A fresh run without cache reuse extracts everything again.
+    assert run(make_config(reuse_cache=False)) == [1, 2, 3, 4, 5]
+
+
+def test_reasoner_resume_skips_personas_recorded_done(tmp_path: Path):
+    pytest.importorskip('openai')
+    from adsp.data_pipeline.persona_data_pipeline.extract_raw.config import PersonaExtractionConfig
+    from adsp.data_pipeline.persona_data_pipeline.extract_raw.reasoner import PersonaReasoner
+
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs['messages'][1]['content'])
+        content = json.dumps({'style_profile': {'directness': 'high'}})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    reasoner = PersonaReasoner(PersonaExtractionConfig(vllm_model='vlm'))
+    reasoner.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    statement = {'label': 's', 'salience': {'is_salient': True}}
+    personas = {
+        pid: {'persona_id': pid, 'indicators': [{'id': 'i', 'statements': [statement]}]} for pid in ('a', 'b')
+    }
+    out_dir = tmp_path / 'traits'
+    journal_path = tmp_path / 'run_journal.jsonl'
+
+    reasoner.process(personas, out_dir, journal=RunJournal.open(journal_path))
+    assert len(calls) == 2
+    # Persona b's profile exists on disk but the journal never saw it finish (e.g. a torn write).
+    lines = journal_path.read_text(encoding='utf-8').splitlines()
+    journal_path.write_text('\n'.join(l for l in lines if '"item": "b"' not in l) + '\n', encoding='utf-8')
+
+    calls.clear()
+    journal = RunJournal.open(journal_path, resume=True)
+    results = reasoner.process(personas, out_dir, journal=journal)
+    assert len(calls) == 1 and 'persona_id: b' in calls[0]
+    assert set(results) == {'a', 'b'}
+    assert journal.completed(STAGE_REASONING) == {'a', 'b'}
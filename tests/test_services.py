@@ -5,6 +5,8 @@ Tests for app services, communication, storage, and misc utilities.
 from dataclasses import dataclass
 import logging
 from pathlib import Path
+import threading
+import time
 
 import pytest
 
@@ -16,6 +18,7 @@ from adsp.app.report_service import ReportService
 from adsp.communication.cache import CacheClient
 from adsp.communication.event_broker import EventBroker
 from adsp.communication.rpc import RPCClient
+from adsp.communication.single_flight import SingleFlight
 from adsp.core.types import ChatResponse
 from adsp.storage.business_db import BusinessDatabase
 from adsp.storage.object_store import get, list_keys, put, put_bytes, _STORE
@@ -199,6 +202,57 @@ def test_rpc_client_allows_multiple_services():
     assert client.call("b", {"y": 2}) == 2
 
 
+def test_single_flight_shares_result_with_concurrent_callers():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    results = {}
+
+    def work() -> str:
+        calls.append("leader")
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    def follower_work() -> str:
+        calls.append("follower")
+        return "unexpected"
+
+    leader = threading.Thread(target=lambda: results.setdefault("leader", flight.do("key", work)))
+    leader.start()
+    started.wait(timeout=5)
+    follower = threading.Thread(
+        target=lambda: results.setdefault("follower", flight.do("key", follower_work))
+    )
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert calls == ["leader"]
+    assert results == {"leader": ("value", False), "follower": ("value", True)}
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_runs_again_after_completion():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == (1, False)
+    assert flight.do("key", lambda: 2) == (2, False)
+
+
+def test_single_flight_propagates_errors_and_clears_key():
+    flight = SingleFlight()
+
+    def boom() -> None:
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", boom)
+    assert flight.in_flight() == 0
+
+
 def test_object_store_put_and_get(tmp_path: Path):
     _STORE.clear()
     file_path = tmp_path / "doc.txt"
@@ -0,0 +1,181 @@
+"""
+Streaming extraction tests: extraction overlaps rendering, each image is
+encoded once, encoding stays a bounded distance ahead of a slow extractor,
+and the fact-data pipeline writes pages incrementally.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+from adsp.data_pipeline.streaming import (
+    context_window_numbers,
+    max_encoded_pages,
+    run_streaming_extraction,
+)
+
+
+@dataclass
+class _Page:
+    page_number: int
+
+
+def test_context_window_numbers():
+    assert context_window_numbers(1, {1, 2, 3}, 1) == [1, 2]
+    assert context_window_numbers(2, {1, 2, 3}, 1) == [2, 1, 3]
+    assert context_window_numbers(2, {1, 2, 3}, 0) == [2]
+
+
+def test_extraction_starts_before_rendering_finishes():
+    first_extracted = threading.Event()
+    rendered_after_first_extract = []
+    encode_calls = []
+
+    def pages():
+        for number in range(1, 6):
+            if number == 4:
+                assert first_extracted.wait(timeout=5), 'extraction did not overlap rendering'
+            if first_extracted.is_set():
+                rendered_after_first_extract.append(number)
+            yield _Page(number)
+
+    def encode(page):
+        encode_calls.append(page.page_number)
+        return f'img-{page.page_number}'
+
+    def extract(page, context_pages, contents):
+        first_extracted.set()
+        return page.page_number, [p.page_number for p in context_pages], dict(contents)
+
+    results = run_streaming_extraction(
+        pages(),
+        page_numbers=[1, 2, 3, 4, 5],
+        extract_numbers={1, 2, 3, 4, 5},
+        context_window=1,
+        encode=encode,
+        extract=extract,
+        on_result=lambda r: None,
+        extract_workers=2,
+        queue_size=2,
+    )
+
+    assert rendered_after_first_extract == [4, 5]
+    assert sorted(encode_calls) == [1, 2, 3, 4, 5]
+    by_page = {number: (ctx, contents) for number, ctx, contents in results}
+    assert by_page[3] == ([3, 2, 4], {2: 'img-2', 3: 'img-3', 4: 'img-4'})
+
+
+def test_encoding_waits_for_a_slow_extractor():
+    lock = threading.Lock()
+    counts = {'encoded': 0, 'delivered': 0, 'peak': 0}
+
+    def encode(page):
+        with lock:
+            counts['encoded'] += 1
+            counts['peak'] = max(counts['peak'], counts['encoded'] - counts['delivered'])
+        return f'img-{page.page_number}'
+
+    def extract(page, context_pages, contents):
+        time.sleep(0.005)
+        return page.page_number
+
+    def on_result(result):
+        with lock:
+            counts['delivered'] += 1
+
+    results = run_streaming_extraction(
+        iter([_Page(n) for n in range(1, 41)]),
+        page_numbers=list(range(1, 41)),
+        extract_numbers=set(range(1, 41)),
+        context_window=1,
+        encode=encode,
+        extract=extract,
+        on_result=on_result,
+        encode_workers=4,
+        extract_workers=2,
+        queue_size=8,
+    )
+
+    assert sorted(results) == list(range(1, 41))
+    assert counts['peak'] <= max_encoded_pages(2, 1)
+
+
+def test_streaming_only_extracts_requested_pages_and_propagates_errors():
+    results = run_streaming_extraction(
+        iter([_Page(n) for n in range(1, 5)]),
+        page_numbers=[1, 2, 3, 4],
+        extract_numbers={4},
+        context_window=1,
+        encode=lambda page: page.page_number,
+        extract=lambda page, ctx, contents: sorted(contents),
+        on_result=lambda r: None,
+    )
+    assert results == [[3, 4]]
+
+    def boom(page, ctx, contents):
+        raise RuntimeError('extract failed')
+
+    with pytest.raises(RuntimeError, match='extract failed'):
+        run_streaming_extraction(
+            iter([_Page(n) for n in range(1, 20)]),
+            page_numbers=list(range(1, 20)),
+            extract_numbers=set(range(1, 20)),
+            context_window=0,
+            encode=lambda page: page.page_number,
+            extract=boom,
+            on_result=lambda r: None,
+            queue_size=1,
+        )
+
+
+def test_fact_data_pipeline_streaming_writes_markdown(tmp_path: Path):
+    fitz = pytest.importorskip('fitz')
+    pytest.importorskip('openai')
+    pytest.importorskip('langchain_core')
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.config import FactDataExtractionConfig
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.models import PageExtractionResult
+    from adsp.data_pipeline.fact_data_pipeline.extract_raw.pipeline import FactDataExtractionPipeline
+
+    pdf_path = tmp_path / 'deck.pdf'
+    doc = fitz.open()
+    for number in range(1, 5):
+        doc.new_page(width=120, height=80).insert_text((10, 40), f'Page {number}')
+    doc.save(pdf_path)
+    doc.close()
+
+    cfg = FactDataExtractionConfig(
+        pdf_path=pdf_path,
+        page_images_dir=tmp_path / 'images',
+        raw_responses_dir=tmp_path / 'raw',
+        fact_data_output_dir=tmp_path / 'out',
+        vllm_model='vlm',
+        dpi=20,
+        render_workers=1,
+        streaming=True,
+    )
+    extracted = []
+
+    def fake_extract(page, context_pages, image_contents):
+        extracted.append(page.page_number)
+        assert set(image_contents) == {p.page_number for p in context_pages}
+        return PageExtractionResult(page_number=page.page_number, markdown_content=f'# Page {page.page_number}')
+
+    pipeline = FactDataExtractionPipeline(cfg)
+    pipeline.extractor.extract_page = fake_extract
+    state = pipeline.run()
+
+    assert sorted(extracted) == [1, 2, 3, 4]
+    assert [r.page_number for r in state['page_results']] == [1, 2, 3, 4]
+
+    # A second run keys its cache on the images already on disk and extracts nothing.
+    extracted.clear()
+    rerun = FactDataExtractionPipeline(cfg)
+    rerun.extractor.extract_page = fake_extract
+    state = rerun.run()
+
+    assert extracted == []
+    assert [r.page_number for r in state['page_results']] == [1, 2, 3, 4]
+    assert (tmp_path / 'out' / 'pages' / 'page_0004.md').read_text(encoding='utf-8') == '# Page 4'
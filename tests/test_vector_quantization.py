@@ -0,0 +1,162 @@
+"""
+Vector quantization tests: fp16/sq8 indexes shrink storage and keep the exact
+neighbours, float16 snapshots round-trip, and the fact-data index reuses a
+snapshot (its own or the indexing pipeline's) only while the markdown, the
+chunking and the embedding model are unchanged.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+faiss = pytest.importorskip('faiss')
+np = pytest.importorskip('numpy')
+pytest.importorskip('langchain_community')
+
+from adsp.core.rag.persona_index import HashEmbeddings
+from adsp.data_pipeline.vector_quantization import (
+    build_faiss_index,
+    bytes_per_vector,
+    load_snapshot,
+    normalize_quantization,
+    quantize_vectorstore,
+    read_snapshot_manifest,
+    save_snapshot,
+)
+
+
+def _vectors(n=200, dim=32, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype('float32')
+
+
+@pytest.mark.parametrize(
+    'mode,rescore_factor,size',
+    [('none', 0, 128), ('fp16', 0, 64), ('sq8', 0, 32), ('sq8', 4, 96)],
+)
+def test_quantized_indexes_keep_nearest_neighbours(mode, rescore_factor, size):
+    vectors = _vectors()
+    exact = build_faiss_index(vectors, 'none')
+    index = build_faiss_index(vectors, mode, rescore_factor=rescore_factor)
+    assert bytes_per_vector(index) == size
+
+    queries = vectors[:20] + 0.01
+    _, expected = exact.search(queries, 5)
+    _, found = index.search(queries, 5)
+    overlap = np.mean([len(set(a) & set(b)) / 5 for a, b in zip(expected, found)])
+    assert overlap >= 0.8
+    assert list(found[:, 0]) == list(range(20))
+
+
+def test_normalize_quantization_aliases():
+    assert normalize_quantization(None) == 'none'
+    assert normalize_quantization('INT8') == 'sq8'
+    with pytest.raises(ValueError):
+        normalize_quantization('pq')
+
+
+def _store(texts):
+    from adsp.data_pipeline.persona_data_pipeline.rag.indicator import _default_vectorstore
+
+    store = _default_vectorstore(HashEmbeddings(dim=64))
+    store.add_texts(texts, metadatas=[{'n': i} for i in range(len(texts))])
+    return store
+
+
+def test_quantize_vectorstore_and_snapshot_round_trip(tmp_path: Path):
+    texts = [f'coffee brand {i} espresso roast origin {i % 7}' for i in range(50)]
+    store = _store(texts)
+    save_snapshot(store, tmp_path / 'snap', embedding_model='hash')
+    assert np.load(tmp_path / 'snap' / 'vectors.npy').dtype == np.float16
+    assert read_snapshot_manifest(tmp_path / 'snap')['embedding_model'] == 'hash'
+
+    assert quantize_vectorstore(store, 'sq8')
+    assert not quantize_vectorstore(store, 'sq8')  # already quantized
+    assert store.similarity_search(texts[3], k=1)[0].metadata == {'n': 3}
+
+    loaded = load_snapshot(tmp_path / 'snap', HashEmbeddings(dim=64), quantization='fp16')
+    assert bytes_per_vector(loaded.index) == 128
+    hit = loaded.similarity_search(texts[12], k=1)[0]
+    assert hit.page_content == texts[12] and hit.metadata == {'n': 12}
+
+
+def test_fact_index_snapshot_reused_until_markdown_changes(tmp_path: Path, monkeypatch):
+    from adsp.core.rag.fact_data_index import build_fact_data_index_from_markdown
+
+    class NamedHash(HashEmbeddings):
+        model_name = 'hash-model'
+
+    class NoEmbedding(NamedHash):
+        def embed_documents(self, texts):
+            raise AssertionError('snapshot should have been loaded')
+
+    monkeypatch.setenv('ADSP_RAG_QUANTIZATION', 'sq8')
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    body = '\n'.join(f'Respondents in group {i} drink {i} cups of filter coffee per day.' for i in range(12))
+    (pages / 'page_0001.md').write_text(f'# Segment: Coffee\n## Page: 1\n\n{body}\n', encoding='utf-8')
+    (pages / 'page_0002.md').write_text(f'# Segment: Tea\n## Page: 2\n\n{body}\n', encoding='utf-8')
+    snapshot_dir = tmp_path / 'snapshot'
+
+    built = build_fact_data_index_from_markdown(pages, embeddings=NamedHash(), snapshot_dir=snapshot_dir)
+    assert bytes_per_vector(built.rag.vectorstore.index) == 384
+    manifest = read_snapshot_manifest(snapshot_dir)
+    assert manifest['count'] == len(built.indexed_chunk_ids)
+    assert (manifest['embedding_model'], manifest['dim']) == ('hash-model', 384)
+
+    loaded = build_fact_data_index_from_markdown(pages, embeddings=NoEmbedding(), snapshot_dir=snapshot_dir)
+    assert sorted(loaded.indexed_chunk_ids) == sorted(built.indexed_chunk_ids)
+    assert loaded.search('filter coffee cups', k=1)
+
+    # Another embedding model (name or dimension) never reuses the vectors.
+    class OtherModel(NoEmbedding):
+        model_name = 'other-model'
+
+    for embeddings in (OtherModel(), NoEmbedding(dim=128)):
+        with pytest.raises(AssertionError, match='snapshot should have been loaded'):
+            build_fact_data_index_from_markdown(pages, embeddings=embeddings, snapshot_dir=snapshot_dir)
+    with pytest.raises(ValueError, match='128-dim'):
+        load_snapshot(snapshot_dir, HashEmbeddings(dim=128))
+
+    # Replacing a file with an older copy keeps the count and the newest mtime but is detected.
+    older = pages / 'page_0001.md'
+    stat = older.stat()
+    older.write_text(f'# Segment: Cocoa\n## Page: 1\n\n{body}\n', encoding='utf-8')
+    os.utime(older, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+    with pytest.raises(AssertionError, match='snapshot should have been loaded'):
+        build_fact_data_index_from_markdown(pages, embeddings=NoEmbedding(), snapshot_dir=snapshot_dir)
+
+
+def test_indexing_pipeline_snapshot_is_loaded_by_the_runtime(tmp_path: Path, monkeypatch):
+    from adsp.core.rag.fact_data_index import build_fact_data_index_from_markdown
+    from adsp.data_pipeline.fact_data_pipeline.rag.pipeline import run_fact_data_indexing_pipeline
+
+    class NamedHash(HashEmbeddings):
+        model_name = 'hash-model'
+
+    class NoEmbedding(NamedHash):
+        def embed_documents(self, texts):
+            raise AssertionError('snapshot should have been loaded')
+
+    monkeypatch.delenv('ADSP_FACTDATA_CHUNK_MAX_TOKENS', raising=False)
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    body = '\n'.join(f'Respondents in group {i} drink {i} cups of filter coffee per day.' for i in range(12))
+    (pages / 'page_0001.md').write_text(f'# Segment: Coffee\n## Page: 1\n\n{body}\n', encoding='utf-8')
+    snapshot_dir = tmp_path / 'snapshot'
+
+    # The manifest names the model that built the vectors, not the unused default name.
+    run_fact_data_indexing_pipeline(
+        pages, embedding_model=NamedHash(), embedding_model_name='unused/default', snapshot_dir=snapshot_dir
+    )
+    manifest = read_snapshot_manifest(snapshot_dir)
+    assert manifest['embedding_model'] == 'hash-model'
+    assert (manifest['chunk_size'], manifest['chunk_overlap'], manifest['chunk_max_tokens']) == (1200, 50, 0)
+
+    loaded = build_fact_data_index_from_markdown(pages, embeddings=NoEmbedding(), snapshot_dir=snapshot_dir)
+    assert loaded.search('filter coffee cups', k=1)
+
+    # Chunked differently from the runtime: rebuilt instead of loaded.
+    run_fact_data_indexing_pipeline(pages, embedding_model=NamedHash(), chunk_size=300, snapshot_dir=snapshot_dir)
+    with pytest.raises(AssertionError, match='snapshot should have been loaded'):
+        build_fact_data_index_from_markdown(pages, embeddings=NoEmbedding(), snapshot_dir=snapshot_dir)
@@ -0,0 +1,121 @@
+"""
+Runtime warm-up tests: components are swapped into the orchestrator one by one,
+failures are recorded per component, and the API answers /health at once,
+reports progress on /ready and gates persona and chat routes until ready.
+"""
+
+import threading
+
+import pytest
+
+from adsp.core.prompt_builder import PromptBuilder
+from adsp.core.runtime import FAILED, READY, SKIPPED, RuntimeWarmup, build_registry
+from adsp.core.types import ChatResponse
+from adsp.data_pipeline.schema import PersonaProfileModel
+
+
+class GatedWarmup(RuntimeWarmup):
+    """Warm-up whose steps block until the test releases them."""
+
+    gates = {}
+
+    def _wait(self, name):
+        gate = self.gates.get(name)
+        if gate is not None:
+            assert gate.wait(10), f'{name} gate never released'
+
+    def _load_personas(self):
+        self._wait('personas')
+        personas = [PersonaProfileModel(persona_id='p1', persona_name='Pia')]
+        self.orchestrator.prompt_builder = PromptBuilder(registry=build_registry(personas))
+        return personas
+
+    def _build_persona_index(self, personas):
+        self._wait('persona_index')
+
+    def _build_fact_index(self):
+        self._wait('fact_index')
+        self.components['fact_index'].state = SKIPPED
+
+
+def test_failed_component_is_recorded_and_later_steps_still_run():
+    class Broken(GatedWarmup):
+        gates = {}
+
+        def _build_persona_index(self, personas):
+            raise RuntimeError('no embeddings')
+
+    warmup = Broken()
+    warmup.run()
+    status = warmup.status()
+    assert status['personas']['state'] == READY
+    assert status['persona_index'] == {'state': FAILED, 'detail': 'no embeddings', 'seconds': status['persona_index']['seconds']}
+    assert status['fact_index']['state'] == SKIPPED
+    assert not warmup.is_ready() and warmup.is_ready('personas', 'fact_index')
+    assert warmup.pending() == ['persona_index']
+
+    with pytest.raises(RuntimeError):
+        Broken().run(strict=True)
+
+
+def test_background_warmup_returns_immediately():
+    gate = threading.Event()
+    GatedWarmup.gates = {'personas': gate}
+    try:
+        warmup = GatedWarmup().start()
+        assert not warmup.wait(0.05)
+        assert warmup.pending() == ['personas', 'persona_index', 'fact_index']
+        gate.set()
+        assert warmup.wait(10) and warmup.is_ready()
+    finally:
+        GatedWarmup.gates = {}
+
+
+def test_api_gates_routes_until_components_are_ready(tmp_path, monkeypatch):
+    pytest.importorskip('fastapi')
+    pytest.importorskip('httpx')
+    from fastapi.testclient import TestClient
+
+    import adsp.app.api_server as api_server
+
+    gates = {name: threading.Event() for name in ('personas', 'persona_index', 'fact_index')}
+    monkeypatch.setattr(GatedWarmup, 'gates', gates)
+    monkeypatch.setattr(api_server, 'RuntimeWarmup', GatedWarmup)
+    monkeypatch.setenv('ADSP_REPORTS_DIR', str(tmp_path / 'reports'))
+    monkeypatch.delenv('ADSP_REQUIRE_AUTH', raising=False)
+
+    with TestClient(api_server.create_app()) as client:
+        warmup = client.app.state.services.warmup
+        warmup.orchestrator.handle = lambda request: ChatResponse(persona_id=request.persona_id, answer='hi')
+        chat = {'persona_id': 'p1', 'query': 'Coffee?'}
+
+        assert client.get('/health').status_code == 200
+        ready = client.get('/ready')
+        assert ready.status_code == 503 and ready.headers['Retry-After']
+        assert ready.json()['components']['personas']['state'] in ('pending', 'loading')
+        blocked = client.get('/v1/personas')
+        assert blocked.status_code == 503 and 'personas' in blocked.json()['detail']
+        assert client.post('/v1/chat', json=chat).status_code == 503
+
+        gates['personas'].set()
+        for _ in range(200):
+            if warmup.is_ready('personas'):
+                break
+            threading.Event().wait(0.01)
+        listed = client.get('/v1/personas')
+        assert listed.status_code == 200 and 'p1' in [p['persona_id'] for p in listed.json()['personas']]
+        degraded = client.post('/v1/chat', json=chat)
+        assert degraded.status_code == 200
+        assert degraded.headers['X-ADSP-Degraded'] == 'persona_index,fact_index'
+
+        monkeypatch.setenv('ADSP_API_SERVE_DEGRADED', 'false')
+        assert client.post('/v1/chat', json=chat).status_code == 503
+
+        gates['persona_index'].set()
+        gates['fact_index'].set()
+        assert warmup.wait(10)
+        ready = client.get('/ready')
+        assert ready.status_code == 200 and ready.json()['ready'] is True
+        assert ready.json()['components']['fact_index']['state'] == 'skipped'
+        ok = client.post('/v1/chat', json=chat)
+        assert ok.status_code == 200 and 'X-ADSP-Degraded' not in ok.headers